@@ -29,7 +29,7 @@ class Adapter(BaseAdapter):
 
     async def _setup_client(self) -> None:
         """Connect to client"""
-        self.client = Client(self.config, self.process_incoming_event)
+        self.client = Client(self.config, self.dispatch_incoming_event)
         self.connected = await self.client.connect()
 
     async def _get_adapter_info(self) -> None:
@@ -75,6 +75,14 @@ class Adapter(BaseAdapter):
             self.config.get_setting("adapter", "adapter_id")
         )
 
+    def _connection_is_alive(self) -> bool:
+        """Check the connection with the gateway heartbeats
+
+        Returns:
+            bool: True if the gateway is alive, False if it has to be probed
+        """
+        return self.client.is_gateway_alive()
+
     async def _reconnect_with_client(self) -> None:
         """Reconnect with client.
         The official discord.py library handles reconnecting automatically.
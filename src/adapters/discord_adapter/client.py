@@ -1,9 +1,10 @@
 import asyncio
 import logging
+import math
 import discord
 from discord.ext import commands
 
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.config import Config
@@ -27,16 +28,37 @@ class Client:
         intents.reactions = True        # Needed for reaction events
         intents.guilds = True
 
+        lean_gateway = self.config.get_setting("adapter", "lean_gateway", default=True)
+        if lean_gateway:
+            intents.typing = False      # Typing events are not processed
+
         self.bot = commands.Bot(
             command_prefix='!',
             intents=intents,
-            application_id=int(self.config.get_setting("adapter", "application_id"))
+            application_id=int(self.config.get_setting("adapter", "application_id")),
+            **(self._get_lean_cache_options() if lean_gateway else {})
         )
         self._setup_event_handlers()
 
         self.running = False
         self._connection_task: Optional[asyncio.Task] = None
 
+    def _get_lean_cache_options(self) -> Dict[str, Any]:
+        """Get the Bot options that turn off the caches of discord.py
+
+        Messages and users are kept in our own MessageCache and UserCache,
+        which are filled from the gateway payloads, so discord.py does not
+        need to keep copies of them.
+
+        Returns:
+            Dict[str, Any]: Bot keyword arguments
+        """
+        return {
+            "max_messages": None,
+            "member_cache_flags": discord.MemberCacheFlags.none(),
+            "chunk_guilds_at_startup": False
+        }
+
     def _setup_event_handlers(self) -> None:
         """Set up Discord event handlers"""
         @self.bot.event
@@ -75,6 +97,18 @@ class Client:
         async def on_guild_update(before, after):
             await self.process_event({"type": "renamed_server", "event": after})
 
+    def is_gateway_alive(self) -> bool:
+        """Check the gateway connection without an API request
+
+        discord.py closes and resumes the gateway when heartbeats are not
+        acknowledged, so an open gateway with a measured heartbeat latency
+        is alive.
+
+        Returns:
+            bool: True if the gateway is open and heartbeats are acknowledged
+        """
+        return self.running and not self.bot.is_closed() and math.isfinite(self.bot.latency)
+
     async def connect(self) -> bool:
         """Connect to Discord"""
         try:
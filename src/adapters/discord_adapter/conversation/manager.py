@@ -45,7 +45,12 @@ class Manager(BaseManager):
         else:
             server_id = str(event.id)
 
-        for conversation in self.conversations.values():
+        if server_id:
+            conversation_ids = self.index.get_server_conversations(server_id)
+        else:
+            conversation_ids = self.index.get_platform_conversations(platform_conversation_id)
+
+        for conversation in self._get_indexed_conversations(conversation_ids):
             if server_id:
                 updated = self._update_server_metadata(conversation, server_id, new_name)
             else:
@@ -9,13 +9,13 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List
 
-from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.attachment_loading import (
     create_attachment_dir,
     get_attachment_type_by_extension,
     save_metadata_file
 )
 from src.core.utils.config import Config
+from src.core.utils.http_session_pool import HttpSessionPool
 
 class Downloader():
     """Handles efficient file downloads from Discord"""
@@ -29,9 +29,10 @@ class Downloader():
         """
         self.config = config
         self.content_required = content_required
-        self.rate_limiter = RateLimiter(config)
+        self.http_session_pool = HttpSessionPool.get_instance(config)
         self.download_dir = self.config.get_setting("attachments", "storage_dir")
         self.max_file_size = self.config.get_setting("attachments", "max_file_size_mb") * 1024 * 1024
+        self.chunk_size = self.config.get_setting("adapter", "chunk_size", default=64 * 1024)
 
     async def download_attachment(self, message: Any) -> List[Dict[str, Any]]:
         """Process attachments from a Discord message
@@ -45,53 +46,62 @@ class Downloader():
         if not message or not hasattr(message, "attachments"):
             return []
 
-        metadata = []
-
-        for attachment in getattr(message, "attachments", []):
-            file_extension = None
-            if "." in attachment.filename:
-                file_extension = attachment.filename.split(".")[-1].lower()
-
-            attachment_metadata = {
-                "attachment_id": str(attachment.id),
-                "attachment_type": get_attachment_type_by_extension(file_extension),
-                "filename": self._get_local_filename(str(attachment.id), file_extension),
-                "size": attachment.size,
-                "content_type": attachment.content_type,
-                "content": None,
-                "url": attachment.url,
-                "created_at": datetime.now(),
-                "processable": False
-            }
-
-            if attachment_metadata["size"] > self.max_file_size:
-                logging.warning(f"Skipping download for {attachment.id} because it is too large")
-            else:
-                attachment_dir = os.path.join(
-                    self.download_dir,
-                    attachment_metadata["attachment_type"],
-                    attachment_metadata["attachment_id"]
-                )
-                local_file_path = os.path.join(
-                    attachment_dir,
-                    attachment_metadata["filename"]
-                )
-
-                if await self._download_file(attachment_dir, local_file_path, attachment):
-                    attachment_metadata["processable"] = True
-                    save_metadata_file(attachment_metadata, attachment_dir)
-
-                    if self.content_required:
-                        try:
-                            with open(local_file_path, "rb") as f:
-                                file_content = f.read()
-                                attachment_metadata["content"] = base64.b64encode(file_content).decode("utf-8")
-                        except Exception as e:
-                            logging.error(f"Error reading file {local_file_path}: {e}")
-
-            metadata.append(attachment_metadata)
-
-        return metadata
+        return list(await asyncio.gather(*[
+            self._process_attachment(attachment)
+            for attachment in getattr(message, "attachments", [])
+        ]))
+
+    async def _process_attachment(self, attachment: Any) -> Dict[str, Any]:
+        """Download a single attachment of a Discord message
+
+        Args:
+            attachment: Discord attachment object
+
+        Returns:
+            Dictionary with attachment metadata
+        """
+        file_extension = None
+        if "." in attachment.filename:
+            file_extension = attachment.filename.split(".")[-1].lower()
+
+        attachment_metadata = {
+            "attachment_id": str(attachment.id),
+            "attachment_type": get_attachment_type_by_extension(file_extension),
+            "filename": self._get_local_filename(str(attachment.id), file_extension),
+            "size": attachment.size,
+            "content_type": attachment.content_type,
+            "content": None,
+            "url": attachment.url,
+            "created_at": datetime.now(),
+            "processable": False
+        }
+
+        if attachment_metadata["size"] > self.max_file_size:
+            logging.warning(f"Skipping download for {attachment.id} because it is too large")
+        else:
+            attachment_dir = os.path.join(
+                self.download_dir,
+                attachment_metadata["attachment_type"],
+                attachment_metadata["attachment_id"]
+            )
+            local_file_path = os.path.join(
+                attachment_dir,
+                attachment_metadata["filename"]
+            )
+
+            if await self._download_file(attachment_dir, local_file_path, attachment):
+                attachment_metadata["processable"] = True
+                save_metadata_file(attachment_metadata, attachment_dir)
+
+                if self.content_required:
+                    try:
+                        with open(local_file_path, "rb") as f:
+                            file_content = f.read()
+                            attachment_metadata["content"] = base64.b64encode(file_content).decode("utf-8")
+                    except Exception as e:
+                        logging.error(f"Error reading file {local_file_path}: {e}")
+
+        return attachment_metadata
 
     def _get_local_filename(self,
                             attachment_id: str,
@@ -118,6 +128,11 @@ class Downloader():
                              attachment: Dict[str, Any]) -> bool:
         """Download an attachment and save it to the local file system
 
+        The content is streamed to the file chunk by chunk, and the chunks
+        are written in an executor, so neither the whole file is held in
+        memory nor the event loop is blocked by the disk. A partially
+        written file is removed, so the download is retried next time.
+
         Args:
             attachment_dir: The directory of the attachment
             local_file_path: The local file path for the attachment
@@ -129,12 +144,26 @@ class Downloader():
         if not os.path.exists(local_file_path):
             try:
                 create_attachment_dir(attachment_dir)
-                await self.rate_limiter.limit_request("download")
-                await attachment.save(local_file_path)
+                loop = asyncio.get_running_loop()
+
+                async with self.http_session_pool.limit(attachment.url):
+                    session = self.http_session_pool.get_session()
+                    async with session.get(attachment.url) as response:
+                        response.raise_for_status()
+
+                        with open(local_file_path, "wb") as f:
+                            while True:
+                                chunk = await response.content.read(self.chunk_size)
+                                if not chunk:
+                                    break
+                                await loop.run_in_executor(None, f.write, chunk)
+
                 logging.info(f"Downloaded {local_file_path}")
                 return True
             except Exception as e:
                 logging.error(f"Error downloading {attachment.id}: {e}")
+                if os.path.exists(local_file_path):
+                    os.remove(local_file_path)
                 return False
         else:
             logging.info(f"Skipping download for {local_file_path} because it already exists")
@@ -1,4 +1,3 @@
-import base64
 import discord
 import logging
 import os
@@ -6,6 +5,7 @@ import shutil
 import uuid
 
 from typing import Any, List, Tuple
+from src.core.utils.attachment_uploading import AttachmentUpload
 from src.core.utils.config import Config
 
 class Uploader():
@@ -36,7 +36,7 @@ class Uploader():
         except Exception as e:
             logging.error(f"Error removing temporary directory: {e}")
 
-    def upload_attachment(self, attachments: List[Any]) -> Tuple[List[str], List[str]]:
+    async def upload_attachment(self, attachments: List[Any]) -> Tuple[List[str], List[str]]:
         """Upload a file to Discord
 
         Args:
@@ -50,20 +50,18 @@ class Uploader():
 
         try:
             for attachment in attachments:
-                try:
-                    file_content = base64.b64decode(attachment.content)
-                except Exception as e:
-                    logging.error(f"Failed to decode base64 content: {e}")
-                    continue
+                upload = AttachmentUpload(
+                    attachment.content,
+                    os.path.join(self.temp_dir, attachment.file_name),
+                    self.max_file_size
+                )
 
-                if len(file_content) > self.max_file_size:
-                    logging.error(f"Decoded content exceeds size limit: {len(file_content)/1024/1024:.2f} MB")
+                try:
+                    temp_path = await upload.persist_async()
+                except ValueError as e:
+                    logging.error(str(e))
                     continue
 
-                temp_path = os.path.join(self.temp_dir, attachment.file_name)
-                with open(temp_path, "wb") as f:
-                    f.write(file_content)
-
                 files.append(discord.File(temp_path))
                 paths.append(temp_path)
 
@@ -70,9 +70,10 @@ class HistoryFetcher(BaseHistoryFetcher):
 
             result = []
             if self.anchor:
-                result = await self._make_api_request(
-                    channel, {"limit": self.history_limit}
-                )
+                kwargs = {"limit": self.history_limit}
+                if str(self.anchor).isdigit():
+                    kwargs["before"] = discord.Object(id=int(self.anchor))
+                result = await self._make_api_request(channel, kwargs)
             elif self.before:
                 result = await self._fetch_history_in_batches(channel, 0)
             elif self.after:
@@ -56,6 +56,22 @@ class IncomingEventProcessor(BaseIncomingEventProcessor):
             DiscordIncomingEventType.RENAMED_CONVERSATION: self._handle_rename
         }
 
+    def get_conversation_key(self, event: Any) -> Optional[str]:
+        """Get the key of the conversation an event belongs to
+
+        Args:
+            event: Discord event object
+
+        Returns:
+            Channel ID, or None for events outside of channels
+        """
+        discord_event = event.get("event", None)
+        channel_id = getattr(discord_event, "channel_id", None)
+
+        if channel_id is None:
+            channel_id = getattr(getattr(discord_event, "channel", None), "id", None)
+        return str(channel_id) if channel_id is not None else None
+
     async def _handle_message(self, event: Any) -> List[Dict[str, Any]]:
         """Handle a new message event from Discord
 
@@ -4,8 +4,9 @@ import json
 import logging
 import os
 
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from src.adapters.discord_adapter.conversation.manager import Manager
 from src.adapters.discord_adapter.event_processing.discord_utils import get_discord_channel
@@ -27,6 +28,7 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         """
         super().__init__(config, client, conversation_manager)
         self.uploader = Uploader(self.config)
+        self.channels: Dict[str, Any] = {}
 
     async def _send_message(self, conversation_info: Any, data: BaseModel) -> Dict[str, Any]:
         """Send a message to a chat
@@ -39,32 +41,32 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             Dictionary containing the status and message_ids
         """
         message_ids = []
-        channel = await self._get_channel(conversation_info.platform_conversation_id)
-        user_info_preprocessor = UserInfoPreprocessor(self.config, self.client)
-
-        for message in self._split_long_message(await user_info_preprocessor.process_outgoing_event(data.mentions, data.text)):
-            await self.rate_limiter.limit_request("message", data.conversation_id)
-            response = await channel.send(message)
-            if hasattr(response, "id"):
-                message_ids.append(str(response.id))
-
-        attachment_limit = self.config.get_setting("attachments", "max_attachments_per_message")
-        attachments = data.attachments
-        if attachments:
-            attachment_chunks = [
-                attachments[i:i+attachment_limit]
-                for i in range(0, len(attachments), attachment_limit)
-            ]
-            clean_up_paths = []
-
-            for chunk in attachment_chunks:
+        async with self._conversation_channel(conversation_info) as channel:
+            user_info_preprocessor = UserInfoPreprocessor(self.config, self.client)
+
+            for message in self._split_long_message(await user_info_preprocessor.process_outgoing_event(data.mentions, data.text)):
                 await self.rate_limiter.limit_request("message", data.conversation_id)
-                files, paths = self.uploader.upload_attachment(chunk)
-                clean_up_paths.extend(paths)
-                response = await channel.send(files=files)
+                response = await channel.send(message)
                 if hasattr(response, "id"):
                     message_ids.append(str(response.id))
-            self.uploader.clean_up_uploaded_files(clean_up_paths)
+
+            attachment_limit = self.config.get_setting("attachments", "max_attachments_per_message")
+            attachments = data.attachments
+            if attachments:
+                attachment_chunks = [
+                    attachments[i:i+attachment_limit]
+                    for i in range(0, len(attachments), attachment_limit)
+                ]
+                clean_up_paths = []
+
+                for chunk in attachment_chunks:
+                    await self.rate_limiter.limit_request("message", data.conversation_id)
+                    files, paths = await self.uploader.upload_attachment(chunk)
+                    clean_up_paths.extend(paths)
+                    response = await channel.send(files=files)
+                    if hasattr(response, "id"):
+                        message_ids.append(str(response.id))
+                self.uploader.clean_up_uploaded_files(clean_up_paths)
 
         logging.info(f"Message sent to {data.conversation_id} with {len(attachments)} attachments")
         return {"request_completed": True, "message_ids": message_ids}
@@ -79,12 +81,13 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dictionary containing the status
         """
-        channel = await self._get_channel(conversation_info.platform_conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
-        user_info_preprocessor = UserInfoPreprocessor(self.config, self.client)
+        async with self._conversation_channel(conversation_info) as channel:
+            message = await self._get_message(channel, data.message_id)
+            user_info_preprocessor = UserInfoPreprocessor(self.config, self.client)
+
+            await self.rate_limiter.limit_request("edit_message", data.conversation_id)
+            await message.edit(content=await user_info_preprocessor.process_outgoing_event(data.mentions, data.text))
 
-        await self.rate_limiter.limit_request("edit_message", data.conversation_id)
-        await message.edit(content=await user_info_preprocessor.process_outgoing_event(data.mentions, data.text))
         logging.info(f"Message {data.message_id} edited successfully")
 
         return {"request_completed": True}
@@ -98,11 +101,12 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dictionary containing the status
         """
-        channel = await self._get_channel(conversation_info.platform_conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
+        async with self._conversation_channel(conversation_info) as channel:
+            message = await self._get_message(channel, data.message_id)
+
+            await self.rate_limiter.limit_request("delete_message", data.conversation_id)
+            await message.delete()
 
-        await self.rate_limiter.limit_request("delete_message", data.conversation_id)
-        await message.delete()
         logging.info(f"Message {data.message_id} deleted successfully")
 
         return {"request_completed": True}
@@ -116,15 +120,16 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dictionary containing the status
         """
-        channel = await self._get_channel(conversation_info.platform_conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
         emoji_symbol = emoji.emojize(f":{data.emoji}:")
 
         if not emoji_symbol or emoji_symbol == f":{data.emoji}:":
             raise Exception(f"Python library emoji does not support this emoji: {data.emoji}")
 
-        await self.rate_limiter.limit_request("add_reaction", data.conversation_id)
-        await message.add_reaction(emoji_symbol)
+        async with self._conversation_channel(conversation_info) as channel:
+            message = await self._get_message(channel, data.message_id)
+            await self.rate_limiter.limit_request("add_reaction", data.conversation_id)
+            await message.add_reaction(emoji_symbol)
+
         logging.info(f"Reaction added to message {data.message_id}")
         return {"request_completed": True}
 
@@ -137,15 +142,16 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dictionary containing the status
         """
-        channel = await self._get_channel(conversation_info.platform_conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
         emoji_symbol = emoji.emojize(f":{data.emoji}:")
 
         if not emoji_symbol or emoji_symbol == f":{data.emoji}:":
             raise Exception(f"Python library emoji does not support this emoji: {data.emoji}")
 
-        await self.rate_limiter.limit_request("remove_reaction", data.conversation_id)
-        await message.remove_reaction(emoji_symbol, self.client.user)
+        async with self._conversation_channel(conversation_info) as channel:
+            message = await self._get_message(channel, data.message_id)
+            await self.rate_limiter.limit_request("remove_reaction", data.conversation_id)
+            await message.remove_reaction(emoji_symbol, self.client.user)
+
         logging.info(f"Reaction removed from message {data.message_id}")
         return {"request_completed": True}
 
@@ -158,11 +164,11 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        channel = await self._get_channel(conversation_info.platform_conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
+        async with self._conversation_channel(conversation_info) as channel:
+            message = await self._get_message(channel, data.message_id)
 
-        await self.rate_limiter.limit_request("pin_message", data.conversation_id)
-        await message.pin()
+            await self.rate_limiter.limit_request("pin_message", data.conversation_id)
+            await message.pin()
 
         logging.info(f"Message {data.message_id} pinned successfully")
         return {"request_completed": True}
@@ -176,11 +182,11 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        channel = await self._get_channel(conversation_info.platform_conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
+        async with self._conversation_channel(conversation_info) as channel:
+            message = await self._get_message(channel, data.message_id)
 
-        await self.rate_limiter.limit_request("unpin_message", data.conversation_id)
-        await message.unpin()
+            await self.rate_limiter.limit_request("unpin_message", data.conversation_id)
+            await message.unpin()
 
         logging.info(f"Message {data.message_id} unpinned successfully")
         return {"request_completed": True}
@@ -194,25 +200,74 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        channel = await self._get_channel(conversation_info.platform_conversation_id)
-
-        await self.rate_limiter.limit_request("send_typing_indicator", data.conversation_id)
-        # channel.typing() causes typing notification display that lasts ~10 seconds;
-        # channel.send() triggered by adapter via `send_message` event will stop notification earlier
-        await channel.typing()
+        async with self._conversation_channel(conversation_info) as channel:
+            await self.rate_limiter.limit_request("send_typing_indicator", data.conversation_id)
+            # channel.typing() causes typing notification display that lasts ~10 seconds;
+            # channel.send() triggered by adapter via `send_message` event will stop notification earlier
+            await channel.typing()
 
         logging.info(f"Typing indicator sent to {data.conversation_id}")
         return {"request_completed": True}
 
+    @asynccontextmanager
+    async def _conversation_channel(self, conversation_info: Any) -> AsyncIterator[Any]:
+        """Provide the conversation channel for an outgoing action
+
+        A failed action drops the cached channel, so the next
+        action looks the channel up again.
+
+        Args:
+            conversation_info: Conversation info
+
+        Yields:
+            Discord channel object
+        """
+        channel = await self._get_channel(conversation_info.platform_conversation_id)
+
+        try:
+            yield channel
+        except Exception:
+            self.channels.pop(conversation_info.platform_conversation_id, None)
+            raise
+
     async def _get_channel(self, conversation_id: str) -> Optional[Any]:
         """Get a channel from a conversation_id
 
+        Channels are cached per conversation; channels known to the client
+        are taken from its cache, so only unknown channels are fetched.
+
         Args:
             conversation_id: Conversation ID
 
         Returns:
             Optional[Any]: Channel object if found, None otherwise
         """
-        await self.rate_limiter.limit_request("fetch_channel")
+        if conversation_id in self.channels:
+            return self.channels[conversation_id]
+
+        channel = self.client.get_channel(int(conversation_id.split("/")[-1]))
+
+        if not channel:
+            await self.rate_limiter.limit_request("fetch_channel")
+            channel = await get_discord_channel(self.client, conversation_id)
+
+        self.channels[conversation_id] = channel
+        return channel
+
+    async def _get_message(self, channel: Any, message_id: str) -> Any:
+        """Get a message handle to act on
+
+        A partial message is built from the IDs without any request;
+        the message is fetched only if the channel can not build one.
+
+        Args:
+            channel: Discord channel object
+            message_id: Message ID
+
+        Returns:
+            Partial or full Discord message object
+        """
+        if hasattr(channel, "get_partial_message"):
+            return channel.get_partial_message(int(message_id))
 
-        return await get_discord_channel(self.client, conversation_id)
+        return await channel.fetch_message(int(message_id))
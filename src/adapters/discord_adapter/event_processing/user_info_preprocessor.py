@@ -42,6 +42,7 @@ class UserInfoPreprocessor:
             self.author_id = str(user.id)
             self._get_or_create_user(self.author_id, user)
 
+        self._add_payload_users_to_cache(message)
         await self._add_mentioned_users_to_cache_and_update_content(message)
 
         return {
@@ -50,11 +51,33 @@ class UserInfoPreprocessor:
             "mentions": list(self.mentions)
         }
 
+    def _add_payload_users_to_cache(self, message: Any) -> None:
+        """Add the users delivered with a Discord payload to the cache.
+        Messages carry their author and mentioned users, raw edit payloads
+        carry them as dictionaries, so mentions are resolved without API requests.
+
+        Args:
+            message: a Discord message object or raw edit payload
+        """
+        if not message:
+            return
+
+        users = list(getattr(message, "mentions", None) or [])
+        data = getattr(message, "data", None)
+
+        if isinstance(data, dict):
+            users += [data.get("author", None)] + data.get("mentions", [])
+
+        for user in users:
+            user_id = user.get("id", None) if isinstance(user, dict) else getattr(user, "id", None)
+            if user_id:
+                self._get_or_create_user(str(user_id), user)
+
     async def _add_mentioned_users_to_cache_and_update_content(self, message: Any) -> None:
         """Get mentions from a Discord message.
         Extracts mentions of the bot or @all from the message text.
         Also checks if the message is a reply to the bot.
-        Adds the users to the cache and updates the message content.
+        Replaces the mentions of cached users with their names.
 
         Args:
             message: a Discord message object
@@ -80,14 +103,15 @@ class UserInfoPreprocessor:
 
         # Pattern for Discord user mentions: <@USER_ID>
         for mention in found_user_mentions:
-            user = self._get_or_create_user(mention, await self.client.fetch_user(mention))
+            user = self.cache.user_cache.get_user_by_id(mention)
 
             if self.adapter_id and mention == self.adapter_id:
                 self.mentions.add(self.adapter_id)
 
             # Replace the mention with the user's display name
-            mention_regex = f"<@{mention}>"
-            self.updated_content = re.sub(mention_regex, f"<@{user.display_name}>", self.updated_content)
+            if user:
+                mention_regex = f"<@{mention}>"
+                self.updated_content = re.sub(mention_regex, f"<@{user.display_name}>", self.updated_content)
 
         # Check for special mentions (@everyone and @here)
         if "@everyone" in content or "@here" in content:
@@ -98,7 +122,7 @@ class UserInfoPreprocessor:
 
         Args:
             user_id: The ID of the user
-            user: The user object
+            user: The user object or user payload dictionary
         """
         if not user_id:
             return None
@@ -106,7 +130,7 @@ class UserInfoPreprocessor:
         if user_id not in self.cache.user_cache.users:
             self.cache.user_cache.add_user({
                 "user_id": user_id,
-                "username": user.name,
+                "username": user.get("username", None) if isinstance(user, dict) else user.name,
                 "is_bot": self.adapter_id == user_id
             })
 
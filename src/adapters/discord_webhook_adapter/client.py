@@ -1,16 +1,19 @@
-import aiohttp
 import asyncio
 import json
 import logging
 import discord
 from discord.ext import commands
 
-from typing import Any, Dict, Optional
-from src.core.rate_limiter.rate_limiter import RateLimiter
+from typing import Any, Dict, List, Optional, Tuple
+from src.adapters.discord_webhook_adapter.webhook_registry import WebhookRegistry
 from src.core.utils.config import Config
+from src.core.utils.http_session_pool import HttpSessionPool
 
 class Client:
     """Discord webhook client implementation"""
+    WEBHOOK_NAME = "Connectome Bot"
+    BOT_READY_TIMEOUT = 60  # in seconds
+    INVALID_WEBHOOK_STATUSES = (401, 403, 404)
 
     def __init__(self, config: Config):
         """Initialize the Discord webhook client
@@ -35,20 +38,40 @@ class Client:
             )
 
         self._connection_tasks = []
+        self._refresh_task = None
+        self._webhook_locks: Dict[str, asyncio.Lock] = {}
         self.session = None
         self.running = False
-        self.webhooks = {}
-        self.rate_limiter = RateLimiter.get_instance(self.config)
+        self.registry = WebhookRegistry(self.config)
+        self.refresh_interval = self.config.get_setting(
+            "adapter", "webhook_refresh_interval", default=3600
+        )
+        self.scan_concurrency = self.config.get_setting(
+            "adapter", "webhook_scan_concurrency", default=5
+        )
+
+    @property
+    def webhooks(self) -> Dict[str, Dict[str, Any]]:
+        """Webhooks known to the client by conversation ID"""
+        return self.registry.webhooks
+
+    @webhooks.setter
+    def webhooks(self, webhooks: Dict[str, Dict[str, Any]]) -> None:
+        self.registry.webhooks = webhooks
 
     async def connect(self) -> bool:
         """Initialize HTTP session
 
+        Webhook requests go through the HTTP session shared with the
+        attachment transfers, which is closed when the adapter stops.
+        Webhooks saved by the previous runs and the configured ones are
+        available immediately, while guilds are scanned in the background.
+
         Returns:
             bool: True if connection successful
         """
         try:
-            if self.session is None or self.session.closed:
-                self.session = aiohttp.ClientSession()
+            self.session = HttpSessionPool.get_instance(self.config).get_session()
 
             connection_tasks = []
             for bot_token in self.bots:
@@ -57,8 +80,11 @@ class Client:
                 self._connection_tasks.append(task)
             await asyncio.gather(*connection_tasks, return_exceptions=True)
 
+            await self.registry.load()
+            self._load_config_webhooks()
+
             self.running = True
-            await self._load_webhooks()
+            self._refresh_task = asyncio.create_task(self._refresh_webhooks())
 
             logging.info(f"Discord webhook client initialized with {len(self.webhooks)} webhooks")
             return True
@@ -67,12 +93,16 @@ class Client:
             return False
 
     async def disconnect(self) -> None:
-        """Close HTTP session"""
+        """Close bot connections"""
         self.running = False
 
         try:
-            if self.session and not self.session.closed:
-                await self.session.close()
+            if self._refresh_task and not self._refresh_task.done():
+                self._refresh_task.cancel()
+                try:
+                    await self._refresh_task
+                except asyncio.CancelledError:
+                    pass  # Expected
 
             for bot_token in self.bots:
                 try:
@@ -93,14 +123,92 @@ class Client:
             logging.error(f"Error closing webhook client session: {e}")
 
     async def get_or_create_webhook(self, conversation_id: str) -> Optional[Dict[str, Any]]:
-        """Create a webhook in the specified channel if possible
+        """Get the webhook of a conversation or create one if possible
+
+        A webhook loaded from the registry is validated on its first use,
+        webhooks that no longer exist are replaced.
 
         Args:
             conversation_id: Conversation ID to create webhook in
         """
-        if conversation_id in self.webhooks:
-            return self.webhooks[conversation_id]
+        if conversation_id not in self._webhook_locks:
+            self._webhook_locks[conversation_id] = asyncio.Lock()
+
+        async with self._webhook_locks[conversation_id]:
+            webhook_info = self.registry.get(conversation_id)
+
+            if webhook_info:
+                if self.registry.is_validated(conversation_id):
+                    return webhook_info
+                if await self._validate_webhook(conversation_id, webhook_info):
+                    return webhook_info
 
+            return await self._create_webhook(conversation_id)
+
+    def get_client_bot(self, bot_token: str) -> Optional[Any]:
+        """Get the bot for a conversation
+
+        Args:
+            bot_token: Bot token
+
+        Returns:
+            Bot object or None if not found
+        """
+        return self.bots.get(bot_token, None)
+
+    async def _connect_bot(self, bot_token) -> bool:
+        """Connect a single bot
+
+        Args:
+            bot_token: Bot token
+
+        Returns:
+            bool: True if connection successful
+        """
+        try:
+            asyncio.create_task(self.bots[bot_token].start(bot_token))
+            await asyncio.sleep(1)
+            return True
+        except Exception as e:
+            logging.error(f"Error connecting bot: {e}")
+            return False
+
+    async def _validate_webhook(self, conversation_id: str, webhook_info: Dict[str, Any]) -> bool:
+        """Check that a webhook still exists
+
+        The webhook is removed from the registry only when Discord reports
+        that it is gone, other failures leave it to be checked on the next use.
+
+        Args:
+            conversation_id: Conversation ID
+            webhook_info: Webhook info
+
+        Returns:
+            bool: False if the webhook no longer exists, True otherwise
+        """
+        try:
+            async with self.session.get(webhook_info["url"]) as response:
+                if response.status in self.INVALID_WEBHOOK_STATUSES:
+                    logging.warning(f"Webhook of conversation {conversation_id} no longer exists")
+                    self.registry.remove(conversation_id)
+                    await self.registry.save()
+                    return False
+
+                if response.status < 400:
+                    self.registry.mark_validated(conversation_id)
+        except Exception as e:
+            logging.error(f"Error validating webhook: {e}")
+
+        return True
+
+    async def _create_webhook(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Create a webhook in the conversation channel if possible
+
+        A webhook that one of the bots has created before is reused.
+
+        Args:
+            conversation_id: Conversation ID to create webhook in
+        """
         try:
             guild_id, channel_id = conversation_id.split("/")
             if not guild_id or not channel_id:
@@ -120,72 +228,161 @@ class Client:
                     logging.error(f"No permission to create webhooks in conversation {conversation_id}")
                     return None
 
-                webhook = await channel.create_webhook(name="Connectome Bot")
-                self.webhooks[conversation_id] = {
+                webhook = await self._find_bot_webhook(channel, self.bots[bot_token])
+                if webhook:
+                    logging.info(f"Reusing existing webhook in conversation {conversation_id}")
+                else:
+                    webhook = await channel.create_webhook(name=self.WEBHOOK_NAME)
+                    logging.info(f"Created webhook in conversation {conversation_id}")
+
+                self.registry.add(conversation_id, {
                     "url": webhook.url,
                     "name": webhook.name,
                     "bot_token": bot_token
-                }
+                })
+                await self.registry.save()
 
-                logging.info(f"Created webhook in conversation {conversation_id}")
                 return self.webhooks[conversation_id]
         except Exception as e:
             logging.error(f"Error creating webhook: {e}")
 
         return None
 
-    def get_client_bot(self, bot_token: str) -> Optional[Any]:
-        """Get the bot for a conversation
+    async def _find_bot_webhook(self, channel: Any, bot: Any) -> Optional[Any]:
+        """Find a webhook created by the bot in a channel
 
         Args:
-            bot_token: Bot token
+            channel: Discord channel
+            bot: Bot object
 
         Returns:
-            Bot object or None if not found
+            Webhook or None if not found
         """
-        return self.bots.get(bot_token, None)
+        for webhook in await channel.webhooks():
+            if (webhook.name == self.WEBHOOK_NAME and
+                    webhook.token and
+                    webhook.user and
+                    webhook.user.id == bot.user.id):
+                return webhook
+        return None
 
-    async def _connect_bot(self, bot_token) -> bool:
-        """Connect a single bot
+    async def _refresh_webhooks(self) -> None:
+        """Background loop that keeps the webhook registry up to date"""
+        while self.running:
+            await self._load_webhooks()
 
-        Args:
-            bot_token: Bot token
+            if not self.refresh_interval:
+                break
+            await asyncio.sleep(self.refresh_interval)
 
-        Returns:
-            bool: True if connection successful
+    async def _load_webhooks(self) -> None:
+        """Load webhook configuration from config and from Discord
+
+        Guilds are scanned concurrently. Discord.py follows the rate limits
+        of the webhooks route, so the global rate limiter is not applied here.
         """
         try:
-            asyncio.create_task(self.bots[bot_token].start(bot_token))
-            await asyncio.sleep(1)
-            return True
+            await asyncio.gather(*[
+                self._wait_until_ready(bot_token) for bot_token in self.bots
+            ])
+
+            semaphore = asyncio.Semaphore(self.scan_concurrency)
+            scans = await asyncio.gather(*[
+                self._scan_guild(bot_token, guild, semaphore)
+                for bot_token in self.bots
+                for guild in self.bots[bot_token].guilds
+            ])
+
+            scanned_webhooks = {}
+            for scan in scans:
+                for conversation_id, webhook_info in scan:
+                    scanned_webhooks.setdefault(conversation_id, []).append(webhook_info)
+
+            for conversation_id, candidates in scanned_webhooks.items():
+                self._merge_scanned_webhooks(conversation_id, candidates)
+
+            self._load_config_webhooks()
+            await self.registry.save()
+
+            logging.info(f"Webhook registry refreshed, {len(self.webhooks)} webhooks known")
         except Exception as e:
-            logging.error(f"Error connecting bot: {e}")
-            return False
+            logging.error(f"Error loading webhooks: {e}")
 
-    async def _load_webhooks(self) -> None:
-        """Load webhook configuration from config and from Discord"""
+    async def _wait_until_ready(self, bot_token: str) -> None:
+        """Wait until a bot is ready to list its guilds
+
+        Args:
+            bot_token: Bot token
+        """
         try:
-            # Load webhooks from Discord
-            for bot_token in self.bots:
-                if not self.bots[bot_token].is_ready():
-                    await asyncio.sleep(3)
-
-                for guild in self.bots[bot_token].guilds:
-                    await self.rate_limiter.limit_request("load_webhooks")
-                    for webhook in await guild.webhooks():
-                        self.webhooks[f"{guild.id}/{webhook.channel_id}"] = {
-                            "url": webhook.url,
-                            "name": webhook.name,
-                            "bot_token": bot_token
-                        }
-
-            # Load additional webhooks from file
-            for webhook in self.config.get_setting("adapter", "webhooks", default=[]):
-                if webhook["conversation_id"] and webhook["conversation_id"] not in self.webhooks:
-                    self.webhooks[webhook["conversation_id"]] = {
+            await asyncio.wait_for(
+                self.bots[bot_token].wait_until_ready(), timeout=self.BOT_READY_TIMEOUT
+            )
+        except Exception as e:
+            logging.warning(f"Bot is not ready, its guilds will not be scanned: {e}")
+
+    async def _scan_guild(self,
+                          bot_token: str,
+                          guild: Any,
+                          semaphore: asyncio.Semaphore) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get the webhooks of a guild
+
+        Args:
+            bot_token: Bot token
+            guild: Discord guild
+            semaphore: Semaphore limiting the number of concurrent scans
+
+        Returns:
+            List of conversation IDs with webhook info
+        """
+        async with semaphore:
+            try:
+                return [
+                    (
+                        f"{guild.id}/{webhook.channel_id}",
+                        {"url": webhook.url, "name": webhook.name, "bot_token": bot_token}
+                    )
+                    for webhook in await guild.webhooks() if webhook.token
+                ]
+            except Exception as e:
+                logging.error(f"Error loading webhooks of guild {guild.id}: {e}")
+                return []
+
+    def _merge_scanned_webhooks(self,
+                                conversation_id: str,
+                                candidates: List[Dict[str, Any]]) -> None:
+        """Update the registry with the webhooks found in a channel
+
+        The webhook already used for the conversation is kept while it exists,
+        so that the messages sent through it can still be edited and deleted.
+
+        Args:
+            conversation_id: Conversation ID
+            candidates: Webhooks found in the conversation channel
+        """
+        current = self.registry.get(conversation_id)
+        urls = [candidate["url"] for candidate in candidates]
+
+        if current and current["url"] in urls:
+            webhook_info = candidates[urls.index(current["url"])]
+        else:
+            webhook_info = next(
+                (candidate for candidate in candidates if candidate["name"] == self.WEBHOOK_NAME),
+                candidates[-1]
+            )
+
+        self.registry.add(conversation_id, webhook_info)
+
+    def _load_config_webhooks(self) -> None:
+        """Load additional webhooks from config"""
+        for webhook in self.config.get_setting("adapter", "webhooks", default=[]):
+            if webhook["conversation_id"] and webhook["conversation_id"] not in self.webhooks:
+                self.registry.add(
+                    webhook["conversation_id"],
+                    {
                         "url": webhook["url"],
                         "name": webhook["name"],
                         "bot_token": None
-                    }
-        except Exception as e:
-            logging.error(f"Error loading webhooks: {e}")
+                    },
+                    validated=False
+                )
@@ -1,9 +1,9 @@
-import base64
 import logging
 import os
 import shutil
 
 from typing import Any, List
+from src.core.utils.attachment_uploading import AttachmentUpload
 from src.core.utils.config import Config
 
 class Uploader():
@@ -33,7 +33,7 @@ class Uploader():
         except Exception as e:
             logging.error(f"Error removing temporary directory: {e}")
 
-    def upload_attachment(self, attachments: List[Any]) -> List[str]:
+    async def upload_attachment(self, attachments: List[Any]) -> List[str]:
         """Upload a file to Discord
 
         Args:
@@ -46,21 +46,16 @@ class Uploader():
 
         try:
             for attachment in attachments:
-                try:
-                    file_content = base64.b64decode(attachment.content)
-                except Exception as e:
-                    logging.error(f"Failed to decode base64 content: {e}")
-                    continue
-
-                if len(file_content) > self.max_file_size:
-                    logging.error(f"Decoded content exceeds size limit: {len(file_content)/1024/1024:.2f} MB")
-                    continue
+                upload = AttachmentUpload(
+                    attachment.content,
+                    os.path.join(self.temp_dir, attachment.file_name),
+                    self.max_file_size
+                )
 
-                temp_path = os.path.join(self.temp_dir, attachment.file_name)
-                with open(temp_path, "wb") as f:
-                    f.write(file_content)
-
-                files.append(temp_path)
+                try:
+                    files.append(await upload.persist_async())
+                except ValueError as e:
+                    logging.error(str(e))
 
             return files
         except Exception as e:
@@ -2,11 +2,13 @@ import aiohttp
 import asyncio
 import json
 import logging
+import os
 
 from pydantic import BaseModel
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, List
 
 from src.adapters.discord_webhook_adapter.event_processing.attachment_loaders.uploader import Uploader
+from src.adapters.discord_webhook_adapter.event_processing.webhook_rate_limiter import WebhookRateLimiter
 from src.adapters.discord_webhook_adapter.conversation.manager import Manager
 
 from src.core.conversation.base_data_classes import UserInfo
@@ -15,6 +17,8 @@ from src.core.utils.config import Config
 
 class OutgoingEventProcessor(BaseOutgoingEventProcessor):
     """Processes events from socket.io and sends them to Discord"""
+    MAX_RATE_LIMIT_RETRIES = 3
+    FILE_CHUNK_SIZE = 256 * 1024  # in bytes
 
     def __init__(self, config: Config, client: Any, conversation_manager: Manager):
         """Initialize the socket.io events processor
@@ -27,6 +31,7 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         super().__init__(config, client, conversation_manager)
         self.session = self.client.session
         self.uploader = Uploader(self.config)
+        self.webhook_rate_limiter = WebhookRateLimiter()
 
     async def _handle_fetch_attachment_event(self, data: BaseModel) -> Dict[str, Any]:
         """Fetch attachment event is not available for webhooks adapter.
@@ -57,7 +62,7 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             message_ids.append(response.get("id", ""))
             self.conversation_manager.add_to_conversation({**response, **webhook_info})
 
-        attachments = self.uploader.upload_attachment(data.attachments)
+        attachments = await self.uploader.upload_attachment(data.attachments)
         for response in await self._send_attachments(webhook_info, attachments):
             message_ids.append(response.get("id", ""))
             self.conversation_manager.add_to_conversation({**response, **webhook_info})
@@ -81,12 +86,12 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         responses = []
 
         for message in self._split_long_message(initial_message):
-            await self.rate_limiter.limit_request("message", webhook_info["url"])
-            response = await self.session.post(
+            response = await self._send_webhook_request(
+                "post",
+                webhook_info["url"],
                 webhook_info["url"] + "?wait=true",
-                json={"content": message, "username": webhook_info["name"]}
+                lambda: {"json": {"content": message, "username": webhook_info["name"]}}
             )
-            await self._check_api_response(response)
             responses.append(await response.json())
 
         return responses
@@ -114,21 +119,61 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         responses = []
 
         for chunk in attachment_chunks:
-            await self.rate_limiter.limit_request("message", webhook_info["url"])
-            form = aiohttp.FormData()
-            for i, attachment in enumerate(chunk):
-                with open(attachment, "rb") as f:
-                    filename = attachment.split("/")[-1]
-                    form.add_field(f"file{i}", f.read(), filename=filename)
-            form.add_field("payload_json", json.dumps(payload))
-            response = await self.session.post(
-                webhook_info["url"] + "?wait=true", data=form
+            response = await self._send_webhook_request(
+                "post",
+                webhook_info["url"],
+                webhook_info["url"] + "?wait=true",
+                lambda: {"data": self._build_form(chunk, payload)}
             )
-            await self._check_api_response(response)
             responses.append(await response.json())
 
         return responses
 
+    def _build_form(self, attachments: List[str], payload: Dict[str, Any]) -> aiohttp.FormData:
+        """Build a multipart form for attachments
+
+        Files are read in an executor while the form is sent, and
+        every file is closed once it is read or the request fails.
+
+        Args:
+            attachments: Paths to the attachment files
+            payload: Message payload
+
+        Returns:
+            aiohttp.FormData: Form to send
+        """
+        form = aiohttp.FormData()
+        for i, attachment in enumerate(attachments):
+            form.add_field(
+                f"file{i}",
+                aiohttp.AsyncIterablePayload(self._stream_file(attachment)),
+                filename=os.path.basename(attachment),
+                content_type="application/octet-stream"
+            )
+        form.add_field("payload_json", json.dumps(payload))
+        return form
+
+    async def _stream_file(self, file_path: str) -> AsyncIterator[bytes]:
+        """Yield the content of a file chunk by chunk without blocking the event loop
+
+        The file is opened only when the first chunk is requested,
+        so forms that are never sent do not hold open files.
+
+        Args:
+            file_path: Path to the file
+        """
+        loop = asyncio.get_running_loop()
+        file = await loop.run_in_executor(None, open, file_path, "rb")
+
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, file.read, self.FILE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            file.close()
+
     async def _edit_message(self, _: Any, data: BaseModel) -> Dict[str, Any]:
         """Edit a message
 
@@ -140,13 +185,13 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             Dictionary containing the status
         """
         webhook_info = await self._get_webhook_info(data.conversation_id)
-        await self.rate_limiter.limit_request("edit_message", webhook_info["url"])
-        await self._check_api_response(
-            await self.session.patch(
-                f"{webhook_info['url']}/messages/{data.message_id}",
-                json={"content": data.text}
-            )
+        response = await self._send_webhook_request(
+            "patch",
+            webhook_info["url"],
+            f"{webhook_info['url']}/messages/{data.message_id}",
+            lambda: {"json": {"content": data.text}}
         )
+        response.release()
         logging.info(f"Message {data.message_id} edited successfully")
         return {"request_completed": True}
 
@@ -161,12 +206,13 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             Dictionary containing the status
         """
         webhook_info = await self._get_webhook_info(data.conversation_id)
-        await self.rate_limiter.limit_request("delete_message", webhook_info["url"])
-        await self._check_api_response(
-            await self.session.delete(
-                f"{webhook_info['url']}/messages/{data.message_id}"
-            )
+        response = await self._send_webhook_request(
+            "delete",
+            webhook_info["url"],
+            f"{webhook_info['url']}/messages/{data.message_id}",
+            lambda: {}
         )
+        response.release()
         self.conversation_manager.delete_from_conversation({
             "conversation_id": data.conversation_id,
             "message_id": data.message_id
@@ -188,6 +234,40 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             return webhook_info.copy()
         raise Exception(f"No webhook configured for conversation {conversation_id}")
 
+    async def _send_webhook_request(self,
+                                    method: str,
+                                    webhook_url: str,
+                                    url: str,
+                                    build_request_kwargs: Callable[[], Dict[str, Any]]) -> Any:
+        """Send a request to a webhook within its rate limit bucket
+
+        Requests rejected with 429 are retried after the period
+        that Discord asked us to wait.
+
+        Args:
+            method: HTTP method of the session to use
+            webhook_url: Webhook URL (rate limit bucket key)
+            url: Request URL
+            build_request_kwargs: Callable building request arguments for each attempt
+
+        Returns:
+            Any: API response
+        """
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            async with self.webhook_rate_limiter.limit(webhook_url):
+                response = await getattr(self.session, method)(url, **build_request_kwargs())
+                self.webhook_rate_limiter.update(webhook_url, response)
+
+            # The last response is kept readable for the error message
+            if response.status != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                break
+
+            logging.warning(f"Webhook request was rate limited, retrying")
+            response.release()
+
+        await self._check_api_response(response)
+        return response
+
     async def _check_api_response(self, response: Any) -> None:
         """Check the API response for errors"""
         if response.status >= 400:
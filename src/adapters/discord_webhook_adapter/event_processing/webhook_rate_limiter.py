@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import time
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+class WebhookRateLimiter:
+    """Rate limiter that follows Discord's per-webhook rate limit headers"""
+
+    def __init__(self):
+        """Initialize the webhook rate limiter"""
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self.remaining: Dict[str, int] = {}
+        self.reset_at: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def limit(self, webhook_url: str) -> AsyncIterator[None]:
+        """Wait for the webhook's rate limit bucket and hold it for one request
+
+        Requests to the same webhook are executed one by one in the order
+        they arrived, while requests to different webhooks do not block each other.
+
+        Args:
+            webhook_url: Webhook URL
+        """
+        if webhook_url not in self.locks:
+            self.locks[webhook_url] = asyncio.Lock()
+
+        async with self.locks[webhook_url]:
+            wait_time = self.get_wait_time(webhook_url)
+
+            if wait_time > 0:
+                logging.debug(f"Webhook rate limiting: waiting {wait_time:.2f} seconds")
+                await asyncio.sleep(wait_time)
+
+            yield
+
+    def get_wait_time(self, webhook_url: str) -> float:
+        """Get the wait time before making a request to a webhook
+
+        Args:
+            webhook_url: Webhook URL
+
+        Returns:
+            Wait time in seconds
+        """
+        if self.remaining.get(webhook_url, 1) > 0:
+            return 0
+
+        return max(0, self.reset_at.get(webhook_url, 0) - time.monotonic())
+
+    def update(self, webhook_url: str, response: Any) -> None:
+        """Update the webhook's bucket from the response headers
+
+        Args:
+            webhook_url: Webhook URL
+            response: aiohttp response
+        """
+        try:
+            headers = response.headers
+
+            if response.status == 429:
+                retry_after = float(headers.get("Retry-After", 1))
+                self.remaining[webhook_url] = 0
+                self.reset_at[webhook_url] = time.monotonic() + retry_after
+                return
+
+            remaining = headers.get("X-RateLimit-Remaining", None)
+            reset_after = headers.get("X-RateLimit-Reset-After", None)
+
+            if remaining is None or reset_after is None:
+                return
+
+            self.remaining[webhook_url] = int(remaining)
+            self.reset_at[webhook_url] = time.monotonic() + float(reset_after)
+        except (AttributeError, TypeError, ValueError) as e:
+            logging.debug(f"Could not parse webhook rate limit headers: {e}")
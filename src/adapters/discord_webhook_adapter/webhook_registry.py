@@ -0,0 +1,152 @@
+import asyncio
+import json
+import logging
+import os
+
+from typing import Any, Dict, Optional, Set
+from src.core.utils.config import Config
+
+class WebhookRegistry:
+    """Persistent registry of webhooks known to the adapter"""
+
+    def __init__(self, config: Config):
+        """Initialize the webhook registry
+
+        Args:
+            config: Configuration instance
+        """
+        self.registry_path = config.get_setting(
+            "adapter",
+            "webhook_registry_path",
+            default="cache/discord_webhook_adapter/webhooks.json"
+        )
+        self.webhooks: Dict[str, Dict[str, Any]] = {}
+        self.validated: Set[str] = set()
+
+    async def load(self) -> None:
+        """Load webhooks saved by the previous runs of the adapter
+
+        Loaded webhooks are not validated, they are checked
+        on the first use of each conversation instead.
+        """
+        if not self.registry_path or not os.path.exists(self.registry_path):
+            return
+
+        try:
+            loop = asyncio.get_event_loop()
+            saved_webhooks = await loop.run_in_executor(None, self._read_registry)
+
+            for conversation_id, webhook in saved_webhooks.items():
+                if conversation_id not in self.webhooks:
+                    self.webhooks[conversation_id] = {
+                        "url": webhook["url"],
+                        "name": webhook["name"],
+                        "bot_token": None
+                    }
+
+            logging.info(f"Loaded {len(saved_webhooks)} webhooks from {self.registry_path}")
+        except Exception as e:
+            logging.error(f"Error loading webhook registry: {e}", exc_info=True)
+
+    async def save(self) -> None:
+        """Save known webhooks to the registry file
+
+        Bot tokens are never written to the file.
+        """
+        if not self.registry_path:
+            return
+
+        try:
+            webhooks = {
+                conversation_id: {"url": webhook["url"], "name": webhook["name"]}
+                for conversation_id, webhook in self.webhooks.items()
+            }
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, lambda: self._write_registry(webhooks))
+        except Exception as e:
+            logging.error(f"Error saving webhook registry: {e}", exc_info=True)
+
+    def get(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Get the webhook of a conversation
+
+        Args:
+            conversation_id: Conversation ID
+
+        Returns:
+            Webhook info or None if not found
+        """
+        return self.webhooks.get(conversation_id, None)
+
+    def add(self,
+            conversation_id: str,
+            webhook_info: Dict[str, Any],
+            validated: bool = True) -> None:
+        """Add or replace the webhook of a conversation
+
+        Args:
+            conversation_id: Conversation ID
+            webhook_info: Webhook info
+            validated: Whether the webhook is known to exist
+        """
+        self.webhooks[conversation_id] = webhook_info
+
+        if validated:
+            self.validated.add(conversation_id)
+        else:
+            self.validated.discard(conversation_id)
+
+    def remove(self, conversation_id: str) -> None:
+        """Remove the webhook of a conversation
+
+        Args:
+            conversation_id: Conversation ID
+        """
+        self.webhooks.pop(conversation_id, None)
+        self.validated.discard(conversation_id)
+
+    def is_validated(self, conversation_id: str) -> bool:
+        """Check whether the webhook of a conversation was validated
+
+        Args:
+            conversation_id: Conversation ID
+
+        Returns:
+            True if the webhook was validated, False otherwise
+        """
+        return conversation_id in self.validated
+
+    def mark_validated(self, conversation_id: str) -> None:
+        """Mark the webhook of a conversation as validated
+
+        Args:
+            conversation_id: Conversation ID
+        """
+        if conversation_id in self.webhooks:
+            self.validated.add(conversation_id)
+
+    def _read_registry(self) -> Dict[str, Dict[str, Any]]:
+        """Read the registry file
+
+        Returns:
+            Saved webhooks by conversation ID
+        """
+        with open(self.registry_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write_registry(self, webhooks: Dict[str, Dict[str, Any]]) -> None:
+        """Write the registry file atomically
+
+        Webhook URLs contain tokens, so the file is only readable by its owner.
+
+        Args:
+            webhooks: Webhooks to save by conversation ID
+        """
+        registry_dir = os.path.dirname(self.registry_path)
+        if registry_dir:
+            os.makedirs(registry_dir, exist_ok=True)
+
+        temp_path = f"{self.registry_path}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(webhooks, file, indent=2)
+        os.replace(temp_path, self.registry_path)
@@ -5,6 +5,7 @@ from slack_sdk import version as slack_sdk_version
 from typing import Any, Optional
 
 from src.adapters.slack_adapter.conversation.manager import Manager
+from src.adapters.slack_adapter.event_processing.gap_backfiller import GapBackfiller
 from src.adapters.slack_adapter.event_processing.incoming_event_processor import IncomingEventProcessor
 from src.adapters.slack_adapter.event_processing.incoming_file_processor import IncomingFileProcessor
 from src.adapters.slack_adapter.event_processing.outgoing_event_processor import OutgoingEventProcessor
@@ -38,12 +39,14 @@ class Adapter(BaseAdapter):
         """
         if event.get("type") == "file_share":
             await self.file_processor.schedule_file_processing(event["event"])
+        elif event.get("type") in ("file_shared", "file_change"):
+            self.file_processor.handle_file_event(event["event"])
         else:
             await super().process_incoming_event(event)
 
     async def _setup_client(self) -> None:
         """Connect to client"""
-        self.client = Client(self.config, self.process_incoming_event)
+        self.client = Client(self.config, self.dispatch_incoming_event, self._backfill_gap)
         self.connected = await self.client.connect()
 
     async def _get_adapter_info(self) -> None:
@@ -84,6 +87,25 @@ class Adapter(BaseAdapter):
         """Perform post setup tasks"""
         pass
 
+    async def _backfill_gap(self, oldest: str) -> None:
+        """Process the messages missed while Socket Mode was reconnecting
+
+        Args:
+            oldest: Slack timestamp of the last event received before the reconnect
+        """
+        if not self.incoming_events_processor:
+            return
+
+        missed_events = await GapBackfiller(
+            self.config, self.client.web_client, self.conversation_manager
+        ).fetch_missed_messages(oldest)
+        logging.info(f"Backfilling {len(missed_events)} missed Slack messages")
+
+        for event in missed_events:
+            message = event["event"]
+            if self.client.remember_event(self.client.get_message_key(message["channel"], message["ts"])):
+                await self.dispatch_incoming_event(event)
+
     async def _connection_exists(self) -> Optional[Any]:
         """Check connection
 
@@ -101,6 +123,8 @@ class Adapter(BaseAdapter):
 
     async def _teardown_client(self) -> None:
         """Teardown client"""
+        if self.file_processor:
+            self.file_processor.close()
         if self.client:
             await self.client.disconnect()
             self.client = None
@@ -2,26 +2,35 @@ import asyncio
 import logging
 import time
 
-from typing import Any, Callable
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.socket_mode.aiohttp import SocketModeClient
 from slack_sdk.socket_mode.response import SocketModeResponse
 
+from src.adapters.slack_adapter.event_processing.gap_backfiller import NEW_MESSAGE_SUBTYPES
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.config import Config
 
 class Client:
     """Slack client implementation using Socket Mode with a single token"""
+    MAX_REMEMBERED_EVENTS = 10000  # Event IDs and messages kept to drop redeliveries
 
-    def __init__(self, config: Config, process_event: Callable):
+    def __init__(self,
+                 config: Config,
+                 process_event: Callable,
+                 backfill_gap: Optional[Callable] = None):
         """Initialize the Slack client
 
         Args:
             config (Config): The configuration for the Slack client
             process_event (Callable): The function to process events
+            backfill_gap (Optional[Callable]): The function that processes the messages
+                missed during a reconnect, called with the last seen Slack timestamp
         """
         self.config = config
         self.process_event = process_event
+        self.backfill_gap = backfill_gap
         self.rate_limiter = RateLimiter.get_instance(self.config)
 
         self.web_client = None
@@ -30,6 +39,11 @@ class Client:
         self.running = False
         self._connection_task = None
         self._connection_start_time = None
+        self._backfill_task = None
+        self._hello_received = False
+
+        self.seen_events: OrderedDict = OrderedDict()
+        self.last_event_ts = None
 
     async def connect(self) -> bool:
         """Connect to Slack using Socket Mode
@@ -54,6 +68,7 @@ class Client:
                 return False
 
             self.socket_client = SocketModeClient(app_token=app_token, web_client=self.web_client)
+            self.socket_client.message_listeners.append(self._handle_socket_message)
             self.socket_client.socket_mode_request_listeners.append(self._handle_slack_event)
 
             return await self._setup_connect_task()
@@ -71,6 +86,9 @@ class Client:
         """Disconnect from Slack"""
         self.running = False
 
+        if self._backfill_task and not self._backfill_task.done():
+            self._backfill_task.cancel()
+
         await self._cancel_connect_task()
         await self._disconnect_socket_client()
 
@@ -79,6 +97,38 @@ class Client:
 
         logging.info("Disconnected from Slack")
 
+    def remember_event(self, key: str) -> bool:
+        """Remember an event ID or message key in the deduplication window
+
+        Args:
+            key: Slack event ID or message key
+
+        Returns:
+            bool: True if the key was not seen before, False otherwise
+        """
+        if key in self.seen_events:
+            self.seen_events.move_to_end(key)
+            return False
+
+        self.seen_events[key] = True
+        if len(self.seen_events) > self.MAX_REMEMBERED_EVENTS:
+            self.seen_events.popitem(last=False)
+
+        return True
+
+    @staticmethod
+    def get_message_key(channel_id: str, ts: str) -> str:
+        """Get the deduplication key of a message
+
+        Args:
+            channel_id: Slack channel ID
+            ts: Slack timestamp of the message
+
+        Returns:
+            str: Message key
+        """
+        return f"message/{channel_id}/{ts}"
+
     async def _setup_connect_task(self) -> bool:
         """Setup the connect task
 
@@ -92,7 +142,11 @@ class Client:
 
             self.running = True
             self._connection_task = connect_task
-            self._connection_start_time = time.time()
+
+            # Only the first connection drops older events, events redelivered
+            # after a reconnect are deduplicated instead
+            if self._connection_start_time is None:
+                self._connection_start_time = time.time()
 
             return True
         except asyncio.TimeoutError:
@@ -122,23 +176,79 @@ class Client:
         except asyncio.TimeoutError:
             pass
 
+    async def _handle_socket_message(self, _: Any, message: Dict[str, Any], __: str) -> None:
+        """Handle raw Socket Mode messages
+
+        Every Socket Mode connection starts with a hello message, so a hello
+        after the first one means that the connection was re-established,
+        either by reconnect or by the SDK itself, and events may have been missed.
+
+        Args:
+            _: The SocketModeClient that received the message
+            message: The parsed message
+            __: The raw message
+        """
+        if message.get("type", None) != "hello":
+            return
+
+        if not self._hello_received:
+            self._hello_received = True
+            return
+
+        oldest = self.last_event_ts or self._connection_start_time
+        if not self.backfill_gap or not oldest:
+            return
+        if self._backfill_task and not self._backfill_task.done():
+            return
+
+        self._backfill_task = asyncio.create_task(self._backfill(f"{oldest:.6f}"))
+
+    async def _backfill(self, oldest: str) -> None:
+        """Process the messages missed during a reconnect
+
+        Args:
+            oldest: Slack timestamp of the last event received before the reconnect
+        """
+        try:
+            logging.info(f"Backfilling Slack messages sent after {oldest}")
+            await self.backfill_gap(oldest)
+        except Exception as e:
+            logging.error(f"Error backfilling missed Slack events: {e}", exc_info=True)
+
     async def _handle_slack_event(self, _: Any, request: Any) -> None:
         """Handle incoming Slack events
 
+        The request is acknowledged right away, so that Slack does not
+        redeliver it while the event waits for a place in the processing queue.
+        Redelivered events and already backfilled messages are dropped.
+
         Args:
             _: The SocketModeClient that received the event
             req: The event request object
         """
-        try:
-            response = SocketModeResponse(envelope_id=request.envelope_id)
-            await self.socket_client.send_socket_mode_response(response)
+        ack = asyncio.ensure_future(
+            self.socket_client.send_socket_mode_response(
+                SocketModeResponse(envelope_id=request.envelope_id)
+            )
+        )
 
+        try:
             payload = request.payload
             event = payload.get("event", {})
             event.update({"team": payload.get("team_id", "")})
 
-            if float(event.get("event_ts", 0)) < (self._connection_start_time):
+            event_id = payload.get("event_id", None)
+            if event_id and not self.remember_event(event_id):
+                logging.info(
+                    f"Dropping redelivered Slack event {event_id} "
+                    f"(retry attempt {getattr(request, 'retry_attempt', None)})"
+                )
+                return
+
+            event_ts = float(event.get("event_ts", 0))
+            if event_ts < (self._connection_start_time):
                 return
+            self.last_event_ts = max(self.last_event_ts or 0, event_ts)
 
             event_type = event.get("type", None)
             event_subtype = event.get("subtype", None)
@@ -146,9 +256,16 @@ class Client:
             if not event_type:
                 return
 
+            if event_type == "message" and event_subtype in NEW_MESSAGE_SUBTYPES:
+                message_key = self.get_message_key(event.get("channel", ""), event.get("ts", ""))
+                if not self.remember_event(message_key):
+                    return
+
             await self.process_event({
                 "type": event_subtype or event_type,
                 "event": event
             })
         except Exception as e:
             logging.error(f"Error handling Slack event: {e}")
+        finally:
+            await ack
@@ -45,7 +45,12 @@ class Manager(BaseManager):
         else:
             new_name = channel.get("name", "")
 
-        for conversation in self.conversations.values():
+        if update_type == "team_rename":
+            conversation_ids = self.index.get_server_conversations(team_id)
+        else:
+            conversation_ids = self.index.get_platform_conversations(platform_conversation_id)
+
+        for conversation in self._get_indexed_conversations(conversation_ids):
             if update_type == "team_rename":
                 updated = self._update_server_metadata(conversation, team_id, new_name)
             else:
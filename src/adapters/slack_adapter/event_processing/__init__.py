@@ -5,11 +5,15 @@ from src.adapters.slack_adapter.event_processing.incoming_file_processor import
 from src.adapters.slack_adapter.event_processing.history_fetcher import HistoryFetcher
 from src.adapters.slack_adapter.event_processing.outgoing_event_processor import OutgoingEventProcessor
 from src.adapters.slack_adapter.event_processing.user_info_preprocessor import UserInfoPreprocessor
+from src.adapters.slack_adapter.event_processing.gap_backfiller import GapBackfiller
+from src.adapters.slack_adapter.event_processing.file_readiness_coordinator import FileReadinessCoordinator
 
 __all__ = [
     "IncomingEventProcessor",
     "IncomingFileProcessor",
     "HistoryFetcher",
     "OutgoingEventProcessor",
-    "UserInfoPreprocessor"
+    "UserInfoPreprocessor",
+    "GapBackfiller",
+    "FileReadinessCoordinator"
 ]
@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 import base64
 import logging
@@ -14,6 +13,7 @@ from src.core.utils.attachment_loading import (
     save_metadata_file
 )
 from src.core.utils.config import Config
+from src.core.utils.http_session_pool import HttpSessionPool
 
 class Downloader():
     """Handles efficient file downloads from Slack"""
@@ -30,6 +30,7 @@ class Downloader():
         self.client = client
         self.content_required = content_required
         self.rate_limiter = RateLimiter.get_instance(config)
+        self.http_session_pool = HttpSessionPool.get_instance(config)
         self.download_dir = self.config.get_setting("attachments", "storage_dir")
         self.max_file_size = self.config.get_setting("attachments", "max_file_size_mb") * 1024 * 1024
 
@@ -45,53 +46,61 @@ class Downloader():
         if not message or "files" not in message or not message["files"]:
             return []
 
-        metadata = []
-
-        for file in message["files"]:
-            file_extension = None
-            if "." in file.get("name", ""):
-                file_extension = file["name"].split(".")[-1].lower()
-
-            attachment_metadata = {
-                "attachment_id": file["id"],
-                "attachment_type": get_attachment_type_by_extension(file_extension),
-                "filename": self._get_local_filename(file["id"], file_extension),
-                "size": int(file["size"]),
-                "content_type": file["mimetype"],
-                "content": None,
-                "url": file.get("url_private", None),
-                "created_at": datetime.now(),
-                "processable": False
-            }
-
-            if attachment_metadata["size"] > self.max_file_size:
-                logging.warning(f"Skipping download for {file['id']} because it is too large")
-            else:
-                attachment_dir = os.path.join(
-                    self.download_dir,
-                    attachment_metadata["attachment_type"],
-                    attachment_metadata["attachment_id"]
-                )
-                local_file_path = os.path.join(
-                    attachment_dir,
-                    attachment_metadata["filename"]
-                )
-
-                if await self._download_file(attachment_dir, local_file_path, attachment_metadata):
-                    attachment_metadata["processable"] = True
-                    save_metadata_file(attachment_metadata, attachment_dir)
-
-                    if self.content_required:
-                        try:
-                            with open(local_file_path, "rb") as f:
-                                file_content = f.read()
-                                attachment_metadata["content"] = base64.b64encode(file_content).decode("utf-8")
-                        except Exception as e:
-                            logging.error(f"Error reading file {local_file_path}: {e}")
-
-            metadata.append(attachment_metadata)
-
-        return metadata
+        return list(await asyncio.gather(*[
+            self._process_file(file) for file in message["files"]
+        ]))
+
+    async def _process_file(self, file: Dict[str, Any]) -> Dict[str, Any]:
+        """Download a single file of a Slack message
+
+        Args:
+            file: Slack file object
+
+        Returns:
+            Dictionary with attachment metadata
+        """
+        file_extension = None
+        if "." in file.get("name", ""):
+            file_extension = file["name"].split(".")[-1].lower()
+
+        attachment_metadata = {
+            "attachment_id": file["id"],
+            "attachment_type": get_attachment_type_by_extension(file_extension),
+            "filename": self._get_local_filename(file["id"], file_extension),
+            "size": int(file["size"]),
+            "content_type": file["mimetype"],
+            "content": None,
+            "url": file.get("url_private", None),
+            "created_at": datetime.now(),
+            "processable": False
+        }
+
+        if attachment_metadata["size"] > self.max_file_size:
+            logging.warning(f"Skipping download for {file['id']} because it is too large")
+        else:
+            attachment_dir = os.path.join(
+                self.download_dir,
+                attachment_metadata["attachment_type"],
+                attachment_metadata["attachment_id"]
+            )
+            local_file_path = os.path.join(
+                attachment_dir,
+                attachment_metadata["filename"]
+            )
+
+            if await self._download_file(attachment_dir, local_file_path, attachment_metadata):
+                attachment_metadata["processable"] = True
+                save_metadata_file(attachment_metadata, attachment_dir)
+
+                if self.content_required:
+                    try:
+                        with open(local_file_path, "rb") as f:
+                            file_content = f.read()
+                            attachment_metadata["content"] = base64.b64encode(file_content).decode("utf-8")
+                    except Exception as e:
+                        logging.error(f"Error reading file {local_file_path}: {e}")
+
+        return attachment_metadata
 
     def _get_local_filename(self,
                             attachment_id: str,
@@ -129,13 +138,15 @@ class Downloader():
         if not os.path.exists(local_file_path):
             try:
                 create_attachment_dir(attachment_dir)
+
                 await self.rate_limiter.limit_request("download")
 
                 response = await self.client.files_info(file=attachment["attachment_id"])
                 download_url = response["file"]["url_private"]
                 headers = {"Authorization": f"Bearer {self.client.token}"}
 
-                async with aiohttp.ClientSession() as session:
+                async with self.http_session_pool.limit(download_url):
+                    session = self.http_session_pool.get_session()
                     async with session.get(download_url, headers=headers) as response:
                         response.raise_for_status()
                         with open(local_file_path, "wb") as f:
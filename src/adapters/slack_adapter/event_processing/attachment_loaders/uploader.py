@@ -1,4 +1,3 @@
-import base64
 import logging
 import os
 import shutil
@@ -7,9 +6,9 @@ from typing import Any, List
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.attachment_loading import (
     create_attachment_dir,
-    get_attachment_type_by_extension,
-    move_attachment
+    get_attachment_type_by_extension
 )
+from src.core.utils.attachment_uploading import AttachmentUpload
 from src.core.utils.config import Config
 
 class Uploader():
@@ -49,24 +48,22 @@ class Uploader():
         """
         for attachment in data.attachments:
             try:
-                try:
-                    file_content = base64.b64decode(attachment.content)
-                except Exception as e:
-                    logging.error(f"Failed to decode base64 content: {e}")
-                    continue
+                upload = AttachmentUpload(
+                    attachment.content,
+                    os.path.join(self.temp_dir, attachment.file_name),
+                    self.max_file_size
+                )
 
-                if len(file_content) > self.max_file_size:
-                    logging.error(f"Decoded content exceeds size limit: {len(file_content)/1024/1024:.2f} MB")
+                try:
+                    await upload.persist_async()
+                except ValueError as e:
+                    logging.error(str(e))
                     continue
 
-                temp_path = os.path.join(self.temp_dir, attachment.file_name)
-                with open(temp_path, "wb") as f:
-                    f.write(file_content)
-
                 await self.rate_limiter.limit_request("message", data.conversation_id)
 
                 upload_params = {
-                    "file": temp_path,
+                    "file": upload.file_path,
                     "channel": conversation_info.platform_conversation_id.split("/")[-1]
                 }
                 if data.thread_id:
@@ -76,18 +73,18 @@ class Uploader():
                 file_id = response.get("file", {}).get("id", None)
 
                 if file_id:
-                    self._clean_up_uploaded_file(temp_path, file_id)
+                    self._clean_up_uploaded_file(upload, file_id)
             except Exception as e:
                 logging.error(f"Error uploading file: {str(e)}", exc_info=True)
 
-    def _clean_up_uploaded_file(self, old_path: str, slack_file_id: str) -> None:
-        """Clean up a file after it has been uploaded to Slack
+    def _clean_up_uploaded_file(self, upload: AttachmentUpload, slack_file_id: str) -> None:
+        """Move a file into the attachment store after it has been uploaded to Slack
 
         Args:
-            old_path: Path to the old file
+            upload: Attachment upload
             slack_file_id: Slack file ID of the uploaded file
         """
-        file_extension = old_path.split(".")
+        file_extension = upload.file_path.split(".")
 
         if len(file_extension) > 1:
             file_extension = file_extension[-1]
@@ -104,4 +101,4 @@ class Uploader():
         )
 
         create_attachment_dir(attachment_dir)
-        move_attachment(old_path, file_path)
+        upload.move_to(file_path)
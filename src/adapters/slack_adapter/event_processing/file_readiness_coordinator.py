@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import random
+
+from typing import Any, Awaitable, Callable, Dict, Set
+
+class FileReadinessCoordinator:
+    """Waits until all files of a Slack message are ready and releases the message once
+
+    Files that are ready according to the message itself are not checked.
+    The others are checked as soon as a file_shared or file_change event
+    reports them, and otherwise by polling with a jittered backoff. The
+    message is released when all of its files are ready or the timeout
+    expires, whichever comes first.
+    """
+    INITIAL_DELAY = 1         # in seconds
+    MEDIA_INITIAL_DELAY = 5   # in seconds
+    BACKOFF_FACTOR = 2
+    MAX_DELAY = 30            # in seconds
+    TIMEOUT = 60              # in seconds
+    MEDIA_TIMEOUT = 180       # in seconds
+    JITTER = 0.25             # Fraction of the delay added or subtracted at random
+    MEDIA_SUBTYPES = ["slack_audio", "slack_video"]
+
+    def __init__(self,
+                 event: Dict[str, Any],
+                 get_file_info: Callable[[str], Awaitable[Dict[str, Any]]],
+                 is_file_ready: Callable[[Dict[str, Any]], bool],
+                 release: Callable[[Dict[str, Any]], Awaitable[None]]):
+        """Initialize the file readiness coordinator
+
+        Args:
+            event: Slack message event with files
+            get_file_info: Coroutine function that fetches the info of a file
+            is_file_ready: Function that checks whether a file is ready
+            release: Coroutine function that processes the message
+        """
+        self.event = event
+        self.get_file_info = get_file_info
+        self.is_file_ready = is_file_ready
+        self.release = release
+
+        files = [file for file in event.get("files", []) if file.get("id", None)]
+        self.media = (
+            event.get("subtype", None) in self.MEDIA_SUBTYPES or
+            any(file.get("subtype", None) in self.MEDIA_SUBTYPES for file in files)
+        )
+        self.pending: Set[str] = {file["id"] for file in files if not self.is_file_ready(file)}
+        self.notified: Set[str] = set()
+        self.task = None
+        self._wakeup = asyncio.Event()
+
+    def start(self) -> asyncio.Task:
+        """Start waiting for the files
+
+        Returns:
+            Task that releases the message
+        """
+        self.task = asyncio.create_task(self._run())
+        return self.task
+
+    def notify(self, file_id: str) -> None:
+        """Check a file right away because the platform reported a change
+
+        Args:
+            file_id: File ID
+        """
+        if file_id in self.pending:
+            self.notified.add(file_id)
+            self._wakeup.set()
+
+    def cancel(self) -> None:
+        """Stop waiting without releasing the message"""
+        if self.task and not self.task.done():
+            self.task.cancel()
+
+    async def _run(self) -> None:
+        """Wait until all files are ready or the timeout expires, then release the message"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (self.MEDIA_TIMEOUT if self.media else self.TIMEOUT)
+        delay = self.MEDIA_INITIAL_DELAY if self.media else self.INITIAL_DELAY
+
+        while self.pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logging.warning(
+                    f"Files {sorted(self.pending)} not ready after the timeout, processing anyway"
+                )
+                break
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=min(self._jitter(delay), remaining))
+                files_to_check = self.notified & self.pending
+            except asyncio.TimeoutError:
+                files_to_check = set(self.pending)
+                delay = min(self.MAX_DELAY, delay * self.BACKOFF_FACTOR)
+
+            self._wakeup.clear()
+            self.notified.clear()
+
+            for file_id in files_to_check:
+                try:
+                    if self.is_file_ready(await self.get_file_info(file_id)):
+                        self.pending.discard(file_id)
+                except Exception as e:
+                    logging.error(f"Error checking file {file_id}: {e}", exc_info=True)
+
+        try:
+            await self.release(self.event)
+        except Exception as e:
+            logging.error(f"Error processing message with files: {e}", exc_info=True)
+
+    def _jitter(self, delay: float) -> float:
+        """Spread a polling delay so that messages do not poll in lockstep
+
+        Args:
+            delay: Polling delay in seconds
+
+        Returns:
+            Jittered delay in seconds
+        """
+        return delay * random.uniform(1 - self.JITTER, 1 + self.JITTER)
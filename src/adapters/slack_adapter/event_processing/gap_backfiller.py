@@ -0,0 +1,129 @@
+import logging
+
+from typing import Any, Dict, List
+
+from src.adapters.slack_adapter.conversation.manager import Manager
+
+from src.core.rate_limiter.rate_limiter import RateLimiter
+from src.core.utils.config import Config
+
+# Message subtypes that are delivered as new messages
+NEW_MESSAGE_SUBTYPES = (None, "file_share", "thread_broadcast")
+
+class GapBackfiller:
+    """Fetches the messages that were sent while Socket Mode was reconnecting
+
+    Only conversations known to the adapter are backfilled, and only the
+    messages sent after the last event received before the reconnect are
+    fetched. Unknown conversations are picked up with their history on
+    their next message.
+    """
+
+    def __init__(self, config: Config, client: Any, conversation_manager: Manager):
+        """Initialize the gap backfiller
+
+        Args:
+            config: Config instance
+            client: Slack web client
+            conversation_manager: Conversation manager instance
+        """
+        self.config = config
+        self.client = client
+        self.conversation_manager = conversation_manager
+        self.rate_limiter = RateLimiter.get_instance(self.config)
+        self.max_messages = self.config.get_setting("adapter", "max_history_limit", default=100)
+        self.max_iterations = self.config.get_setting("adapter", "max_pagination_iterations", default=5)
+
+    async def fetch_missed_messages(self, oldest: str) -> List[Dict[str, Any]]:
+        """Fetch the messages sent after the given timestamp in every known conversation
+
+        Args:
+            oldest: Slack timestamp of the last event received before the reconnect
+
+        Returns:
+            Incoming events of the missed messages, ordered by timestamp
+        """
+        missed_events = []
+
+        for conversation_info in list(self.conversation_manager.conversations.values()):
+            if not conversation_info.messages or "/" not in (conversation_info.platform_conversation_id or ""):
+                continue
+
+            team_id, channel_id = conversation_info.platform_conversation_id.split("/", 1)
+
+            try:
+                for message in await self._fetch_messages_after(
+                    conversation_info.conversation_id, channel_id, oldest
+                ):
+                    if message.get("ts", "") in conversation_info.messages:
+                        continue
+
+                    subtype = message.get("subtype", None)
+                    if subtype not in NEW_MESSAGE_SUBTYPES:
+                        continue
+
+                    message.update({"channel": channel_id, "team": team_id})
+                    missed_events.append({"type": subtype or "message", "event": message})
+            except Exception as e:
+                logging.error(
+                    f"Error backfilling conversation {conversation_info.conversation_id}: {e}",
+                    exc_info=True
+                )
+
+        return sorted(missed_events, key=lambda event: float(event["event"].get("ts", 0)))
+
+    async def _fetch_messages_after(self,
+                                    conversation_id: str,
+                                    channel_id: str,
+                                    oldest: str) -> List[Dict[str, Any]]:
+        """Fetch the oldest messages of a channel that are newer than the given timestamp
+
+        conversations.history returns the newest messages first and pages
+        towards older ones, so all pages of the gap are requested and only
+        the oldest max_messages of them are kept, instead of the newest.
+        At most max_iterations pages are requested. A longer gap cannot be
+        continued later, so its newest max_messages (the first page) are
+        kept and its oldest part is dropped.
+
+        Args:
+            conversation_id: Conversation ID
+            channel_id: Slack channel ID
+            oldest: Slack timestamp to fetch the messages after
+
+        Returns:
+            List of Slack messages, newest first
+        """
+        params = {
+            "channel": channel_id,
+            "oldest": oldest,
+            "inclusive": False,
+            "limit": self.max_messages
+        }
+        messages = []
+        newest_messages = None
+
+        for _ in range(self.max_iterations):
+            await self.rate_limiter.limit_request("fetch_history", conversation_id)
+
+            response = await self.client.conversations_history(**params)
+            if not response.get("ok", False):
+                logging.error(f"Error fetching missed messages: {response.get('error')}")
+                break
+
+            page = response.get("messages", [])
+            if newest_messages is None:
+                newest_messages = page[:self.max_messages]
+            messages = (messages + page)[-self.max_messages:]
+            cursor = (response.get("response_metadata", None) or {}).get("next_cursor", None)
+
+            if not response.get("has_more", False) or not cursor:
+                break
+            params["cursor"] = cursor
+        else:
+            logging.warning(
+                f"Missed messages of conversation {conversation_id} exceed "
+                f"{self.max_iterations} pages, only the newest {self.max_messages} are backfilled"
+            )
+            messages = newest_messages or []
+
+        return messages
@@ -61,6 +61,25 @@ class IncomingEventProcessor(BaseIncomingEventProcessor):
             SlackIncomingEventType.CHANNEL_RENAME: self._handle_rename
         }
 
+    def get_conversation_key(self, event: Any) -> Optional[str]:
+        """Get the key of the conversation an event belongs to
+
+        Args:
+            event: Slack event object
+
+        Returns:
+            Channel ID, or None for events outside of channels
+        """
+        slack_event = event.get("event", None)
+
+        if not isinstance(slack_event, dict):
+            return None
+
+        channel = slack_event.get("channel", None) or (slack_event.get("item", None) or {}).get("channel", None)
+        if isinstance(channel, dict):  # channel_rename events contain the renamed channel
+            return channel.get("id", None)
+        return channel
+
     async def _handle_message(self, event: Any) -> List[Dict[str, Any]]:
         """Handle a new message event from Slack
 
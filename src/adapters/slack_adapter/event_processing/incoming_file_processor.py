@@ -1,8 +1,6 @@
-import asyncio
-import logging
-import time
-
 from typing import Any, Dict
+
+from src.adapters.slack_adapter.event_processing.file_readiness_coordinator import FileReadinessCoordinator
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.config import Config
 
@@ -19,80 +17,65 @@ class IncomingFileProcessor:
         self.client = client
         self.adapter = adapter
         self.rate_limiter = RateLimiter.get_instance(config)
-        self.status_cache = {}
-        self.processing_tasks = {}
+        self.coordinators: Dict[str, FileReadinessCoordinator] = {}
+        self.file_coordinators: Dict[str, FileReadinessCoordinator] = {}
 
     async def schedule_file_processing(self, event: Dict[str, Any]) -> None:
-        """Schedule a file for processing with appropriate strategy
+        """Hold a message with files until all of its files are ready
 
         Args:
             event: Slack event object
         """
-        slack_media = event.get("subtype", None) in ["slack_audio", "slack_video"]
-
-        for file in event.get("files", []):
-            file_id = file.get("id", None)
-
-            if not file_id or file_id in self.processing_tasks:
-                return
-
-            task = asyncio.create_task(
-                self._process_file_with_retries(
-                    file_id,
-                    file,
-                    event,
-                    initial_delay=5 if slack_media else 1,
-                    max_retries=10 if slack_media else 5,
-                    backoff_factor=1.5 if slack_media else 2
-                )
-            )
-            task.add_done_callback(
-                lambda _: self.processing_tasks.pop(file_id, None)
-            )
-            self.processing_tasks[file_id] = (task, event)
-
-    async def _process_file_with_retries(self,
-                                         file_id,
-                                         file_info,
-                                         event,
-                                         initial_delay,
-                                         max_retries,
-                                         backoff_factor) -> None:
-        """Process a file with adaptive retries and rate limiting
+        message_key = f"{event.get('channel', '')}/{event.get('ts', '')}"
+
+        if message_key in self.coordinators:
+            return
+
+        coordinator = FileReadinessCoordinator(
+            event, self._get_file_status, self._is_file_ready, self._process_message
+        )
+        self.coordinators[message_key] = coordinator
+
+        for file_id in coordinator.pending:
+            self.file_coordinators[file_id] = coordinator
+
+        coordinator.start().add_done_callback(
+            lambda _: self._forget_coordinator(message_key, coordinator)
+        )
+
+    def handle_file_event(self, event: Dict[str, Any]) -> None:
+        """Check a file of a held message after a file_shared or file_change event
 
         Args:
-            file_id: File ID
-            file_info: File info
             event: Slack event object
-            initial_delay: Initial delay
-            max_retries: Maximum number of retries
-            backoff_factor: Backoff factor
         """
-        delay = initial_delay
+        file_id = event.get("file_id", None) or (event.get("file", None) or {}).get("id", None)
+        coordinator = self.file_coordinators.get(file_id, None)
 
-        for _ in range(max_retries):
-            try:
-                await asyncio.sleep(delay)
-                updated_info = await self._get_file_status(file_id)
+        if coordinator:
+            coordinator.notify(file_id)
 
-                if self._is_file_ready(updated_info):
-                    await self._process_file(file_id)
-                    return
+    def close(self) -> None:
+        """Stop waiting for files without processing the held messages"""
+        for coordinator in list(self.coordinators.values()):
+            coordinator.cancel()
 
-                delay = min(30, delay * backoff_factor)  # Cap at 30 seconds
-            except Exception as e:
-                logging.error(f"Error processing file {file_id}: {e}")
-                delay = min(30, delay * backoff_factor)
+    def _forget_coordinator(self, message_key: str, coordinator: FileReadinessCoordinator) -> None:
+        """Remove a finished coordinator and its files
 
-        logging.warning(f"File {file_id} not ready after {max_retries} attempts, processing anyway")
+        Args:
+            message_key: Channel and timestamp of the message
+            coordinator: Finished coordinator
+        """
+        if self.coordinators.get(message_key, None) is coordinator:
+            del self.coordinators[message_key]
 
-        try:
-            await self._process_file(file_id)
-        except Exception as e:
-            logging.error(f"Error processing file after max retries: {e}")
+        for file_id, file_coordinator in list(self.file_coordinators.items()):
+            if file_coordinator is coordinator:
+                del self.file_coordinators[file_id]
 
     async def _get_file_status(self, file_id: str) -> Dict[str, Any]:
-        """Get file status with rate limiting and caching
+        """Get file status with rate limiting
 
         Args:
             file_id: File ID
@@ -100,18 +83,10 @@ class IncomingFileProcessor:
         Returns:
             File info
         """
-        cache_entry = self.status_cache.get(file_id, {})
-        now = time.time()
-        if cache_entry and now - cache_entry["timestamp"] < 5:
-            return cache_entry["info"]
+        await self.rate_limiter.limit_request("files_info")
 
         response = await self.client.files_info(file=file_id)
-        self.status_cache[file_id] = {
-            "info": response["file"],
-            "timestamp": now
-        }
-
-        return self.status_cache[file_id]["info"]
+        return response["file"]
 
     def _is_file_ready(self, file_info: Dict[str, Any]) -> bool:
         """Check if a file is ready to download
@@ -144,18 +119,13 @@ class IncomingFileProcessor:
 
         return True
 
-    async def _process_file(self, file_id: str) -> None:
-        """Download file and process the message
+    async def _process_message(self, event: Dict[str, Any]) -> None:
+        """Process a message whose files are ready
 
         Args:
-            file_id: File ID
+            event: Slack event object
         """
-        _, event = self.processing_tasks[file_id]
-
-        await self.adapter.process_incoming_event({
+        await self.adapter.dispatch_incoming_event({
             "type": "message",
             "event": event
         })
-
-        if file_id in self.status_cache:
-            del self.status_cache[file_id]
@@ -9,6 +9,7 @@ from typing import Any, Optional
 from src.adapters.telegram_adapter.conversation.manager import Manager
 from src.adapters.telegram_adapter.event_processing.incoming_event_processor import IncomingEventProcessor
 from src.adapters.telegram_adapter.event_processing.outgoing_event_processor import OutgoingEventProcessor
+from src.adapters.telegram_adapter.event_processing.gap_backfiller import GapBackfiller
 from src.adapters.telegram_adapter.client import Client
 
 from src.core.adapter.base_adapter import BaseAdapter
@@ -28,10 +29,11 @@ class Adapter(BaseAdapter):
         """
         super().__init__(config, socketio_server)
         self.conversation_manager = Manager(config)
+        self._backfill_task: Optional[asyncio.Task] = None
 
     async def _setup_client(self) -> None:
         """Connect to client"""
-        self.client = Client(self.config, self.process_incoming_event)
+        self.client = Client(self.config, self.dispatch_incoming_event)
         self.connected = await self.client.connect()
 
     async def _get_adapter_info(self) -> None:
@@ -66,7 +68,52 @@ class Adapter(BaseAdapter):
 
     async def _perform_post_setup_tasks(self) -> None:
         """Perform post setup tasks"""
-        pass
+        self._start_backfill()
+
+    def _start_backfill(self) -> None:
+        """Backfill the missed messages in the background
+
+        Fetching the history of every recorded dialog can take a while,
+        so it must not delay the start or the connection monitoring.
+        """
+        if self._backfill_task and not self._backfill_task.done():
+            return
+        self._backfill_task = asyncio.create_task(self._run_backfill())
+
+    async def _run_backfill(self) -> None:
+        """Run the backfill of the missed messages and log its errors"""
+        try:
+            await self._backfill_gap()
+        except Exception as e:
+            logging.error(f"Error backfilling missed Telegram messages: {e}", exc_info=True)
+
+    async def _backfill_gap(self) -> None:
+        """Process the messages missed while the adapter was not receiving updates"""
+        if not self.incoming_events_processor:
+            return
+
+        missed_messages = await GapBackfiller(
+            self.config, self.client.client, self.client.dialog_state
+        ).fetch_missed_messages()
+        logging.info(f"Backfilling {len(missed_messages)} missed Telegram messages")
+
+        for event in missed_messages:
+            await self.dispatch_incoming_event(event)
+
+    async def process_incoming_event(self, event: Any) -> None:
+        """Process events from client
+
+        The message of a new message event is recorded in the dialog state
+        only after it is processed, so the gap backfill never skips messages
+        that were received or fetched but dropped before processing.
+
+        Args:
+            event: client's event object
+        """
+        await super().process_incoming_event(event)
+
+        if event.get("type", None) == "new_message":
+            self.client.record_message(event["event"])
 
     async def _connection_exists(self) -> Optional[Any]:
         """Check connection
@@ -78,11 +125,29 @@ class Adapter(BaseAdapter):
         return await self.client.client.get_me()
 
     async def _reconnect_with_client(self) -> None:
-        """Reconnect with client"""
-        pass
+        """Reconnect with client
+
+        Telethon reconnects by itself while it is running, so the client
+        is only connected again if it gave up, and the messages missed in
+        the meantime are then fetched.
+        """
+        try:
+            if not self.client.client.is_connected():
+                await self.client.client.connect()
+            self._start_backfill()
+        except Exception as e:
+            logging.error(f"Error reconnecting to Telegram: {e}", exc_info=True)
 
     async def _teardown_client(self) -> None:
         """Teardown client"""
+        if self._backfill_task and not self._backfill_task.done():
+            self._backfill_task.cancel()
+            try:
+                await self._backfill_task
+            except asyncio.CancelledError:
+                pass
+        self._backfill_task = None
+
         try:
             await self.client.disconnect()
             logging.info("Disconnected from Telegram")
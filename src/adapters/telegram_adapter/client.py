@@ -1,17 +1,22 @@
 import asyncio
 import logging
+import os
 import time
 
-from typing import Callable, Optional
-from telethon import TelegramClient, events
-from telethon.sessions import MemorySession
+from typing import Any, Callable, Optional
+from telethon import TelegramClient, events, types
+from telethon.sessions import MemorySession, Session, SQLiteSession
 
+from src.adapters.telegram_adapter.dialog_state import DialogState
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.config import Config
 
 class Client:
     """Handles Telegram connection using Telethon"""
 
+    MIGRATION_ACTIONS = (types.MessageActionChatMigrateTo, types.MessageActionChannelMigrateFrom)
+    DIALOG_STATE_SAVE_DELAY = 30  # in seconds
+
     def __init__(self, config: Config, event_callback: Callable):
         """Initialize the Telethon client
 
@@ -25,11 +30,14 @@ class Client:
         self.client: Optional[TelegramClient] = None
         self.connected = False
         self.me = None
+        self.dialog_state = DialogState(self.config)
+        self._save_dialog_state_task = None
 
         self.api_id = self.config.get_setting("adapter", "api_id", None)
         self.api_hash = self.config.get_setting("adapter", "api_hash", None)
         self.bot_token = self.config.get_setting("adapter", "bot_token", None)
         self.phone = self.config.get_setting("adapter", "phone", None)
+        self.session_file = self.config.get_setting("adapter", "session_file", None)
 
         if not self.api_id or not self.api_hash:
             raise ValueError("Telegram API ID and hash are required in configuration")
@@ -40,12 +48,16 @@ class Client:
         Returns:
             bool: True if connection was successful, False otherwise
         """
+        # Telethon persists the update state only in a session file,
+        # so catching up on missed updates needs one
         self.client = TelegramClient(
-            MemorySession(),
+            self._create_session(),
             self.api_id,
-            self.api_hash
+            self.api_hash,
+            catch_up=bool(self.session_file)
         )
 
+        await self.dialog_state.load()
         await self.client.connect()
 
         if not await self.client.is_user_authorized():
@@ -70,6 +82,31 @@ class Client:
 
         return self.connected
 
+    def _create_session(self) -> Session:
+        """Create the Telethon session
+
+        A file-backed session keeps the authorization, known entities
+        and update state between restarts, so peers do not have to be
+        resolved again. Without a session file, nothing is kept.
+
+        Returns:
+            Telethon session
+        """
+        if not self.session_file:
+            return MemorySession()
+
+        session_dir = os.path.dirname(self.session_file)
+        if session_dir:
+            os.makedirs(session_dir, exist_ok=True)
+
+        session = SQLiteSession(self.session_file)
+        # The session contains the authorization key
+        if os.path.exists(session.filename):
+            os.chmod(session.filename, 0o600)
+        logging.info(f"Using Telegram session file {session.filename}")
+
+        return session
+
     def _setup_event_handlers(self) -> None:
         """Set up comprehensive event handlers for Telegram events"""
         logging.info("Setting up Telethon event handlers")
@@ -90,8 +127,46 @@ class Client:
         async def on_chat_action(event):
             await self.event_callback({"type": "chat_action", "event": event})
 
+        # Telethon does not report migrations as chat actions
+        @self.client.on(events.Raw([types.UpdateNewMessage, types.UpdateNewChannelMessage]))
+        async def on_migration(update):
+            message = getattr(update, "message", None)
+            if isinstance(getattr(message, "action", None), self.MIGRATION_ACTIONS):
+                await self.event_callback({"type": "migration", "event": message})
+
+    def record_message(self, event: Any) -> None:
+        """Record the last message processed in a dialog and schedule saving the dialog state
+
+        Called once the message is processed, so messages that are dropped
+        before (e.g. on stop) are not recorded and are backfilled later.
+
+        Args:
+            event: Telethon new message event
+        """
+        try:
+            self.dialog_state.update(event.chat_id, event.message.id, event.input_chat)
+        except Exception as e:
+            logging.error(f"Error recording Telegram message: {e}", exc_info=True)
+            return
+
+        if self.dialog_state.dirty and not self._save_dialog_state_task:
+            self._save_dialog_state_task = asyncio.create_task(self._save_dialog_state_later())
+
+    async def _save_dialog_state_later(self) -> None:
+        """Save the dialog state after a delay, so that bursts of messages are saved once"""
+        try:
+            await asyncio.sleep(self.DIALOG_STATE_SAVE_DELAY)
+            await self.dialog_state.save()
+        finally:
+            self._save_dialog_state_task = None
+
     async def disconnect(self) -> None:
         """Disconnect from Telegram"""
+        if self._save_dialog_state_task:
+            self._save_dialog_state_task.cancel()
+            self._save_dialog_state_task = None
+        await self.dialog_state.save()
+
         if self.client:
             await self.client.disconnect()
             self.connected = False
@@ -0,0 +1,52 @@
+from typing import Any, Dict, Optional
+
+class EntityCache:
+    """Resolved Telegram entities of known conversations
+
+    Entities are stored by platform conversation ID, so outgoing
+    actions can use them without resolving the conversation again.
+    """
+
+    def __init__(self):
+        """Initialize the entity cache"""
+        self.entities: Dict[str, Any] = {}
+
+    def get(self, platform_conversation_id: str) -> Optional[Any]:
+        """Get the entity of a conversation
+
+        Args:
+            platform_conversation_id: Platform conversation ID
+
+        Returns:
+            Entity or InputPeer, or None if not cached
+        """
+        return self.entities.get(str(platform_conversation_id), None)
+
+    def add(self, platform_conversation_id: str, entity: Any) -> None:
+        """Add or replace the entity of a conversation
+
+        Args:
+            platform_conversation_id: Platform conversation ID
+            entity: Entity or InputPeer
+        """
+        if entity:
+            self.entities[str(platform_conversation_id)] = entity
+
+    def remove(self, platform_conversation_id: str) -> None:
+        """Remove the entity of a conversation
+
+        Args:
+            platform_conversation_id: Platform conversation ID
+        """
+        self.entities.pop(str(platform_conversation_id), None)
+
+    def __contains__(self, platform_conversation_id: str) -> bool:
+        """Check whether the entity of a conversation is cached
+
+        Args:
+            platform_conversation_id: Platform conversation ID
+
+        Returns:
+            True if the entity is cached, False otherwise
+        """
+        return str(platform_conversation_id) in self.entities
@@ -7,6 +7,7 @@ from enum import Enum
 from typing import Dict, Optional, List, Any
 
 from src.adapters.telegram_adapter.conversation.data_classes import ConversationInfo
+from src.adapters.telegram_adapter.conversation.entity_cache import EntityCache
 from src.adapters.telegram_adapter.conversation.message_builder import MessageBuilder
 from src.adapters.telegram_adapter.conversation.reaction_handler import ReactionHandler
 from src.adapters.telegram_adapter.conversation.thread_handler import ThreadHandler
@@ -29,6 +30,72 @@ class TelegramEventType(str, Enum):
 class Manager(BaseManager):
     """Tracks and manages information about Telegram conversations"""
 
+    def __init__(self, config: Config):
+        """Initialize the Telegram conversation manager
+
+        Args:
+            config: Config instance
+        """
+        super().__init__(config)
+        self.entity_cache = EntityCache()
+
+    async def cache_entity(self, message: Any, entity: Any = None) -> None:
+        """Remember the resolved entity of the message's conversation
+
+        The entity of a new conversation (e.g. a retrieved channel) is
+        preferred; otherwise the InputPeer that Telethon already knows
+        from the message is used, which does not require an API call.
+
+        Args:
+            message: Telethon message object
+            entity: Resolved entity of the conversation, if available
+        """
+        platform_conversation_id = await self._get_platform_conversation_id(await self._get_peer(message))
+        if not platform_conversation_id:
+            return
+
+        if entity:
+            self.entity_cache.add(platform_conversation_id, entity)
+        elif platform_conversation_id not in self.entity_cache:
+            self.entity_cache.add(platform_conversation_id, getattr(message, "input_chat", None))
+
+    async def message_exists(self, message: Any) -> bool:
+        """Check whether a message is already cached
+
+        Messages recovered after an update gap may also arrive as
+        regular updates, so they are checked before being added.
+
+        Args:
+            message: Telethon message object
+
+        Returns:
+            True if the message is cached, False otherwise
+        """
+        conversation_id = await self._get_conversation_id_from_update(message)
+        if not conversation_id or conversation_id not in self.conversations:
+            return False
+
+        return await self.cache.message_cache.get_message_by_id(
+            conversation_id, str(message.id)
+        ) is not None
+
+    async def invalidate_migrated_entities(self, message: Any) -> None:
+        """Forget the cached entities of a group migrated to a supergroup
+
+        Both the old group and the new supergroup are forgotten,
+        so they are resolved again on their next use.
+
+        Args:
+            message: Telethon service message with the migration action
+        """
+        self.entity_cache.remove(await self._get_platform_conversation_id(await self._get_peer(message)))
+
+        action = getattr(message, "action", None)
+        if getattr(action, "channel_id", None):
+            self.entity_cache.remove(f"-100{action.channel_id}")
+        if getattr(action, "chat_id", None):
+            self.entity_cache.remove(str(int(action.chat_id) * -1))
+
     async def update_metadata(self, event: Any) -> List[Dict[str, Any]]:
         """Update the conversation metadata
 
@@ -42,7 +109,11 @@ class Manager(BaseManager):
         platform_conversation_id = await self._get_platform_conversation_id(await self._get_peer(event))
         new_name = getattr(event.action, "title", None)
 
-        for conversation in self.conversations.values():
+        conversations = self._get_indexed_conversations(
+            self.index.get_platform_conversations(platform_conversation_id)
+        )
+
+        for conversation in conversations:
             if self._update_conversation_metadata(conversation, platform_conversation_id, new_name):
                 deltas.append(
                     ConversationDelta(
@@ -81,14 +152,14 @@ class Manager(BaseManager):
         if conversation_id in self.conversations:
             return self.conversations[conversation_id]
 
-        self.conversations[conversation_id] = self._create_conversation_info(
-            platform_conversation_id=platform_conversation_id,
-            conversation_id=conversation_id,
-            conversation_type=await self._get_conversation_type(peer)
+        return self._add_conversation(
+            self._create_conversation_info(
+                platform_conversation_id=platform_conversation_id,
+                conversation_id=conversation_id,
+                conversation_type=await self._get_conversation_type(peer)
+            )
         )
 
-        return self.conversations[conversation_id]
-
     async def _get_peer(self, message: Any) -> Any:
         """Get the peer from a Telethon message
 
@@ -411,17 +482,14 @@ class Manager(BaseManager):
         if conversation_id in self.conversations:
             return self.conversations[conversation_id]
 
-        best_match = None
-        best_match_count = 0
+        match_counts = {}
 
-        for id, messages in self.cache.message_cache.messages.items():
-            matching_ids = set(deleted_ids).intersection(set(messages.keys()))
-            if not matching_ids:
-                continue
+        for message_id in deleted_ids:
+            for id in self.index.get_message_conversations(message_id):
+                if id in self.conversations:
+                    match_counts[id] = match_counts.get(id, 0) + 1
 
-            match_count = len(matching_ids)
-            if match_count > best_match_count:
-                best_match = self.conversations[id]
-                best_match_count = match_count
+        if not match_counts:
+            return None
 
-        return best_match
+        return self.conversations[max(match_counts, key=match_counts.get)]
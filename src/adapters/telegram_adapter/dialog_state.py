@@ -0,0 +1,188 @@
+import asyncio
+import json
+import logging
+import os
+import time
+
+from typing import Any, Dict, Optional
+from telethon import types
+
+from src.core.utils.config import Config
+
+class DialogState:
+    """Persistent ID of the last message seen in every Telegram dialog
+
+    Telethon catches up on missed updates by itself only while it keeps
+    its update state (pts) in a session file. The last message IDs let
+    the adapter fetch the messages it missed in any other case, for
+    example after a restart with an in-memory session, without fetching
+    the whole history again. The input peer of every dialog is kept as
+    well, so the dialog can be reached before its entity is cached again.
+    Dialogs without messages for max_age_days are forgotten, and only
+    the max_dialogs most recently active dialogs are kept, so the state
+    and the backfill on start do not grow with every dialog ever seen.
+    """
+
+    def __init__(self, config: Config):
+        """Initialize the dialog state
+
+        Args:
+            config: Configuration instance
+        """
+        self.state_path = config.get_setting(
+            "adapter",
+            "dialog_state_path",
+            default="cache/telegram_adapter/dialog_state.json"
+        )
+        self.max_dialogs = config.get_setting("adapter", "dialog_state_max_dialogs", default=1000)
+        self.max_age_days = config.get_setting("adapter", "dialog_state_max_age_days", default=30)
+        self.dialogs: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+
+    async def load(self) -> None:
+        """Load the dialog state saved by the previous run of the adapter"""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+            state = await loop.run_in_executor(None, self._read_state)
+            self.dialogs.update(state.get("dialogs", {}))
+            for dialog in self.dialogs.values():
+                dialog.setdefault("updated_at", time.time())
+            self.prune()
+        except Exception as e:
+            logging.error(f"Error loading Telegram dialog state: {e}", exc_info=True)
+
+    async def save(self) -> None:
+        """Save the dialog state if it changed since the last save"""
+        if not self.state_path:
+            return
+
+        self.prune()
+        if not self.dirty:
+            return
+
+        try:
+            # The state is serialized in an executor while update() keeps
+            # changing the dialogs, so every dialog is copied
+            state = {"dialogs": {dialog_id: dict(dialog) for dialog_id, dialog in self.dialogs.items()}}
+            self.dirty = False
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: self._write_state(state))
+        except Exception as e:
+            self.dirty = True
+            logging.error(f"Error saving Telegram dialog state: {e}", exc_info=True)
+
+    def update(self, dialog_id: Any, message_id: int, input_peer: Any = None) -> None:
+        """Record a message seen in a dialog
+
+        Args:
+            dialog_id: Telegram peer ID of the dialog
+            message_id: Message ID
+            input_peer: Optional Telethon input peer of the dialog
+        """
+        dialog = self.dialogs.setdefault(str(dialog_id), {"last_message_id": 0})
+
+        if message_id > dialog.get("last_message_id", 0):
+            dialog["last_message_id"] = message_id
+            dialog["updated_at"] = time.time()
+            self.dirty = True
+
+        peer = self._serialize_input_peer(input_peer)
+        if peer and dialog.get("peer", None) != peer:
+            dialog["peer"] = peer
+            self.dirty = True
+
+    def prune(self) -> None:
+        """Forget the dialogs that were inactive for too long or exceed the maximum count"""
+        dialog_ids = sorted(
+            self.dialogs, key=lambda dialog_id: self.dialogs[dialog_id].get("updated_at", 0), reverse=True
+        )
+        expired_before = time.time() - self.max_age_days * 24 * 60 * 60 if self.max_age_days else None
+
+        for index, dialog_id in enumerate(dialog_ids):
+            updated_at = self.dialogs[dialog_id].get("updated_at", 0)
+
+            if (self.max_dialogs and index >= self.max_dialogs) or \
+               (expired_before is not None and updated_at < expired_before):
+                del self.dialogs[dialog_id]
+                self.dirty = True
+
+    def get_last_message_id(self, dialog_id: Any) -> int:
+        """Get the ID of the last message seen in a dialog
+
+        Args:
+            dialog_id: Telegram peer ID of the dialog
+
+        Returns:
+            Message ID, or 0 if no message was seen
+        """
+        return self.dialogs.get(str(dialog_id), {}).get("last_message_id", 0)
+
+    def get_input_peer(self, dialog_id: Any) -> Optional[Any]:
+        """Get the input peer of a dialog
+
+        Args:
+            dialog_id: Telegram peer ID of the dialog
+
+        Returns:
+            Telethon input peer, or None if it was not recorded
+        """
+        peer = self.dialogs.get(str(dialog_id), {}).get("peer", None)
+        if not peer:
+            return None
+
+        if peer["type"] == "user":
+            return types.InputPeerUser(peer["id"], peer["access_hash"])
+        if peer["type"] == "chat":
+            return types.InputPeerChat(peer["id"])
+        if peer["type"] == "channel":
+            return types.InputPeerChannel(peer["id"], peer["access_hash"])
+        return None
+
+    def _serialize_input_peer(self, input_peer: Any) -> Optional[Dict[str, Any]]:
+        """Convert an input peer to a JSON serializable dictionary
+
+        Args:
+            input_peer: Telethon input peer
+
+        Returns:
+            Dictionary with the peer type, ID and access hash, or None
+        """
+        if isinstance(input_peer, types.InputPeerUser):
+            return {"type": "user", "id": input_peer.user_id, "access_hash": input_peer.access_hash}
+        if isinstance(input_peer, types.InputPeerChat):
+            return {"type": "chat", "id": input_peer.chat_id}
+        if isinstance(input_peer, types.InputPeerChannel):
+            return {"type": "channel", "id": input_peer.channel_id, "access_hash": input_peer.access_hash}
+        return None
+
+    def _read_state(self) -> Dict[str, Any]:
+        """Read the state file
+
+        Returns:
+            Saved state
+        """
+        with open(self.state_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        """Write the state file atomically
+
+        The file is readable by its owner only, as it contains the
+        access hashes of the dialog peers.
+
+        Args:
+            state: State to save
+        """
+        state_dir = os.path.dirname(self.state_path)
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+
+        temp_path = f"{self.state_path}.tmp"
+        file_descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.chmod(temp_path, 0o600)
+        os.replace(temp_path, self.state_path)
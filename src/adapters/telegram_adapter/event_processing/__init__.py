@@ -1,12 +1,14 @@
 """Adapter event handlers implementation."""
 
 from src.adapters.telegram_adapter.event_processing.incoming_event_processor import IncomingEventProcessor
+from src.adapters.telegram_adapter.event_processing.gap_backfiller import GapBackfiller
 from src.adapters.telegram_adapter.event_processing.history_fetcher import HistoryFetcher
 from src.adapters.telegram_adapter.event_processing.outgoing_event_processor import OutgoingEventProcessor
 from src.adapters.telegram_adapter.event_processing.user_info_preprocessor import UserInfoPreprocessor
 
 __all__ = [
     "IncomingEventProcessor",
+    "GapBackfiller",
     "HistoryFetcher",
     "OutgoingEventProcessor",
     "UserInfoPreprocessor"
@@ -1,7 +1,5 @@
 import asyncio
-import base64
 import logging
-import magic
 import os
 import shutil
 
@@ -9,9 +7,9 @@ from typing import Any, Dict, Optional
 from src.adapters.telegram_adapter.event_processing.attachment_loaders.base_loader import BaseLoader
 from src.core.utils.attachment_loading import (
     create_attachment_dir,
-    move_attachment,
     save_metadata_file
 )
+from src.core.utils.attachment_uploading import AttachmentUpload
 from src.core.utils.config import Config
 
 class Uploader(BaseLoader):
@@ -54,21 +52,26 @@ class Uploader(BaseLoader):
                 logging.error(f"Could not resolve conversation ID")
                 return {}
 
-            try:
-                file_content = base64.b64decode(attachment.content)
-            except Exception as e:
-                logging.error(f"Failed to decode base64 content: {e}")
-                return {}
+            upload = AttachmentUpload(
+                attachment.content,
+                os.path.join(self.temp_dir, attachment.file_name),
+                self.max_file_size
+            )
 
-            if len(file_content) > self.max_file_size:
-                logging.error(f"Decoded content exceeds size limit: {len(file_content)/1024/1024:.2f} MB")
+            try:
+                await upload.persist_async()
+            except ValueError as e:
+                logging.error(str(e))
                 return {}
 
-            temp_path = os.path.join(self.temp_dir, attachment.file_name)
-            with open(temp_path, "wb") as f:
-                f.write(file_content)
+            try:
+                message = await self.client.send_file(
+                    entity=conversation, file=upload.file_path, reply_to=reply_to
+                )
+            except Exception:
+                upload.discard()
+                raise
 
-            message = await self.client.send_file(entity=conversation, file=temp_path, reply_to=reply_to)
             metadata = await self._get_attachment_metadata(message)
 
             if metadata:
@@ -80,13 +83,13 @@ class Uploader(BaseLoader):
                     metadata["attachment_type"],
                     metadata["attachment_id"]
                 )
-                local_file_path = os.path.join(attachment_dir, metadata["filename"])
                 create_attachment_dir(attachment_dir)
-                move_attachment(temp_path, local_file_path)
+                upload.move_to(os.path.join(attachment_dir, metadata["filename"]))
 
-                mime = magic.Magic(mime=True)
-                metadata["content_type"] = mime.from_file(local_file_path)
+                metadata["content_type"] = upload.content_type
                 save_metadata_file(metadata, attachment_dir)
+            else:
+                upload.discard()
 
             return metadata
         except Exception as e:
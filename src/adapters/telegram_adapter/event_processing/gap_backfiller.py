@@ -0,0 +1,83 @@
+import logging
+
+from typing import Any, Dict, List
+from telethon import events, types
+
+from src.adapters.telegram_adapter.dialog_state import DialogState
+
+from src.core.rate_limiter.rate_limiter import RateLimiter
+from src.core.utils.config import Config
+
+class GapBackfiller:
+    """Fetches the messages that were sent while the adapter was not receiving updates
+
+    Only dialogs with a recorded last message are backfilled, and only
+    the messages newer than that message are fetched (min_id), so the
+    history is never fetched again in full. They are fetched oldest
+    first, so if a dialog missed more messages than one pass fetches,
+    the next pass continues after the last processed message instead
+    of skipping the oldest ones. The dialog state is updated by the
+    adapter once a message is processed, not when it is fetched.
+    Unknown dialogs are picked up with their history on their next
+    message.
+    """
+
+    def __init__(self, config: Config, client: Any, dialog_state: DialogState):
+        """Initialize the gap backfiller
+
+        Args:
+            config: Config instance
+            client: Telethon client instance
+            dialog_state: Last message IDs of the dialogs
+        """
+        self.config = config
+        self.client = client
+        self.dialog_state = dialog_state
+        self.rate_limiter = RateLimiter.get_instance(self.config)
+        self.max_messages = self.config.get_setting("adapter", "max_history_limit", default=100)
+
+    async def fetch_missed_messages(self) -> List[Dict[str, Any]]:
+        """Fetch the messages sent after the last seen message of every dialog
+
+        Returns:
+            New message events of the missed messages, oldest first in every dialog
+        """
+        missed_events = []
+
+        for dialog_id in list(self.dialog_state.dialogs.keys()):
+            last_message_id = self.dialog_state.get_last_message_id(dialog_id)
+            if not last_message_id:
+                continue
+
+            try:
+                messages = await self._fetch_messages_after(dialog_id, last_message_id)
+
+                for message in messages:
+                    # Service messages are not delivered as new messages
+                    if not isinstance(message, types.Message):
+                        continue
+
+                    event = events.NewMessage.Event(message)
+                    event._set_client(self.client)
+                    missed_events.append({"type": "new_message", "event": event})
+            except Exception as e:
+                logging.error(f"Error backfilling dialog {dialog_id}: {e}", exc_info=True)
+
+        return missed_events
+
+    async def _fetch_messages_after(self, dialog_id: str, min_id: int) -> List[Any]:
+        """Fetch the messages of a dialog that are newer than the given message
+
+        Args:
+            dialog_id: Telegram peer ID of the dialog
+            min_id: ID of the last seen message
+
+        Returns:
+            List of Telethon messages, oldest first
+        """
+        entity = self.dialog_state.get_input_peer(dialog_id) or int(dialog_id)
+
+        await self.rate_limiter.limit_request("fetch_history", dialog_id)
+        return list(await self.client.get_messages(
+            entity, min_id=min_id, limit=self.max_messages, reverse=True
+        ) or [])
@@ -66,7 +66,8 @@ class HistoryFetcher(BaseHistoryFetcher):
 
             if self.anchor:
                 result = await self._make_api_request(
-                    self.history_limit, offset_id=0
+                    self.history_limit,
+                    offset_id=int(self.anchor) if str(self.anchor).isdigit() else 0
                 )
             elif self.before:
                 result = await self._make_api_request(
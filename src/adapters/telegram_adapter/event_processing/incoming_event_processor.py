@@ -21,6 +21,7 @@ class TelegramIncomingEventType(str, Enum):
     EDITED_MESSAGE = "edited_message"
     DELETED_MESSAGE = "deleted_message"
     CHAT_ACTION = "chat_action"
+    MIGRATION = "migration"
     FETCH_HISTORY = "fetch_history"
 
 class IncomingEventProcessor(BaseIncomingEventProcessor):
@@ -48,9 +49,22 @@ class IncomingEventProcessor(BaseIncomingEventProcessor):
             TelegramIncomingEventType.EDITED_MESSAGE: self._handle_edited_message,
             TelegramIncomingEventType.DELETED_MESSAGE: self._handle_deleted_message,
             TelegramIncomingEventType.CHAT_ACTION: self._handle_chat_action,
+            TelegramIncomingEventType.MIGRATION: self._handle_migration,
             TelegramIncomingEventType.FETCH_HISTORY: self._handle_fetch_history
         }
 
+    def get_conversation_key(self, event: Any) -> Optional[str]:
+        """Get the key of the conversation an event belongs to
+
+        Args:
+            event: Telethon event object
+
+        Returns:
+            Chat ID, or None if the chat is unknown (e.g. deletions in private chats)
+        """
+        chat_id = getattr(event.get("event", None), "chat_id", None)
+        return str(chat_id) if chat_id is not None else None
+
     async def _handle_new_message(self, event: Any) -> List[Dict[str, Any]]:
         """Handle a new message event from Telegram
 
@@ -66,9 +80,13 @@ class IncomingEventProcessor(BaseIncomingEventProcessor):
             message = event["event"].message
             channel = None
 
+            if await self.conversation_manager.message_exists(message):
+                return events
+
             if not await self.conversation_manager.conversation_exists(message):
                 channel = await self._get_channel(message)
 
+            await self.conversation_manager.cache_entity(message, channel)
             attachments = [await self.downloader.download_attachment(message)]
             initial_event_details = {"message": message, "attachments": attachments, "server": None, "platform_conversation": channel}
             user_info_preprocessor = UserInfoPreprocessor(self.config, self.client)
@@ -177,6 +195,22 @@ class IncomingEventProcessor(BaseIncomingEventProcessor):
 
         return []
 
+    async def _handle_migration(self, event: Any) -> List[Dict[str, Any]]:
+        """Handle a group migration to a supergroup
+
+        Args:
+            event: Dictionary containing the event data
+
+        Returns:
+            List of events to emit (always empty for this case)
+        """
+        try:
+            await self.conversation_manager.invalidate_migrated_entities(event["event"])
+        except Exception as e:
+            logging.error(f"Error handling migration: {e}", exc_info=True)
+
+        return []
+
     async def _get_channel(self, message: Any) -> Optional[Any]:
         """Get channel information from Telegram
 
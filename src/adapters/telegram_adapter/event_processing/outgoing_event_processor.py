@@ -5,10 +5,11 @@ import logging
 import os
 import telethon
 
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
 from telethon import functions, types
 from telethon.tl.types import ReactionEmoji
-from typing import Any, Dict, List, Union
+from typing import Any, AsyncIterator, Dict, List, Union
 
 from src.adapters.telegram_adapter.conversation.manager import Manager
 from src.adapters.telegram_adapter.event_processing.attachment_loaders.uploader import Uploader
@@ -41,41 +42,41 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             Dict[str, Any]: Dictionary containing the status and message_ids
         """
         user_info_preprocessor = UserInfoPreprocessor(self.config, self.client)
-        entity = await self._get_entity(conversation_info)
-        message_ids = []
-        reply_to_message_id = None
-        adapter_id = self.config.get_setting("adapter", "adapter_id")
+        async with self._conversation_entity(conversation_info) as entity:
+            message_ids = []
+            reply_to_message_id = None
+            adapter_id = self.config.get_setting("adapter", "adapter_id")
 
-        if data.thread_id:
-            try:
-                reply_to_message_id = int(data.thread_id)
-            except ValueError:
-                reply_to_message_id = None
+            if data.thread_id:
+                try:
+                    reply_to_message_id = int(data.thread_id)
+                except ValueError:
+                    reply_to_message_id = None
 
-        for message in self._split_long_message(await user_info_preprocessor.process_outgoing_event(data.mentions, data.text)):
-            await self.rate_limiter.limit_request("message", data.conversation_id)
-            message = await self.client.send_message(entity=entity, message=message, reply_to=reply_to_message_id)
+            for message in self._split_long_message(await user_info_preprocessor.process_outgoing_event(data.mentions, data.text)):
+                await self.rate_limiter.limit_request("message", data.conversation_id)
+                message = await self.client.send_message(entity=entity, message=message, reply_to=reply_to_message_id)
 
-            if hasattr(message, "id"):
-                message_ids.append(str(message.id))
+                if hasattr(message, "id"):
+                    message_ids.append(str(message.id))
 
-            await self.conversation_manager.add_to_conversation({"message": message, "user_id": adapter_id})
+                await self.conversation_manager.add_to_conversation({"message": message, "user_id": adapter_id})
 
-        for attachment in data.attachments:
-            await self.rate_limiter.limit_request("message", data.conversation_id)
-            attachment_info = await self.uploader.upload_attachment(entity, attachment, reply_to=reply_to_message_id)
+            for attachment in data.attachments:
+                await self.rate_limiter.limit_request("message", data.conversation_id)
+                attachment_info = await self.uploader.upload_attachment(entity, attachment, reply_to=reply_to_message_id)
 
-            if attachment_info and attachment_info.get("message"):
-                message = attachment_info["message"]
-                if hasattr(message, "id"):
-                    message_ids.append(str(message.id))
-                del attachment_info["message"]
+                if attachment_info and attachment_info.get("message"):
+                    message = attachment_info["message"]
+                    if hasattr(message, "id"):
+                        message_ids.append(str(message.id))
+                    del attachment_info["message"]
 
-                await self.conversation_manager.add_to_conversation({
-                    "message": message,
-                    "attachments": [attachment_info],
-                    "user_id": adapter_id
-                })
+                    await self.conversation_manager.add_to_conversation({
+                        "message": message,
+                        "attachments": [attachment_info],
+                        "user_id": adapter_id
+                    })
 
         logging.info(f"Message sent to conversation {data.conversation_id}")
         return {"request_completed": True, "message_ids": message_ids}
@@ -91,17 +92,16 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             Dict[str, Any]: Dictionary containing the status
         """
         user_info_preprocessor = UserInfoPreprocessor(self.config, self.client)
-        entity = await self._get_entity(conversation_info)
-
-        await self.rate_limiter.limit_request("edit_message", data.conversation_id)
-        await self.conversation_manager.update_conversation({
-            "event_type": "edited_message",
-            "message": await self.client.edit_message(
-                entity=entity,
-                message=int(data.message_id),
-                text=await user_info_preprocessor.process_outgoing_event(data.mentions, data.text)
-            )
-        })
+        async with self._conversation_entity(conversation_info) as entity:
+            await self.rate_limiter.limit_request("edit_message", data.conversation_id)
+            await self.conversation_manager.update_conversation({
+                "event_type": "edited_message",
+                "message": await self.client.edit_message(
+                    entity=entity,
+                    message=int(data.message_id),
+                    text=await user_info_preprocessor.process_outgoing_event(data.mentions, data.text)
+                )
+            })
 
         logging.info(f"Message edited in conversation {data.conversation_id}")
         return {"request_completed": True}
@@ -116,17 +116,17 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        entity = await self._get_entity(conversation_info)
-        await self.rate_limiter.limit_request("delete_message", data.conversation_id)
-        messages = await self.client.delete_messages(entity=entity, message_ids=[(int(data.message_id))])
-
-        if messages:
-            await self.conversation_manager.delete_from_conversation(
-                outgoing_event={
-                    "deleted_ids": [data.message_id],
-                    "conversation_id": data.conversation_id
-                }
-            )
+        async with self._conversation_entity(conversation_info) as entity:
+            await self.rate_limiter.limit_request("delete_message", data.conversation_id)
+            messages = await self.client.delete_messages(entity=entity, message_ids=[(int(data.message_id))])
+
+            if messages:
+                await self.conversation_manager.delete_from_conversation(
+                    outgoing_event={
+                        "deleted_ids": [data.message_id],
+                        "conversation_id": data.conversation_id
+                    }
+                )
 
         logging.info(f"Message deleted in conversation {data.conversation_id}")
         return {"request_completed": True}
@@ -141,23 +141,23 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        entity = await self._get_entity(conversation_info)
         emoji_symbol = emoji.emojize(f":{data.emoji}:")
 
         if not emoji_symbol or emoji_symbol == f":{data.emoji}:":
             raise Exception(f"Python library emoji does not support this emoji: {data.emoji}")
 
-        await self.rate_limiter.limit_request("add_reaction", data.conversation_id)
-        await self.conversation_manager.update_conversation({
-            "event_type": "edited_message",
-            "message": await self.client(
-                functions.messages.SendReactionRequest(
-                    peer=entity,
-                    msg_id=int(data.message_id),
-                    reaction=[ReactionEmoji(emoticon=emoji_symbol)]
+        async with self._conversation_entity(conversation_info) as entity:
+            await self.rate_limiter.limit_request("add_reaction", data.conversation_id)
+            await self.conversation_manager.update_conversation({
+                "event_type": "edited_message",
+                "message": await self.client(
+                    functions.messages.SendReactionRequest(
+                        peer=entity,
+                        msg_id=int(data.message_id),
+                        reaction=[ReactionEmoji(emoticon=emoji_symbol)]
+                    )
                 )
-            )
-        })
+            })
 
         logging.info(f"Reaction added to message in conversation {data.conversation_id}")
         return {"request_completed": True}
@@ -172,30 +172,30 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        entity = await self._get_entity(conversation_info)
         emoji_symbol = emoji.emojize(f":{data.emoji}:")
 
         if not emoji_symbol or emoji_symbol == f":{data.emoji}:":
             raise Exception(f"Python library emoji does not support this emoji: {data.emoji}")
 
-        await self.rate_limiter.limit_request("get_messages", data.conversation_id)
-
-        message_id = int(data.message_id)
-        old_message = await self.client.get_messages(entity, ids=message_id)
-        old_reactions = getattr(old_message, "reactions", None) if old_message else None
-        new_reactions = self._update_reactions_list(old_reactions, emoji_symbol)
-
-        await self.rate_limiter.limit_request("remove_reaction", data.conversation_id)
-        await self.conversation_manager.update_conversation({
-            "event_type": "edited_message",
-            "message": await self.client(
-                functions.messages.SendReactionRequest(
-                    peer=entity,
-                    msg_id=message_id,
-                    reaction=new_reactions
+        async with self._conversation_entity(conversation_info) as entity:
+            await self.rate_limiter.limit_request("get_messages", data.conversation_id)
+
+            message_id = int(data.message_id)
+            old_message = await self.client.get_messages(entity, ids=message_id)
+            old_reactions = getattr(old_message, "reactions", None) if old_message else None
+            new_reactions = self._update_reactions_list(old_reactions, emoji_symbol)
+
+            await self.rate_limiter.limit_request("remove_reaction", data.conversation_id)
+            await self.conversation_manager.update_conversation({
+                "event_type": "edited_message",
+                "message": await self.client(
+                    functions.messages.SendReactionRequest(
+                        peer=entity,
+                        msg_id=message_id,
+                        reaction=new_reactions
+                    )
                 )
-            )
-        })
+            })
 
         logging.info(f"Reaction removed from message in conversation {data.conversation_id}")
         return {"request_completed": True}
@@ -210,21 +210,20 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        entity = await self._get_entity(conversation_info)
-
-        await self.rate_limiter.limit_request("pin_message", data.conversation_id)
-        message = await self.client(functions.messages.UpdatePinnedMessageRequest(
-            peer=entity, id=int(data.message_id), silent=False
-        ))
-
-        if message:
-            await self.conversation_manager.update_conversation({
-                "event_type": "pinned_message",
-                "message": {
-                    "conversation_id": data.conversation_id,
-                    "message_id": data.message_id
-                }
-            })
+        async with self._conversation_entity(conversation_info) as entity:
+            await self.rate_limiter.limit_request("pin_message", data.conversation_id)
+            message = await self.client(functions.messages.UpdatePinnedMessageRequest(
+                peer=entity, id=int(data.message_id), silent=False
+            ))
+
+            if message:
+                await self.conversation_manager.update_conversation({
+                    "event_type": "pinned_message",
+                    "message": {
+                        "conversation_id": data.conversation_id,
+                        "message_id": data.message_id
+                    }
+                })
 
         logging.info(f"Message {data.message_id} pinned in conversation {data.conversation_id}")
         return {"request_completed": True}
@@ -239,20 +238,20 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        entity = await self._get_entity(conversation_info)
-        await self.rate_limiter.limit_request("unpin_message", data.conversation_id)
-        message = await self.client(functions.messages.UpdatePinnedMessageRequest(
-            peer=entity, id=int(data.message_id), unpin=True
-        ))
-
-        if message:
-            await self.conversation_manager.update_conversation({
-                "event_type": "unpinned_message",
-                "message": {
-                    "conversation_id": data.conversation_id,
-                    "message_id": data.message_id
-                }
-            })
+        async with self._conversation_entity(conversation_info) as entity:
+            await self.rate_limiter.limit_request("unpin_message", data.conversation_id)
+            message = await self.client(functions.messages.UpdatePinnedMessageRequest(
+                peer=entity, id=int(data.message_id), unpin=True
+            ))
+
+            if message:
+                await self.conversation_manager.update_conversation({
+                    "event_type": "unpinned_message",
+                    "message": {
+                        "conversation_id": data.conversation_id,
+                        "message_id": data.message_id
+                    }
+                })
 
         logging.info(f"Message {data.message_id} unpinned in conversation {data.conversation_id}")
         return {"request_completed": True}
@@ -266,12 +265,12 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        entity = await self._get_entity(conversation_info)
-        await self.rate_limiter.limit_request("send_typing_indicator", data.conversation_id)
+        async with self._conversation_entity(conversation_info) as entity:
+            await self.rate_limiter.limit_request("send_typing_indicator", data.conversation_id)
 
-        # typing notification lasts ~5 seconds;
-        # `send_message` event will stop notification earlier
-        await self.client(functions.messages.SetTypingRequest(peer=entity, action=types.SendMessageTypingAction()))
+            # typing notification lasts ~5 seconds;
+            # `send_message` event will stop notification earlier
+            await self.client(functions.messages.SetTypingRequest(peer=entity, action=types.SendMessageTypingAction()))
 
         logging.info(f"Typing indicator sent to {data.conversation_id}")
         return {"request_completed": True}
@@ -319,15 +318,45 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
 
         return reactions_to_add
 
+    @asynccontextmanager
+    async def _conversation_entity(self, conversation_info: Any) -> AsyncIterator[Any]:
+        """Provide the conversation entity for an outgoing action
+
+        A failed action drops the cached entity, so the next
+        action resolves the conversation again.
+
+        Args:
+            conversation_info: The conversation info
+
+        Yields:
+            The entity of the conversation
+        """
+        entity = await self._get_entity(conversation_info)
+
+        try:
+            yield entity
+        except Exception:
+            self.conversation_manager.entity_cache.remove(conversation_info.platform_conversation_id)
+            raise
+
     async def _get_entity(self, conversation_info: Any) -> Any:
         """Get an entity from a conversation ID
 
+        Cached entities are returned without any API call;
+        otherwise the entity is resolved and cached.
+
         Args:
             conversation_info: The conversation info
 
         Returns:
             The entity or raises an exception if not found
         """
+        entity_cache = self.conversation_manager.entity_cache
+        entity = entity_cache.get(conversation_info.platform_conversation_id)
+
+        if entity:
+            return entity
+
         await self.rate_limiter.limit_request("get_entity")
 
         conversation_id = self._format_conversation_id(conversation_info.platform_conversation_id)
@@ -336,4 +365,5 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         if not entity:
             raise Exception(f"No entity found for conversation {conversation_info.conversation_id}")
 
+        entity_cache.add(conversation_info.platform_conversation_id, entity)
         return entity
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from src.adapters.text_file_adapter.event_processing.file_event_cache import FileEventCache
 from src.adapters.text_file_adapter.event_processing.processor import Processor
 from src.core.utils.config import Config
@@ -71,11 +71,12 @@ class Adapter():
         await self._emit_event("disconnect")
         logging.info("Adapter stopped")
 
-    async def process_outgoing_event(self, data: Any) -> Dict[str, Any]:
+    async def process_outgoing_event(self, data: Any, outgoing_event: Optional[Any] = None) -> Dict[str, Any]:
         """Process events from socket_io.client
 
         Args:
             data: data for event
+            outgoing_event: Unused, requests are not validated before they are queued
 
         Returns:
             Dict[str, Any]: Dictionary containing the status and data fields if applicable
@@ -122,6 +122,51 @@ class FileEventCache:
             if old_path in self.event_cache:
                 del self.event_cache[old_path]
 
+    async def record_batch_event(self, file_paths: List[str]) -> None:
+        """Record the state of every file modified by a batch request
+
+        The whole batch is recorded under a single lock acquisition with
+        at most one backup per file, so undoing a file afterwards restores
+        the content it had before the batch was applied. Nothing is recorded
+        unless every backup succeeds.
+
+        Args:
+            file_paths: Paths to the files the batch is going to modify
+        """
+        async with self._lock:
+            existing_paths = [path for path in file_paths if os.path.exists(path)]
+            backups = await asyncio.gather(
+                *[self._create_backup(path) for path in existing_paths]
+            )
+            backups_by_path = dict(zip(existing_paths, backups))
+
+            failed_paths = [path for path, backup in backups_by_path.items() if not backup]
+            if failed_paths:
+                for backup in backups:
+                    if backup:
+                        await self._cleanup_backup(backup)
+                raise Exception(f"Failed to create backup for {failed_paths[0]}")
+
+            for file_path in file_paths:
+                if file_path not in backups_by_path:
+                    await self._add_event_to_cache(
+                        file_path,
+                        {
+                            "timestamp": time.time(),
+                            "action": "delete"
+                        }
+                    )
+                    continue
+
+                await self._add_event_to_cache(
+                    file_path,
+                    {
+                        "action": "update",
+                        "timestamp": time.time(),
+                        "backup_info": backups_by_path[file_path]
+                    }
+                )
+
     async def undo_recorded_event(self, file_path: str) -> bool:
         """Undo the last recorded event for a file
 
@@ -38,6 +38,16 @@ class ReplaceData(BaseModel):
     old_string: str
     new_string: str
 
+class BatchOperation(BaseModel):
+    """Single operation of a batch request"""
+    event_type: str
+    data: Dict[str, Any]
+
+class BatchData(BaseModel):
+    """Batch request data model"""
+    operations: List[BatchOperation]
+    atomic: bool = False
+
 # Complete request models
 class ViewEvent(BaseEvent):
     """Complete view event model"""
@@ -84,6 +94,11 @@ class UndoEvent(BaseEvent):
     event_type: str = "undo"
     data: FileData
 
+class BatchEvent(BaseEvent):
+    """Complete batch event model"""
+    event_type: str = "batch"
+    data: BatchData
+
 class OutgoingEventBuilder:
     """Builder class for outgoing events"""
 
@@ -126,4 +141,7 @@ class OutgoingEventBuilder:
         if event_type == "undo":
             return UndoEvent(event_type=event_type, data=FileData(**event_data))
 
+        if event_type == "batch":
+            return BatchEvent(event_type=event_type, data=BatchData(**event_data))
+
         raise ValueError(f"Unknown event type: {event_type}")
@@ -10,7 +10,7 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from pydantic import BaseModel
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional
 from uuid import uuid4
 
 from src.adapters.text_file_adapter.event_processing.file_event_cache import FileEventCache
@@ -29,10 +29,20 @@ class FileEventType(str, Enum):
     INSERT = "insert"
     REPLACE = "replace"
     UNDO = "undo"
+    BATCH = "batch"
 
 class Processor():
     """Processes events from socket.io"""
 
+    BATCH_READ_OPERATIONS = [FileEventType.VIEW, FileEventType.READ]
+    BATCH_WRITE_OPERATIONS = [
+        FileEventType.CREATE,
+        FileEventType.DELETE,
+        FileEventType.UPDATE,
+        FileEventType.INSERT,
+        FileEventType.REPLACE
+    ]
+
     def __init__(self, config: Config, file_event_cache: FileEventCache):
         """Initialize the socket.io events processor
 
@@ -59,19 +69,8 @@ class Processor():
             Dict[str, Any]: Dictionary containing the status and data fields if applicable
         """
         try:
-            event_handlers = {
-                FileEventType.VIEW: self._handle_view_event,
-                FileEventType.READ: self._handle_read_event,
-                FileEventType.CREATE: self._handle_create_event,
-                FileEventType.DELETE: self._handle_delete_event,
-                FileEventType.MOVE: self._handle_move_event,
-                FileEventType.UPDATE: self._handle_update_event,
-                FileEventType.INSERT: self._handle_insert_event,
-                FileEventType.REPLACE: self._handle_replace_event,
-                FileEventType.UNDO: self._handle_undo_event
-            }
             outgoing_event = self.outgoing_event_builder.build(data)
-            handler = event_handlers.get(outgoing_event.event_type)
+            handler = self._get_event_handlers().get(outgoing_event.event_type)
 
             return await handler(outgoing_event.data)
         except Exception as e:
@@ -81,6 +80,21 @@ class Processor():
                 "error": f"Error processing event: {e}"
             }
 
+    def _get_event_handlers(self) -> Dict[str, Callable]:
+        """Get event handlers for outgoing events"""
+        return {
+            FileEventType.VIEW: self._handle_view_event,
+            FileEventType.READ: self._handle_read_event,
+            FileEventType.CREATE: self._handle_create_event,
+            FileEventType.DELETE: self._handle_delete_event,
+            FileEventType.MOVE: self._handle_move_event,
+            FileEventType.UPDATE: self._handle_update_event,
+            FileEventType.INSERT: self._handle_insert_event,
+            FileEventType.REPLACE: self._handle_replace_event,
+            FileEventType.UNDO: self._handle_undo_event,
+            FileEventType.BATCH: self._handle_batch_event
+        }
+
     async def _handle_view_event(self, data: BaseModel) -> Dict[str, Any]:
         """List files and directories in a directory
 
@@ -138,12 +152,10 @@ class Processor():
                 error_msg = " ".join(validator.errors)
                 raise Exception(f"File validation failed: {path}. {error_msg}")
 
-            view_range = data.line_range
-            with open(path, "r", encoding="utf-8") as file:
-                if view_range:
-                    content = "".join(file.readlines()[view_range[0]:view_range[1]])
-                else:
-                    content = file.read()
+            loop = asyncio.get_event_loop()
+            content = await loop.run_in_executor(
+                None, lambda: self._read_file(path, data.line_range)
+            )
 
             return {"request_completed": True, "file_content": content}
         except Exception as e:
@@ -153,13 +165,16 @@ class Processor():
                 "error": f"Error reading file: {e}"
             }
 
-    async def _handle_create_event(self, data: BaseModel) -> Dict[str, Any]:
+    async def _handle_create_event(self,
+                                   data: BaseModel,
+                                   record_event: bool = True) -> Dict[str, Any]:
         """Create a new file with content
 
         Args:
             data: data model containing:
                 - path: Path to create the file
                 - content: Content to write to the file
+            record_event: Whether to record the event for undo purposes
 
         Returns:
             Dictionary containing success status
@@ -167,7 +182,8 @@ class Processor():
         try:
             path = self._sanitize_path(data.path)
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            await self.file_event_cache.record_create_event(path)
+            if record_event:
+                await self.file_event_cache.record_create_event(path)
 
             with open(path, "w", encoding="utf-8") as file:
                 file.write(data.content)
@@ -180,12 +196,15 @@ class Processor():
                 "error": f"Error creating file: {e}"
             }
 
-    async def _handle_delete_event(self, data: BaseModel) -> Dict[str, Any]:
+    async def _handle_delete_event(self,
+                                   data: BaseModel,
+                                   record_event: bool = True) -> Dict[str, Any]:
         """Delete a file
 
         Args:
             data: data model containing:
                 - path: Path to the file to delete
+            record_event: Whether to record the event for undo purposes
 
         Returns:
             Dictionary containing success status
@@ -193,7 +212,8 @@ class Processor():
         try:
             path = self._sanitize_path(data.path)
             self._check_if_path_exists(path)
-            await self.file_event_cache.record_delete_event(path)
+            if record_event:
+                await self.file_event_cache.record_delete_event(path)
             os.remove(path)
 
             return {"request_completed": True}
@@ -234,13 +254,16 @@ class Processor():
                 "error": f"Error moving file: {e}"
             }
 
-    async def _handle_update_event(self, data: BaseModel) -> Dict[str, Any]:
+    async def _handle_update_event(self,
+                                   data: BaseModel,
+                                   record_event: bool = True) -> Dict[str, Any]:
         """Update a file's entire content
 
         Args:
             data: data model containing:
                 - path: Path to the file to update
                 - content: New content for the file
+            record_event: Whether to record the event for undo purposes
 
         Returns:
             Dictionary containing success status
@@ -248,7 +271,8 @@ class Processor():
         try:
             path = self._sanitize_path(data.path)
             self._check_if_path_exists(path)
-            await self.file_event_cache.record_update_event(path)
+            if record_event:
+                await self.file_event_cache.record_update_event(path)
 
             with open(path, "w", encoding="utf-8") as file:
                 file.write(data.content)
@@ -261,7 +285,9 @@ class Processor():
                 "error": f"Error updating file: {e}"
             }
 
-    async def _handle_insert_event(self, data: BaseModel) -> Dict[str, Any]:
+    async def _handle_insert_event(self,
+                                   data: BaseModel,
+                                   record_event: bool = True) -> Dict[str, Any]:
         """Insert content at a specific line in a file
 
         Args:
@@ -269,6 +295,7 @@ class Processor():
                 - path: Path to the file
                 - line: Line number to insert after (0 for beginning of file)
                 - content: Content to insert
+            record_event: Whether to record the event for undo purposes
 
         Returns:
             Dictionary containing success status
@@ -276,7 +303,8 @@ class Processor():
         try:
             path = self._sanitize_path(data.path)
             self._check_if_path_exists(path)
-            await self.file_event_cache.record_update_event(path)
+            if record_event:
+                await self.file_event_cache.record_update_event(path)
 
             with open(path, "r", encoding="utf-8") as file:
                 lines = file.readlines()
@@ -300,7 +328,9 @@ class Processor():
                 "error": f"Error inserting into file: {e}"
             }
 
-    async def _handle_replace_event(self, data: BaseModel) -> Dict[str, Any]:
+    async def _handle_replace_event(self,
+                                    data: BaseModel,
+                                    record_event: bool = True) -> Dict[str, Any]:
         """Replace text in a file
 
         Args:
@@ -308,6 +338,7 @@ class Processor():
                 - path: Path to the file
                 - old_string: Text to replace
                 - new_string: Replacement text
+            record_event: Whether to record the event for undo purposes
 
         Returns:
             Dictionary containing success status
@@ -315,7 +346,8 @@ class Processor():
         try:
             path = self._sanitize_path(data.path)
             self._check_if_path_exists(path)
-            await self.file_event_cache.record_update_event(path)
+            if record_event:
+                await self.file_event_cache.record_update_event(path)
 
             with open(path, "r", encoding="utf-8") as file:
                 content = file.read()
@@ -357,6 +389,133 @@ class Processor():
                 "error": f"Error undoing file changes: {e}"
             }
 
+    async def _handle_batch_event(self, data: BaseModel) -> Dict[str, Any]:
+        """Execute an ordered list of file operations as a single request
+
+        Args:
+            data: data model containing:
+                - operations: Ordered list of view, read, create, update,
+                  insert, replace and delete operations
+                - atomic: Whether to roll back all changes if any operation fails
+
+        Returns:
+            Dictionary containing success status and per-operation results
+        """
+        try:
+            operations = []
+            for operation in data.operations:
+                outgoing_event = self.outgoing_event_builder.build(operation.model_dump())
+                event_type = outgoing_event.event_type
+
+                if event_type not in self.BATCH_READ_OPERATIONS + self.BATCH_WRITE_OPERATIONS:
+                    raise ValueError(f"Operation is not supported in batch: {event_type}")
+
+                operations.append((outgoing_event, self._sanitize_path(outgoing_event.data.path)))
+        except Exception as e:
+            logging.error(f"Error validating batch: {e}", exc_info=True)
+            return {
+                "request_completed": False,
+                "error": f"Error validating batch: {e}"
+            }
+
+        modified_paths = list(dict.fromkeys(
+            path for event, path in operations if event.event_type in self.BATCH_WRITE_OPERATIONS
+        ))
+
+        try:
+            await self.file_event_cache.record_batch_event(modified_paths)
+        except Exception as e:
+            logging.error(f"Error recording batch: {e}", exc_info=True)
+            return {
+                "request_completed": False,
+                "error": f"Error recording batch: {e}"
+            }
+
+        results = await self._execute_batch_operations(
+            [event for event, _ in operations], data.atomic
+        )
+        failed_operations = [
+            index for index, result in enumerate(results) if not result["request_completed"]
+        ]
+
+        if not failed_operations:
+            return {"request_completed": True, "results": results}
+
+        if data.atomic:
+            for path in reversed(modified_paths):
+                await self.file_event_cache.undo_recorded_event(path)
+
+        error = f"Batch operations failed: {failed_operations}"
+        if data.atomic:
+            error += ". All changes were rolled back"
+
+        return {
+            "request_completed": False,
+            "results": results,
+            "error": error
+        }
+
+    async def _execute_batch_operations(self,
+                                        operations: List[BaseModel],
+                                        atomic: bool) -> List[Dict[str, Any]]:
+        """Execute batch operations in order
+
+        Consecutive read operations do not depend on each other, therefore
+        they are executed concurrently. Write operations are executed one by one.
+
+        Args:
+            operations: List of built outgoing events
+            atomic: Whether to stop at the first failed operation
+
+        Returns:
+            List of per-operation results in the order of operations
+        """
+        event_handlers = self._get_event_handlers()
+        results = []
+        index = 0
+
+        while index < len(operations):
+            if operations[index].event_type in self.BATCH_READ_OPERATIONS:
+                group_end = index
+                while group_end < len(operations) and \
+                      operations[group_end].event_type in self.BATCH_READ_OPERATIONS:
+                    group_end += 1
+
+                group = operations[index:group_end]
+                group_results = await asyncio.gather(
+                    *[event_handlers[event.event_type](event.data) for event in group]
+                )
+            else:
+                group = [operations[index]]
+                group_results = [
+                    await event_handlers[group[0].event_type](group[0].data, record_event=False)
+                ]
+
+            for event, result in zip(group, group_results):
+                results.append({"event_type": event.event_type, **result})
+
+            index += len(group)
+
+            if atomic and not all(result["request_completed"] for result in group_results):
+                break
+
+        return results
+
+    def _read_file(self, path: str, line_range: Optional[List[int]] = None) -> str:
+        """Read a file's contents
+
+        Args:
+            path: Path to the file to read
+            line_range: (Optional) [start, end] line range to read
+
+        Returns:
+            File content
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            if line_range:
+                return "".join(file.readlines()[line_range[0]:line_range[1]])
+            return file.read()
+
     def _sanitize_path(self, path: str) -> str:
         """Sanitize a path to prevent directory traversal"""
         if not os.path.isabs(path):
@@ -1,12 +1,12 @@
-import asyncio
 import logging
 import zulip
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from src.adapters.zulip_adapter.conversation.manager import Manager
 from src.adapters.zulip_adapter.event_processing.incoming_event_processor import IncomingEventProcessor
 from src.adapters.zulip_adapter.event_processing.outgoing_event_processor import OutgoingEventProcessor
+from src.adapters.zulip_adapter.event_processing.gap_backfiller import GapBackfiller
 from src.adapters.zulip_adapter.client import Client
 
 from src.core.adapter.base_adapter import BaseAdapter
@@ -29,14 +29,19 @@ class Adapter(BaseAdapter):
 
     async def _setup_client(self) -> None:
         """Connect to client"""
-        self.client = Client(self.config, self.process_incoming_event)
+        self.client = Client(
+            self.config,
+            self.dispatch_incoming_event,
+            self.record_connection_activity,
+            self._backfill_gap
+        )
         await self.client.connect()
         self.connected = self.client.running
 
     async def _get_adapter_info(self) -> None:
         """Get adapter information"""
         await self.rate_limiter.limit_request("get_profile")
-        adapter_info = self.client.client.get_profile()
+        adapter_info = await self.client.api_executor.run(self.client.client.get_profile)
         self.config.add_setting("adapter", "adapter_email", adapter_info.get("email", ""))
         self.config.add_setting("adapter", "adapter_name", adapter_info.get("full_name", ""))
         self.config.add_setting("adapter", "adapter_id", str(adapter_info.get("user_id", "")))
@@ -64,6 +69,19 @@ class Adapter(BaseAdapter):
         """Perform post setup tasks"""
         await self.client.start_polling()
 
+    async def _backfill_gap(self) -> None:
+        """Process the messages missed while the event queue was being replaced"""
+        if not self.incoming_events_processor:
+            return
+
+        missed_messages = await GapBackfiller(
+            self.config, self.client.client, self.conversation_manager
+        ).fetch_missed_messages()
+        logging.info(f"Backfilling {len(missed_messages)} missed Zulip messages")
+
+        for message in missed_messages:
+            await self.dispatch_incoming_event({"type": "message", "message": message})
+
     async def _connection_exists(self) -> Optional[Any]:
         """Check connection
 
@@ -71,7 +89,7 @@ class Adapter(BaseAdapter):
             Any: True if connection exists, False otherwise
         """
         await self.rate_limiter.limit_request("get_profile")
-        response = self.client.client.get_profile()
+        response = await self.client.api_executor.run(self.client.client.get_profile)
         return response and response.get("result", None) == "success"
 
     async def _reconnect_with_client(self) -> None:
@@ -88,7 +106,23 @@ class Adapter(BaseAdapter):
             else:
                 logging.error("Failed to reconnect Zulip client")
 
+    def get_platform_stats(self) -> Dict[str, Any]:
+        """Get the statistics of the Zulip API threads
+
+        Returns:
+            Dict[str, Any]: API executor statistics
+        """
+        if not self.client:
+            return {}
+        return {"api_executor": self.client.api_executor.get_stats()}
+
+    async def _stop_receiving_events(self) -> None:
+        """Stop polling before the queued events are drained"""
+        if self.client:
+            await self.client.stop_polling()
+
     async def _teardown_client(self) -> None:
         """Teardown client"""
         if self.client:
             await self.client.disconnect()
+            self.client.api_executor.shutdown()
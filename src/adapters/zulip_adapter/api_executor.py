@@ -0,0 +1,173 @@
+import asyncio
+import copy
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Dict
+
+from src.core.utils.config import Config
+
+class ApiExecutor:
+    """Runs the blocking calls of the Zulip SDK on dedicated threads
+
+    API calls share a pool of max_api_workers threads, separate from
+    the default executor of the event loop. The event queue long poll
+    is blocked on the server for most of the time, so it has a thread
+    and an HTTP session of its own and never holds up other calls.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls, config: Config):
+        """Get or create the singleton instance
+
+        Args:
+            config: Configuration object (only used during first initialization)
+
+        Returns:
+            The singleton ApiExecutor instance
+        """
+        if cls._instance is None:
+            cls._instance = cls(config)
+        return cls._instance
+
+    def __init__(self, config: Config):
+        """Initialize the API executor
+
+        Args:
+            config: Config instance
+        """
+        self.max_workers = config.get_setting("adapter", "max_api_workers", default=4)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="zulip-api"
+        )
+        self.long_poll_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="zulip-long-poll"
+        )
+        self.queued_calls = 0
+        self.active_calls = 0
+        self.max_queued_calls = 0
+        self.long_poll_active = False
+        self._lock = threading.Lock()
+
+    def configure_client(self, client: Any) -> Any:
+        """Size the HTTP connection pool of a Zulip client to the worker count
+
+        Args:
+            client: Zulip client used by the API calls
+
+        Returns:
+            Copy of the client with a separate HTTP session for the long poll
+        """
+        client.ensure_session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        client.session.mount("https://", adapter)
+        client.session.mount("http://", adapter)
+
+        long_poll_client = copy.copy(client)
+        long_poll_client.session = None
+        return long_poll_client
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """Run a blocking call on the API threads
+
+        Args:
+            func: Function to call
+            *args: Positional arguments of the function
+
+        Returns:
+            Result of the call
+        """
+        with self._lock:
+            self.queued_calls += 1
+            self.max_queued_calls = max(self.max_queued_calls, self.queued_calls)
+
+        try:
+            future = self.executor.submit(self._call, func, args)
+        except Exception:
+            self._discard_queued_call()
+            raise
+
+        future.add_done_callback(self._discard_cancelled_call)
+        return await asyncio.wrap_future(future)
+
+    async def run_long_poll(self, func: Callable, *args: Any) -> Any:
+        """Run the event queue long poll on its reserved thread
+
+        Args:
+            func: Function to call
+            *args: Positional arguments of the function
+
+        Returns:
+            Result of the call
+        """
+        with self._lock:
+            self.long_poll_active = True
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.long_poll_executor, func, *args
+            )
+        finally:
+            with self._lock:
+                self.long_poll_active = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the executor statistics
+
+        Returns:
+            Dictionary with the worker count, the calls waiting for a thread,
+            the calls in progress and the most calls that ever waited at once
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued_calls": self.queued_calls,
+                "active_calls": self.active_calls,
+                "max_queued_calls": self.max_queued_calls,
+                "long_poll_active": self.long_poll_active
+            }
+
+    def shutdown(self) -> None:
+        """Stop the threads and drop the singleton instance"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.long_poll_executor.shutdown(wait=False, cancel_futures=True)
+
+        if ApiExecutor._instance is self:
+            ApiExecutor._instance = None
+
+    def _discard_cancelled_call(self, future: Future) -> None:
+        """Stop counting a call that was cancelled before it reached a thread
+
+        Args:
+            future: Future of the call
+        """
+        if future.cancelled():
+            self._discard_queued_call()
+
+    def _discard_queued_call(self) -> None:
+        """Stop counting a call that waited for a thread but will never run"""
+        with self._lock:
+            self.queued_calls -= 1
+
+    def _call(self, func: Callable, args: Any) -> Any:
+        """Call a function on a worker thread and account for it
+
+        Args:
+            func: Function to call
+            args: Positional arguments of the function
+
+        Returns:
+            Result of the call
+        """
+        with self._lock:
+            self.queued_calls -= 1
+            self.active_calls += 1
+
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.active_calls -= 1
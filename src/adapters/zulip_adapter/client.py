@@ -4,19 +4,33 @@ import zulip
 
 from typing import List, Dict, Callable, Optional
 
+from src.adapters.zulip_adapter.api_executor import ApiExecutor
+from src.adapters.zulip_adapter.event_queue_state import EventQueueState
+
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.config import Config
 
 class Client:
     """Zulip client implementation"""
-
-    def __init__(self, config: Config, process_zulip_event: Callable):
+    BAD_EVENT_QUEUE_ID = "BAD_EVENT_QUEUE_ID"
+    INITIAL_BACKOFF = 1  # in seconds
+    MAX_BACKOFF = 60     # in seconds
+
+    def __init__(self,
+                 config: Config,
+                 process_zulip_event: Callable,
+                 record_activity: Optional[Callable] = None,
+                 backfill_gap: Optional[Callable] = None):
         self.config = config
         self.process_event = process_zulip_event
+        self.record_activity = record_activity
+        self.backfill_gap = backfill_gap
         self.rate_limiter = RateLimiter.get_instance(self.config)
         self.client = zulip.Client(
             config_file=self.config.get_setting("adapter", "zuliprc_path")
         )
+        self.api_executor = ApiExecutor.get_instance(self.config)
+        self.queue_state = EventQueueState(self.config)
         self.queue_id = None
         self.last_event_id = None
         self.running = False
@@ -24,18 +38,21 @@ class Client:
         self._polling_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
-        """Initialize connection and register for events"""
+        """Resume the event queue of the previous run or register a new one
+
+        A resumed queue that has expired in the meantime is
+        replaced by the polling loop.
+        """
         try:
-            result = self.client.register(
-                event_types=[
-                    "message", "reaction", "update_message",
-                    "delete_message", "stream", "subscription", "realm"
-                ]
-            )
-
-            if result:
-                self.queue_id = result["queue_id"]
-                self.last_event_id = result["last_event_id"]
+            state = await self.queue_state.load()
+
+            if state:
+                self.queue_id = state["queue_id"]
+                self.last_event_id = state["last_event_id"]
+                self.running = True
+
+                logging.info(f"Resumed Zulip event queue {self.queue_id}")
+            elif await self.api_executor.run(self._register_queue):
                 self.running = True
 
                 logging.info(f"Connected to Zulip")
@@ -44,6 +61,26 @@ class Client:
         except Exception as e:
             logging.error(f"Error connecting to Zulip: {e}")
 
+    def _register_queue(self) -> bool:
+        """Register a new event queue
+
+        Returns:
+            bool: True if the queue was registered, False otherwise
+        """
+        result = self.client.register(
+            event_types=[
+                "message", "reaction", "update_message",
+                "delete_message", "stream", "subscription", "realm"
+            ]
+        )
+
+        if not result or "queue_id" not in result:
+            return False
+
+        self.queue_id = result["queue_id"]
+        self.last_event_id = result["last_event_id"]
+        return True
+
     async def start_polling(self) -> None:
         """Start the long polling loop in a separate task"""
         if self._polling_task is None or self._polling_task.done():
@@ -51,34 +88,91 @@ class Client:
             logging.info("Started Zulip event polling")
 
     async def _polling_loop(self) -> None:
-        """Long polling loop that runs as a background task"""
-        loop = asyncio.get_running_loop()
+        """Long polling loop that runs as a background task
+
+        Received events are handed to the adapter's dispatcher and the next
+        poll is issued right away, so a slow conversation does not delay the others.
+        Failed requests are retried with exponential backoff, an expired
+        event queue is replaced with a new one.
+        """
+        long_poll_client = self.api_executor.configure_client(self.client)
+        backoff = self.INITIAL_BACKOFF
 
         while self.running:
             try:
                 await self.rate_limiter.limit_request("get_events")
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.client.get_events(
+                response = await self.api_executor.run_long_poll(
+                    lambda: long_poll_client.get_events(
                         queue_id=self.queue_id,
                         last_event_id=self.last_event_id,
                         dont_block=False
                     )
                 )
 
-                if response and "events" in response:
-                    events = response["events"]
+                if response and response.get("code", None) == self.BAD_EVENT_QUEUE_ID:
+                    logging.warning(f"Zulip event queue {self.queue_id} has expired")
+                    await self._replace_expired_queue()
+                    backoff = self.INITIAL_BACKOFF
+                    continue
+
+                if not response or "events" not in response:
+                    raise RuntimeError(f"Unexpected response: {response}")
+
+                backoff = self.INITIAL_BACKOFF
+                if self.record_activity:
+                    self.record_activity()
+
+                events = response["events"]
+
+                if events:
+                    self.last_event_id = events[-1]["id"]
 
-                    if events:
-                        self.last_event_id = events[-1]["id"]
+                for event in events:
+                    await self.process_event(event)
 
-                    for event in events:
-                        await self.process_event(event)
+                if events:
+                    await self.queue_state.save(self.queue_id, self.last_event_id)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logging.error(f"Error in polling loop: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF)
 
-    async def disconnect(self) -> None:
-        """Disconnect from Zulip and clean up resources"""
+    async def _replace_expired_queue(self) -> None:
+        """Register a new event queue in place of an expired one
+
+        Registration is retried with exponential backoff. The events
+        sent between the two queues are lost, so the messages of known
+        conversations are backfilled once the new queue is registered.
+        """
+        await self.queue_state.clear()
+        backoff = self.INITIAL_BACKOFF
+
+        while self.running:
+            try:
+                if await self.api_executor.run(self._register_queue):
+                    break
+                logging.error("Failed to register a new Zulip event queue")
+            except Exception as e:
+                logging.error(f"Error registering a new Zulip event queue: {e}")
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.MAX_BACKOFF)
+        else:
+            return
+
+        logging.info(f"Registered new Zulip event queue {self.queue_id}")
+        await self.queue_state.save(self.queue_id, self.last_event_id)
+
+        if self.backfill_gap:
+            try:
+                await self.backfill_gap()
+            except Exception as e:
+                logging.error(f"Error backfilling missed Zulip events: {e}", exc_info=True)
+
+    async def stop_polling(self) -> None:
+        """Stop the long polling loop, so that no more events are received"""
         self.running = False
 
         if self._polling_task and not self._polling_task.done():
@@ -89,6 +183,17 @@ class Client:
             except asyncio.CancelledError:
                 pass  # This is expected
 
+    async def disconnect(self) -> None:
+        """Disconnect from Zulip and clean up resources
+
+        The event queue is kept on the server and saved,
+        so the next connect resumes it. The adapter stops polling and
+        drains its queued events before disconnecting, so the saved
+        position does not skip events that were received but not processed.
+        """
+        await self.stop_polling()
+        await self.queue_state.save(self.queue_id, self.last_event_id)
+
         self.queue_id = None
         self.last_event_id = None
         logging.info("Disconnected from Zulip")
@@ -3,7 +3,7 @@ import re
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from src.adapters.zulip_adapter.conversation.data_classes import ConversationInfo
 from src.adapters.zulip_adapter.conversation.message_builder import MessageBuilder
@@ -24,6 +24,15 @@ class ZulipEventType(str, Enum):
 class Manager(BaseManager):
     """Tracks and manages information about Zulip conversations"""
 
+    def __init__(self, config: Config):
+        """Initialize the Zulip conversation manager
+
+        Args:
+            config: Config instance
+        """
+        super().__init__(config)
+        self.stream_conversations: Dict[str, Set[str]] = {}  # stream_id -> conversation_ids
+
     def get_conversation(self, conversation_id: str) -> Optional[BaseConversationInfo]:
         """Get the conversation info for a given conversation ID
 
@@ -91,6 +100,8 @@ class Manager(BaseManager):
                 )
                 self.conversations[new_conversation.conversation_id].messages.add(str(message_id))
                 self.conversations[old_conversation.conversation_id].messages.discard(str(message_id))
+                self.index.remove_message(old_conversation.conversation_id, message_id, attachment_ids)
+                self.index.add_message(new_conversation.conversation_id, message_id, attachment_ids)
 
                 for attachment_id in attachment_ids:
                     new_conversation.attachments.add(attachment_id)
@@ -99,14 +110,7 @@ class Manager(BaseManager):
                     if attachment:
                         attachment.conversations.add(new_conversation.conversation_id)
 
-                    still_referenced = False
-                    if old_conversation.conversation_id in self.cache.message_cache.messages:
-                        for other_msg_id, other_msg in self.cache.message_cache.messages[old_conversation.conversation_id].items():
-                            if other_msg_id != message_id and attachment_id in other_msg.attachments:
-                                still_referenced = True
-                                break
-
-                    if not still_referenced:
+                    if not self.index.count_attachment_references(old_conversation.conversation_id, attachment_id):
                         old_conversation.attachments.discard(attachment_id)
                         if attachment:
                             attachment.conversations.discard(old_conversation.conversation_id)
@@ -140,7 +144,12 @@ class Manager(BaseManager):
         if event.get("type", None) != "realm":
             stream_id = str(event.get("stream_id", ""))
 
-        for conversation in self.conversations.values():
+        if stream_id:
+            conversations = self._get_indexed_conversations(self.stream_conversations.get(stream_id, set()))
+        else:
+            conversations = list(self.conversations.values())
+
+        for conversation in conversations:
             updated = False
 
             if not stream_id:
@@ -190,6 +199,9 @@ class Manager(BaseManager):
                 conversation_info.stream_name = event["message"].get("stream_name", None)
 
             conversation_info.stream_topic = event["message"].get("subject", None)
+            self.stream_conversations.setdefault(
+                conversation_info.stream_id, set()
+            ).add(conversation_info.conversation_id)
 
         return conversation_info
 
@@ -248,8 +260,8 @@ class Manager(BaseManager):
         message_id = str(message.get("message_id", ""))
 
         if message_id:
-            for conversation_id, conversation_info in self.conversations.items():
-                if message_id in conversation_info.messages:
+            for conversation_id in self.index.get_message_conversations(message_id):
+                if conversation_id in self.conversations:
                     return conversation_id
 
         return None
@@ -326,7 +338,9 @@ class Manager(BaseManager):
             thread_changed, thread_info = await self.thread_handler.update_thread_info(message, conversation_info)
             cached_msg = await self._update_message(event, conversation_info, thread_changed, thread_info)
             attachments = await self._update_attachment(conversation_info, event.get("attachments", []))
+            self.index.remove_message(conversation_info.conversation_id, cached_msg.message_id, cached_msg.attachments)
             cached_msg.attachments = {attachment["attachment_id"] for attachment in attachments}
+            self.index.add_message(conversation_info.conversation_id, cached_msg.message_id, cached_msg.attachments)
 
             await self._update_delta_list(
                 conversation_id=conversation_info.conversation_id,
@@ -3,9 +3,11 @@
 from src.adapters.zulip_adapter.event_processing.incoming_event_processor import IncomingEventProcessor
 from src.adapters.zulip_adapter.event_processing.outgoing_event_processor import OutgoingEventProcessor
 from src.adapters.zulip_adapter.event_processing.history_fetcher import HistoryFetcher
+from src.adapters.zulip_adapter.event_processing.gap_backfiller import GapBackfiller
 
 __all__ = [
     "IncomingEventProcessor",
     "OutgoingEventProcessor",
-    "HistoryFetcher"
+    "HistoryFetcher",
+    "GapBackfiller"
 ]
@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 import base64
 import logging
@@ -17,6 +16,7 @@ from src.core.utils.attachment_loading import (
     save_metadata_file
 )
 from src.core.utils.config import Config
+from src.core.utils.http_session_pool import HttpSessionPool
 
 class Downloader(BaseLoader):
     """Handles efficient file downloads from Zulip"""
@@ -35,6 +35,7 @@ class Downloader(BaseLoader):
         super().__init__(config, client)
         self.chunk_size = self.config.get_setting("adapter", "chunk_size")
         self.content_required = content_required
+        self.http_session_pool = HttpSessionPool.get_instance(config)
 
     async def download_attachment(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process attachments from a Zulip message
@@ -45,43 +46,53 @@ class Downloader(BaseLoader):
         Returns:
             List of dictionaries with attachment metadata, empty list if no attachments
         """
-        attachments_metadata = []
+        return list(await asyncio.gather(*[
+            self._process_attachment(filename, file_path)
+            for filename, file_path in self._get_attachments_list(message)
+        ]))
 
-        for filename, file_path in self._get_attachments_list(message):
-            metadata = self._get_initial_metadata(filename, file_path)
+    async def _process_attachment(self, filename: str, file_path: str) -> Dict[str, Any]:
+        """Download a single attachment of a Zulip message
 
-            attachment_dir = os.path.join(
-                self.download_dir,
-                metadata["attachment_type"],
-                metadata["attachment_id"]
-            )
-            local_file_path = os.path.join(attachment_dir, metadata["filename"])
-
-            if not os.path.exists(local_file_path):
-                create_attachment_dir(attachment_dir)
-                await self._download_file(metadata["url"], local_file_path)
-            else:
-                logging.info(f"Skipping download for {local_file_path} because it already exists")
-
-            metadata["size"] = os.path.getsize(local_file_path)
-            mime = magic.Magic(mime=True)
-            metadata["content_type"] = mime.from_file(local_file_path)
-
-            if metadata["size"] <= self.max_file_size:
-                metadata["processable"] = True
-                save_metadata_file(metadata, attachment_dir)
-
-                if self.content_required:
-                    try:
-                        with open(local_file_path, "rb") as f:
-                            file_content = f.read()
-                            metadata["content"] = base64.b64encode(file_content).decode("utf-8")
-                    except Exception as e:
-                        logging.error(f"Error reading file {local_file_path}: {e}")
-
-            attachments_metadata.append(metadata)
+        Args:
+            filename: The filename of the attachment
+            file_path: The file path of the attachment
 
-        return attachments_metadata
+        Returns:
+            Dictionary with attachment metadata
+        """
+        metadata = self._get_initial_metadata(filename, file_path)
+
+        attachment_dir = os.path.join(
+            self.download_dir,
+            metadata["attachment_type"],
+            metadata["attachment_id"]
+        )
+        local_file_path = os.path.join(attachment_dir, metadata["filename"])
+
+        if not os.path.exists(local_file_path):
+            create_attachment_dir(attachment_dir)
+            await self._download_file(metadata["url"], local_file_path)
+        else:
+            logging.info(f"Skipping download for {local_file_path} because it already exists")
+
+        metadata["size"] = os.path.getsize(local_file_path)
+        mime = magic.Magic(mime=True)
+        metadata["content_type"] = mime.from_file(local_file_path)
+
+        if metadata["size"] <= self.max_file_size:
+            metadata["processable"] = True
+            save_metadata_file(metadata, attachment_dir)
+
+            if self.content_required:
+                try:
+                    with open(local_file_path, "rb") as f:
+                        file_content = f.read()
+                        metadata["content"] = base64.b64encode(file_content).decode("utf-8")
+                except Exception as e:
+                    logging.error(f"Error reading file {local_file_path}: {e}")
+
+        return metadata
 
     def _get_attachments_list(self, message: Dict[str, Any]) -> List[Tuple[str, str]]:
         """Extract attachment information from a Zulip message
@@ -176,8 +187,9 @@ class Downloader(BaseLoader):
             file_path: Path to save the file
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(download_url, timeout=30) as response:
+            async with self.http_session_pool.limit(download_url):
+                session = self.http_session_pool.get_session()
+                async with session.get(download_url) as response:
                     if response.status != 200:
                         content = await response.text()
                         logging.error(f"Download failed: HTTP {response.status}, Response: {content[:200]}")
@@ -1,8 +1,6 @@
 import aiohttp
 import asyncio
-import base64
 import logging
-import magic
 import os
 import shutil
 
@@ -10,10 +8,11 @@ from typing import Dict, Any, Optional
 from src.adapters.zulip_adapter.event_processing.attachment_loaders.base_loader import BaseLoader
 from src.core.utils.attachment_loading import (
     create_attachment_dir,
-    get_attachment_type_by_extension,
-    move_attachment
+    get_attachment_type_by_extension
 )
+from src.core.utils.attachment_uploading import AttachmentUpload
 from src.core.utils.config import Config
+from src.core.utils.http_session_pool import HttpSessionPool
 
 class Uploader(BaseLoader):
     """Handles efficient file uploads to Zulip"""
@@ -26,6 +25,7 @@ class Uploader(BaseLoader):
             client: Zulip client
         """
         super().__init__(config, client)
+        self.http_session_pool = HttpSessionPool.get_instance(config)
         self.temp_dir = os.path.join(
             self.config.get_setting("attachments", "storage_dir"),
             "tmp_uploads"
@@ -51,73 +51,76 @@ class Uploader(BaseLoader):
             Dictionary with attachment metadata or {} if error
         """
         try:
-            try:
-                file_content = base64.b64decode(attachment.content)
-            except Exception as e:
-                logging.error(f"Failed to decode base64 content: {e}")
-                return None
+            upload = AttachmentUpload(
+                attachment.content,
+                os.path.join(self.temp_dir, attachment.file_name),
+                self.max_file_size
+            )
 
-            if len(file_content) > self.max_file_size:
-                logging.error(f"Decoded content exceeds size limit: {len(file_content)/1024/1024:.2f} MB")
+            try:
+                upload.prepare()
+            except ValueError as e:
+                logging.error(str(e))
                 return None
 
-            temp_path = os.path.join(self.temp_dir, attachment.file_name)
-            with open(temp_path, "wb") as f:
-                f.write(file_content)
-
-            result = await self._upload_file(temp_path)
+            result = await self._upload_file(upload)
             if not result or "uri" not in result:
                 logging.error(f"Upload failed: {result}")
+                upload.discard()
                 return None
 
-            self._clean_up_uploaded_file(temp_path, result["uri"])
+            self._clean_up_uploaded_file(upload, result["uri"])
             return result["uri"]
         except Exception as e:
             logging.error(f"Error uploading file: {str(e)}", exc_info=True)
             return None
 
-    async def _upload_file(self, file_path: str) -> Dict[str, Any]:
+    async def _upload_file(self, upload: AttachmentUpload) -> Dict[str, Any]:
         """Upload a file manually using HTTP requests
 
+        The content is decoded while the request body is streamed
+        and saved to the temporary file in the same pass.
+
         Args:
-            file_path: Path to the file
+            upload: Attachment upload
 
         Returns:
             Upload result dictionary
         """
-        file_name = os.path.basename(file_path)
-        mime = magic.Magic(mime=True)
-        mime_type = mime.from_file(file_path)
-
         api_key = self._get_api_key()
         email = self.config.get_setting("adapter", "adapter_email")
         upload_url = f"{self.zulip_site}/api/v1/user_uploads"
         auth = aiohttp.BasicAuth(email, api_key)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                with open(file_path, "rb") as f:
-                    form_data = aiohttp.FormData()
-                    form_data.add_field("file", f, filename=file_name, content_type=mime_type)
-
-                    async with session.post(upload_url, data=form_data, auth=auth) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            logging.error(f"Upload failed with status {response.status}: {error_text}")
-                            return {}
-
-                        return await response.json()
+            form_data = aiohttp.FormData()
+            form_data.add_field(
+                "file",
+                aiohttp.AsyncIterablePayload(upload.stream()),
+                filename=upload.file_name,
+                content_type=upload.content_type
+            )
+
+            session = self.http_session_pool.get_session()
+            async with session.post(upload_url, data=form_data, auth=auth) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logging.error(f"Upload failed with status {response.status}: {error_text}")
+                    return {}
+
+                return await response.json()
         except Exception as e:
             logging.error(f"Error in manual upload: {e}", exc_info=True)
             return {}
 
-    def _clean_up_uploaded_file(self, old_path: str, zulip_uri: str) -> None:
-        """Clean up a file after it has been uploaded to Zulip
+    def _clean_up_uploaded_file(self, upload: AttachmentUpload, zulip_uri: str) -> None:
+        """Move a file into the attachment store after it has been uploaded to Zulip
 
         Args:
-            old_path: Path to the old file
+            upload: Attachment upload
             zulip_uri: Zulip URI of the uploaded file
         """
+        old_path = upload.file_path
         file_extension = old_path.split(".")[-1]
         attachment_id = self._generate_attachment_id(zulip_uri)
         attachment_type = get_attachment_type_by_extension(file_extension)
@@ -128,4 +131,4 @@ class Uploader(BaseLoader):
             file_name += "." + file_extension
 
         create_attachment_dir(attachment_dir)
-        move_attachment(old_path, os.path.join(attachment_dir, file_name))
+        upload.move_to(os.path.join(attachment_dir, file_name))
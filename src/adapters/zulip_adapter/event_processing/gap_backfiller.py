@@ -0,0 +1,95 @@
+import json
+import logging
+
+from typing import Any, Dict, List
+
+from src.adapters.zulip_adapter.api_executor import ApiExecutor
+from src.adapters.zulip_adapter.conversation.manager import Manager
+from src.adapters.zulip_adapter.event_processing.history_fetcher import get_conversation_narrow
+
+from src.core.rate_limiter.rate_limiter import RateLimiter
+from src.core.utils.config import Config
+
+class GapBackfiller:
+    """Fetches the messages that were sent while no event queue was registered
+
+    Only conversations known to the adapter are backfilled, starting
+    right after the newest message known in each of them. Unknown
+    conversations are picked up with their history on their next message.
+    """
+
+    def __init__(self, config: Config, client: Any, conversation_manager: Manager):
+        """Initialize the gap backfiller
+
+        Args:
+            config: Config instance
+            client: Zulip client
+            conversation_manager: Conversation manager instance
+        """
+        self.config = config
+        self.client = client
+        self.conversation_manager = conversation_manager
+        self.rate_limiter = RateLimiter.get_instance(self.config)
+        self.api_executor = ApiExecutor.get_instance(self.config)
+        self.max_messages = self.config.get_setting("adapter", "max_history_limit", default=100)
+
+    async def fetch_missed_messages(self) -> List[Dict[str, Any]]:
+        """Fetch the messages sent after the newest known message of every conversation
+
+        Returns:
+            Zulip messages ordered by ID
+        """
+        missed_messages = {}
+
+        for conversation_info in list(self.conversation_manager.conversations.values()):
+            narrow = get_conversation_narrow(conversation_info)
+
+            if not conversation_info.messages or not narrow:
+                continue
+
+            try:
+                for message in await self._fetch_messages_after(
+                    conversation_info.conversation_id,
+                    narrow,
+                    int(max(conversation_info.messages, key=int))
+                ):
+                    missed_messages[message["id"]] = message
+            except Exception as e:
+                logging.error(
+                    f"Error backfilling conversation {conversation_info.conversation_id}: {e}",
+                    exc_info=True
+                )
+
+        return [missed_messages[message_id] for message_id in sorted(missed_messages)]
+
+    async def _fetch_messages_after(self,
+                                    conversation_id: str,
+                                    narrow: List[Dict[str, Any]],
+                                    anchor: int) -> List[Dict[str, Any]]:
+        """Fetch the messages of a conversation that are newer than the anchor
+
+        Args:
+            conversation_id: Conversation ID
+            narrow: Narrow of the conversation
+            anchor: ID of the newest known message
+
+        Returns:
+            List of Zulip messages
+        """
+        await self.rate_limiter.limit_request("get_messages", conversation_id)
+
+        result = await self.api_executor.run(
+            lambda: self.client.get_messages({
+                "narrow": json.dumps(narrow),
+                "anchor": anchor,
+                "num_before": 0,
+                "num_after": self.max_messages,
+                "include_anchor": False,
+                "apply_markdown": False
+            })
+        )
+
+        if result.get("result", None) != "success":
+            return []
+
+        return result.get("messages", [])
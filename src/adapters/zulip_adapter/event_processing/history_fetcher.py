@@ -5,6 +5,7 @@ import re
 
 from typing import Any, Dict, List, Optional
 
+from src.adapters.zulip_adapter.api_executor import ApiExecutor
 from src.adapters.zulip_adapter.conversation.manager import Manager
 from src.adapters.zulip_adapter.event_processing.attachment_loaders.downloader import Downloader
 from src.adapters.zulip_adapter.event_processing.user_info_preprocessor import UserInfoPreprocessor
@@ -12,6 +13,26 @@ from src.adapters.zulip_adapter.event_processing.user_info_preprocessor import U
 from src.core.events.history_fetcher.base_history_fetcher import BaseHistoryFetcher
 from src.core.utils.config import Config
 
+def get_conversation_narrow(conversation: Any) -> List[Dict[str, Any]]:
+    """Get the narrow parameter for a conversation
+
+    Args:
+        conversation: Conversation info object
+
+    Returns:
+        Narrow parameter for API call or empty list if info is not found
+    """
+    if conversation.conversation_type == "private":
+        emails = conversation.emails()
+        if emails:
+            return [{"operator": "pm-with", "operand": ",".join(emails)}]
+        return []
+
+    return [
+        {"operator": "stream", "operand": conversation.stream_name},
+        {"operator": "topic", "operand": conversation.stream_topic}
+    ]
+
 class HistoryFetcher(BaseHistoryFetcher):
     """Fetches and formats history from Zulip"""
 
@@ -145,9 +166,7 @@ class HistoryFetcher(BaseHistoryFetcher):
             "get_messages", self.conversation.conversation_id
         )
 
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(
-            None,
+        result = await ApiExecutor.get_instance(self.config).run(
             lambda: self.client.get_messages({
                 "narrow": narrow,
                 "anchor": self.anchor,
@@ -248,16 +267,7 @@ class HistoryFetcher(BaseHistoryFetcher):
         Returns:
             Narrow parameter for API call or empty list if info is not found
         """
-        if self.conversation.conversation_type == "private":
-            emails = self.conversation.emails()
-            if emails:
-                return [{"operator": "pm-with", "operand": ",".join(emails)}]
-            return []
-
-        return [
-            {"operator": "stream", "operand": self.conversation.stream_name},
-            {"operator": "topic", "operand": self.conversation.stream_topic}
-        ]
+        return get_conversation_narrow(self.conversation)
 
     def _extract_reply_to_id(self, content: str) -> str:
         """Get the reply to ID from a message
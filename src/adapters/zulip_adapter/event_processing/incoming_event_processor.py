@@ -1,9 +1,11 @@
 import asyncio
 import logging
 
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
+from src.adapters.zulip_adapter.api_executor import ApiExecutor
 from src.adapters.zulip_adapter.conversation.manager import Manager
 from src.adapters.zulip_adapter.event_processing.attachment_loaders.downloader import Downloader
 from src.adapters.zulip_adapter.event_processing.history_fetcher import HistoryFetcher
@@ -24,6 +26,7 @@ class ZulipIncomingEventType(str, Enum):
 
 class IncomingEventProcessor(BaseIncomingEventProcessor):
     """Zulip events processor"""
+    MAX_REMEMBERED_MESSAGES = 10000
 
     def __init__(self, config: Config, client: Any, conversation_manager: Manager):
         """Initialize the Zulip incoming event processor
@@ -35,6 +38,8 @@ class IncomingEventProcessor(BaseIncomingEventProcessor):
         """
         super().__init__(config, client, conversation_manager)
         self.downloader = Downloader(self.config, self.client)
+        self.api_executor = ApiExecutor.get_instance(self.config)
+        self.message_keys: OrderedDict = OrderedDict()
 
     def _get_event_handlers(self) -> Dict[str, Callable]:
         """Get event handlers for incoming events
@@ -52,6 +57,56 @@ class IncomingEventProcessor(BaseIncomingEventProcessor):
             ZulipIncomingEventType.FETCH_HISTORY: self._handle_fetch_history
         }
 
+    def get_conversation_key(self, event: Any) -> Optional[str]:
+        """Get the key of the conversation an event belongs to
+
+        Events that refer to messages by ID only (e.g. reactions) use the
+        conversation of the message seen in an earlier event. Events that
+        belong to no conversation share one key.
+
+        Args:
+            event: Zulip event
+
+        Returns:
+            Conversation key or None
+        """
+        message = event.get("message", None)
+
+        if event.get("type", None) == "message" and message:
+            key = self._get_message_conversation_key(message)
+            self.message_keys[message.get("id", None)] = key
+            if len(self.message_keys) > self.MAX_REMEMBERED_MESSAGES:
+                self.message_keys.popitem(last=False)
+            return key
+
+        message_ids = event.get("message_ids", None) or [event.get("message_id", None)]
+        for message_id in message_ids:
+            if message_id in self.message_keys:
+                return self.message_keys[message_id]
+
+        topic = event.get("orig_subject", None) or event.get("subject", None) or event.get("topic", None)
+        if event.get("stream_id", None) and topic:
+            return f"{event['stream_id']}/{topic}"
+
+        return None
+
+    def _get_message_conversation_key(self, message: Dict[str, Any]) -> Optional[str]:
+        """Get the key of the conversation of a message
+
+        Args:
+            message: Zulip message
+
+        Returns:
+            Conversation key or None
+        """
+        if message.get("type", None) == "private":
+            return "_".join(sorted(
+                str(recipient.get("id")) for recipient in message.get("display_recipient", [])
+                if "id" in recipient
+            ))
+
+        return f"{message.get('stream_id', None)}/{message.get('subject', None)}"
+
     async def _handle_message(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Handle a new message event from Zulip
 
@@ -71,7 +126,7 @@ class IncomingEventProcessor(BaseIncomingEventProcessor):
 
             server = None
             if not await self.conversation_manager.conversation_exists(message):
-                server = self.client.get_server_settings()
+                server = await self.api_executor.run(self.client.get_server_settings)
 
             attachments = await self.downloader.download_attachment(message)
             initial_event_details = {"message": message, "attachments": attachments, "server": server}
@@ -133,9 +188,10 @@ class IncomingEventProcessor(BaseIncomingEventProcessor):
             List of events to emit
         """
         events = []
-        delta = await self.conversation_manager.migrate_between_conversations(
-            {"message": event, "server": self.client.get_server_settings()}
-        )
+        delta = await self.conversation_manager.migrate_between_conversations({
+            "message": event,
+            "server": await self.api_executor.run(self.client.get_server_settings)
+        })
 
         if delta:
             await self._add_new_conversation_events(events=events, delta=delta, exclude_messages=False)
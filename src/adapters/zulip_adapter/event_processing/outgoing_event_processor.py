@@ -6,6 +6,7 @@ import os
 from pydantic import BaseModel
 from typing import Any, Dict, Optional
 
+from src.adapters.zulip_adapter.api_executor import ApiExecutor
 from src.adapters.zulip_adapter.conversation.manager import Manager
 from src.adapters.zulip_adapter.event_processing.attachment_loaders.uploader import Uploader
 from src.adapters.zulip_adapter.event_processing.user_info_preprocessor import UserInfoPreprocessor
@@ -27,6 +28,7 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         """
         super().__init__(config, client, conversation_manager)
         self.uploader = Uploader(self.config, self.client)
+        self.api_executor = ApiExecutor.get_instance(self.config)
 
     async def _send_message(self, conversation_info: Any, data: BaseModel) -> Dict[str, Any]:
         """Send a message to a chat
@@ -60,7 +62,7 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
 
         for message in messages:
             await self.rate_limiter.limit_request("message", conversation_info.conversation_id)
-            result = self.client.send_message({
+            result = await self.api_executor.run(self.client.send_message, {
                 "type": message_type,
                 "to": to_field,
                 "content": message,
@@ -91,7 +93,9 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             "message_id": int(data.message_id),
             "content": await user_info_preprocessor.process_outgoing_event(data.mentions, data.text)
         }
-        self._check_api_request_success(self.client.update_message(message_data), "edit message")
+        self._check_api_request_success(
+            await self.api_executor.run(self.client.update_message, message_data), "edit message"
+        )
 
         logging.info(f"Message {data.message_id} edited successfully")
         return {"request_completed": True}
@@ -109,9 +113,8 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         await self.rate_limiter.limit_request("delete_message", conversation_info.conversation_id)
 
         self._check_api_request_success(
-            self.client.call_endpoint(
-                f"messages/{int(data.message_id)}",
-                method="DELETE"
+            await self.api_executor.run(
+                lambda: self.client.call_endpoint(f"messages/{int(data.message_id)}", method="DELETE")
             ),
             "delete message"
         )
@@ -135,7 +138,9 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             "message_id": int(data.message_id),
             "emoji_name": EmojiConverter.get_instance().standard_to_platform_specific(data.emoji)
         }
-        self._check_api_request_success(self.client.add_reaction(reaction_data), "add reaction")
+        self._check_api_request_success(
+            await self.api_executor.run(self.client.add_reaction, reaction_data), "add reaction"
+        )
 
         logging.info(f"Reaction {data.emoji} added to message {data.message_id}")
         return {"request_completed": True}
@@ -156,7 +161,9 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             "message_id": int(data.message_id),
             "emoji_name": EmojiConverter.get_instance().standard_to_platform_specific(data.emoji)
         }
-        self._check_api_request_success(self.client.remove_reaction(reaction_data), "remove reaction")
+        self._check_api_request_success(
+            await self.api_executor.run(self.client.remove_reaction, reaction_data), "remove reaction"
+        )
 
         logging.info(f"Reaction {data.emoji} removed from message {data.message_id}")
         return {"request_completed": True}
@@ -181,13 +188,17 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
 
         request["op"] = "start"
         await self.rate_limiter.limit_request("send_typing_indicator", data.conversation_id)
-        self.client.call_endpoint(url="typing", method="POST", request=request)
+        await self.api_executor.run(
+            lambda: self.client.call_endpoint(url="typing", method="POST", request=request)
+        )
 
         await asyncio.sleep(5)
 
         request["op"] = "stop"
         await self.rate_limiter.limit_request("send_typing_indicator", data.conversation_id)
-        self.client.call_endpoint(url="typing", method="POST", request=request)
+        await self.api_executor.run(
+            lambda: self.client.call_endpoint(url="typing", method="POST", request=request)
+        )
 
         logging.info(f"Typing indicator sent to {data.conversation_id}")
         return {"request_completed": True}
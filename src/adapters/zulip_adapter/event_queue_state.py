@@ -0,0 +1,98 @@
+import asyncio
+import json
+import logging
+import os
+
+from typing import Any, Dict, Optional
+from src.core.utils.config import Config
+
+class EventQueueState:
+    """Persistent ID and position of the Zulip event queue
+
+    The queue is kept on the Zulip server between restarts of the
+    adapter, so resuming it delivers the events missed in between.
+    """
+
+    def __init__(self, config: Config):
+        """Initialize the event queue state
+
+        Args:
+            config: Configuration instance
+        """
+        self.state_path = config.get_setting(
+            "adapter",
+            "event_queue_state_path",
+            default="cache/zulip_adapter/event_queue.json"
+        )
+
+    async def load(self) -> Optional[Dict[str, Any]]:
+        """Load the event queue saved by the previous run of the adapter
+
+        Returns:
+            Dictionary with queue_id and last_event_id, or None if nothing was saved
+        """
+        if not self.state_path or not os.path.exists(self.state_path):
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+            state = await loop.run_in_executor(None, self._read_state)
+
+            if state.get("queue_id", None) and state.get("last_event_id", None) is not None:
+                return state
+        except Exception as e:
+            logging.error(f"Error loading Zulip event queue state: {e}", exc_info=True)
+
+        return None
+
+    async def save(self, queue_id: Optional[str], last_event_id: Optional[int]) -> None:
+        """Save the event queue
+
+        Args:
+            queue_id: Event queue ID
+            last_event_id: ID of the last received event
+        """
+        if not self.state_path or not queue_id:
+            return
+
+        try:
+            state = {"queue_id": queue_id, "last_event_id": last_event_id}
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: self._write_state(state))
+        except Exception as e:
+            logging.error(f"Error saving Zulip event queue state: {e}", exc_info=True)
+
+    async def clear(self) -> None:
+        """Forget the saved event queue"""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, os.remove, self.state_path)
+        except Exception as e:
+            logging.error(f"Error clearing Zulip event queue state: {e}", exc_info=True)
+
+    def _read_state(self) -> Dict[str, Any]:
+        """Read the state file
+
+        Returns:
+            Saved state
+        """
+        with open(self.state_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        """Write the state file atomically
+
+        Args:
+            state: State to save
+        """
+        state_dir = os.path.dirname(self.state_path)
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(temp_path, self.state_path)
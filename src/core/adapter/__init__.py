@@ -1,7 +1,9 @@
 """Adapter implementation."""
 
 from src.core.adapter.base_adapter import BaseAdapter
+from src.core.adapter.connection_health import ConnectionHealth
 
 __all__ = [
-    "BaseAdapter"
+    "BaseAdapter",
+    "ConnectionHealth"
 ]
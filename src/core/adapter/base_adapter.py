@@ -2,11 +2,15 @@ import asyncio
 import logging
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+from src.core.adapter.connection_health import ConnectionHealth
 from src.core.events.models.connection_events import ConnectionEvent
+from src.core.events.models.outgoing_events import BaseOutgoingEvent
+from src.core.events.processors.incoming_event_dispatcher import IncomingEventDispatcher
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.config import Config
+from src.core.utils.http_session_pool import HttpSessionPool
 
 class BaseAdapter(ABC):
     """Base adapter implementation.
@@ -22,7 +26,7 @@ class BaseAdapter(ABC):
     - _print_api_compatibility: Log API compatibility information
     - _setup_processors: Initialize event processors
     - _perform_post_setup_tasks: Execute any additional setup tasks
-    - _check_connection: Verify the connection is still active
+    - _connection_exists: Verify the connection is still active with an API request
     - _teardown_client: Clean up platform connections
     """
 
@@ -46,6 +50,10 @@ class BaseAdapter(ABC):
         self.rate_limiter = RateLimiter.get_instance(self.config)
         self.max_reconnect_attempts = self.config.get_setting("adapter", "max_reconnect_attempts")
         self.current_reconnect_attempt = 0
+        self.connection_health = ConnectionHealth()
+        self.incoming_event_dispatcher = IncomingEventDispatcher(
+            self.config, self.process_incoming_event, self._get_incoming_event_key
+        )
 
     async def start(self) -> None:
         """Start the adapter"""
@@ -61,15 +69,17 @@ class BaseAdapter(ABC):
                 await self._get_adapter_info()
                 self._print_api_compatibility()
                 self._setup_processors()
+                self._setup_event_emitter()
                 await self._perform_post_setup_tasks()
                 self._setup_monitoring()
-                await self._emit_event("connect")
+                self.record_connection_activity()
+                await self._set_connection_state(True)
 
                 logging.info("Adapter started successfully")
                 return
         except Exception as e:
             logging.error(f"Error starting adapter: {e}", exc_info=True)
-            await self._emit_event("disconnect")
+            await self._set_connection_state(False)
 
         self.running = False
 
@@ -93,6 +103,11 @@ class BaseAdapter(ABC):
         """Setup processors"""
         raise NotImplementedError("Child classes must implement _setup_processors")
 
+    def _setup_event_emitter(self) -> None:
+        """Let the incoming events processor emit events outside of process_incoming_event"""
+        if self.incoming_events_processor:
+            self.incoming_events_processor.event_emitter = self._emit_bot_request
+
     @abstractmethod
     async def _perform_post_setup_tasks(self) -> None:
         """Perform post setup tasks"""
@@ -103,9 +118,16 @@ class BaseAdapter(ABC):
         self.monitoring_task = asyncio.create_task(self._monitor_connection())
 
     async def _monitor_connection(self) -> None:
-        """Monitor connection to client"""
+        """Monitor connection to client
+
+        The connection is probed with an API request only when no
+        traffic proved it alive for connection_probe_idle_period seconds.
+        """
         check_interval = self.config.get_setting("adapter", "connection_check_interval")
         retry_delay = self.config.get_setting("adapter", "retry_delay")
+        probe_idle_period = float(
+            self.config.get_setting("adapter", "connection_probe_idle_period", default=check_interval)
+        )
 
         while self.running:
             try:
@@ -114,7 +136,7 @@ class BaseAdapter(ABC):
                 if not self.initialized or not self.running:
                     continue
 
-                if not await self._connection_exists():
+                if not await self._connection_is_healthy(probe_idle_period):
                     if self.current_reconnect_attempt >= self.max_reconnect_attempts:
                         raise RuntimeError("Connection check failed")
 
@@ -123,15 +145,74 @@ class BaseAdapter(ABC):
                     continue
 
                 self.current_reconnect_attempt = 0
-                await self._emit_event("connect")
+                await self._set_connection_state(True)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logging.error(f"Error in connection monitor: {e}")
 
-                await self._emit_event("disconnect")
+                await self._set_connection_state(False)
                 await asyncio.sleep(retry_delay)
 
+    async def _connection_is_healthy(self, probe_idle_period: float) -> bool:
+        """Check the connection, probing it only if it has been idle
+
+        Args:
+            probe_idle_period: Seconds without activity after which the connection is probed
+
+        Returns:
+            bool: True if the connection is alive, False otherwise
+        """
+        if self.connection_health.idle_for() < probe_idle_period or self._connection_is_alive():
+            return True
+
+        if await self._connection_exists():
+            self.record_connection_activity()
+            return True
+
+        return False
+
+    def _connection_is_alive(self) -> bool:
+        """Check the connection without an API request
+
+        Adapters whose platform library keeps its own connection alive
+        (e.g. with gateway heartbeats) can report it here.
+
+        Returns:
+            bool: True if the connection is known to be alive, False if it has to be probed
+        """
+        return False
+
+    def record_connection_activity(self) -> None:
+        """Record traffic that proves the connection to the platform is alive"""
+        self.connection_health.record_activity()
+
+    async def _set_connection_state(self, connected: bool) -> None:
+        """Update the connection state and emit connect or disconnect when it changes
+
+        Args:
+            connected: Whether the connection is alive
+        """
+        if self.connection_health.set_connected(connected):
+            await self._emit_event("connect" if connected else "disconnect")
+
+    def get_connection_event(self) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Get the event describing the current connection state
+
+        Lets clients that connect after the last state change learn the state.
+
+        Returns:
+            Optional[Tuple[str, Dict[str, Any]]]: Event type (connect, disconnect)
+                and its data, or None if the state is not known yet
+        """
+        if self.connection_health.connected is None:
+            return None
+
+        return (
+            "connect" if self.connection_health.connected else "disconnect",
+            ConnectionEvent(adapter_type=self.adapter_type).model_dump()
+        )
+
     @abstractmethod
     async def _connection_exists(self) -> Optional[Any]:
         """Check connection"""
@@ -161,17 +242,85 @@ class BaseAdapter(ABC):
         if self.monitoring_task:
             self.monitoring_task.cancel()
 
+        await self._stop_receiving_events()
+        await self._drain_incoming_events()
+        await self.incoming_event_dispatcher.close()
+
+        if self.incoming_events_processor:
+            self.incoming_events_processor.close()
+
         await self._teardown_client()
+        await HttpSessionPool.get_instance(self.config).close()
         self.connected = False
 
-        await self._emit_event("disconnect")
+        await self._set_connection_state(False)
         logging.info("Adapter stopped")
 
+    async def _stop_receiving_events(self) -> None:
+        """Stop receiving events from the platform before the queued events are drained
+
+        Adapters that acknowledge received events to the platform (e.g. by
+        saving an event queue position) override this, so that no event is
+        acknowledged without being processed.
+        """
+        pass
+
+    async def _drain_incoming_events(self) -> None:
+        """Wait a limited time for the queued incoming events to be processed"""
+        timeout = self.config.get_setting("adapter", "incoming_event_drain_timeout", default=30)
+
+        if not await self.incoming_event_dispatcher.join(timeout):
+            logging.warning(
+                f"{self.incoming_event_dispatcher.queued_events} incoming events were not "
+                f"processed within {timeout} seconds and are dropped"
+            )
+
     @abstractmethod
     async def _teardown_client(self) -> None:
         """Teardown client"""
         raise NotImplementedError("Child classes must implement _teardown_client")
 
+    async def dispatch_incoming_event(self, event: Any) -> None:
+        """Queue an event from client for processing
+
+        Platform callbacks hand their events over here instead of
+        processing them, so a slow event only delays later events of
+        the same conversation. Waits while the dispatcher queue is full.
+
+        Args:
+            event: client's event object
+        """
+        await self.incoming_event_dispatcher.dispatch(event)
+
+    def _get_incoming_event_key(self, event: Any) -> Optional[str]:
+        """Get the conversation key that orders the processing of an event
+
+        Args:
+            event: client's event object
+
+        Returns:
+            Optional[str]: Conversation key, or None for events outside of conversations
+        """
+        if not self.incoming_events_processor:
+            return None
+        return self.incoming_events_processor.get_conversation_key(event)
+
+    def get_incoming_event_stats(self) -> Dict[str, Any]:
+        """Get the statistics of incoming event processing
+
+        Returns:
+            Dict[str, Any]: Queued events, processing latency and lag of every conversation
+        """
+        return self.incoming_event_dispatcher.get_stats()
+
+    def get_platform_stats(self) -> Dict[str, Any]:
+        """Get the statistics of platform specific resources
+
+        Returns:
+            Dict[str, Any]: Statistics by resource, empty if the adapter has none
+        """
+        return {}
+
     async def process_incoming_event(self, event: Any) -> None:
         """Process events from client
 
@@ -179,14 +328,27 @@ class BaseAdapter(ABC):
             event_type: event type
             event: client's event object
         """
-        for event_info in await self.incoming_events_processor.process_event(event):
-            await self.socketio_server.emit_event("bot_request", event_info)
+        self.record_connection_activity()
+        await self.socketio_server.emit_bot_requests(
+            await self.incoming_events_processor.process_event(event)
+        )
+
+    async def _emit_bot_request(self, event_info: Dict[str, Any]) -> None:
+        """Emit an incoming event to the framework
+
+        Args:
+            event_info: Standardized event dictionary
+        """
+        await self.socketio_server.emit_bot_requests([event_info])
 
-    async def process_outgoing_event(self, data: Any) -> Dict[str, Any]:
+    async def process_outgoing_event(self,
+                                     data: Any,
+                                     outgoing_event: Optional[BaseOutgoingEvent] = None) -> Dict[str, Any]:
         """Process events from socket_io.client
 
         Args:
             data: data for event
+            outgoing_event: Optional event already validated when it was queued
 
         Returns:
             Dict[str, Any]: Dictionary containing the status and data fields if applicable
@@ -198,7 +360,9 @@ class BaseAdapter(ABC):
                 "error": "Adapter is not connected to perform action"
             }
 
-        result = await self.outgoing_events_processor.process_event(data)
+        result = await self.outgoing_events_processor.process_event(data, outgoing_event)
+        if result.get("request_completed", False):
+            self.record_connection_activity()
         if self._incoming_event_should_be_triggered(data, result):
             asyncio.create_task(
                 self.process_incoming_event(
@@ -208,6 +372,28 @@ class BaseAdapter(ABC):
 
         return result
 
+    def validate_outgoing_event(self, data: Any) -> Optional[BaseOutgoingEvent]:
+        """Validate an event from socket_io.client before it is queued
+
+        Args:
+            data: data for event
+
+        Returns:
+            Optional[BaseOutgoingEvent]: The validated event, or None if
+                the processors are not set up yet
+
+        Raises:
+            ValueError: If the event is invalid
+        """
+        if not self.outgoing_events_processor:
+            return None
+
+        try:
+            return self.outgoing_events_processor.validate_event(data)
+        except Exception as e:
+            logging.error(f"Invalid request: {e}")
+            raise ValueError(f"Invalid request: {e}")
+
     def _incoming_event_should_be_triggered(self,
                                             data: Any,
                                             outgoing_event_result: Dict[str, Any]) -> bool:
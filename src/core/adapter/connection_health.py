@@ -0,0 +1,45 @@
+import math
+import time
+
+from typing import Optional
+
+class ConnectionHealth:
+    """Liveness of the connection to a platform
+
+    Successful API calls, gateway heartbeats and polling responses are
+    recorded as activity, so the connection only has to be probed with
+    an API request after it has been idle. The connection state is kept
+    to report connects and disconnects only when the state changes.
+    """
+
+    def __init__(self):
+        """Initialize the connection health"""
+        self.last_activity: Optional[float] = None
+        self.connected: Optional[bool] = None
+
+    def record_activity(self) -> None:
+        """Record traffic that proves the connection is alive"""
+        self.last_activity = time.monotonic()
+
+    def idle_for(self) -> float:
+        """Get the time since the last recorded activity
+
+        Returns:
+            Seconds since the last activity, infinity if there was none
+        """
+        if self.last_activity is None:
+            return math.inf
+        return time.monotonic() - self.last_activity
+
+    def set_connected(self, connected: bool) -> bool:
+        """Update the connection state
+
+        Args:
+            connected: Whether the connection is alive
+
+        Returns:
+            True if the state changed, False otherwise
+        """
+        changed = self.connected != connected
+        self.connected = connected
+        return changed
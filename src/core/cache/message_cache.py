@@ -3,7 +3,7 @@ import logging
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from src.core.utils.config import Config
 
@@ -62,6 +62,7 @@ class MessageCache:
         self.max_messages_per_conversation = self.config.get_setting("caching", "max_messages_per_conversation")
         self.max_total_messages = self.config.get_setting("caching", "max_total_messages")
         self._lock = asyncio.Lock()
+        self.eviction_listeners: List[Callable[[CachedMessage], None]] = []
         self.maintenance_task = asyncio.create_task(self._maintenance_loop()) if start_maintenance else None
 
     def __del__(self):
@@ -71,6 +72,15 @@ class MessageCache:
                 self.maintenance_task.cancel()
                 logging.info("Cache maintenance task cancelled during cleanup")
 
+    def add_eviction_listener(self, listener: Callable[[CachedMessage], None]) -> None:
+        """Register a callback for messages evicted by cache maintenance
+
+        Args:
+            listener: Callback receiving each evicted message
+        """
+        if listener not in self.eviction_listeners:
+            self.eviction_listeners.append(listener)
+
     def get_messages_by_conversation_id(self, conversation_id: str) -> List[str]:
         """Get all messages for a given conversation ID
 
@@ -206,6 +216,7 @@ class MessageCache:
         self.messages[conversation_id] = {
             msg.message_id: msg for msg in sorted_messages[-self.max_messages_per_conversation:]
         }
+        self._notify_evicted(sorted_messages[:-self.max_messages_per_conversation])
 
     async def _enforce_total_limit(self) -> None:
         """Ensure total messages don't exceed limit"""
@@ -224,12 +235,14 @@ class MessageCache:
 
         all_messages.sort(key=lambda x: x[2])
 
+        evicted_messages = []
+
         for i in range(to_remove):
             if i >= len(all_messages):
                 break
             conv_id, msg_id, _ = all_messages[i]
             if conv_id in self.messages and msg_id in self.messages[conv_id]:
-                del self.messages[conv_id][msg_id]
+                evicted_messages.append(self.messages[conv_id].pop(msg_id))
 
         empty_convs = [
             conv_id for conv_id, msgs in self.messages.items()
@@ -237,3 +250,18 @@ class MessageCache:
         ]
         for conv_id in empty_convs:
             del self.messages[conv_id]
+
+        self._notify_evicted(evicted_messages)
+
+    def _notify_evicted(self, messages: List[CachedMessage]) -> None:
+        """Pass evicted messages to the eviction listeners
+
+        Args:
+            messages: Evicted messages
+        """
+        for listener in self.eviction_listeners:
+            for message in messages:
+                try:
+                    listener(message)
+                except Exception as e:
+                    logging.error(f"Error in cache eviction listener: {e}", exc_info=True)
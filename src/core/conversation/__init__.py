@@ -7,6 +7,7 @@ from src.core.conversation.base_manager import BaseManager
 from src.core.conversation.base_message_builder import BaseMessageBuilder
 from src.core.conversation.base_reaction_handler import BaseReactionHandler
 from src.core.conversation.base_thread_handler import BaseThreadHandler
+from src.core.conversation.conversation_index import ConversationIndex
 
 __all__ = [
     "ConversationUpdateType",
@@ -17,5 +18,6 @@ __all__ = [
     "BaseManager",
     "BaseMessageBuilder",
     "BaseReactionHandler",
-    "BaseThreadHandler"
+    "BaseThreadHandler",
+    "ConversationIndex"
 ]
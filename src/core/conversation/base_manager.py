@@ -4,13 +4,14 @@ import hashlib
 import os
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from src.core.conversation.base_data_classes import BaseConversationInfo, ConversationDelta
 
 from src.core.cache.cache import Cache
 from src.core.cache.message_cache import CachedMessage
 from src.core.conversation.base_data_classes import BaseConversationInfo, ThreadInfo
+from src.core.conversation.conversation_index import ConversationIndex
 from src.core.utils.config import Config
 
 class BaseManager(ABC):
@@ -27,6 +28,8 @@ class BaseManager(ABC):
         self.conversations: Dict[str, BaseConversationInfo] = {}
         self._lock = asyncio.Lock()
         self.cache = Cache.get_instance()
+        self.index = ConversationIndex()
+        self.cache.message_cache.add_eviction_listener(self._unindex_evicted_message)
         self.message_builder = self._message_builder_class()()
         self.thread_handler = self._thread_handler_class()()
 
@@ -129,6 +132,9 @@ class BaseManager(ABC):
             attachments = await self._update_attachment(conversation_info, attachments)
             for attachment in attachments:
                 cached_msg.attachments.add(attachment["attachment_id"])
+            self.index.add_message(
+                conversation_info.conversation_id, cached_msg.message_id, cached_msg.attachments
+            )
 
             if not conversation_info.conversation_name:
                 await self._update_conversation_name(event, conversation_info)
@@ -212,6 +218,9 @@ class BaseManager(ABC):
                     await self.cache.message_cache.delete_message(
                         conversation_info.conversation_id, msg_id
                     )
+                    self.index.remove_message(
+                        conversation_info.conversation_id, msg_id, cached_msg.attachments
+                    )
 
                     if hasattr(conversation_info, "messages"):
                         conversation_info.messages.discard(msg_id)
@@ -271,14 +280,51 @@ class BaseManager(ABC):
         if conversation_id in self.conversations:
             return self.conversations[conversation_id]
 
-        self.conversations[conversation_id] = self._create_conversation_info(
-            platform_conversation_id=platform_conversation_id,
-            conversation_id=conversation_id,
-            conversation_type=await self._get_conversation_type(event["message"]),
-            server=event.get("server", None)
+        return self._add_conversation(
+            self._create_conversation_info(
+                platform_conversation_id=platform_conversation_id,
+                conversation_id=conversation_id,
+                conversation_type=await self._get_conversation_type(event["message"]),
+                server=event.get("server", None)
+            )
         )
 
-        return self.conversations[conversation_id]
+    def _add_conversation(self, conversation_info: BaseConversationInfo) -> BaseConversationInfo:
+        """Store a new conversation and index it
+
+        Args:
+            conversation_info: Conversation info object
+
+        Returns:
+            The stored conversation info object
+        """
+        self.conversations[conversation_info.conversation_id] = conversation_info
+        self.index.add_conversation(conversation_info)
+
+        return conversation_info
+
+    def _get_indexed_conversations(self, conversation_ids: Set[str]) -> List[BaseConversationInfo]:
+        """Get the conversations found in the index
+
+        Args:
+            conversation_ids: Conversation IDs from the index
+
+        Returns:
+            List of conversation info objects
+        """
+        return [
+            self.conversations[conversation_id]
+            for conversation_id in conversation_ids
+            if conversation_id in self.conversations
+        ]
+
+    def _unindex_evicted_message(self, cached_msg: CachedMessage) -> None:
+        """Remove a message evicted from the message cache from the index
+
+        Args:
+            cached_msg: Evicted message
+        """
+        self.index.remove_message(cached_msg.conversation_id, cached_msg.message_id, cached_msg.attachments)
 
     def _generate_deterministic_conversation_id(self, platform_id):
         """Generate a deterministic standardized ID from platform-specific information.
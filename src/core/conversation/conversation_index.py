@@ -0,0 +1,139 @@
+from typing import Dict, Iterable, Set, Tuple
+
+from src.core.conversation.base_data_classes import BaseConversationInfo
+
+class ConversationIndex:
+    """Reverse lookups over the conversations of a manager
+
+    Keeps the conversations of messages and servers, and the messages
+    referencing each attachment, so that updates do not have to scan
+    every conversation or every cached message.
+    """
+
+    def __init__(self):
+        """Initialize the conversation index"""
+        self.message_conversations: Dict[str, Set[str]] = {}
+        self.attachment_messages: Dict[Tuple[str, str], Set[str]] = {}
+        self.server_conversations: Dict[str, Set[str]] = {}
+        self.platform_conversations: Dict[str, Set[str]] = {}
+
+    def add_conversation(self, conversation_info: BaseConversationInfo) -> None:
+        """Index a conversation by its platform and server IDs
+
+        Args:
+            conversation_info: Conversation info object
+        """
+        conversation_id = conversation_info.conversation_id
+
+        if conversation_info.platform_conversation_id:
+            self.platform_conversations.setdefault(
+                str(conversation_info.platform_conversation_id), set()
+            ).add(conversation_id)
+
+        if conversation_info.server_id:
+            self.server_conversations.setdefault(
+                str(conversation_info.server_id), set()
+            ).add(conversation_id)
+
+    def add_message(self,
+                    conversation_id: str,
+                    message_id: str,
+                    attachment_ids: Iterable[str] = ()) -> None:
+        """Index a message and the attachments it references
+
+        Args:
+            conversation_id: Conversation ID
+            message_id: Message ID
+            attachment_ids: IDs of the attachments of the message
+        """
+        self.message_conversations.setdefault(message_id, set()).add(conversation_id)
+
+        for attachment_id in attachment_ids:
+            self.attachment_messages.setdefault(
+                (conversation_id, attachment_id), set()
+            ).add(message_id)
+
+    def remove_message(self,
+                       conversation_id: str,
+                       message_id: str,
+                       attachment_ids: Iterable[str] = ()) -> None:
+        """Remove a message and its attachment references from the index
+
+        Args:
+            conversation_id: Conversation ID
+            message_id: Message ID
+            attachment_ids: IDs of the attachments of the message
+        """
+        conversation_ids = self.message_conversations.get(message_id, None)
+
+        if conversation_ids is not None:
+            conversation_ids.discard(conversation_id)
+            if not conversation_ids:
+                del self.message_conversations[message_id]
+
+        for attachment_id in attachment_ids:
+            self.remove_attachment_reference(conversation_id, attachment_id, message_id)
+
+    def remove_attachment_reference(self,
+                                    conversation_id: str,
+                                    attachment_id: str,
+                                    message_id: str) -> None:
+        """Remove the reference of a message to an attachment
+
+        Args:
+            conversation_id: Conversation ID
+            attachment_id: Attachment ID
+            message_id: Message ID
+        """
+        key = (conversation_id, attachment_id)
+        message_ids = self.attachment_messages.get(key, None)
+
+        if message_ids is not None:
+            message_ids.discard(message_id)
+            if not message_ids:
+                del self.attachment_messages[key]
+
+    def get_message_conversations(self, message_id: str) -> Set[str]:
+        """Get the conversations that contain a message
+
+        Args:
+            message_id: Message ID
+
+        Returns:
+            Set of conversation IDs
+        """
+        return self.message_conversations.get(message_id, set())
+
+    def count_attachment_references(self, conversation_id: str, attachment_id: str) -> int:
+        """Count the messages of a conversation that reference an attachment
+
+        Args:
+            conversation_id: Conversation ID
+            attachment_id: Attachment ID
+
+        Returns:
+            Number of referencing messages
+        """
+        return len(self.attachment_messages.get((conversation_id, attachment_id), ()))
+
+    def get_server_conversations(self, server_id: str) -> Set[str]:
+        """Get the conversations of a server
+
+        Args:
+            server_id: Server ID
+
+        Returns:
+            Set of conversation IDs
+        """
+        return self.server_conversations.get(str(server_id), set())
+
+    def get_platform_conversations(self, platform_conversation_id: str) -> Set[str]:
+        """Get the conversations with a platform conversation ID
+
+        Args:
+            platform_conversation_id: Platform conversation ID
+
+        Returns:
+            Set of conversation IDs
+        """
+        return self.platform_conversations.get(str(platform_conversation_id), set())
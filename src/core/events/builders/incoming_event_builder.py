@@ -21,14 +21,28 @@ from src.core.events.models.incoming_events import (
     HistoryFetchedEvent
 )
 
+# Field names of the attachment model and whether they are required,
+# read once so that trusted attachments are serialized without validation
+ATTACHMENT_FIELDS = [
+    (name, field.is_required()) for name, field in IncomingAttachmentInfo.model_fields.items()
+]
+
 class IncomingEventBuilder:
     """
     Event builder for constructing standardized events to send to the framework.
     This class handles the construction of properly formatted event dictionaries
     with Pydantic validation.
+
+    Messages come from the conversation managers and history fetchers, which
+    already produce them in the expected format, so message_received and
+    history_fetched events skip the validation unless it is enabled.
     """
 
-    def __init__(self, adapter_type: str, adapter_name: str, adapter_id: str):
+    def __init__(self,
+                 adapter_type: str,
+                 adapter_name: str,
+                 adapter_id: str,
+                 validate_messages: bool = False):
         """
         Initialize the EventBuilder with the adapter type.
 
@@ -36,10 +50,12 @@ class IncomingEventBuilder:
             adapter_type: The adapter type (telegram, discord, etc.)
             adapter_name: Name of the adapter instance
             adapter_id: ID of the adapter instance
+            validate_messages: Whether to validate messages with the Pydantic models
         """
         self.adapter_type = adapter_type
         self.adapter_name = adapter_name
         self.adapter_id = adapter_id
+        self.validate_messages = validate_messages
 
     def conversation_started(self, delta: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -83,6 +99,13 @@ class IncomingEventBuilder:
         Returns:
             Dictionary containing the validated event
         """
+        if not self.validate_messages:
+            return {
+                "adapter_type": self.adapter_type,
+                "event_type": "message_received",
+                "data": self._serialize_message(delta)
+            }
+
         event = MessageReceivedEvent(
             adapter_type=self.adapter_type,
             data=self._process_message(delta)
@@ -222,6 +245,18 @@ class IncomingEventBuilder:
         Returns:
             Dictionary containing the validated event
         """
+        if not self.validate_messages:
+            return {
+                "adapter_type": self.adapter_type,
+                "event_type": "history_fetched",
+                "data": {
+                    "adapter_name": self.adapter_name,
+                    "adapter_id": self.adapter_id,
+                    "conversation_id": delta["conversation_id"],
+                    "history": [self._serialize_message(message) for message in history]
+                }
+            }
+
         event = HistoryFetchedEvent(
             adapter_type=self.adapter_type,
             data=HistoryFetchedData(
@@ -283,3 +318,51 @@ class IncomingEventBuilder:
             attachments=[IncomingAttachmentInfo(**attachment) for attachment in delta.get("attachments", [])],
             mentions=delta.get("mentions", [])
         )
+
+    def _serialize_message(self, delta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serialize a trusted message delta into the dictionary MessageReceivedData dumps to.
+
+        Args:
+            delta: Event change information
+
+        Returns:
+            Dictionary with the message data
+        """
+        sender = delta.get("sender", {})
+
+        return {
+            "adapter_name": self.adapter_name,
+            "adapter_id": self.adapter_id,
+            "message_id": delta["message_id"],
+            "conversation_id": delta["conversation_id"],
+            "sender": {
+                "user_id": sender.get("user_id", None) or "Unknown",
+                "display_name": sender.get("display_name", None) or "Unknown User"
+            },
+            "timestamp": delta["timestamp"],
+            "edited": delta.get("edited", False),
+            "is_direct_message": delta.get("is_direct_message", True),
+            "text": delta.get("text", ""),
+            "thread_id": delta.get("thread_id"),
+            "attachments": [
+                self._serialize_attachment(attachment) for attachment in delta.get("attachments", [])
+            ],
+            "mentions": delta.get("mentions", []),
+            "edit_timestamp": delta.get("edit_timestamp", None)
+        }
+
+    def _serialize_attachment(self, attachment: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serialize a trusted attachment into the dictionary IncomingAttachmentInfo dumps to.
+
+        Args:
+            attachment: Attachment information
+
+        Returns:
+            Dictionary with the attachment fields
+        """
+        return {
+            name: attachment[name] if required else attachment.get(name, None)
+            for name, required in ATTACHMENT_FIELDS
+        }
@@ -1,14 +1,5 @@
-from typing import Any, Dict
+from typing import Any, Dict, Type
 from src.core.events.models.outgoing_events import (
-    OutgoingAttachmentInfo,
-    SendMessageData,
-    EditMessageData,
-    DeleteMessageData,
-    ReactionData,
-    FetchHistoryData,
-    FetchAttachmentData,
-    PinStatusData,
-    SendTypingIndicatorData,
     BaseOutgoingEvent,
     SendMessageEvent,
     EditMessageEvent,
@@ -25,6 +16,21 @@ from src.core.events.models.outgoing_events import (
 class OutgoingEventBuilder:
     """Builder class for outgoing events"""
 
+    # Models are looked up by event type, so each request is validated
+    # by a single compiled model instead of a chain of type checks
+    EVENT_MODELS: Dict[str, Type[BaseOutgoingEvent]] = {
+        "send_message": SendMessageEvent,
+        "edit_message": EditMessageEvent,
+        "delete_message": DeleteMessageEvent,
+        "add_reaction": AddReactionEvent,
+        "remove_reaction": RemoveReactionEvent,
+        "fetch_history": FetchHistoryEvent,
+        "fetch_attachment": FetchAttachmentEvent,
+        "pin_message": PinMessageEvent,
+        "unpin_message": UnpinMessageEvent,
+        "send_typing_indicator": SendTypingIndicatorEvent
+    }
+
     def build(self, data: Dict[str, Any]) -> BaseOutgoingEvent:
         """Build the event based on the event type
 
@@ -33,76 +39,18 @@ class OutgoingEventBuilder:
 
         Returns:
             The built event
+
+        Raises:
+            ValueError: If the event type is unknown or the data is invalid
         """
         event_type = data.get("event_type", None)
         event_data = data.get("data", {})
+        model = self.EVENT_MODELS.get(event_type, None)
 
-        if event_type == "send_message":
-            attachments = [OutgoingAttachmentInfo(**attachment) for attachment in event_data.get("attachments", [])]
-            return SendMessageEvent(
-                event_type=event_type,
-                data=SendMessageData(
-                    conversation_id=event_data.get("conversation_id", None),
-                    text=event_data.get("text", None),
-                    thread_id=event_data.get("thread_id", None),
-                    custom_name=event_data.get("custom_name", None),
-                    mentions=event_data.get("mentions", []),
-                    attachments=attachments
-                )
-            )
-
-        if event_type == "edit_message":
-            return EditMessageEvent(
-                event_type=event_type,
-                data=EditMessageData(**event_data)
-            )
-
-        if event_type == "delete_message":
-            return DeleteMessageEvent(
-                event_type=event_type,
-                data=DeleteMessageData(**event_data)
-            )
-
-        if event_type == "add_reaction":
-            return AddReactionEvent(
-                event_type=event_type,
-                data=ReactionData(**event_data)
-            )
-
-        if event_type == "remove_reaction":
-            return RemoveReactionEvent(
-                event_type=event_type,
-                data=ReactionData(**event_data)
-            )
-
-        if event_type == "fetch_history":
-            return FetchHistoryEvent(
-                event_type=event_type,
-                data=FetchHistoryData(**event_data)
-            )
-
-        if event_type == "fetch_attachment":
-            return FetchAttachmentEvent(
-                event_type=event_type,
-                data=FetchAttachmentData(**event_data)
-            )
-
-        if event_type == "pin_message":
-            return PinMessageEvent(
-                event_type=event_type,
-                data=PinStatusData(**event_data)
-            )
-
-        if event_type == "unpin_message":
-            return UnpinMessageEvent(
-                event_type=event_type,
-                data=PinStatusData(**event_data)
-            )
+        if model is None:
+            raise ValueError(f"Unknown event type: {event_type}")
 
-        if event_type == "send_typing_indicator":
-            return SendTypingIndicatorEvent(
-                event_type=event_type,
-                data=SendTypingIndicatorData(**event_data)
-            )
+        if event_type == "send_message" and isinstance(event_data, dict):
+            event_data = {"mentions": [], **event_data}
 
-        raise ValueError(f"Unknown event type: {event_type}")
+        return model.model_validate({"event_type": event_type, "data": event_data})
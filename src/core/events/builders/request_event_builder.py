@@ -1,6 +1,7 @@
 from typing import Any, Dict, Optional
 from src.core.events.models.request_events import (
     RequestEvent,
+    BatchResultData,
     FetchedAttachmentData,
     SentMessageData,
     ReadFileData,
@@ -38,6 +39,8 @@ class RequestEventBuilder:
             validated_data = ReadFileData(file_content=data["file_content"])
         elif "directories" in data:
             validated_data = ViewDirectoryData(directories=data["directories"], files=data["files"])
+        elif "results" in data:
+            validated_data = BatchResultData(results=data["results"], error=data.get("error", None))
         elif "error" in data:
             validated_data = ErrorData(error=data["error"], affected_message_id=data["affected_message_id"])
 
@@ -1,7 +1,9 @@
 """Event history fetchers implementation."""
 
 from src.core.events.history_fetcher.base_history_fetcher import BaseHistoryFetcher
+from src.core.events.history_fetcher.history_fetch_scheduler import HistoryFetchScheduler
 
 __all__ = [
-    "BaseHistoryFetcher"
+    "BaseHistoryFetcher",
+    "HistoryFetchScheduler"
 ]
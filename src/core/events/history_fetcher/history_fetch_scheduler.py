@@ -0,0 +1,144 @@
+import asyncio
+import itertools
+import logging
+
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+from src.core.utils.config import Config
+
+HistoryFetch = Callable[[], Awaitable[List[Dict[str, Any]]]]
+
+class HistoryFetchScheduler:
+    """Schedules conversation history fetches
+
+    Fetches of the same window share a single request, and at most
+    max_concurrent_history_fetches of them run at once. Queued fetches
+    are started in order of the latest activity of their conversations,
+    so the conversations that keep receiving messages go first.
+    """
+
+    def __init__(self, config: Config):
+        """Initialize the history fetch scheduler
+
+        Args:
+            config: Config instance
+        """
+        self.max_concurrent_fetches = config.get_setting(
+            "adapter", "max_concurrent_history_fetches", default=4
+        )
+        self.futures: Dict[Tuple[str, Any], asyncio.Future] = {}
+        self.queued: Dict[Tuple[str, Any], HistoryFetch] = {}
+        self.activity: Dict[str, int] = {}
+        self.tasks: Set[asyncio.Task] = set()
+        self._activity_counter = itertools.count()
+
+    def schedule(self, conversation_id: str, window: Any, fetch: HistoryFetch) -> asyncio.Future:
+        """Queue a history fetch, or join the fetch of the same window
+
+        Args:
+            conversation_id: Conversation ID
+            window: Hashable description of the fetched window
+            fetch: Callable that performs the fetch
+
+        Returns:
+            Future resolved with the fetched history
+        """
+        key = (conversation_id, window)
+
+        if key not in self.futures:
+            self.futures[key] = asyncio.get_running_loop().create_future()
+            self.queued[key] = fetch
+            self.touch(conversation_id, track=True)
+            self._dispatch()
+
+        return self.futures[key]
+
+    async def fetch_now(self, conversation_id: str, window: Any, fetch: HistoryFetch) -> List[Dict[str, Any]]:
+        """Fetch history right away, ahead of the queued fetches
+
+        A queued or running fetch of the same window is joined
+        instead of being requested again.
+
+        Args:
+            conversation_id: Conversation ID
+            window: Hashable description of the fetched window
+            fetch: Callable that performs the fetch
+
+        Returns:
+            Fetched history
+        """
+        future = self.schedule(conversation_id, window, fetch)
+        key = (conversation_id, window)
+
+        if key in self.queued:
+            self._start(key)
+
+        return await asyncio.shield(future)
+
+    def touch(self, conversation_id: str, track: bool = False) -> None:
+        """Record activity in a conversation
+
+        Only conversations with scheduled fetches are tracked.
+
+        Args:
+            conversation_id: Conversation ID
+            track: Whether to start tracking the conversation
+        """
+        if track or conversation_id in self.activity:
+            self.activity[conversation_id] = next(self._activity_counter)
+
+    def close(self) -> None:
+        """Cancel all queued and running fetches"""
+        for task in list(self.tasks):
+            task.cancel()
+
+        for future in self.futures.values():
+            if not future.done():
+                future.cancel()
+
+        self.futures.clear()
+        self.queued.clear()
+        self.activity.clear()
+
+    def _dispatch(self) -> None:
+        """Start queued fetches while the concurrency budget allows"""
+        while self.queued and len(self.tasks) < self.max_concurrent_fetches:
+            self._start(
+                max(self.queued, key=lambda key: self.activity.get(key[0], -1))
+            )
+
+    def _start(self, key: Tuple[str, Any]) -> None:
+        """Start a queued fetch
+
+        Args:
+            key: Conversation ID and window of the fetch
+        """
+        task = asyncio.create_task(self._run(key, self.queued.pop(key)))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, key: Tuple[str, Any], fetch: HistoryFetch) -> None:
+        """Run a fetch and resolve its future
+
+        Args:
+            key: Conversation ID and window of the fetch
+            fetch: Callable that performs the fetch
+        """
+        future = self.futures.get(key, None)
+
+        try:
+            history = await fetch()
+            if future and not future.done():
+                future.set_result(history)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"Error fetching history of {key[0]}: {e}", exc_info=True)
+            if future and not future.done():
+                future.set_result([])
+        finally:
+            if self.futures.get(key, None) is future:
+                del self.futures[key]
+            if not any(conversation_id == key[0] for conversation_id, _ in self.futures):
+                self.activity.pop(key[0], None)
+            self.tasks.discard(asyncio.current_task())
+            self._dispatch()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 class SentMessageData(BaseModel):
     """Sent message data model"""
@@ -18,6 +18,11 @@ class ViewDirectoryData(BaseModel):
     directories: Optional[List[str]] = []
     files: Optional[List[str]] = []
 
+class BatchResultData(BaseModel):
+    """Batch result data model"""
+    results: List[Dict[str, Any]]
+    error: Optional[str] = None
+
 class ErrorData(BaseModel):
     """Error data model"""
     error: Optional[str] = None
@@ -34,6 +39,7 @@ class RequestEvent(BaseModel):
             FetchedAttachmentData,
             ReadFileData,
             ViewDirectoryData,
+            BatchResultData,
             ErrorData
         ]
     ] = None
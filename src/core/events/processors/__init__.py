@@ -2,9 +2,11 @@
 
 from src.core.events.processors.base_incoming_event_processor import BaseIncomingEventProcessor
 from src.core.events.processors.base_outgoing_event_processor import OutgoingEventType, BaseOutgoingEventProcessor
+from src.core.events.processors.incoming_event_dispatcher import IncomingEventDispatcher
 
 __all__ = [
     "BaseIncomingEventProcessor",
     "BaseOutgoingEventProcessor",
+    "IncomingEventDispatcher",
     "OutgoingEventType"
 ]
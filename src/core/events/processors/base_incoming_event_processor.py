@@ -3,9 +3,10 @@ import json
 import logging
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 from src.core.events.builders.incoming_event_builder import IncomingEventBuilder
+from src.core.events.history_fetcher.history_fetch_scheduler import HistoryFetchScheduler
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.config import Config
 
@@ -27,8 +28,14 @@ class BaseIncomingEventProcessor(ABC):
         self.incoming_event_builder = IncomingEventBuilder(
             self.config.get_setting("adapter", "adapter_type"),
             self.config.get_setting("adapter", "adapter_name"),
-            self.config.get_setting("adapter", "adapter_id")
+            self.config.get_setting("adapter", "adapter_id"),
+            validate_messages=self.config.get_setting(
+                "adapter", "validate_incoming_messages", default=False
+            )
         )
+        self.history_scheduler = HistoryFetchScheduler(self.config)
+        self.event_emitter: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+        self.emit_tasks: Set[asyncio.Task] = set()
 
     async def process_event(self, event: Any) -> List[Dict[str, Any]]:
         """Process events from a client
@@ -44,7 +51,9 @@ class BaseIncomingEventProcessor(ABC):
             handler = event_handlers.get(event["type"])
 
             if handler:
-                return await handler(event)
+                events = await handler(event)
+                self._track_conversation_activity(events)
+                return events
 
             logging.debug(f"Unhandled event type: {event['type']}")
             return []
@@ -52,11 +61,43 @@ class BaseIncomingEventProcessor(ABC):
             logging.error(f"Error processing event: {e}", exc_info=True)
             return []
 
+    def get_conversation_key(self, event: Any) -> Optional[str]:
+        """Get the key of the conversation an event belongs to
+
+        Events with the same key are processed one at a time in the order
+        they were received, events with different keys concurrently.
+        Events without a key share one sequence.
+
+        Args:
+            event: Event object
+
+        Returns:
+            Conversation key or None
+        """
+        return None
+
+    def close(self) -> None:
+        """Cancel scheduled history fetches and pending emissions"""
+        self.history_scheduler.close()
+
+        for task in list(self.emit_tasks):
+            task.cancel()
+
     @abstractmethod
     def _get_event_handlers(self) -> Dict[str, Callable]:
         """Get event handlers for incoming events"""
         raise NotImplementedError("Child classes must implement _get_event_handlers")
 
+    def _track_conversation_activity(self, events: List[Dict[str, Any]]) -> None:
+        """Move queued history fetches of conversations with new messages forward
+
+        Args:
+            events: List of events to emit
+        """
+        for event in events or []:
+            if isinstance(event, dict) and event.get("event_type", None) == "message_received":
+                self.history_scheduler.touch(event.get("data", {}).get("conversation_id", None))
+
     async def _handle_fetch_history(self, event: Any) -> List[Dict[str, Any]]:
         """Fetch conversation history
 
@@ -66,14 +107,20 @@ class BaseIncomingEventProcessor(ABC):
         Returns:
             List of events to emit
         """
+        conversation_id = event["event"].get("conversation_id", None)
+        before = event["event"].get("before", None)
+        after = event["event"].get("after", None)
+        limit = event["event"].get("limit", None)
+
         return [
             self.incoming_event_builder.history_fetched(
                 event["event"],
-                await self._fetch_history(
-                    event["event"].get("conversation_id", None),
-                    before=event["event"].get("before", None),
-                    after=event["event"].get("after", None),
-                    limit=event["event"].get("limit", None)
+                await self.history_scheduler.fetch_now(
+                    conversation_id,
+                    (None, before, after, limit),
+                    lambda: self._fetch_history(
+                        conversation_id, before=before, after=after, limit=limit
+                    )
                 )
             )
         ]
@@ -148,6 +195,13 @@ class BaseIncomingEventProcessor(ABC):
                                            exclude_messages: Optional[bool] = True) -> None:
         """Add new conversation events
 
+        The history is fetched through the history scheduler. When an event
+        emitter is set, the history_fetched event is emitted once the fetch
+        completes, so the first messages of the conversation are not held back.
+        Unless an anchor is given, the fetch is anchored at the message that
+        started the conversation, so messages received while the fetch waits
+        are not returned (and cached) a second time as history.
+
         Args:
             events: List of events to emit
             delta: Delta object
@@ -159,12 +213,40 @@ class BaseIncomingEventProcessor(ABC):
 
         events.append(self.incoming_event_builder.conversation_started(delta))
 
+        conversation_id = delta["conversation_id"]
         added_messages = delta.get("added_messages", [])
-        message_to_exclude = added_messages[-1] if added_messages else None
-        history = await self._fetch_history(
-            delta["conversation_id"],
-            anchor=anchor if anchor else "newest",
-            message_to_exclude=message_to_exclude if exclude_messages else None
+        message_to_exclude = added_messages[-1] if added_messages and exclude_messages else None
+        if not anchor:
+            anchor = message_to_exclude.get("message_id", None) if message_to_exclude else None
+        anchor = anchor if anchor else "newest"
+        history = self.history_scheduler.schedule(
+            conversation_id,
+            (anchor, None, None, None),
+            lambda: self._fetch_history(
+                conversation_id, anchor=anchor, message_to_exclude=message_to_exclude
+            )
         )
 
-        events.append(self.incoming_event_builder.history_fetched(delta, history))
+        if self.event_emitter is None:
+            events.append(self.incoming_event_builder.history_fetched(delta, await asyncio.shield(history)))
+            return
+
+        task = asyncio.create_task(self._emit_fetched_history(delta, history))
+        self.emit_tasks.add(task)
+        task.add_done_callback(self.emit_tasks.discard)
+
+    async def _emit_fetched_history(self, delta: Dict[str, Any], history: asyncio.Future) -> None:
+        """Emit a history_fetched event once the scheduled fetch completes
+
+        Args:
+            delta: Delta object
+            history: Future of the scheduled fetch
+        """
+        try:
+            await self.event_emitter(
+                self.incoming_event_builder.history_fetched(delta, await asyncio.shield(history))
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"Error emitting fetched history: {e}", exc_info=True)
@@ -3,17 +3,21 @@ import base64
 import emoji
 import json
 import logging
+import magic
 import os
+import re
 
 from abc import ABC, abstractmethod
 from enum import Enum
 from pydantic import BaseModel
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from src.core.cache.cache import Cache
 from src.core.conversation.base_data_classes import BaseConversationInfo, UserInfo
 from src.core.events.builders.outgoing_event_builder import OutgoingEventBuilder
+from src.core.events.models.outgoing_events import BaseOutgoingEvent
 from src.core.rate_limiter.rate_limiter import RateLimiter
+from src.core.utils.attachment_loading import get_attachment_type_by_extension
 from src.core.utils.config import Config
 
 class OutgoingEventType(str, Enum):
@@ -32,6 +36,19 @@ class OutgoingEventType(str, Enum):
 class BaseOutgoingEventProcessor(ABC):
     """Processes events from socket.io and sends them to adapter client"""
 
+    # Number of base64 characters decoded to detect the type of an attachment
+    ATTACHMENT_SNIFF_LENGTH = 2048
+    # Media types accepted for the attachment types that are checked
+    ATTACHMENT_MEDIA_TYPES = {
+        "image": ("image",),
+        "audio": ("audio", "video"),
+        "video": ("audio", "video")
+    }
+    # Media types that can not be told apart from other content by their first bytes
+    UNSNIFFABLE_MIME_TYPES = ("application/octet-stream", "application/ogg")
+    # Extensions that are shared with text formats (SVG images, TypeScript sources)
+    UNSNIFFABLE_EXTENSIONS = ("svg", "ts")
+
     def __init__(self, config: Config, client: Any, conversation_manager: Any):
         """Initialize the socket.io events processor
 
@@ -47,11 +64,15 @@ class BaseOutgoingEventProcessor(ABC):
         self.rate_limiter = RateLimiter.get_instance(self.config)
         self.outgoing_event_builder = OutgoingEventBuilder()
 
-    async def process_event(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_event(self,
+                            data: Dict[str, Any],
+                            outgoing_event: Optional[BaseOutgoingEvent] = None) -> Dict[str, Any]:
         """Process an event based on its type
 
         Args:
             data: The event data
+            outgoing_event: Optional event already built by validate_event,
+                so the request is not parsed again
 
         Returns:
             Dict[str, Any]: Dictionary containing the status and data fields if applicable
@@ -69,7 +90,8 @@ class BaseOutgoingEventProcessor(ABC):
                 OutgoingEventType.UNPIN_MESSAGE: self._handle_unpin_event,
                 OutgoingEventType.SEND_TYPING_INDICATOR: self._handle_send_typing_indicator_event
             }
-            outgoing_event = self.outgoing_event_builder.build(data)
+            if outgoing_event is None:
+                outgoing_event = self.outgoing_event_builder.build(data)
             handler = event_handlers.get(outgoing_event.event_type)
 
             return await handler(outgoing_event.data)
@@ -80,6 +102,82 @@ class BaseOutgoingEventProcessor(ABC):
                 "error": f"Error processing event: {e}"
             }
 
+    def validate_event(self, data: Dict[str, Any]) -> BaseOutgoingEvent:
+        """Validate an event before it is queued
+
+        Attachments are checked by the size of their base64 content,
+        so they are rejected without being decoded. Their type is checked
+        by decoding only the first bytes of the content.
+
+        Args:
+            data: The event data
+
+        Returns:
+            BaseOutgoingEvent: The validated event
+
+        Raises:
+            ValueError: If the event is invalid
+        """
+        outgoing_event = self.outgoing_event_builder.build(data)
+        max_file_size_mb = self.config.get_setting("attachments", "max_file_size_mb", default=None)
+
+        for attachment in getattr(outgoing_event.data, "attachments", []):
+            if max_file_size_mb and \
+               self._estimate_decoded_size(attachment.content) > max_file_size_mb * 1024 * 1024:
+                raise ValueError(
+                    f"Attachment {attachment.file_name} exceeds size limit: {max_file_size_mb} MB"
+                )
+            self._validate_attachment_type(attachment.file_name, attachment.content)
+
+        return outgoing_event
+
+    def _estimate_decoded_size(self, content: str) -> int:
+        """Estimate the decoded size of base64 content without decoding it
+
+        Args:
+            content: Base64 encoded content
+
+        Returns:
+            Lower bound of the decoded size in bytes
+        """
+        encoded_length = len(content) - content.count("\n") - content.count("\r")
+        return max(0, encoded_length // 4 * 3 - 2)
+
+    def _validate_attachment_type(self, file_name: str, content: str) -> None:
+        """Check that the content of an attachment matches its extension
+
+        Only media extensions are checked, since documents and other
+        files can not be reliably told apart by their first bytes.
+
+        Args:
+            file_name: Name of the attachment
+            content: Base64 encoded content
+
+        Raises:
+            ValueError: If the content is not valid base64 or does not match the extension
+        """
+        prefix = re.sub(r"\s", "", content[:self.ATTACHMENT_SNIFF_LENGTH])
+        prefix = prefix[:len(prefix) // 4 * 4]
+
+        try:
+            header = base64.b64decode(prefix, validate=True)
+        except Exception:
+            raise ValueError(f"Attachment {file_name} is not valid base64")
+
+        extension = os.path.splitext(file_name)[1][1:].lower()
+        expected_type = get_attachment_type_by_extension(extension)
+        if not header or \
+           expected_type not in self.ATTACHMENT_MEDIA_TYPES or \
+           extension in self.UNSNIFFABLE_EXTENSIONS:
+            return
+
+        mime_type = magic.from_buffer(header, mime=True)
+        if mime_type not in self.UNSNIFFABLE_MIME_TYPES and \
+           mime_type.split("/")[0] not in self.ATTACHMENT_MEDIA_TYPES[expected_type]:
+            raise ValueError(
+                f"Attachment {file_name} does not contain {expected_type} content: {mime_type}"
+            )
+
     async def _handle_fetch_attachment_event(self, data: BaseModel) -> Dict[str, Any]:
         """Fetch attachment content
 
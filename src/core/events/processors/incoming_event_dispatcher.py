@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from src.core.utils.config import Config
+
+class IncomingEventDispatcher:
+    """Processes incoming events concurrently, in order within each conversation
+
+    Events are sharded by a key (usually the platform conversation ID).
+    Events of one shard are processed one at a time in the order they
+    were dispatched, while different shards run concurrently up to
+    max_concurrent_incoming_events. At most max_queued_incoming_events
+    events wait for processing; dispatch blocks while the queue is full,
+    so the platform stops being read instead of memory growing. Once
+    closed, events are no longer queued and blocked dispatches return.
+    """
+
+    def __init__(self,
+                 config: Config,
+                 process_event: Callable[[Any], Awaitable[Any]],
+                 get_key: Callable[[Any], Optional[str]]):
+        """Initialize the incoming event dispatcher
+
+        Args:
+            config: Config instance
+            process_event: Coroutine function that processes an event
+            get_key: Function that returns the shard key of an event
+        """
+        self.process_event = process_event
+        self.get_key = get_key
+        self.max_concurrent_events = config.get_setting(
+            "adapter", "max_concurrent_incoming_events", default=8
+        )
+        self.max_queued_events = config.get_setting(
+            "adapter", "max_queued_incoming_events", default=1000
+        )
+        self.shards: Dict[Optional[str], Deque[Tuple[Any, float]]] = {}
+        self.workers: Dict[Optional[str], asyncio.Task] = {}
+        self.queued_events = 0
+        self.closed = False
+        self.dispatched_events = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._space_available: Optional[asyncio.Event] = None
+
+    async def dispatch(self, event: Any) -> None:
+        """Queue an event for processing
+
+        Waits while the queue is full. Events dispatched after
+        the dispatcher is closed are dropped.
+
+        Args:
+            event: Platform event
+        """
+        self._create_primitives()
+
+        while not self.closed and self.queued_events >= self.max_queued_events:
+            self._space_available.clear()
+            await self._space_available.wait()
+
+        if self.closed:
+            logging.debug("Incoming event dropped, the dispatcher is closed")
+            return
+
+        key = self.get_key(event)
+        self.shards.setdefault(key, deque()).append((event, time.monotonic()))
+        self.queued_events += 1
+
+        if key not in self.workers:
+            self.workers[key] = asyncio.create_task(self._process_shard(key))
+
+    async def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued events are processed
+
+        Args:
+            timeout: Optional maximum time to wait in seconds
+
+        Returns:
+            True if all events were processed, False if the timeout expired
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while self.workers:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+
+            # Unlike gather, wait does not cancel the workers when it times out
+            await asyncio.wait(list(self.workers.values()), timeout=remaining)
+
+        return True
+
+    async def close(self) -> None:
+        """Cancel the processing of all queued events and release blocked dispatches"""
+        self.closed = True
+        if self._space_available:
+            self._space_available.set()
+
+        workers = list(self.workers.values())
+
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        self.shards.clear()
+        self.workers.clear()
+        self.queued_events = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the dispatch statistics
+
+        Latency is the time between dispatching an event and the start
+        of its processing, the lag of a shard is the latency its oldest
+        waiting event has accumulated so far.
+
+        Returns:
+            Dictionary with the dispatch statistics
+        """
+        now = time.monotonic()
+
+        return {
+            "queued_events": self.queued_events,
+            "active_shards": len(self.workers),
+            "dispatched_events": self.dispatched_events,
+            "average_latency": (
+                self.total_latency / self.dispatched_events if self.dispatched_events else 0.0
+            ),
+            "max_latency": self.max_latency,
+            "shards": {
+                str(key): {"queued_events": len(shard), "lag": now - shard[0][1]}
+                for key, shard in self.shards.items()
+                if shard
+            }
+        }
+
+    async def _process_shard(self, key: Optional[str]) -> None:
+        """Process the events of a shard in order
+
+        Args:
+            key: Shard key
+        """
+        shard = self.shards[key]
+
+        try:
+            while shard:
+                async with self._semaphore:
+                    event, dispatched_at = shard.popleft()
+                    self._record_latency(time.monotonic() - dispatched_at)
+
+                    try:
+                        await self.process_event(event)
+                    except Exception as e:
+                        logging.error(f"Error processing incoming event: {e}", exc_info=True)
+                    finally:
+                        self.queued_events -= 1
+                        self._space_available.set()
+        finally:
+            if self.workers.get(key, None) is asyncio.current_task():
+                del self.workers[key]
+                if not shard:
+                    self.shards.pop(key, None)
+
+    def _record_latency(self, latency: float) -> None:
+        """Update the latency statistics
+
+        Args:
+            latency: Seconds between dispatching an event and the start of its processing
+        """
+        self.dispatched_events += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def _create_primitives(self) -> None:
+        """Create the synchronization primitives in the running event loop"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_events)
+            self._space_available = asyncio.Event()
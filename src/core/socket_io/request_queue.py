@@ -0,0 +1,366 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+class RequestPriority(str, Enum):
+    """Priority classes of queued requests, from the most to the least urgent"""
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BULK = "bulk"
+
+# Priority of requests that do not specify one in their envelope
+DEFAULT_PRIORITIES = {
+    "send_typing_indicator": RequestPriority.INTERACTIVE,
+    "add_reaction": RequestPriority.INTERACTIVE,
+    "remove_reaction": RequestPriority.INTERACTIVE,
+    "fetch_history": RequestPriority.BULK,
+    "fetch_attachment": RequestPriority.BULK
+}
+
+PRIORITY_RANKS = {priority: rank for rank, priority in enumerate(RequestPriority)}
+
+@dataclass
+class PriorityStats:
+    """Queue statistics of a priority class"""
+    depth: int = 0  # Requests waiting in the queue
+    dequeued: int = 0  # Requests taken from the queue
+    expired: int = 0  # Requests dropped because their deadline passed
+    total_wait: float = 0.0  # Seconds dequeued requests spent in the queue
+    max_wait: float = 0.0  # Longest time a dequeued request spent in the queue
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the statistics to a dictionary
+
+        Returns:
+            Dictionary with the statistics
+        """
+        return {
+            "depth": self.depth,
+            "dequeued": self.dequeued,
+            "expired": self.expired,
+            "average_wait": self.total_wait / self.dequeued if self.dequeued else 0.0,
+            "max_wait": self.max_wait
+        }
+
+@dataclass
+class QueueUsage:
+    """Requests and payload bytes held by the queue"""
+    requests: int = 0
+    bytes: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert the usage to a dictionary
+
+        Returns:
+            Dictionary with the usage
+        """
+        return {"requests": self.requests, "bytes": self.bytes}
+
+class RequestQueue:
+    """Queue of requests ordered by priority class, then by arrival
+
+    Requests of one conversation are always taken in the order they were
+    queued, the priority classes only decide which conversation goes next.
+    Every conversation is ranked by its most urgent queued request and by
+    the arrival of its oldest one, so an urgent request is taken as soon
+    as the requests queued before it in its conversation have been taken.
+    Requests without a conversation are ranked on their own.
+
+    Implements the part of the asyncio.Queue interface used by the
+    Socket.IO server and keeps statistics per priority class. Queued
+    requests and their payload bytes are accounted in total and per
+    client, so requests that would exceed the limits can be refused
+    before they are queued. A limit of 0 disables the check. Requests
+    that are cancelled or whose deadline passed while they are queued
+    stop being accounted right away, not only once they are taken.
+    """
+
+    def __init__(self,
+                 max_requests: int = 0,
+                 max_bytes: int = 0,
+                 max_requests_per_client: int = 0,
+                 max_bytes_per_client: int = 0):
+        """Initialize the request queue
+
+        Args:
+            max_requests: Maximum number of queued requests
+            max_bytes: Maximum payload bytes of queued requests
+            max_requests_per_client: Maximum number of queued requests of one client
+            max_bytes_per_client: Maximum payload bytes of queued requests of one client
+        """
+        # Heap of (rank, arrival of the oldest request, group), entries that no
+        # longer match the current rank of their group are skipped when popped
+        self._heap: List[Tuple[int, int, Any]] = []
+        self._groups: Dict[Any, Deque[Tuple[int, Any]]] = {}
+        self._group_ranks: Dict[Any, Tuple[int, int]] = {}
+        self._size = 0
+        self._unfinished_tasks = 0
+        self._not_empty = asyncio.Event()
+        self._counter = itertools.count()
+        self.stats = {priority: PriorityStats() for priority in RequestPriority}
+        self.max_requests = max_requests
+        self.max_bytes = max_bytes
+        self.max_requests_per_client = max_requests_per_client
+        self.max_bytes_per_client = max_bytes_per_client
+        self.usage = QueueUsage()
+        self.client_usage: Dict[str, QueueUsage] = {}
+        # IDs of the queued events that are accounted in the usage
+        self._accounted: Set[int] = set()
+
+    @staticmethod
+    def resolve_priority(priority: Optional[str], event_type: Optional[str]) -> RequestPriority:
+        """Get the priority class of a request
+
+        Args:
+            priority: Priority from the request envelope
+            event_type: Event type of the request
+
+        Returns:
+            Priority class
+
+        Raises:
+            ValueError: If the priority is unknown
+        """
+        if priority is None:
+            return DEFAULT_PRIORITIES.get(event_type, RequestPriority.NORMAL)
+        return RequestPriority(priority)
+
+    def check_capacity(self, sid: str, size: int) -> Optional[str]:
+        """Check whether a request fits into the queue
+
+        Args:
+            sid: Socket ID of the client
+            size: Payload bytes of the request
+
+        Returns:
+            Description of the exceeded limit, or None if the request fits
+        """
+        exceeded_limit = self._get_exceeded_limit(sid, size)
+
+        if exceeded_limit and self._release_expired():
+            exceeded_limit = self._get_exceeded_limit(sid, size)
+        return exceeded_limit
+
+    def release(self, event: Any) -> None:
+        """Stop accounting a queued request that will not be processed, e.g. a cancelled one
+
+        The request stays in the queue until it is taken, but no longer
+        counts towards the limits. Does nothing for requests that were
+        already taken or released.
+
+        Args:
+            event: Queued event
+        """
+        if id(event) in self._accounted:
+            self._update_usage(event, -1)
+
+    def _get_exceeded_limit(self, sid: str, size: int) -> Optional[str]:
+        """Get the limit a request would exceed
+
+        Args:
+            sid: Socket ID of the client
+            size: Payload bytes of the request
+
+        Returns:
+            Description of the exceeded limit, or None if the request fits
+        """
+        client_usage = self.client_usage.get(sid, QueueUsage())
+
+        if self.max_requests and self.usage.requests + 1 > self.max_requests:
+            return f"queue holds the maximum of {self.max_requests} requests"
+        if self.max_bytes and self.usage.bytes + size > self.max_bytes:
+            return f"queue holds the maximum of {self.max_bytes} payload bytes"
+        if self.max_requests_per_client and client_usage.requests + 1 > self.max_requests_per_client:
+            return f"client has the maximum of {self.max_requests_per_client} queued requests"
+        if self.max_bytes_per_client and client_usage.bytes + size > self.max_bytes_per_client:
+            return f"client has the maximum of {self.max_bytes_per_client} queued payload bytes"
+        return None
+
+    def put_nowait(self, event: Any) -> None:
+        """Add a request to the queue
+
+        Args:
+            event: Queued event with priority, timestamp, sid, size
+                and conversation_key attributes
+        """
+        arrival = next(self._counter)
+        conversation_key = getattr(event, "conversation_key", None)
+        group = ("conversation", conversation_key) if conversation_key else ("request", arrival)
+
+        self._groups.setdefault(group, deque()).append((arrival, event))
+        group_rank = self._group_ranks.get(group)
+        if group_rank is None or PRIORITY_RANKS[event.priority] < group_rank[0]:
+            self._rank_group(group)
+        self._size += 1
+        self._unfinished_tasks += 1
+        self._not_empty.set()
+
+        self.stats[event.priority].depth += 1
+        self._update_usage(event, 1)
+
+    def get_nowait(self) -> Any:
+        """Take the most urgent request from the queue
+
+        Returns:
+            Queued event
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty
+        """
+        while self._heap:
+            rank, arrival, group = heapq.heappop(self._heap)
+            if self._group_ranks.get(group) != (rank, arrival):
+                continue
+
+            _, event = self._groups[group].popleft()
+            del self._group_ranks[group]
+            if self._groups[group]:
+                self._rank_group(group)
+            else:
+                del self._groups[group]
+
+            self._size -= 1
+            self._record_dequeue(event)
+            return event
+
+        raise asyncio.QueueEmpty()
+
+    async def get(self) -> Any:
+        """Wait for a request and take it from the queue
+
+        Returns:
+            Queued event
+        """
+        while self.empty():
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def task_done(self) -> None:
+        """Mark a dequeued request as handled
+
+        Raises:
+            ValueError: If called more times than there were queued requests
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+
+    def empty(self) -> bool:
+        """Check whether the queue is empty
+
+        Returns:
+            True if no requests are queued
+        """
+        return self._size == 0
+
+    def qsize(self) -> int:
+        """Get the number of queued requests
+
+        Returns:
+            Number of queued requests
+        """
+        return self._size
+
+    def record_expired(self, event: Any) -> None:
+        """Count a dequeued request that was dropped because of its deadline
+
+        Args:
+            event: Queued event
+        """
+        self.stats[event.priority].expired += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the statistics of all priority classes
+
+        Returns:
+            Dictionary of statistics by priority class
+        """
+        return {priority.value: stats.to_dict() for priority, stats in self.stats.items()}
+
+    def get_usage(self) -> Dict[str, Any]:
+        """Get the requests and payload bytes held by the queue
+
+        Returns:
+            Dictionary with the total usage and the usage of every client
+        """
+        return {
+            **self.usage.to_dict(),
+            "clients": {sid: usage.to_dict() for sid, usage in self.client_usage.items()}
+        }
+
+    def _release_expired(self) -> bool:
+        """Stop accounting the queued requests whose deadline has passed
+
+        They are still taken from the queue and reported as expired.
+
+        Returns:
+            True if any request was released
+        """
+        now = time.time()
+        released = False
+
+        for group in self._groups.values():
+            for _, event in group:
+                deadline = getattr(event, "deadline", None)
+                if deadline is not None and now > deadline and id(event) in self._accounted:
+                    self._update_usage(event, -1)
+                    released = True
+
+        return released
+
+    def _rank_group(self, group: Any) -> None:
+        """Rank a group by its most urgent request and the arrival of its oldest one
+
+        Args:
+            group: Key of a group with queued requests
+        """
+        rank = min(PRIORITY_RANKS[event.priority] for _, event in self._groups[group])
+        group_rank = (rank, self._groups[group][0][0])
+
+        if self._group_ranks.get(group) != group_rank:
+            self._group_ranks[group] = group_rank
+            heapq.heappush(self._heap, (*group_rank, group))
+
+    def _record_dequeue(self, event: Any) -> None:
+        """Update the statistics of a dequeued request
+
+        Args:
+            event: Queued event
+        """
+        stats = self.stats[event.priority]
+        wait = max(0.0, time.time() - event.timestamp)
+
+        stats.depth -= 1
+        stats.dequeued += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        if id(event) in self._accounted:
+            self._update_usage(event, -1)
+
+    def _update_usage(self, event: Any, sign: int) -> None:
+        """Account a request that enters or leaves the queue
+
+        Args:
+            event: Queued event
+            sign: 1 when the request enters the queue, -1 when it leaves
+        """
+        if sign > 0:
+            self._accounted.add(id(event))
+        else:
+            self._accounted.discard(id(event))
+
+        client_usage = self.client_usage.setdefault(event.sid, QueueUsage())
+
+        for usage in (self.usage, client_usage):
+            usage.requests += sign
+            usage.bytes += sign * event.size
+
+        if client_usage.requests <= 0:
+            del self.client_usage[event.sid]
@@ -5,11 +5,46 @@ import time
 import uuid
 from aiohttp import web
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
 
 from src.core.events.builders.request_event_builder import RequestEventBuilder
+from src.core.socket_io.request_queue import RequestPriority, RequestQueue
 from src.core.utils.config import Config
 
+try:
+    import orjson
+except ImportError:  # optional, packets are encoded with the standard json module without it
+    orjson = None
+
+class OrjsonPacketEncoder:
+    """json compatible interface to orjson for encoding Socket.IO packets"""
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        """Serialize an object to a JSON string
+
+        Args:
+            obj: Object to serialize
+            kwargs: Options of json.dumps, orjson always uses the compact format
+
+        Returns:
+            JSON string
+        """
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    @staticmethod
+    def loads(s: Union[str, bytes], **kwargs) -> Any:
+        """Deserialize a JSON string
+
+        Args:
+            s: JSON string
+            kwargs: Options of json.loads, not used by orjson
+
+        Returns:
+            Deserialized object
+        """
+        return orjson.loads(s)
+
 @dataclass
 class SocketIOQueuedEvent:
     """Represents an event queued for processing"""
@@ -18,10 +53,20 @@ class SocketIOQueuedEvent:
     timestamp: float  # When it was queued
     request_id: Optional[str] = None  # Optional ID for tracking/cancellation
     internal_request_id: Optional[str] = None  # Optional external ID for tracking
+    priority: RequestPriority = RequestPriority.NORMAL  # Priority class used for scheduling
+    deadline: Optional[float] = None  # Optional Unix timestamp after which the request is dropped
+    size: int = 0  # Approximate payload bytes held while the request is queued
+    outgoing_event: Optional[Any] = None  # Request model built when the request was validated
+    conversation_key: Optional[str] = None  # Requests with the same key are processed in queue order
 
 class SocketIOServer:
     """Socket.IO server for communicating with LLM services"""
     ADAPTER_STOPPED_ERROR = "Not processed due to adapter stopping"
+    DEADLINE_EXCEEDED_ERROR = "Not processed due to deadline being exceeded"
+    THROTTLED_ERROR = "Not queued due to request queue limits"
+    BATCHED_BOT_REQUESTS_CAPABILITY = "bot_requests"
+    BATCHED_CLIENTS_ROOM = "bot_requests"
+    SINGLE_EVENT_CLIENTS_ROOM = "bot_request"
 
     def __init__(self, config: Config):
         """Initialize the Socket.IO server
@@ -38,7 +83,8 @@ class SocketIOServer:
             ),
             logger=True,
             ping_interval=65,
-            ping_timeout=60
+            ping_timeout=60,
+            json=OrjsonPacketEncoder if orjson else None
         )
         self.app = web.Application()
         self.sio.attach(self.app)
@@ -47,17 +93,44 @@ class SocketIOServer:
         self.adapter = None  # Will be set later
         self.connected_clients = set()  # Track connected clients
 
-        self.event_queue = asyncio.Queue()
-        self.processing_task = None
+        # Queued requests hold their full payloads (including base64 attachments),
+        # so the queue is bounded by request count and payload bytes, in total and per client
+        self.event_queue = RequestQueue(
+            max_requests=self.config.get_setting("socketio", "max_queued_requests", 1000),
+            max_bytes=self.config.get_setting("socketio", "max_queued_mb", 256) * 1024 * 1024,
+            max_requests_per_client=self.config.get_setting(
+                "socketio", "max_queued_requests_per_client", 500
+            ),
+            max_bytes_per_client=self.config.get_setting(
+                "socketio", "max_queued_mb_per_client", 128
+            ) * 1024 * 1024
+        )
+        self.max_concurrent_requests = self.config.get_setting(
+            "socketio", "max_concurrent_requests", 1
+        )
+        self.processing_tasks = []
+        self.conversation_locks: Dict[Optional[str], asyncio.Lock] = {}
+        self.conversation_lock_users: Dict[Optional[str], int] = {}
         self.is_processing = False
         self.is_stopping = False
         self.request_map = {}
         self.request_event_builder = RequestEventBuilder(self.adapter_type)
 
+        # Incoming events are buffered for a few milliseconds and sent as a single
+        # bot_requests frame to clients that support it, one bot_request per event otherwise
+        self.bot_request_batch_interval = self.config.get_setting(
+            "socketio", "bot_request_batch_interval_ms", 5
+        ) / 1000
+        self.max_bot_request_batch_size = self.config.get_setting(
+            "socketio", "max_bot_request_batch_size", 100
+        )
+        self.bot_request_buffer: List[Dict[str, Any]] = []
+        self.bot_request_flush_task: Optional[asyncio.Task] = None
+        self.bot_request_lock = asyncio.Lock()
+
         @self.sio.event
-        async def connect(sid, environ):
-            self.connected_clients.add(sid)
-            logging.info(f"LLM client connected: {sid}")
+        async def connect(sid, environ, auth=None):
+            await self._connect_client(sid, auth)
 
         @self.sio.event
         async def disconnect(sid):
@@ -75,6 +148,31 @@ class SocketIOServer:
             """Handle request to send a message to adapter"""
             await self._queue_event(sid, data)
 
+        @self.sio.event
+        async def queue_stats(sid, data=None):
+            """Handle request for the request queue statistics"""
+            return self.get_queue_stats()
+
+    async def _connect_client(self, sid: str, auth: Optional[Dict[str, Any]]) -> None:
+        """Register a connected client and tell it the current adapter connection state
+
+        Connection events are only emitted when the state changes,
+        so clients connecting later would not learn it otherwise.
+
+        Args:
+            sid: Socket ID of the client
+            auth: Authentication data sent by the client
+        """
+        self.connected_clients.add(sid)
+        await self.sio.enter_room(sid, self._get_bot_request_room(auth))
+        logging.info(f"LLM client connected: {sid}")
+
+        get_connection_event = getattr(self.adapter, "get_connection_event", None)
+        connection_event = get_connection_event() if get_connection_event is not None else None
+
+        if connection_event:
+            await self.sio.emit(connection_event[0], connection_event[1], to=sid)
+
     def set_adapter(self, adapter: Any) -> None:
         """Set the reference to the adapter instance
 
@@ -95,8 +193,11 @@ class SocketIOServer:
         logging.info(f"Socket.IO server started on {host}:{port}")
 
         self.is_processing = True
-        self.processing_task = asyncio.create_task(self._process_event_queue())
-        logging.info("Event queue processor started")
+        self.processing_tasks = [
+            asyncio.create_task(self._process_event_queue())
+            for _ in range(self.max_concurrent_requests)
+        ]
+        logging.info(f"Event queue processor started with {self.max_concurrent_requests} worker(s)")
 
     async def stop(self) -> None:
         """Stop the Socket.IO server"""
@@ -105,12 +206,21 @@ class SocketIOServer:
         while not self.event_queue.empty():
             await self._process_single_event()
 
+        if self.bot_request_flush_task and not self.bot_request_flush_task.done():
+            self.bot_request_flush_task.cancel()
+            try:
+                await self.bot_request_flush_task
+            except asyncio.CancelledError:
+                pass
+        self.bot_request_flush_task = None
+        await self.flush_bot_requests()
+
         if self.is_processing:
             self.is_processing = False
-            if self.processing_task:
-                self.processing_task.cancel()
+            for processing_task in self.processing_tasks:
+                processing_task.cancel()
                 try:
-                    await self.processing_task
+                    await processing_task
                 except asyncio.CancelledError:
                     pass
             logging.info("Event queue processor stopped")
@@ -122,12 +232,56 @@ class SocketIOServer:
     async def emit_event(self, event: str, data: Dict[str, Any] = {}) -> None:
         """Emit a status event to all connected clients
 
+        Buffered bot requests are sent first, so events reach
+        the clients in the order they were emitted.
+
         Args:
             event: Event type
             data: Event data
         """
+        await self.flush_bot_requests()
         await self.sio.emit(event, data)
-        print(f"Emitted event: {event} with data: {data}")
+        logging.debug(f"Emitted event: {event}")
+
+    async def emit_bot_requests(self, events: List[Dict[str, Any]]) -> None:
+        """Buffer incoming platform events for emission to all connected clients
+
+        The buffer is sent once the batch interval passes or
+        the batch size is reached, whichever comes first.
+
+        Args:
+            events: Standardized event dictionaries
+        """
+        if not events:
+            return
+
+        self.bot_request_buffer.extend(events)
+
+        if self.bot_request_batch_interval <= 0 or \
+           len(self.bot_request_buffer) >= self.max_bot_request_batch_size:
+            await self.flush_bot_requests()
+        elif not self.bot_request_flush_task or self.bot_request_flush_task.done():
+            self.bot_request_flush_task = asyncio.create_task(self._flush_bot_requests_later())
+
+    async def flush_bot_requests(self) -> None:
+        """Send the buffered bot requests"""
+        async with self.bot_request_lock:
+            while self.bot_request_buffer:
+                events = self.bot_request_buffer[:self.max_bot_request_batch_size]
+                del self.bot_request_buffer[:self.max_bot_request_batch_size]
+
+                try:
+                    await self.sio.emit("bot_requests", events, room=self.BATCHED_CLIENTS_ROOM)
+                    for event in events:
+                        await self.sio.emit("bot_request", event, room=self.SINGLE_EVENT_CLIENTS_ROOM)
+                    logging.debug(f"Emitted {len(events)} bot request(s)")
+                except Exception as e:
+                    logging.error(f"Error emitting bot requests: {e}", exc_info=True)
+
+    async def _flush_bot_requests_later(self) -> None:
+        """Send the buffered bot requests once the batch interval passes"""
+        await asyncio.sleep(self.bot_request_batch_interval)
+        await self.flush_bot_requests()
 
     async def emit_request_queued_event(self, data: Dict[str, Any] = {}) -> None:
         """Emit a request queued event to all connected clients
@@ -175,20 +329,64 @@ class SocketIOServer:
 
         event = SocketIOQueuedEvent(data, sid, time.time(), request_id, internal_request_id)
 
-        if self.is_stopping:
+        error = self.ADAPTER_STOPPED_ERROR if self.is_stopping else self._read_envelope(event)
+        error = error or self._validate_event(event)
+        if not error:
+            event.size = self._estimate_payload_size(data)
+            throttle_reason = self.event_queue.check_capacity(sid, event.size)
+            if throttle_reason:
+                error = f"{self.THROTTLED_ERROR}: {throttle_reason}"
+                await self._emit_request_throttled_event(sid, event, throttle_reason)
+        if error:
             await self.emit_request_failed_event(
                 self._build_request_event(
-                    request_id, internal_request_id, {"error": self.ADAPTER_STOPPED_ERROR}
+                    request_id,
+                    internal_request_id,
+                    {"error": error, "affected_message_id": self._get_affected_message_id(data)}
                 )
             )
             return
 
+        event.conversation_key = self._get_conversation_key(event)
         self.request_map[request_id] = event
         self.event_queue.put_nowait(event)
 
         logging.info(f"Queued event with request_id {request_id}")
         await self.emit_request_queued_event(self._build_request_event(request_id, internal_request_id))
 
+    async def _emit_request_throttled_event(self,
+                                            sid: str,
+                                            event: SocketIOQueuedEvent,
+                                            reason: str) -> None:
+        """Tell a client that its request was refused because the queue is full
+
+        The client should retry the request later, once its
+        earlier requests have been processed.
+
+        Args:
+            sid: Socket ID of the client
+            event: The refused event
+            reason: Description of the exceeded limit
+        """
+        logging.warning(f"Throttled request {event.request_id} of client {sid}: {reason}")
+
+        try:
+            await self.sio.emit(
+                "request_throttled",
+                {
+                    "adapter_type": self.adapter_type,
+                    "request_id": event.request_id,
+                    "internal_request_id": event.internal_request_id,
+                    "reason": reason,
+                    "queue_usage": self.event_queue.get_usage()["clients"].get(
+                        sid, {"requests": 0, "bytes": 0}
+                    )
+                },
+                to=sid
+            )
+        except Exception as e:
+            logging.error(f"Error emitting request throttled event: {e}", exc_info=True)
+
     async def _process_event_queue(self) -> None:
         """Process events from the queue with rate limiting"""
         logging.info("Starting event queue processor")
@@ -201,19 +399,47 @@ class SocketIOServer:
         try:
             event = self.event_queue.get_nowait()
         except asyncio.QueueEmpty:
-            await asyncio.sleep(1)
-            return
+            try:
+                event = await asyncio.wait_for(self.event_queue.get(), timeout=1)
+            except asyncio.TimeoutError:
+                return
 
         if event.request_id and event.request_id not in self.request_map:
             self.event_queue.task_done()
             return
 
+        # Requests of the same conversation keep their queue order even when
+        # several workers are running, requests of other conversations do not wait
+        conversation_key = event.conversation_key
+        if conversation_key not in self.conversation_locks:
+            self.conversation_locks[conversation_key] = asyncio.Lock()
+        self.conversation_lock_users[conversation_key] = \
+            self.conversation_lock_users.get(conversation_key, 0) + 1
+
+        try:
+            async with self.conversation_locks[conversation_key]:
+                if event.deadline is not None and time.time() > event.deadline:
+                    await self._expire_event(event)
+                else:
+                    await self._process_event(event)
+        finally:
+            self.conversation_lock_users[conversation_key] -= 1
+            if self.conversation_lock_users[conversation_key] == 0:
+                del self.conversation_lock_users[conversation_key]
+                del self.conversation_locks[conversation_key]
+
+    async def _process_event(self, event: SocketIOQueuedEvent) -> None:
+        """Process a dequeued request event
+
+        Args:
+            event: The event to process
+        """
         logging.info(f"Processing event: {event.request_id}")
 
         try:
             result = {}
             if not self.is_stopping:
-                result = await self.adapter.process_outgoing_event(event.data)
+                result = await self.adapter.process_outgoing_event(event.data, event.outgoing_event)
 
             request_event_data = self.request_event_builder.build(
                 event.request_id,
@@ -235,6 +461,48 @@ class SocketIOServer:
             logging.error(f"Unexpected error in event queue processor: {e}", exc_info=True)
             await asyncio.sleep(5)  # Prevent tight loop on error
 
+    async def _expire_event(self, event: SocketIOQueuedEvent) -> None:
+        """Drop a dequeued request whose deadline has passed
+
+        Args:
+            event: The expired event
+        """
+        logging.info(f"Dropping event {event.request_id}: deadline exceeded")
+
+        self.request_map.pop(event.request_id, None)
+        self.event_queue.record_expired(event)
+        self.event_queue.task_done()
+
+        await self.emit_request_failed_event(
+            self._build_request_event(
+                event.request_id,
+                event.internal_request_id,
+                {
+                    "error": self.DEADLINE_EXCEEDED_ERROR,
+                    "affected_message_id": self._get_affected_message_id(event.data)
+                }
+            )
+        )
+
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the request queue statistics
+
+        Returns:
+            Depth, dequeued and expired counts, and wait times by priority class,
+            the requests and payload bytes held by the queue under "usage",
+            the incoming event statistics of the adapter under "incoming"
+            and its platform specific statistics under "platform"
+        """
+        stats = {**self.event_queue.get_stats(), "usage": self.event_queue.get_usage()}
+        get_incoming_event_stats = getattr(self.adapter, "get_incoming_event_stats", None)
+        get_platform_stats = getattr(self.adapter, "get_platform_stats", None)
+
+        if get_incoming_event_stats is not None:
+            stats["incoming"] = get_incoming_event_stats()
+        if get_platform_stats is not None and get_platform_stats():
+            stats["platform"] = get_platform_stats()
+        return stats
+
     async def _cancel_request(self, sid: str, data: Dict[str, Any]) -> None:
         """Cancel a queued request if it hasn't been processed yet
 
@@ -257,7 +525,7 @@ class SocketIOServer:
             )
             return
 
-        del self.request_map[request_id]
+        self.event_queue.release(self.request_map.pop(request_id))
         logging.info(f"Request with request_id {request_id} cancelled successfully")
 
         await self.emit_request_success_event(
@@ -266,6 +534,120 @@ class SocketIOServer:
             ).model_dump()
         )
 
+    def _read_envelope(self, event: SocketIOQueuedEvent) -> Optional[str]:
+        """Read the priority and deadline of a request from its envelope
+
+        Args:
+            event: The queued event
+
+        Returns:
+            Error message if the envelope is invalid, None otherwise
+        """
+        priority = event.data.pop("priority", None)
+        deadline = event.data.pop("deadline", None)
+
+        try:
+            event.priority = RequestQueue.resolve_priority(priority, event.data.get("event_type", None))
+        except ValueError:
+            return f"Invalid request: unknown priority {priority}"
+
+        if deadline is not None:
+            if isinstance(deadline, bool) or not isinstance(deadline, (int, float)):
+                return f"Invalid request: deadline must be a Unix timestamp, got {deadline}"
+            event.deadline = float(deadline)
+
+        return None
+
+    def _estimate_payload_size(self, value: Any) -> int:
+        """Estimate the memory held by the payload of a request
+
+        Only strings and bytes are counted, they dominate the size of
+        requests with attachments or long messages.
+
+        Args:
+            value: Event data or a value nested in it
+
+        Returns:
+            Approximate size in bytes
+        """
+        if isinstance(value, (str, bytes)):
+            return len(value)
+        if isinstance(value, dict):
+            return sum(self._estimate_payload_size(item) for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return sum(self._estimate_payload_size(item) for item in value)
+        return 0
+
+    def _validate_event(self, event: SocketIOQueuedEvent) -> Optional[str]:
+        """Validate a request before it is queued
+
+        The request model built by the adapter is kept on the event,
+        so the request is not parsed again when it is processed.
+        Adapters without request validation accept every request here,
+        their requests are validated when they are processed.
+
+        Args:
+            event: Event to validate
+
+        Returns:
+            Error message if the request is invalid, None otherwise
+        """
+        validate_outgoing_event = getattr(self.adapter, "validate_outgoing_event", None)
+
+        if validate_outgoing_event is None:
+            return None
+
+        try:
+            event.outgoing_event = validate_outgoing_event(event.data)
+        except ValueError as e:
+            return str(e)
+        return None
+
+    def _get_affected_message_id(self, data: Dict[str, Any]) -> Optional[str]:
+        """Get the ID of the message a request refers to
+
+        Args:
+            data: Event data
+
+        Returns:
+            Message ID or None if the request does not refer to a message
+        """
+        event_data = data.get("data", None)
+
+        if isinstance(event_data, dict):
+            return event_data.get("message_id", None)
+        return None
+
+    def _get_bot_request_room(self, auth: Any) -> str:
+        """Get the room of a client based on the capabilities it advertised
+
+        Args:
+            auth: Authentication data sent by the client on connect
+
+        Returns:
+            Room that receives the bot requests in the format the client supports
+        """
+        capabilities = auth.get("capabilities", []) if isinstance(auth, dict) else []
+
+        if self.BATCHED_BOT_REQUESTS_CAPABILITY in capabilities:
+            return self.BATCHED_CLIENTS_ROOM
+        return self.SINGLE_EVENT_CLIENTS_ROOM
+
+    def _get_conversation_key(self, event: SocketIOQueuedEvent) -> Optional[str]:
+        """Get the key that determines which requests must be processed in order
+
+        Args:
+            event: The queued event
+
+        Returns:
+            Conversation ID of the request or None if the request has none
+        """
+        event_data = event.data.get("data", None)
+
+        if isinstance(event_data, dict):
+            return event_data.get("conversation_id", None)
+        return None
+
     def _build_request_event(self,
                              request_id: str,
                              internal_request_id: Optional[str] = None,
@@ -314,6 +696,10 @@ class SocketIOServer:
         elif "directories" in result and "files" in result:
             data["directories"] = result["directories"]
             data["files"] = result["files"]
+        elif "results" in result:
+            data["results"] = result["results"]
+            if "error" in result:
+                data["error"] = result["error"]
         elif "error" in result:
             data["error"] = result["error"]
             data["affected_message_id"] = affected_message_id
@@ -0,0 +1,231 @@
+import asyncio
+import base64
+import binascii
+import logging
+import magic
+import os
+import re
+
+from typing import AsyncIterator, BinaryIO, Iterator, Optional
+from src.core.utils.attachment_loading import move_attachment
+
+DEFAULT_CHUNK_SIZE = 256 * 1024  # in bytes, decoded content held in memory at once
+NON_BASE64_CHARACTERS = re.compile(r"[^A-Za-z0-9+/=]")
+
+class AttachmentUpload:
+    """Attachment content decoded from base64 chunk by chunk
+
+    The decoded content is written to a file and, optionally, streamed
+    as a request body in the same pass, so at most one decoded chunk
+    is held in memory. The MIME type is sniffed from the first chunk.
+    """
+
+    def __init__(self,
+                 content: str,
+                 file_path: str,
+                 max_file_size: int,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Initialize the attachment upload
+
+        Args:
+            content: Base64 encoded content
+            file_path: Path to write the decoded content to
+            max_file_size: Maximum size of the decoded content in bytes
+            chunk_size: Size of a decoded chunk in bytes
+        """
+        self.content = content
+        self.file_path = file_path
+        self.max_file_size = max_file_size
+        self.chunk_size = max(3, chunk_size - chunk_size % 3)
+        self.size = 0
+        self.content_type: Optional[str] = None
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._first_chunk = b""
+
+    @property
+    def file_name(self) -> str:
+        """Name of the file the content is written to"""
+        return os.path.basename(self.file_path)
+
+    def prepare(self) -> None:
+        """Decode the first chunk and sniff the MIME type from it
+
+        Raises:
+            ValueError: If the content is not valid base64 or exceeds the size limit
+        """
+        if self._chunks is not None:
+            return
+
+        self._chunks = self._decode_chunks()
+        self._first_chunk = next(self._chunks, b"")
+        self.content_type = magic.from_buffer(self._first_chunk, mime=True)
+
+    def persist(self) -> str:
+        """Decode the whole content into the file
+
+        Returns:
+            Path to the file
+
+        Raises:
+            ValueError: If the content is not valid base64 or exceeds the size limit
+        """
+        try:
+            with self._open_file() as file:
+                for chunk in self._iter_chunks():
+                    file.write(chunk)
+        except ValueError:
+            self.discard()
+            raise
+
+        return self.file_path
+
+    async def persist_async(self) -> str:
+        """Decode the whole content into the file without blocking the event loop
+
+        Returns:
+            Path to the file
+
+        Raises:
+            ValueError: If the content is not valid base64 or exceeds the size limit
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.persist)
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Yield decoded chunks for a streaming request body
+
+        Every chunk is written to the file before it is yielded,
+        so the content is persisted by the time the body is sent.
+        Chunks are decoded and written in an executor, so large
+        uploads do not block the event loop.
+
+        Raises:
+            ValueError: If the content is not valid base64 or exceeds the size limit
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+            file = await loop.run_in_executor(None, self._open_file)
+            with file:
+                chunks = self._iter_chunks()
+                while True:
+                    chunk = await loop.run_in_executor(None, self._write_next_chunk, chunks, file)
+                    if chunk is None:
+                        break
+                    yield chunk
+        except ValueError:
+            self.discard()
+            raise
+
+    def move_to(self, dest_path: str) -> None:
+        """Move the written file, e.g. into the attachment store
+
+        Args:
+            dest_path: Destination path
+        """
+        move_attachment(self.file_path, dest_path)
+        self.file_path = dest_path
+
+    def discard(self) -> None:
+        """Remove the written file"""
+        try:
+            if os.path.exists(self.file_path):
+                os.remove(self.file_path)
+        except Exception as e:
+            logging.error(f"Error removing file {self.file_path}: {e}")
+
+    def _open_file(self) -> BinaryIO:
+        """Open the file for writing, creating its directory if needed
+
+        Returns:
+            File object
+        """
+        file_dir = os.path.dirname(self.file_path)
+        if file_dir:
+            os.makedirs(file_dir, exist_ok=True)
+        return open(self.file_path, "wb")
+
+    def _write_next_chunk(self, chunks: Iterator[bytes], file: BinaryIO) -> Optional[bytes]:
+        """Decode the next chunk and write it to the file
+
+        Args:
+            chunks: Iterator over the decoded chunks
+            file: File object to write to
+
+        Returns:
+            Decoded chunk or None when all chunks are written
+
+        Raises:
+            ValueError: If the content is not valid base64 or exceeds the size limit
+        """
+        chunk = next(chunks, None)
+        if chunk is not None:
+            file.write(chunk)
+        return chunk
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        """Iterate over all decoded chunks
+
+        Yields:
+            Decoded chunks
+        """
+        self.prepare()
+
+        if self._first_chunk:
+            yield self._first_chunk
+            self._first_chunk = b""
+
+        yield from self._chunks
+
+    def _decode_chunks(self) -> Iterator[bytes]:
+        """Decode the content chunk by chunk
+
+        Characters outside of the base64 alphabet are skipped
+        the same way base64.b64decode does.
+
+        Yields:
+            Decoded chunks
+
+        Raises:
+            ValueError: If the content is not valid base64 or exceeds the size limit
+        """
+        encoded_chunk_size = self.chunk_size // 3 * 4
+        remainder = ""
+
+        for start in range(0, len(self.content), encoded_chunk_size):
+            piece = remainder + NON_BASE64_CHARACTERS.sub(
+                "", self.content[start:start + encoded_chunk_size]
+            )
+            usable_length = len(piece) - len(piece) % 4
+            remainder = piece[usable_length:]
+
+            if usable_length:
+                yield self._decode(piece[:usable_length])
+
+        if remainder:
+            yield self._decode(remainder)
+
+    def _decode(self, encoded: str) -> bytes:
+        """Decode a single chunk and check the size limit
+
+        Args:
+            encoded: Base64 encoded chunk
+
+        Returns:
+            Decoded chunk
+
+        Raises:
+            ValueError: If the chunk is not valid base64 or the size limit is exceeded
+        """
+        try:
+            chunk = base64.b64decode(encoded)
+        except binascii.Error as e:
+            raise ValueError(f"Failed to decode base64 content: {e}")
+
+        self.size += len(chunk)
+        if self.size > self.max_file_size:
+            raise ValueError(
+                f"Decoded content exceeds size limit: {self.size/1024/1024:.2f} MB"
+            )
+
+        return chunk
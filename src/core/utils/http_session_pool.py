@@ -0,0 +1,159 @@
+import aiohttp
+import asyncio
+import logging
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+from src.core.utils.config import Config
+
+class HttpSessionPool:
+    """Shared HTTP session and download limits for attachment transfers
+
+    All adapters download and upload attachments through one session,
+    so connections to a host are kept alive and reused, and DNS lookups
+    are cached, instead of paying for new TCP and TLS handshakes with
+    every file. Downloads additionally take a global and a per-host slot.
+
+    The session belongs to the event loop it was created in, so the pool
+    must not outlive that loop: it is closed when the adapter stops, which
+    also drops the singleton instance.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls, config: Config):
+        """Get or create the singleton instance
+
+        Args:
+            config: Configuration object (only used during first initialization)
+
+        Returns:
+            The singleton HttpSessionPool instance
+        """
+        if cls._instance is None:
+            cls._instance = cls(config)
+        return cls._instance
+
+    def __init__(self, config: Config):
+        """Initialize the HTTP session pool
+
+        Args:
+            config: Configuration object
+        """
+        self.max_concurrent_downloads = config.get_setting(
+            "attachments", "max_concurrent_downloads", default=8
+        )
+        self.max_downloads_per_host = config.get_setting(
+            "attachments", "max_downloads_per_host", default=4
+        )
+        self.connection_limit = config.get_setting(
+            "adapter", "http_connection_limit", default=20
+        )
+        self.keepalive_timeout = config.get_setting(
+            "adapter", "http_keepalive_timeout", default=60
+        )
+        self.dns_cache_ttl = config.get_setting(
+            "adapter", "http_dns_cache_ttl", default=300
+        )
+        self.connect_timeout = config.get_setting(
+            "adapter", "http_connect_timeout", default=10
+        )
+        self.read_timeout = config.get_setting(
+            "adapter", "http_read_timeout", default=60
+        )
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def limit(self, url: Optional[str]) -> AsyncIterator[None]:
+        """Hold a download slot for a URL
+
+        The host slot is taken first, so downloads waiting for
+        a busy host do not occupy the global slots.
+
+        Args:
+            url: URL to download
+        """
+        self._bind_to_running_loop()
+        host = urlparse(url or "").netloc
+
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_downloads_per_host)
+
+        async with self._host_semaphores[host]:
+            async with self._semaphore:
+                yield
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session
+
+        The session must not be closed by its users, it is closed
+        together with the pool when the adapter stops.
+
+        Returns:
+            aiohttp.ClientSession: Session with pooled connections
+        """
+        self._bind_to_running_loop()
+
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=self._create_connector(),
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    connect=self.connect_timeout,
+                    sock_read=self.read_timeout
+                )
+            )
+
+        return self.session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session and drop the singleton instance"""
+        try:
+            if self.session and not self.session.closed:
+                await self.session.close()
+        except Exception as e:
+            logging.error(f"Error closing HTTP session: {e}")
+        finally:
+            self.session = None
+
+            if HttpSessionPool._instance is self:
+                HttpSessionPool._instance = None
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Create a connector that keeps connections alive and caches DNS lookups
+
+        Returns:
+            aiohttp.TCPConnector: Connector for the HTTP session
+        """
+        return aiohttp.TCPConnector(
+            limit_per_host=self.connection_limit,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl
+        )
+
+    def _bind_to_running_loop(self) -> None:
+        """Create the limits for the running event loop
+
+        Semaphores can not be shared between event loops, so they are
+        recreated when the pool is used from a new loop. A session left
+        open in the previous loop can not be closed from this one; it means
+        the pool outlived its loop without being closed.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._loop is loop:
+            return
+
+        if self.session is not None and not self.session.closed:
+            logging.warning("HTTP session pool used from a new event loop without being closed")
+
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+        self._host_semaphores = {}
+        self.session = None
@@ -127,7 +127,8 @@ def telegram_config(basic_config_data, mock_config_factory):
         "api_hash": "test_hash",
         "phone": "+1234567890",
         "flood_sleep_threshold": 10,
-        "max_history_limit": 1
+        "max_history_limit": 1,
+        "dialog_state_path": ""
     })
     return mock_config_factory(config)
 
@@ -142,7 +143,8 @@ def zulip_config(basic_config_data, mock_config_factory):
         "adapter_email": "adapter_email@example.com",
         "site": "https://zulip.example.com/",
         "chunk_size": 8192,
-        "emoji_mappings": "config/zulip_emoji_mappings.csv"
+        "emoji_mappings": "config/zulip_emoji_mappings.csv",
+        "event_queue_state_path": ""
     })
     return mock_config_factory(config)
 
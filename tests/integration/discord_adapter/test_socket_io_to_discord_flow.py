@@ -45,7 +45,7 @@ class TestSocketIOToDiscordFlowIntegration:
     def uploader_mock(self):
         """Create a mocked Uploader"""
         uploader_mock = MagicMock(spec=Uploader)
-        uploader_mock.upload_attachment = MagicMock(return_value=[])
+        uploader_mock.upload_attachment = AsyncMock(return_value=[])
         uploader_mock.clean_up_uploaded_files = MagicMock()
         return uploader_mock
 
@@ -128,7 +128,7 @@ class TestSocketIOToDiscordFlowIntegration:
         message.pin = AsyncMock(return_value=MagicMock())
         message.unpin = AsyncMock(return_value=MagicMock())
 
-        channel.fetch_message = AsyncMock(return_value=message)
+        channel.get_partial_message = MagicMock(return_value=message)
 
         return channel
 
@@ -199,8 +199,8 @@ class TestSocketIOToDiscordFlowIntegration:
             })
             assert response["request_completed"] is True
 
-            channel_mock.fetch_message.assert_called_once_with(111222333)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(111222333)
+            message = channel_mock.get_partial_message.return_value
             message.edit.assert_called_once_with(content="Edited message content")
 
     @pytest.mark.asyncio
@@ -228,8 +228,8 @@ class TestSocketIOToDiscordFlowIntegration:
             })
             assert response["request_completed"] is True
 
-            channel_mock.fetch_message.assert_called_once_with(111222333)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(111222333)
+            message = channel_mock.get_partial_message.return_value
             message.delete.assert_called_once()
 
     @pytest.mark.asyncio
@@ -258,8 +258,8 @@ class TestSocketIOToDiscordFlowIntegration:
             })
             assert response["request_completed"] is True
 
-            channel_mock.fetch_message.assert_called_once_with(111222333)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(111222333)
+            message = channel_mock.get_partial_message.return_value
             message.add_reaction.assert_called_once_with("👍")
 
     @pytest.mark.asyncio
@@ -288,8 +288,8 @@ class TestSocketIOToDiscordFlowIntegration:
             })
             assert response["request_completed"] is True
 
-            channel_mock.fetch_message.assert_called_once_with(111222333)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(111222333)
+            message = channel_mock.get_partial_message.return_value
             message.remove_reaction.assert_called_once_with("👍", adapter.client.bot.user)
 
     @pytest.mark.asyncio
@@ -317,8 +317,8 @@ class TestSocketIOToDiscordFlowIntegration:
             })
             assert response["request_completed"] is True
 
-            channel_mock.fetch_message.assert_called_once_with(111222333)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(111222333)
+            message = channel_mock.get_partial_message.return_value
             message.pin.assert_called_once()
 
     @pytest.mark.asyncio
@@ -346,8 +346,8 @@ class TestSocketIOToDiscordFlowIntegration:
             })
             assert response["request_completed"] is True
 
-            channel_mock.fetch_message.assert_called_once_with(111222333)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(111222333)
+            message = channel_mock.get_partial_message.return_value
             message.unpin.assert_called_once()
 
     @pytest.mark.asyncio
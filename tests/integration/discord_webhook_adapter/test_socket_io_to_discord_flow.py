@@ -37,21 +37,29 @@ class TestSocketIOToDiscordWebhookFlowIntegration:
         session = AsyncMock()
 
         post_response = AsyncMock()
+        post_response.release = MagicMock()
+        post_response.headers = {}
         post_response.status = 200
         post_response.json = AsyncMock(return_value={"id": "111222333"})
         session.post = AsyncMock(return_value=post_response)
 
         patch_response = AsyncMock()
+        patch_response.release = MagicMock()
+        patch_response.headers = {}
         patch_response.status = 200
         patch_response.json = AsyncMock(return_value={"id": "111222333"})
         session.patch = AsyncMock(return_value=patch_response)
 
         delete_response = AsyncMock()
+        delete_response.release = MagicMock()
+        delete_response.headers = {}
         delete_response.status = 204
         delete_response.text = AsyncMock(return_value="")
         session.delete = AsyncMock(return_value=delete_response)
 
         get_response = AsyncMock()
+        get_response.release = MagicMock()
+        get_response.headers = {}
         get_response.status = 200
         get_response.json = AsyncMock(return_value={"url": "wss://gateway.discord.gg"})
         session.get = AsyncMock(return_value=get_response)
@@ -86,7 +94,7 @@ class TestSocketIOToDiscordWebhookFlowIntegration:
     def uploader_mock(self):
         """Create a mocked Uploader"""
         uploader_mock = MagicMock(spec=Uploader)
-        uploader_mock.upload_attachment = MagicMock(return_value=[])
+        uploader_mock.upload_attachment = AsyncMock(return_value=[])
         uploader_mock.clean_up_uploaded_files = MagicMock()
         return uploader_mock
 
@@ -138,7 +146,8 @@ class TestSocketIOToDiscordWebhookFlowIntegration:
         assert result["message_ids"] == ["111222333"]
 
         adapter.client.get_or_create_webhook.assert_called_with("987654321/123456789")
-        adapter.outgoing_events_processor.rate_limiter.limit_request.assert_called()
+        assert "https://discord.com/api/webhooks/123456789/token" in \
+            adapter.outgoing_events_processor.webhook_rate_limiter.locks
 
         assert "987654321/123456789" in adapter.conversation_manager.conversations
         assert adapter.conversation_manager.conversations["987654321/123456789"].message_count == 1
@@ -161,9 +170,8 @@ class TestSocketIOToDiscordWebhookFlowIntegration:
         })
         assert result["request_completed"] is True
 
-        adapter.outgoing_events_processor.rate_limiter.limit_request.assert_called_with(
-            "edit_message", "https://discord.com/api/webhooks/123456789/token"
-        )
+        assert "https://discord.com/api/webhooks/123456789/token" in \
+            adapter.outgoing_events_processor.webhook_rate_limiter.locks
         session_mock.patch.assert_called_with(
             "https://discord.com/api/webhooks/123456789/token/messages/111222333",
             json={"content": "Edited message content"}
@@ -186,9 +194,8 @@ class TestSocketIOToDiscordWebhookFlowIntegration:
         })
         assert result["request_completed"] is True
 
-        adapter.outgoing_events_processor.rate_limiter.limit_request.assert_called_with(
-            "delete_message", "https://discord.com/api/webhooks/123456789/token"
-        )
+        assert "https://discord.com/api/webhooks/123456789/token" in \
+            adapter.outgoing_events_processor.webhook_rate_limiter.locks
         session_mock.delete.assert_called_with(
             "https://discord.com/api/webhooks/123456789/token/messages/111222333"
         )
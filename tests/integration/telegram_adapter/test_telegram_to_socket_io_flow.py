@@ -95,6 +95,7 @@ class TestTelegramToSocketIOFlowIntegration:
             if reactions is not None:
                 cached_msg.reactions = reactions
             cached_msg.is_pinned = is_pinned
+            adapter.conversation_manager.index.add_message(standard_conversation_id, message_id)
 
             return cached_msg
         return _setup
@@ -147,6 +147,7 @@ class TestZulipToSocketIOFlowIntegration:
 
             if conversation_id in adapter.conversation_manager.conversations:
                 adapter.conversation_manager.conversations[conversation_id].messages.add(message_id)
+                adapter.conversation_manager.index.add_message(conversation_id, message_id)
 
             return cached_msg
         return _setup
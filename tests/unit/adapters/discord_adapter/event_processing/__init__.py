@@ -6,6 +6,7 @@ This package contains unit tests for the core adapter components including:
 - IncomingEventProcessor: For Discord incoming event processing
 - HistoryFetcher: For fetching and parsing Discord message history
 - OutgoingEventProcessor: For Discord outgoing event processing
+- UserInfoPreprocessor: For Discord user and mention processing
 """
 
 __author__ = "Your Name"
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -20,10 +21,20 @@ class TestDownloader:
         attachment.id = "xyz123"
         attachment.size = 12345
         attachment.content_type = "application/pdf"
-        attachment.url = None
-        attachment.save = AsyncMock()
+        attachment.url = "https://cdn.discordapp.com/attachments/test.pdf"
         return attachment
 
+    @pytest.fixture
+    def session_mock(self):
+        """Create a mocked HTTP session"""
+        response = MagicMock()
+        response.__aenter__.return_value = response
+        response.content.read = AsyncMock(side_effect=[b"test file content", b""])
+
+        session = MagicMock()
+        session.get = MagicMock(return_value=response)
+        return session
+
     @pytest.fixture
     def discord_message_mock(self, attachment_mock):
         """Create a mocked Discord message with no attachments"""
@@ -32,12 +43,15 @@ class TestDownloader:
         return message
 
     @pytest.fixture
-    def downloader(self, discord_config):
+    def downloader(self, discord_config, session_mock):
         """Create a Downloader with mocked dependencies"""
-        return Downloader(discord_config)
+        downloader = Downloader(discord_config)
+
+        with patch.object(downloader.http_session_pool, "get_session", return_value=session_mock):
+            yield downloader
 
     @pytest.mark.asyncio
-    async def test_download_attachment_new_file(self, downloader, discord_message_mock):
+    async def test_download_attachment_new_file(self, downloader, discord_message_mock, session_mock):
         """Test downloading a new attachment"""
         with patch("os.path.exists", side_effect=[False, True]):  # File doesn't exist, then does after download
             with patch("src.core.utils.attachment_loading.create_attachment_dir"):
@@ -51,10 +65,11 @@ class TestDownloader:
                             assert result[0]["filename"] == "xyz123.pdf"
                             assert result[0]["size"] == 12345
                             assert result[0]["content_type"] == "application/pdf"
-                            assert result[0]["url"] is None
                             assert result[0]["processable"] is True
 
-                            discord_message_mock.attachments[0].save.assert_called_once()
+                            session_mock.get.assert_called_once_with(
+                                "https://cdn.discordapp.com/attachments/test.pdf"
+                            )
 
                             assert mock_log.called
                             assert "Downloaded" in mock_log.call_args_list[0][0][0]
@@ -73,7 +88,6 @@ class TestDownloader:
                         assert result[0]["filename"] == "xyz123.pdf"
                         assert result[0]["size"] == 12345
                         assert result[0]["content_type"] == "application/pdf"
-                        assert result[0]["url"] is None
                         assert result[0]["processable"] is True
 
                         assert mock_log.called
@@ -85,3 +99,70 @@ class TestDownloader:
         discord_message_mock.attachments = []
 
         assert await downloader.download_attachment(discord_message_mock) == []
+
+    @pytest.mark.asyncio
+    async def test_download_attachments_concurrently(self, downloader, tmp_path):
+        """Test that attachments of a message are downloaded concurrently in order"""
+        downloader.download_dir = str(tmp_path)
+        downloader.content_required = False
+        finished = []
+
+        def create_attachment(attachment_id):
+            attachment = MagicMock()
+            attachment.filename = f"{attachment_id}.txt"
+            attachment.id = attachment_id
+            attachment.size = 10
+            attachment.content_type = "text/plain"
+            attachment.url = f"https://cdn.discordapp.com/attachments/{attachment_id}.txt"
+            return attachment
+
+        def get(url):
+            attachment_id = url.rsplit("/", 1)[-1].split(".")[0]
+
+            chunks = [b"content", b""]
+
+            async def read(_):
+                await asyncio.sleep(0.05 if attachment_id == "first" else 0)
+                if len(chunks) == 1:
+                    finished.append(attachment_id)
+                return chunks.pop(0)
+
+            response = MagicMock()
+            response.__aenter__.return_value = response
+            response.content.read = read
+            return response
+
+        downloader.http_session_pool.get_session.return_value.get = get
+
+        message = MagicMock()
+        message.attachments = [create_attachment("first"), create_attachment("second")]
+
+        result = await downloader.download_attachment(message)
+
+        assert [attachment["attachment_id"] for attachment in result] == ["first", "second"]
+        assert all(attachment["processable"] for attachment in result)
+        assert finished == ["second", "first"]
+
+    @pytest.mark.asyncio
+    async def test_download_file_in_chunks(self, downloader, attachment_mock, session_mock, tmp_path):
+        """Test that the content is written chunk by chunk"""
+        downloader.chunk_size = 4
+        session_mock.get.return_value.content.read = AsyncMock(side_effect=[b"test", b" file", b""])
+        local_file_path = str(tmp_path / "xyz123.pdf")
+
+        assert await downloader._download_file(str(tmp_path), local_file_path, attachment_mock) is True
+
+        session_mock.get.return_value.content.read.assert_awaited_with(4)
+        with open(local_file_path, "rb") as file:
+            assert file.read() == b"test file"
+
+    @pytest.mark.asyncio
+    async def test_failed_download_removes_partial_file(self, downloader, attachment_mock, session_mock, tmp_path):
+        """Test that a download failing midway leaves no partial file behind"""
+        session_mock.get.return_value.content.read = AsyncMock(
+            side_effect=[b"test", asyncio.TimeoutError()]
+        )
+        local_file_path = str(tmp_path / "xyz123.pdf")
+
+        assert await downloader._download_file(str(tmp_path), local_file_path, attachment_mock) is False
+        assert not os.path.exists(local_file_path)
@@ -488,3 +488,18 @@ class TestIncomingEventProcessor:
             """Test handling exceptions during reaction processing"""
             processor.conversation_manager.update_conversation.side_effect = Exception("Test error")
             assert await processor._handle_reaction(reaction_add_event_mock) == []
+
+    class TestConversationKeys:
+        """Tests for sharding events by conversation"""
+
+        def test_conversation_keys(self, processor):
+            """Test the keys of messages, raw payloads and server events"""
+            message = MagicMock(spec=["channel"])
+            message.channel.id = 123
+            payload = MagicMock(spec=["channel_id"])
+            payload.channel_id = 456
+            server = MagicMock(spec=["id", "name"])
+
+            assert processor.get_conversation_key({"type": "new_message", "event": message}) == "123"
+            assert processor.get_conversation_key({"type": "added_reaction", "event": payload}) == "456"
+            assert processor.get_conversation_key({"type": "renamed_server", "event": server}) is None
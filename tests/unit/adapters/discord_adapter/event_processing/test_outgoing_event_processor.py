@@ -38,14 +38,14 @@ class TestOutgoingEventProcessor:
         message_mock.delete = AsyncMock()
         message_mock.add_reaction = AsyncMock()
         message_mock.remove_reaction = AsyncMock()
-        channel.fetch_message = AsyncMock(return_value=message_mock)
+        channel.get_partial_message = MagicMock(return_value=message_mock)
         return channel
 
     @pytest.fixture
     def uploader_mock(self):
         """Create a mocked uploader"""
         uploader = MagicMock()
-        uploader.upload_attachment = MagicMock(return_value=[[], []])
+        uploader.upload_attachment = AsyncMock(return_value=[[], []])
         uploader.clean_up_uploaded_files = MagicMock()
         return uploader
 
@@ -58,7 +58,7 @@ class TestOutgoingEventProcessor:
                   rate_limiter_mock,
                   uploader_mock):
         """Create a DiscordOutgoingEventProcessor with mocked dependencies"""
-        with patch.object(Uploader, "upload_attachment", return_value=[[], []]):
+        with patch.object(Uploader, "upload_attachment", AsyncMock(return_value=[[], []])):
             processor = OutgoingEventProcessor(discord_config, discord_client_mock, conversation_manager_mock)
             processor._get_channel = AsyncMock(return_value=channel_mock)
             processor.rate_limiter = rate_limiter_mock
@@ -201,8 +201,8 @@ class TestOutgoingEventProcessor:
             processor.rate_limiter.limit_request.assert_called_once_with(
                 "edit_message", "123456789"
             )
-            channel_mock.fetch_message.assert_called_once_with(987654321)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(987654321)
+            message = channel_mock.get_partial_message.return_value
             message.edit.assert_called_once_with(content="Updated text")
 
         @pytest.mark.asyncio
@@ -216,7 +216,7 @@ class TestOutgoingEventProcessor:
                     "text": "Updated text"
                 }
             }
-            channel_mock.fetch_message.side_effect = discord.NotFound(MagicMock(), "Message not found")
+            channel_mock.get_partial_message.return_value.edit.side_effect = discord.NotFound(MagicMock(), "Message not found")
 
             response = await processor.process_event(event_data)
             assert response["request_completed"] is False
@@ -240,8 +240,8 @@ class TestOutgoingEventProcessor:
             processor.rate_limiter.limit_request.assert_called_once_with(
                 "delete_message", "123456789"
             )
-            channel_mock.fetch_message.assert_called_once_with(987654321)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(987654321)
+            message = channel_mock.get_partial_message.return_value
             message.delete.assert_called_once()
 
         @pytest.mark.asyncio
@@ -254,7 +254,7 @@ class TestOutgoingEventProcessor:
                     "message_id": "987654321"
                 }
             }
-            channel_mock.fetch_message.side_effect = discord.NotFound(MagicMock(), "Message not found")
+            channel_mock.get_partial_message.return_value.delete.side_effect = discord.NotFound(MagicMock(), "Message not found")
 
             response = await processor.process_event(event_data)
             assert response["request_completed"] is False
@@ -279,8 +279,8 @@ class TestOutgoingEventProcessor:
             processor.rate_limiter.limit_request.assert_called_once_with(
                 "add_reaction", "123456789"
             )
-            channel_mock.fetch_message.assert_called_once_with(987654321)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(987654321)
+            message = channel_mock.get_partial_message.return_value
             message.add_reaction.assert_called_once_with("👍")
 
         @pytest.mark.asyncio
@@ -294,7 +294,7 @@ class TestOutgoingEventProcessor:
                     "emoji": "+1"
                 }
             }
-            channel_mock.fetch_message.side_effect = discord.NotFound(MagicMock(), "Message not found")
+            channel_mock.get_partial_message.return_value.add_reaction.side_effect = discord.NotFound(MagicMock(), "Message not found")
 
             response = await processor.process_event(event_data)
             assert response["request_completed"] is False
@@ -316,8 +316,8 @@ class TestOutgoingEventProcessor:
             processor.rate_limiter.limit_request.assert_called_once_with(
                 "remove_reaction", "123456789"
             )
-            channel_mock.fetch_message.assert_called_once_with(987654321)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(987654321)
+            message = channel_mock.get_partial_message.return_value
             message.remove_reaction.assert_called_once_with("👍", discord_client_mock.user)
 
     class TestPinStatusUpdate:
@@ -338,14 +338,14 @@ class TestOutgoingEventProcessor:
             processor.rate_limiter.limit_request.assert_called_once_with(
                 "pin_message", "123456789"
             )
-            channel_mock.fetch_message.assert_called_once_with(987654321)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(987654321)
+            message = channel_mock.get_partial_message.return_value
             message.pin.assert_called_once()
 
         @pytest.mark.asyncio
         async def test_pin_message_not_found(self, processor, channel_mock):
             """Test pinning a message that doesn't exist"""
-            channel_mock.fetch_message.side_effect = discord.NotFound(MagicMock(), "Message not found")
+            channel_mock.get_partial_message.return_value.pin.side_effect = discord.NotFound(MagicMock(), "Message not found")
 
             response = await processor.process_event({
                 "event_type": "pin_message",
@@ -371,14 +371,14 @@ class TestOutgoingEventProcessor:
             processor.rate_limiter.limit_request.assert_called_once_with(
                 "unpin_message", "123456789"
             )
-            channel_mock.fetch_message.assert_called_once_with(987654321)
-            message = channel_mock.fetch_message.return_value
+            channel_mock.get_partial_message.assert_called_once_with(987654321)
+            message = channel_mock.get_partial_message.return_value
             message.unpin.assert_called_once()
 
         @pytest.mark.asyncio
         async def test_unpin_message_not_found(self, processor, channel_mock):
             """Test unpinning a message that doesn't exist"""
-            channel_mock.fetch_message.side_effect = discord.NotFound(MagicMock(), "Message not found")
+            channel_mock.get_partial_message.return_value.unpin.side_effect = discord.NotFound(MagicMock(), "Message not found")
             response = await processor.process_event({
                 "event_type": "unpin_message",
                 "data": {
@@ -406,3 +406,57 @@ class TestOutgoingEventProcessor:
                 "send_typing_indicator", "123456789"
             )
             channel_mock.typing.assert_called_once()
+
+    class TestChannelCache:
+        """Tests for getting channels and messages to act on"""
+
+        @pytest.fixture
+        def channel_processor(self, discord_config, discord_client_mock, conversation_manager_mock, rate_limiter_mock):
+            """Create a processor that looks channels up through the client"""
+            processor = OutgoingEventProcessor(discord_config, discord_client_mock, conversation_manager_mock)
+            processor.rate_limiter = rate_limiter_mock
+            return processor
+
+        @pytest.mark.asyncio
+        async def test_get_channel_from_client_cache(self, channel_processor, discord_client_mock):
+            """Test that channels known to the client are used without fetching"""
+            channel = await channel_processor._get_channel("111/123456789")
+
+            assert channel == discord_client_mock.get_channel.return_value
+            discord_client_mock.get_channel.assert_called_once_with(123456789)
+            discord_client_mock.fetch_channel.assert_not_called()
+            channel_processor.rate_limiter.limit_request.assert_not_called()
+
+        @pytest.mark.asyncio
+        async def test_get_channel_cached_per_conversation(self, channel_processor, discord_client_mock):
+            """Test that a fetched channel is reused by the next actions"""
+            discord_client_mock.get_channel.return_value = None
+
+            first = await channel_processor._get_channel("111/123456789")
+            second = await channel_processor._get_channel("111/123456789")
+
+            assert first == second == discord_client_mock.fetch_channel.return_value
+            discord_client_mock.fetch_channel.assert_called_once_with(123456789)
+            channel_processor.rate_limiter.limit_request.assert_called_once_with("fetch_channel")
+
+        @pytest.mark.asyncio
+        async def test_failed_action_invalidates_channel(self, channel_processor):
+            """Test that a failed action drops the cached channel"""
+            conversation_info = MagicMock(platform_conversation_id="111/123456789")
+
+            with pytest.raises(discord.NotFound):
+                async with channel_processor._conversation_channel(conversation_info):
+                    raise discord.NotFound(MagicMock(), "Unknown Channel")
+
+            assert "111/123456789" not in channel_processor.channels
+
+        @pytest.mark.asyncio
+        async def test_get_message_without_partial_messages(self, channel_processor):
+            """Test fetching the message when the channel can not build partial messages"""
+            channel = MagicMock(spec=["fetch_message"])
+            channel.fetch_message = AsyncMock()
+
+            message = await channel_processor._get_message(channel, "987654321")
+
+            assert message == channel.fetch_message.return_value
+            channel.fetch_message.assert_called_once_with(987654321)
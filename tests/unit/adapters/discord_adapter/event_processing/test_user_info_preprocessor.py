@@ -0,0 +1,76 @@
+import pytest
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.adapters.discord_adapter.event_processing.user_info_preprocessor import UserInfoPreprocessor
+
+class TestUserInfoPreprocessor:
+    """Tests for the Discord UserInfoPreprocessor class"""
+
+    @pytest.fixture
+    def discord_client_mock(self):
+        """Create a mocked Discord client"""
+        client = AsyncMock()
+        client.fetch_user = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def preprocessor(self, discord_config, discord_client_mock):
+        """Create a user info preprocessor"""
+        discord_config.adapter["adapter_id"] = "999"
+        return UserInfoPreprocessor(discord_config, discord_client_mock)
+
+    def create_user(self, user_id, name):
+        """Create a mocked Discord user"""
+        user = MagicMock()
+        user.id = user_id
+        user.name = name
+        return user
+
+    @pytest.mark.asyncio
+    async def test_mentions_resolved_from_message(self, preprocessor, discord_client_mock, cache_mock):
+        """Test that mentions are resolved from the users delivered with the message"""
+        message = MagicMock()
+        message.author = self.create_user(111, "author")
+        message.mentions = [self.create_user(222, "friend"), self.create_user(999, "bot")]
+        message.reference = None
+        message.content = "Hi <@222> and <@999>"
+
+        result = await preprocessor.process_incoming_event(message)
+
+        assert result["user_id"] == "111"
+        assert result["updated_content"] == "Hi <@friend> and <@bot>"
+        assert result["mentions"] == ["999"]
+        assert cache_mock.user_cache.get_user_by_id("222").username == "friend"
+        assert cache_mock.user_cache.get_user_by_id("999").is_bot is True
+        discord_client_mock.fetch_user.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mentions_resolved_from_raw_edit(self, preprocessor, discord_client_mock, cache_mock):
+        """Test that users of raw edit payloads are added to the cache"""
+        payload = MagicMock(spec=["data"])
+        payload.data = {
+            "content": "Updated for <@222>",
+            "author": {"id": "111", "username": "author"},
+            "mentions": [{"id": "222", "username": "friend"}]
+        }
+
+        result = await preprocessor.process_incoming_event(payload)
+
+        assert result["updated_content"] == "Updated for <@friend>"
+        assert cache_mock.user_cache.get_user_by_id("111").username == "author"
+        discord_client_mock.fetch_user.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_mention_kept(self, preprocessor, discord_client_mock):
+        """Test that mentions of users missing from the payload are left as they are"""
+        message = MagicMock()
+        message.author = self.create_user(111, "author")
+        message.mentions = []
+        message.reference = None
+        message.content = "Hi <@333>"
+
+        result = await preprocessor.process_incoming_event(message)
+
+        assert result["updated_content"] == "Hi <@333>"
+        discord_client_mock.fetch_user.assert_not_called()
@@ -30,6 +30,7 @@ class TestAdapter:
         bot.user.name = "Test Bot"
         bot.fetch_user = AsyncMock(return_value=bot.user)
         client.bot = bot
+        client.is_gateway_alive = MagicMock(return_value=False)
 
         return client
 
@@ -86,6 +87,25 @@ class TestAdapter:
                     "disconnect", {"adapter_type": adapter.adapter_type}
                 )
 
+        @pytest.mark.asyncio
+        async def test_monitor_connection_with_live_gateway(self, adapter, discord_client_mock):
+            """Test that a live gateway is not probed with an API request"""
+            adapter.running = True
+            adapter.initialized = True
+            adapter.client = discord_client_mock
+            discord_client_mock.is_gateway_alive.return_value = True
+
+            with patch("asyncio.sleep", side_effect=[None, asyncio.CancelledError()]):
+                try:
+                    await adapter._monitor_connection()
+                except asyncio.CancelledError:
+                    pass
+
+            discord_client_mock.bot.fetch_user.assert_not_called()
+            adapter.socketio_server.emit_event.assert_called_once_with(
+                "connect", {"adapter_type": adapter.adapter_type}
+            )
+
     class TestEventProcessing:
         """Tests for event processing"""
 
@@ -107,7 +127,22 @@ class TestAdapter:
             await adapter.process_incoming_event(test_event)
 
             adapter.incoming_events_processor.process_event.assert_called_once_with(test_event)
-            adapter.socketio_server.emit_event.assert_called_once_with("bot_request", {"test": "event"})
+            adapter.socketio_server.emit_bot_requests.assert_called_once_with([{"test": "event"}])
+
+        @pytest.mark.asyncio
+        async def test_dispatch_incoming_events(self, adapter, events_processor_mock):
+            """Test that dispatched events are processed in order within their conversation"""
+            adapter.incoming_events_processor = events_processor_mock([{"test": "event"}])
+            adapter.incoming_events_processor.get_conversation_key = MagicMock(return_value="123")
+            events = [{"type": "new_message", "event": MagicMock()} for _ in range(3)]
+
+            for event in events:
+                await adapter.dispatch_incoming_event(event)
+            await adapter.incoming_event_dispatcher.join()
+
+            assert [c.args[0] for c in adapter.incoming_events_processor.process_event.call_args_list] == events
+            assert adapter.socketio_server.emit_bot_requests.call_count == 3
+            assert adapter.get_incoming_event_stats()["dispatched_events"] == 3
 
         @pytest.mark.asyncio
         async def test_process_socket_io_event(self, adapter, events_processor_mock):
@@ -123,7 +158,7 @@ class TestAdapter:
             response = await adapter.process_outgoing_event(test_data)
 
             assert response["request_completed"] is True
-            adapter.outgoing_events_processor.process_event.assert_called_once_with(test_data)
+            adapter.outgoing_events_processor.process_event.assert_called_once_with(test_data, None)
 
         @pytest.mark.asyncio
         async def test_process_socket_io_event_not_connected(self, adapter):
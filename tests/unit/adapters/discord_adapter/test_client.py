@@ -73,3 +73,30 @@ class TestClient:
             assert discord_client.running is False
             discord_client.bot.close.assert_awaited_once()
             task_mock.cancel.assert_not_called()
+
+    class TestGatewayProfile:
+        """Tests for the gateway caching profile"""
+
+        def test_lean_gateway(self, discord_config):
+            """Test that discord.py caches are turned off by default"""
+            with patch("src.adapters.discord_adapter.client.commands.Bot") as bot_class_mock:
+                Client(discord_config, AsyncMock())
+
+            kwargs = bot_class_mock.call_args.kwargs
+            assert kwargs["max_messages"] is None
+            assert kwargs["member_cache_flags"].value == discord.MemberCacheFlags.none().value
+            assert kwargs["chunk_guilds_at_startup"] is False
+            assert kwargs["intents"].typing is False
+            assert kwargs["intents"].message_content is True
+
+        def test_default_gateway(self, discord_config):
+            """Test that the default discord.py caches are kept when the lean gateway is disabled"""
+            discord_config.add_setting("adapter", "lean_gateway", False)
+
+            with patch("src.adapters.discord_adapter.client.commands.Bot") as bot_class_mock:
+                Client(discord_config, AsyncMock())
+
+            kwargs = bot_class_mock.call_args.kwargs
+            assert "max_messages" not in kwargs
+            assert "member_cache_flags" not in kwargs
+            assert kwargs["intents"].typing is True
@@ -49,7 +49,7 @@ class TestOutgoingEventProcessor:
     def uploader_mock(self):
         """Create a mocked uploader"""
         uploader = MagicMock()
-        uploader.upload_attachment = MagicMock()
+        uploader.upload_attachment = AsyncMock(return_value=[])
         uploader.clean_up_uploaded_files = MagicMock()
         return uploader
 
@@ -92,9 +92,8 @@ class TestOutgoingEventProcessor:
             assert result["request_completed"] is True
 
             client_mock.get_or_create_webhook.assert_called_with("987654321/123456789")
-            processor.rate_limiter.limit_request.assert_called_with(
-                "message", "https://discord.com/api/webhooks/123456789/token"
-            )
+            assert "https://discord.com/api/webhooks/123456789/token" in \
+                processor.webhook_rate_limiter.locks
             processor.session.post.assert_called_with(
                 "https://discord.com/api/webhooks/123456789/token?wait=true",
                 json={"content": "Hello, world!", "username": "Test Bot"}
@@ -155,6 +154,58 @@ class TestOutgoingEventProcessor:
                 json={"content": "Part 2", "username": "Test Bot"}
             )
 
+        @pytest.mark.asyncio
+        async def test_send_message_retries_rate_limited_request(self, processor):
+            """Test that a request rejected with 429 is retried"""
+            event_data = {
+                "event_type": "send_message",
+                "data": {
+                    "conversation_id": "987654321/123456789",
+                    "text": "Hello, world!"
+                }
+            }
+
+            limited_response = MagicMock()
+            limited_response.status = 429
+            limited_response.headers = {"Retry-After": "0"}
+
+            response_mock = MagicMock()
+            response_mock.status = 200
+            response_mock.headers = {}
+            response_mock.json = AsyncMock(return_value={"id": "111222333"})
+            processor.session.post = AsyncMock(side_effect=[limited_response, response_mock])
+
+            result = await processor.process_event(event_data)
+
+            assert result["request_completed"] is True
+            assert result["message_ids"] == ["111222333"]
+            assert processor.session.post.call_count == 2
+            limited_response.release.assert_called_once()
+
+        @pytest.mark.asyncio
+        async def test_send_message_rate_limited_too_often(self, processor):
+            """Test that the last rate limited response is read for the error, not released"""
+            event_data = {
+                "event_type": "send_message",
+                "data": {
+                    "conversation_id": "987654321/123456789",
+                    "text": "Hello, world!"
+                }
+            }
+
+            limited_response = MagicMock()
+            limited_response.status = 429
+            limited_response.headers = {"Retry-After": "0"}
+            limited_response.text = AsyncMock(return_value="You are being rate limited")
+            processor.session.post = AsyncMock(return_value=limited_response)
+
+            result = await processor.process_event(event_data)
+
+            assert result["request_completed"] is False
+            assert "You are being rate limited" in result["error"]
+            assert processor.session.post.call_count == processor.MAX_RATE_LIMIT_RETRIES + 1
+            assert limited_response.release.call_count == processor.MAX_RATE_LIMIT_RETRIES
+
     class TestEditMessage:
         """Tests for the edit_message method"""
 
@@ -178,9 +229,8 @@ class TestOutgoingEventProcessor:
             result = await processor.process_event(event_data)
             assert result["request_completed"] is True
 
-            processor.rate_limiter.limit_request.assert_called_with(
-                "edit_message", "https://discord.com/api/webhooks/123456789/token"
-            )
+            assert "https://discord.com/api/webhooks/123456789/token" in \
+                processor.webhook_rate_limiter.locks
             processor.session.patch.assert_called_with(
                 "https://discord.com/api/webhooks/123456789/token/messages/111222333",
                 json={"content": "Updated text"}
@@ -208,9 +258,8 @@ class TestOutgoingEventProcessor:
             result = await processor.process_event(event_data)
             assert result["request_completed"] is True
 
-            processor.rate_limiter.limit_request.assert_called_with(
-                "delete_message", "https://discord.com/api/webhooks/123456789/token"
-            )
+            assert "https://discord.com/api/webhooks/123456789/token" in \
+                processor.webhook_rate_limiter.locks
             processor.session.delete.assert_called_with(
                 "https://discord.com/api/webhooks/123456789/token/messages/111222333"
             )
@@ -246,3 +295,39 @@ class TestOutgoingEventProcessor:
 
             with pytest.raises(Exception, match="Error processing webhook message"):
                 await processor._check_api_response(response)
+
+        @pytest.mark.asyncio
+        async def test_build_form_streams_files(self, processor, tmp_path):
+            """Test that attachments are streamed from disk in chunks"""
+            file_path = tmp_path / "test.txt"
+            file_path.write_bytes(b"0123456789")
+            processor.FILE_CHUNK_SIZE = 4
+
+            form = processor._build_form([str(file_path)], {"content": ""})
+            file_field = form._fields[0]
+
+            assert isinstance(file_field[2], aiohttp.AsyncIterablePayload)
+            assert [chunk async for chunk in processor._stream_file(str(file_path))] == [
+                b"0123", b"4567", b"89"
+            ]
+
+        @pytest.mark.asyncio
+        async def test_stream_file_closes_file(self, processor, tmp_path):
+            """Test that a partially sent file is closed"""
+            file_path = tmp_path / "test.txt"
+            file_path.write_bytes(b"0123456789")
+            processor.FILE_CHUNK_SIZE = 4
+            opened_files = []
+            real_open = open
+
+            def tracking_open(*args):
+                opened_files.append(real_open(*args))
+                return opened_files[-1]
+
+            stream = processor._stream_file(str(file_path))
+            with patch("builtins.open", side_effect=tracking_open):
+                assert await stream.__anext__() == b"0123"
+            await stream.aclose()
+
+            assert len(opened_files) == 1
+            assert opened_files[0].closed
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+
+from unittest.mock import MagicMock
+from src.adapters.discord_webhook_adapter.event_processing.webhook_rate_limiter import WebhookRateLimiter
+
+class TestWebhookRateLimiter:
+    """Tests for the WebhookRateLimiter class"""
+
+    @pytest.fixture
+    def webhook_rate_limiter(self):
+        """Create a WebhookRateLimiter instance"""
+        return WebhookRateLimiter()
+
+    @pytest.fixture
+    def response_factory(self):
+        """Create mocked aiohttp responses"""
+        def _create(status=200, headers=None):
+            response = MagicMock()
+            response.status = status
+            response.headers = headers or {}
+            return response
+        return _create
+
+    def test_no_wait_for_unknown_webhook(self, webhook_rate_limiter):
+        """Test that a webhook without bucket info is not limited"""
+        assert webhook_rate_limiter.get_wait_time("webhook_url") == 0
+
+    def test_update_from_headers(self, webhook_rate_limiter, response_factory):
+        """Test that an exhausted bucket makes the webhook wait until reset"""
+        webhook_rate_limiter.update(
+            "webhook_url",
+            response_factory(headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "2.5"})
+        )
+
+        assert 2 < webhook_rate_limiter.get_wait_time("webhook_url") <= 2.5
+        assert webhook_rate_limiter.get_wait_time("another_webhook_url") == 0
+
+    def test_update_with_remaining_requests(self, webhook_rate_limiter, response_factory):
+        """Test that a bucket with remaining requests does not wait"""
+        webhook_rate_limiter.update(
+            "webhook_url",
+            response_factory(headers={"X-RateLimit-Remaining": "4", "X-RateLimit-Reset-After": "2"})
+        )
+
+        assert webhook_rate_limiter.get_wait_time("webhook_url") == 0
+
+    def test_update_from_rate_limited_response(self, webhook_rate_limiter, response_factory):
+        """Test that a 429 response blocks the webhook for Retry-After seconds"""
+        webhook_rate_limiter.update("webhook_url", response_factory(429, {"Retry-After": "1"}))
+
+        assert 0 < webhook_rate_limiter.get_wait_time("webhook_url") <= 1
+
+    def test_update_ignores_invalid_headers(self, webhook_rate_limiter, response_factory):
+        """Test that unparsable headers are ignored"""
+        webhook_rate_limiter.update(
+            "webhook_url",
+            response_factory(headers={"X-RateLimit-Remaining": "abc", "X-RateLimit-Reset-After": "1"})
+        )
+
+        assert webhook_rate_limiter.get_wait_time("webhook_url") == 0
+
+    @pytest.mark.asyncio
+    async def test_limit_serializes_same_webhook(self, webhook_rate_limiter):
+        """Test that requests to one webhook run one by one in order"""
+        order = []
+
+        async def request(name):
+            async with webhook_rate_limiter.limit("webhook_url"):
+                order.append(f"{name}_start")
+                await asyncio.sleep(0.01)
+                order.append(f"{name}_end")
+
+        await asyncio.gather(request("first"), request("second"))
+
+        assert order == ["first_start", "first_end", "second_start", "second_end"]
+
+    @pytest.mark.asyncio
+    async def test_limit_runs_different_webhooks_concurrently(self, webhook_rate_limiter):
+        """Test that requests to different webhooks do not wait for each other"""
+        order = []
+
+        async def request(webhook_url):
+            async with webhook_rate_limiter.limit(webhook_url):
+                order.append(f"{webhook_url}_start")
+                await asyncio.sleep(0.01)
+                order.append(f"{webhook_url}_end")
+
+        await asyncio.gather(request("first"), request("second"))
+
+        assert order[:2] == ["first_start", "second_start"]
@@ -141,7 +141,7 @@ class TestWebhookAdapter:
             result = await adapter.process_outgoing_event(test_data)
             assert result["request_completed"] is True
 
-            processor_mock.process_event.assert_called_once_with(test_data)
+            processor_mock.process_event.assert_called_once_with(test_data, None)
 
         @pytest.mark.asyncio
         async def test_process_outgoing_event_discord_not_connected(self, adapter):
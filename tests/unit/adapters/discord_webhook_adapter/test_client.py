@@ -64,15 +64,7 @@ class TestClient:
         return session_mock
 
     @pytest.fixture
-    def rate_limiter_mock(self):
-        """Create a mock rate limiter"""
-        rate_limiter = AsyncMock()
-        rate_limiter.limit_request = AsyncMock(return_value=None)
-        rate_limiter.get_wait_time = AsyncMock(return_value=0)
-        return rate_limiter
-
-    @pytest.fixture
-    def discord_webhook_client(self, discord_webhook_config, rate_limiter_mock):
+    def discord_webhook_client(self, discord_webhook_config, tmp_path):
         """Create a DiscordWebhookClient with mocked config"""
         discord_webhook_config.get_setting = MagicMock(side_effect=lambda section, key, default=None: {
             ("adapter", "bot_connections"): [
@@ -91,12 +83,11 @@ class TestClient:
                     "url": "https://discord.com/api/webhooks/222222/token",
                     "name": "Config Webhook"
                 }
-            ]
+            ],
+            ("adapter", "webhook_registry_path"): str(tmp_path / "webhooks.json")
         }.get((section, key), default))
 
-        client = Client(discord_webhook_config)
-        client.rate_limiter = rate_limiter_mock
-        return client
+        return Client(discord_webhook_config)
 
     class TestConnection:
         """Tests for connecting to Discord"""
@@ -104,13 +95,16 @@ class TestClient:
         @pytest.mark.asyncio
         async def test_connect_success(self, discord_webhook_client, bot_mock, session_mock):
             """Test successful connection to Discord"""
-            with patch("aiohttp.ClientSession", return_value=session_mock):
+            with patch(
+                "src.core.utils.http_session_pool.HttpSessionPool.get_session",
+                return_value=session_mock
+            ):
                 discord_webhook_client._connect_bot = AsyncMock(return_value=True)
                 discord_webhook_client.bots = {
                     "test_token1": bot_mock,
                     "test_token2": bot_mock
                 }
-                discord_webhook_client._load_webhooks = AsyncMock()
+                discord_webhook_client._refresh_webhooks = MagicMock()
 
                 with patch("asyncio.gather", AsyncMock(return_value=[True, True])):
                     with patch("asyncio.create_task", side_effect=lambda coro: coro):
@@ -124,7 +118,8 @@ class TestClient:
 
                         assert discord_webhook_client.running is True
                         assert discord_webhook_client.session is session_mock
-                        discord_webhook_client._load_webhooks.assert_awaited_once()
+                        discord_webhook_client._refresh_webhooks.assert_called_once()
+                        assert "111111/222222" in discord_webhook_client.webhooks
 
     class TestDisconnection:
         """Tests for disconnecting from Discord"""
@@ -187,7 +182,9 @@ class TestClient:
             assert discord_webhook_client.webhooks["111111/222222"]["url"] == "https://discord.com/api/webhooks/222222/token"
             assert discord_webhook_client.webhooks["111111/222222"]["name"] == "Config Webhook"
 
-            assert discord_webhook_client.rate_limiter.limit_request.call_count == 2
+            assert discord_webhook_client.registry.is_validated("987654321/123456789")
+            assert not discord_webhook_client.registry.is_validated("111111/222222")
+            assert bot_mock.wait_until_ready.await_count == 2
 
         @pytest.mark.asyncio
         async def test_get_existing_webhook(self, discord_webhook_client):
@@ -198,6 +195,7 @@ class TestClient:
                     "name": "Test Webhook"
                 }
             }
+            discord_webhook_client.registry.mark_validated("987654321/123456789")
 
             result = await discord_webhook_client.get_or_create_webhook("987654321/123456789")
             assert result == {
@@ -216,6 +214,7 @@ class TestClient:
 
             guild = bot_mock.get_guild.return_value
             channel = guild.get_channel.return_value
+            channel.webhooks = AsyncMock(return_value=[])
 
             new_webhook = MagicMock(spec=discord.Webhook)
             new_webhook.url = "https://discord.com/api/webhooks/new/token"
@@ -232,3 +231,80 @@ class TestClient:
             assert "987654321/123456789" in discord_webhook_client.webhooks
             assert discord_webhook_client.webhooks["987654321/123456789"] == result
             channel.create_webhook.assert_awaited_once_with(name="Connectome Bot")
+
+        @pytest.mark.asyncio
+        async def test_reuse_existing_bot_webhook(self, discord_webhook_client, bot_mock):
+            """Test reusing a webhook the bot has created before"""
+            discord_webhook_client.bots = {"test_token1": bot_mock}
+
+            guild = bot_mock.get_guild.return_value
+            channel = guild.get_channel.return_value
+
+            bot_webhook = MagicMock(spec=discord.Webhook)
+            bot_webhook.url = "https://discord.com/api/webhooks/bot/token"
+            bot_webhook.name = "Connectome Bot"
+            bot_webhook.user = bot_mock.user
+            channel.webhooks = AsyncMock(return_value=[bot_webhook])
+
+            result = await discord_webhook_client.get_or_create_webhook("987654321/123456789")
+            assert result["url"] == "https://discord.com/api/webhooks/bot/token"
+            channel.create_webhook.assert_not_awaited()
+
+        @pytest.mark.asyncio
+        async def test_replace_webhook_that_no_longer_exists(self, discord_webhook_client, bot_mock):
+            """Test that a saved webhook is validated on first use and replaced if gone"""
+            discord_webhook_client.bots = {"test_token1": bot_mock}
+            discord_webhook_client.webhooks = {
+                "987654321/123456789": {
+                    "url": "https://discord.com/api/webhooks/deleted/token",
+                    "name": "Deleted Webhook",
+                    "bot_token": None
+                }
+            }
+
+            response = MagicMock()
+            response.status = 404
+            request = MagicMock()
+            request.__aenter__ = AsyncMock(return_value=response)
+            request.__aexit__ = AsyncMock(return_value=None)
+            discord_webhook_client.session = MagicMock()
+            discord_webhook_client.session.get = MagicMock(return_value=request)
+
+            channel = bot_mock.get_guild.return_value.get_channel.return_value
+            channel.webhooks = AsyncMock(return_value=[])
+            new_webhook = MagicMock(spec=discord.Webhook)
+            new_webhook.url = "https://discord.com/api/webhooks/new/token"
+            new_webhook.name = "Connectome Bot"
+            channel.create_webhook.return_value = new_webhook
+
+            result = await discord_webhook_client.get_or_create_webhook("987654321/123456789")
+            assert result["url"] == "https://discord.com/api/webhooks/new/token"
+            discord_webhook_client.session.get.assert_called_once_with(
+                "https://discord.com/api/webhooks/deleted/token"
+            )
+            assert discord_webhook_client.registry.is_validated("987654321/123456789")
+
+        @pytest.mark.asyncio
+        async def test_validate_saved_webhook_once(self, discord_webhook_client):
+            """Test that a saved webhook is validated only on its first use"""
+            discord_webhook_client.webhooks = {
+                "987654321/123456789": {
+                    "url": "https://discord.com/api/webhooks/123456789/token",
+                    "name": "Saved Webhook",
+                    "bot_token": None
+                }
+            }
+
+            response = MagicMock()
+            response.status = 200
+            request = MagicMock()
+            request.__aenter__ = AsyncMock(return_value=response)
+            request.__aexit__ = AsyncMock(return_value=None)
+            discord_webhook_client.session = MagicMock()
+            discord_webhook_client.session.get = MagicMock(return_value=request)
+
+            for _ in range(2):
+                result = await discord_webhook_client.get_or_create_webhook("987654321/123456789")
+                assert result["name"] == "Saved Webhook"
+
+            discord_webhook_client.session.get.assert_called_once()
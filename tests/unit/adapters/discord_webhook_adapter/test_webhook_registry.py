@@ -0,0 +1,66 @@
+import json
+import os
+import pytest
+
+from unittest.mock import MagicMock
+from src.adapters.discord_webhook_adapter.webhook_registry import WebhookRegistry
+
+class TestWebhookRegistry:
+    """Tests for WebhookRegistry"""
+
+    @pytest.fixture
+    def registry_path(self, tmp_path):
+        """Path to the registry file"""
+        return str(tmp_path / "registry" / "webhooks.json")
+
+    @pytest.fixture
+    def registry(self, registry_path):
+        """Create a WebhookRegistry with mocked config"""
+        config = MagicMock()
+        config.get_setting = MagicMock(return_value=registry_path)
+        return WebhookRegistry(config)
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self, registry, registry_path):
+        """Test that webhooks survive a restart without bot tokens"""
+        registry.add("111/222", {
+            "url": "https://discord.com/api/webhooks/222/token",
+            "name": "Connectome Bot",
+            "bot_token": "secret"
+        })
+        await registry.save()
+
+        with open(registry_path, "r") as file:
+            saved = json.load(file)
+        assert saved == {
+            "111/222": {
+                "url": "https://discord.com/api/webhooks/222/token",
+                "name": "Connectome Bot"
+            }
+        }
+        assert os.stat(registry_path).st_mode & 0o777 == 0o600
+
+        restored = WebhookRegistry(MagicMock(get_setting=MagicMock(return_value=registry_path)))
+        await restored.load()
+
+        assert restored.get("111/222") == {
+            "url": "https://discord.com/api/webhooks/222/token",
+            "name": "Connectome Bot",
+            "bot_token": None
+        }
+        assert not restored.is_validated("111/222")
+
+    @pytest.mark.asyncio
+    async def test_load_missing_file(self, registry):
+        """Test loading when nothing was saved yet"""
+        await registry.load()
+        assert registry.webhooks == {}
+
+    def test_remove(self, registry):
+        """Test removing a webhook"""
+        registry.add("111/222", {"url": "url", "name": "name"})
+        assert registry.is_validated("111/222")
+
+        registry.remove("111/222")
+        assert registry.get("111/222") is None
+        assert not registry.is_validated("111/222")
@@ -4,8 +4,10 @@ Unit tests for the Slack adapter event processors and related components.
 This package contains unit tests for the core adapter components including:
 - IncomingEventProcessor: For Slack incoming event processing
 - IncomingFileProcessor: For Slack incoming file processing
+- FileReadinessCoordinator: For holding Slack messages until their files are ready
 - HistoryFetcher: For fetching and parsing Slack message history
 - OutgoingEventProcessor: For Slack outgoing event processing
+- GapBackfiller: For fetching Slack messages missed during reconnects
 """
 
 __author__ = "Your Name"
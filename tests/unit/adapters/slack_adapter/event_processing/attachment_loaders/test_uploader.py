@@ -58,7 +58,7 @@ class TestUploader:
     async def test_upload_file_success(self, uploader, sample_send_message_data, sample_conversation_info):
         """Test successful file upload"""
         with patch("os.path.exists", return_value=True):
-            with patch("src.adapters.slack_adapter.event_processing.attachment_loaders.uploader.move_attachment") as mock_move:
+            with patch("src.core.utils.attachment_uploading.move_attachment") as mock_move:
                 with patch("src.adapters.slack_adapter.event_processing.attachment_loaders.uploader.create_attachment_dir") as mock_create_dir:
                     await uploader.upload_attachments(sample_conversation_info, sample_send_message_data)
 
@@ -109,7 +109,7 @@ class TestUploader:
         ]
 
         with patch("os.path.exists", return_value=True):
-            with patch("src.adapters.slack_adapter.event_processing.attachment_loaders.uploader.move_attachment"):
+            with patch("src.core.utils.attachment_uploading.move_attachment"):
                 with patch("src.adapters.slack_adapter.event_processing.attachment_loaders.uploader.create_attachment_dir"):
                     await uploader.upload_attachments(sample_conversation_info, sample_send_message_data)
 
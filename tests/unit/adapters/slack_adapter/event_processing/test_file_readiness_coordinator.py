@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import pytest
+
+from unittest.mock import AsyncMock, patch
+
+from src.adapters.slack_adapter.event_processing.file_readiness_coordinator import FileReadinessCoordinator
+
+class TestFileReadinessCoordinator:
+    """Tests for the FileReadinessCoordinator class"""
+
+    @pytest.fixture
+    def message_event(self):
+        """Create a message event with two files that are not ready"""
+        return {
+            "type": "message",
+            "subtype": "file_share",
+            "channel": "C123456",
+            "ts": "1234567890.123456",
+            "files": [{"id": "F1"}, {"id": "F2"}, {"id": "F3", "ready": True}]
+        }
+
+    @pytest.fixture
+    def file_infos(self):
+        """Create the file infos returned by status checks"""
+        return {"F1": {"id": "F1"}, "F2": {"id": "F2"}}
+
+    @pytest.fixture
+    def coordinator(self, message_event, file_infos):
+        """Create a coordinator with short delays"""
+        async def get_file_info(file_id):
+            return file_infos[file_id]
+
+        coordinator = FileReadinessCoordinator(
+            message_event,
+            AsyncMock(side_effect=get_file_info),
+            lambda file_info: file_info.get("ready", False),
+            AsyncMock()
+        )
+        coordinator.INITIAL_DELAY = 0.01
+        coordinator.MAX_DELAY = 0.01
+        coordinator.TIMEOUT = 1
+        return coordinator
+
+    def test_ready_files_are_not_pending(self, coordinator):
+        """Test that files that are ready in the message are not checked"""
+        assert coordinator.pending == {"F1", "F2"}
+        assert coordinator.media is False
+
+    @pytest.mark.asyncio
+    async def test_release_once_when_all_files_ready(self, coordinator, file_infos, message_event):
+        """Test that the message is released once after all files became ready"""
+        file_infos["F1"]["ready"] = True
+        coordinator.TIMEOUT = 10
+
+        coordinator.start()
+        await asyncio.sleep(0.05)
+        coordinator.release.assert_not_awaited()
+
+        file_infos["F2"]["ready"] = True
+        await asyncio.wait_for(coordinator.task, timeout=1)
+
+        coordinator.release.assert_awaited_once_with(message_event)
+        assert coordinator.pending == set()
+
+    @pytest.mark.asyncio
+    async def test_notify_checks_only_notified_file(self, coordinator, file_infos):
+        """Test that a notification checks the reported file without waiting for the poll"""
+        coordinator.INITIAL_DELAY = 10
+        file_infos["F1"]["ready"] = True
+
+        coordinator.start()
+        await asyncio.sleep(0)
+        coordinator.notify("F1")
+        await asyncio.sleep(0.01)
+
+        coordinator.get_file_info.assert_awaited_once_with("F1")
+        assert coordinator.pending == {"F2"}
+
+        coordinator.cancel()
+        await asyncio.gather(coordinator.task, return_exceptions=True)
+        coordinator.release.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_release_after_timeout(self, coordinator, message_event):
+        """Test that the message is released when files never become ready"""
+        coordinator.TIMEOUT = 0.05
+
+        with patch.object(logging, "warning") as mock_warning:
+            coordinator.start()
+            await asyncio.wait_for(coordinator.task, timeout=1)
+
+        coordinator.release.assert_awaited_once_with(message_event)
+        assert "not ready after the timeout" in mock_warning.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_failed_check_keeps_file_pending(self, coordinator):
+        """Test that failed status checks are retried on the next poll"""
+        coordinator.get_file_info.side_effect = Exception("ratelimited")
+        coordinator.TIMEOUT = 0.05
+
+        coordinator.start()
+        await asyncio.wait_for(coordinator.task, timeout=1)
+
+        assert coordinator.pending == {"F1", "F2"}
+        coordinator.release.assert_awaited_once()
+
+    def test_jitter_stays_within_bounds(self, coordinator):
+        """Test that jittered delays stay around the base delay"""
+        for _ in range(100):
+            assert 7.5 <= coordinator._jitter(10) <= 12.5
@@ -0,0 +1,158 @@
+import pytest
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.adapters.slack_adapter.conversation.data_classes import ConversationInfo
+from src.adapters.slack_adapter.event_processing.gap_backfiller import GapBackfiller
+
+class TestGapBackfiller:
+    """Tests for the GapBackfiller class"""
+
+    @pytest.fixture
+    def client_mock(self):
+        """Create a mocked Slack web client"""
+        client = AsyncMock()
+        client.conversations_history = AsyncMock(return_value={
+            "ok": True,
+            "messages": [
+                {"ts": "1700000003.000000", "text": "edited", "subtype": "message_changed"},
+                {"ts": "1700000002.000000", "text": "second"},
+                {"ts": "1700000001.000000", "text": "first", "subtype": "file_share"},
+                {"ts": "1700000000.000000", "text": "known"}
+            ],
+            "has_more": False
+        })
+        return client
+
+    @pytest.fixture
+    def conversation_manager_mock(self):
+        """Create a conversation manager with a known channel conversation"""
+        manager = MagicMock()
+        manager.conversations = {
+            "known": ConversationInfo(
+                conversation_id="known",
+                platform_conversation_id="T12345/C12345",
+                conversation_type="channel",
+                messages={"1700000000.000000"}
+            ),
+            "empty": ConversationInfo(
+                conversation_id="empty",
+                platform_conversation_id="T12345/C67890",
+                conversation_type="channel"
+            )
+        }
+        return manager
+
+    @pytest.fixture
+    def backfiller(self, slack_config, client_mock, conversation_manager_mock, rate_limiter_mock):
+        """Create a gap backfiller with mocked dependencies"""
+        with patch("src.core.rate_limiter.rate_limiter.RateLimiter.get_instance", return_value=rate_limiter_mock):
+            yield GapBackfiller(slack_config, client_mock, conversation_manager_mock)
+
+    @pytest.mark.asyncio
+    async def test_fetch_missed_messages(self, backfiller, client_mock):
+        """Test that only new messages after the given timestamp are returned in order"""
+        events = await backfiller.fetch_missed_messages("1699999999.000000")
+
+        assert [event["type"] for event in events] == ["file_share", "message"]
+        assert [event["event"]["text"] for event in events] == ["first", "second"]
+        assert all(event["event"]["channel"] == "C12345" for event in events)
+        assert all(event["event"]["team"] == "T12345" for event in events)
+
+        client_mock.conversations_history.assert_awaited_once()
+        request = client_mock.conversations_history.call_args.kwargs
+        assert request["channel"] == "C12345"
+        assert request["oldest"] == "1699999999.000000"
+        assert request["inclusive"] is False
+
+    @pytest.mark.asyncio
+    async def test_fetch_pages(self, backfiller, client_mock):
+        """Test that further pages are requested with the returned cursor"""
+        client_mock.conversations_history.side_effect = [
+            {
+                "ok": True,
+                "messages": [{"ts": "1700000002.000000"}],
+                "has_more": True,
+                "response_metadata": {"next_cursor": "next"}
+            },
+            {"ok": True, "messages": [{"ts": "1700000001.000000"}], "has_more": False}
+        ]
+
+        events = await backfiller.fetch_missed_messages("1700000000.000000")
+
+        assert [event["event"]["ts"] for event in events] == ["1700000001.000000", "1700000002.000000"]
+        assert client_mock.conversations_history.call_args.kwargs["cursor"] == "next"
+
+    @pytest.mark.asyncio
+    async def test_oldest_messages_are_kept(self, backfiller, client_mock, conversation_manager_mock):
+        """Test that a gap larger than the limit keeps its oldest messages"""
+        backfiller.max_messages = 2
+        del conversation_manager_mock.conversations["empty"]
+        client_mock.conversations_history.side_effect = [
+            {
+                "ok": True,
+                "messages": [{"ts": "1700000004.000000"}, {"ts": "1700000003.000000"}],
+                "has_more": True,
+                "response_metadata": {"next_cursor": "next"}
+            },
+            {
+                "ok": True,
+                "messages": [{"ts": "1700000002.000000"}, {"ts": "1700000001.000000"}],
+                "has_more": False
+            }
+        ]
+
+        events = await backfiller.fetch_missed_messages("1700000000.000000")
+
+        assert [event["event"]["ts"] for event in events] == ["1700000001.000000", "1700000002.000000"]
+
+    @pytest.mark.asyncio
+    async def test_page_count_is_capped(self, backfiller, client_mock, conversation_manager_mock):
+        """Test that a gap with endless pages stops after max_pagination_iterations"""
+        backfiller.max_iterations = 3
+        del conversation_manager_mock.conversations["empty"]
+        client_mock.conversations_history.side_effect = None
+        client_mock.conversations_history.return_value = {
+            "ok": True,
+            "messages": [{"ts": "1700000001.000000"}],
+            "has_more": True,
+            "response_metadata": {"next_cursor": "next"}
+        }
+
+        with patch("src.adapters.slack_adapter.event_processing.gap_backfiller.logging") as logging_mock:
+            await backfiller.fetch_missed_messages("1700000000.000000")
+
+        assert client_mock.conversations_history.await_count == 3
+        logging_mock.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_gap_over_page_cap_keeps_newest_messages(self,
+                                                           backfiller,
+                                                           client_mock,
+                                                           conversation_manager_mock):
+        """Test that a gap longer than the page cap keeps its newest messages"""
+        backfiller.max_messages = 2
+        backfiller.max_iterations = 3
+        del conversation_manager_mock.conversations["empty"]
+        gap = [{"ts": f"17000000{ts:02d}.000000"} for ts in range(20, 0, -1)]
+        client_mock.conversations_history.side_effect = [
+            {
+                "ok": True,
+                "messages": gap[page * 2:page * 2 + 2],
+                "has_more": True,
+                "response_metadata": {"next_cursor": f"page{page + 1}"}
+            }
+            for page in range(10)
+        ]
+
+        events = await backfiller.fetch_missed_messages("1700000000.000000")
+
+        assert client_mock.conversations_history.await_count == 3
+        assert [event["event"]["ts"] for event in events] == ["1700000019.000000", "1700000020.000000"]
+
+    @pytest.mark.asyncio
+    async def test_failed_request(self, backfiller, client_mock):
+        """Test that failed requests do not return messages"""
+        client_mock.conversations_history.return_value = {"ok": False, "error": "ratelimited"}
+
+        assert await backfiller.fetch_missed_messages("1700000000.000000") == []
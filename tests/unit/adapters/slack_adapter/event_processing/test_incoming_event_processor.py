@@ -547,3 +547,16 @@ class TestIncomingEventProcessor:
             """Test handling exceptions during pin processing"""
             processor.conversation_manager.update_conversation.side_effect = Exception("Test error")
             assert await processor._handle_pin(pin_add_event_mock) == []
+
+    class TestConversationKeys:
+        """Tests for sharding events by conversation"""
+
+        @pytest.mark.parametrize("event,expected", [
+            ({"type": "message", "event": {"channel": "C1"}}, "C1"),
+            ({"type": "reaction_added", "event": {"item": {"channel": "C2"}}}, "C2"),
+            ({"type": "channel_rename", "event": {"channel": {"id": "C3", "name": "new"}}}, "C3"),
+            ({"type": "team_rename", "event": {"name": "team"}}, None)
+        ])
+        def test_conversation_keys(self, processor, event, expected):
+            """Test the keys of channel, reaction and team events"""
+            assert processor.get_conversation_key(event) == expected
@@ -1,7 +1,5 @@
 import asyncio
-import logging
 import pytest
-import time
 
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.adapters.slack_adapter.event_processing.incoming_file_processor import IncomingFileProcessor
@@ -26,7 +24,7 @@ class TestIncomingFileProcessor:
     def mock_adapter(self):
         """Create a mock Slack adapter"""
         adapter = AsyncMock()
-        adapter.process_incoming_event = AsyncMock(return_value=None)
+        adapter.dispatch_incoming_event = AsyncMock(return_value=None)
         return adapter
 
     @pytest.fixture
@@ -98,37 +96,62 @@ class TestIncomingFileProcessor:
         }
 
     @pytest.mark.asyncio
-    async def test_schedule_file_processing(self, file_processor, standard_file_event):
-        """Test scheduling file processing tasks"""
-        with patch.object(file_processor, "_process_file_with_retries", AsyncMock()):
-            await file_processor.schedule_file_processing(standard_file_event)
+    async def test_schedule_ready_files(self, file_processor, standard_file_event, mock_adapter):
+        """Test that a message with ready files is processed without status checks"""
+        await file_processor.schedule_file_processing(standard_file_event)
+        await file_processor.coordinators["C123456/1234567890.123456"].task
 
-            assert "F123456" in file_processor.processing_tasks
+        file_processor.client.files_info.assert_not_called()
+        mock_adapter.dispatch_incoming_event.assert_awaited_once_with({
+            "type": "message",
+            "event": standard_file_event
+        })
+        assert file_processor.coordinators == {}
+
+    @pytest.mark.asyncio
+    async def test_schedule_message_once(self, file_processor, media_file_event):
+        """Test that a message is held by a single coordinator"""
+        await file_processor.schedule_file_processing(media_file_event)
+        coordinator = file_processor.coordinators["C123456/1234567890.123456"]
+
+        await file_processor.schedule_file_processing(media_file_event)
 
-            for task, _ in file_processor.processing_tasks.values():
-                task.cancel()
+        assert file_processor.coordinators["C123456/1234567890.123456"] is coordinator
+        assert file_processor.file_coordinators == {"F789012": coordinator}
+
+        file_processor.close()
+        await asyncio.gather(coordinator.task, return_exceptions=True)
 
     @pytest.mark.asyncio
-    async def test_get_file_status_cache_hit(self, file_processor):
-        """Test file status caching"""
-        file_processor.status_cache["F123456"] = {
-            "info": {"id": "F123456"},
-            "timestamp": time.time()
-        }
+    async def test_file_event_releases_message(self,
+                                               file_processor,
+                                               media_file_event,
+                                               ready_media_file,
+                                               mock_adapter):
+        """Test that a file_change event triggers an immediate status check"""
+        file_processor.client.files_info.return_value = {"file": ready_media_file}
+
+        await file_processor.schedule_file_processing(media_file_event)
+        coordinator = file_processor.coordinators["C123456/1234567890.123456"]
 
-        result = await file_processor._get_file_status("F123456")
+        file_processor.handle_file_event({"type": "file_change", "file_id": "F789012"})
+        await asyncio.wait_for(coordinator.task, timeout=1)
 
-        assert result["id"] == "F123456"
-        assert not file_processor.client.files_info.called
+        file_processor.client.files_info.assert_awaited_once_with(file="F789012")
+        file_processor.rate_limiter.limit_request.assert_awaited_with("files_info")
+        mock_adapter.dispatch_incoming_event.assert_awaited_once()
+        assert file_processor.file_coordinators == {}
 
     @pytest.mark.asyncio
-    async def test_get_file_status_cache_miss(self, file_processor):
-        """Test file status API call on cache miss"""
-        result = await file_processor._get_file_status("F123456")
+    async def test_close_does_not_release(self, file_processor, media_file_event, mock_adapter):
+        """Test that closing the processor drops held messages"""
+        await file_processor.schedule_file_processing(media_file_event)
+        coordinator = file_processor.coordinators["C123456/1234567890.123456"]
 
-        file_processor.client.files_info.assert_called_once_with(file="F123456")
-        assert "F123456" in file_processor.status_cache
-        assert file_processor.status_cache["F123456"]["info"] == result
+        file_processor.close()
+        await asyncio.gather(coordinator.task, return_exceptions=True)
+
+        mock_adapter.dispatch_incoming_event.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_is_file_ready_standard_file(self, file_processor):
@@ -173,80 +196,3 @@ class TestIncomingFileProcessor:
         }
 
         assert file_processor._is_file_ready(file_info) == True
-
-    @pytest.mark.asyncio
-    async def test_process_file_with_retries_success_first_try(self,
-                                                               file_processor,
-                                                               standard_file_event):
-        """Test successful file processing on first try"""
-        with patch.object(file_processor, "_get_file_status", AsyncMock(
-            return_value={"id": "F123456", "url_private_download": "https://example.com"}
-        )):
-            with patch.object(file_processor, "_process_file", AsyncMock()) as mock_process:
-                await file_processor._process_file_with_retries(
-                    "F123456",
-                    {"id": "F123456"},
-                    standard_file_event,
-                    initial_delay=0.1,
-                    max_retries=3,
-                    backoff_factor=1.5
-                )
-
-                assert file_processor._get_file_status.call_count == 1
-                mock_process.assert_called_once_with("F123456")
-
-    @pytest.mark.asyncio
-    async def test_process_file_with_retries_success_after_retry(self,
-                                                                 file_processor,
-                                                                 standard_file_event):
-        """Test file processing succeeding after retry"""
-        status_responses = [
-            # First call - not ready
-            {"id": "F123456", "url_private": None, "url_private_download": None},
-            # Second call - ready
-            {"id": "F123456", "url_private_download": "https://example.com"}
-        ]
-
-        async def get_status_side_effect(file_id):
-            return status_responses.pop(0)
-
-        with patch.object(file_processor, "_get_file_status", side_effect=get_status_side_effect):
-            with patch.object(file_processor, "_process_file", AsyncMock()) as mock_process:
-                with patch.object(logging, "warning") as mock_log:
-                    await file_processor._process_file_with_retries(
-                        "F123456",
-                        {"id": "F123456"},
-                        standard_file_event,
-                        initial_delay=0.1,
-                        max_retries=3,
-                        backoff_factor=1.5
-                    )
-
-                    assert file_processor._get_file_status.call_count == 2
-                    mock_process.assert_called_once_with("F123456")
-                    assert not mock_log.called
-
-    @pytest.mark.asyncio
-    async def test_process_file_with_retries_max_retries(self,
-                                                         file_processor,
-                                                         standard_file_event):
-        """Test file processing after max retries"""
-        with patch.object(file_processor, "_get_file_status", AsyncMock(
-            return_value={"id": "F123456", "url_private": None, "url_private_download": None}
-        )):
-            with patch.object(file_processor, "_process_file", AsyncMock()) as mock_process:
-                with patch.object(logging, "warning") as mock_warning:
-                    await file_processor._process_file_with_retries(
-                        "F123456",
-                        {"id": "F123456"},
-                        standard_file_event,
-                        initial_delay=0.1,
-                        max_retries=3,
-                        backoff_factor=1.5
-                    )
-
-                    assert file_processor._get_file_status.call_count == 3
-                    mock_process.assert_called_once_with("F123456")
-
-                    assert mock_warning.called
-                    assert "not ready after 3 attempts" in mock_warning.call_args[0][0]
@@ -124,7 +124,7 @@ class TestAdapter:
             await adapter.process_incoming_event(test_event)
 
             adapter.incoming_events_processor.process_event.assert_called_once_with(test_event)
-            adapter.socketio_server.emit_event.assert_called_once_with("bot_request", {"test": "event"})
+            adapter.socketio_server.emit_bot_requests.assert_called_once_with([{"test": "event"}])
 
         @pytest.mark.asyncio
         async def test_process_file_share_event(self, adapter, file_processor_mock):
@@ -136,6 +136,38 @@ class TestAdapter:
 
             adapter.file_processor.schedule_file_processing.assert_called_once_with(test_event["event"])
 
+        @pytest.mark.asyncio
+        async def test_process_file_change_event(self, adapter):
+            """Test that file change events are passed to the file processor"""
+            adapter.file_processor = MagicMock()
+            test_event = {"type": "file_change", "event": {"file_id": "F12345"}}
+
+            await adapter.process_incoming_event(test_event)
+
+            adapter.file_processor.handle_file_event.assert_called_once_with(test_event["event"])
+
+        @pytest.mark.asyncio
+        async def test_backfill_gap(self, adapter, slack_client_mock):
+            """Test that missed messages are dispatched unless they were already received"""
+            adapter.client = slack_client_mock
+            adapter.client.get_message_key = MagicMock(side_effect=lambda channel, ts: f"{channel}/{ts}")
+            adapter.client.remember_event = MagicMock(side_effect=lambda key: key != "C1/2.0")
+            adapter.incoming_events_processor = MagicMock()
+            adapter.dispatch_incoming_event = AsyncMock()
+            missed_events = [
+                {"type": "message", "event": {"channel": "C1", "ts": "1.0"}},
+                {"type": "message", "event": {"channel": "C1", "ts": "2.0"}}
+            ]
+
+            with patch(
+                "src.adapters.slack_adapter.adapter.GapBackfiller.fetch_missed_messages",
+                AsyncMock(return_value=missed_events)
+            ) as fetch_mock:
+                await adapter._backfill_gap("0.5")
+
+            fetch_mock.assert_awaited_once_with("0.5")
+            adapter.dispatch_incoming_event.assert_awaited_once_with(missed_events[0])
+
         @pytest.mark.asyncio
         async def test_process_outgoing_event(self, adapter, events_processor_mock):
             """Test processing outgoing events"""
@@ -151,7 +183,7 @@ class TestAdapter:
             response = await adapter.process_outgoing_event(test_data)
 
             assert response["request_completed"] is True
-            adapter.outgoing_events_processor.process_event.assert_called_once_with(test_data)
+            adapter.outgoing_events_processor.process_event.assert_called_once_with(test_data, None)
 
         @pytest.mark.asyncio
         async def test_process_outgoing_event_not_connected(self, adapter):
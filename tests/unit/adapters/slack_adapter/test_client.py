@@ -109,3 +109,130 @@ class TestClient:
             # Verify the subtype was used as the event type
             called_event = process_event_mock.call_args[0][0]
             assert called_event["type"] == "message_changed"
+
+        @pytest.mark.asyncio
+        async def test_handle_redelivered_event(self, slack_client, socket_client_mock):
+            """Test that a retried delivery of an event is acknowledged but not processed again"""
+            process_event_mock = AsyncMock()
+            slack_client.process_event = process_event_mock
+            slack_client._connection_start_time = time.time() - 10
+            slack_client.socket_client = socket_client_mock
+
+            for retry_attempt in (None, 1):
+                request = MagicMock()
+                request.envelope_id = f"env_{retry_attempt}"
+                request.retry_attempt = retry_attempt
+                request.payload = {
+                    "event_id": "Ev12345",
+                    "event": {"type": "reaction_added", "event_ts": str(time.time())},
+                    "team_id": "T12345"
+                }
+                await slack_client._handle_slack_event(None, request)
+
+            assert socket_client_mock.send_socket_mode_response.await_count == 2
+            process_event_mock.assert_awaited_once()
+
+        @pytest.mark.asyncio
+        async def test_handle_backfilled_message(self, slack_client, socket_client_mock):
+            """Test that a message that was already backfilled is not processed again"""
+            process_event_mock = AsyncMock()
+            slack_client.process_event = process_event_mock
+            slack_client._connection_start_time = time.time() - 10
+            slack_client.socket_client = socket_client_mock
+            slack_client.remember_event(slack_client.get_message_key("C12345", "1700000000.000100"))
+            request = MagicMock()
+            request.envelope_id = "env_123"
+            request.payload = {
+                "event_id": "Ev12345",
+                "event": {
+                    "type": "message",
+                    "channel": "C12345",
+                    "ts": "1700000000.000100",
+                    "event_ts": str(time.time())
+                },
+                "team_id": "T12345"
+            }
+
+            await slack_client._handle_slack_event(None, request)
+
+            socket_client_mock.send_socket_mode_response.assert_awaited_once()
+            process_event_mock.assert_not_awaited()
+
+        @pytest.mark.asyncio
+        async def test_ack_while_queue_is_full(self, slack_client, socket_client_mock):
+            """Test that the event is acknowledged while it waits for a place in the queue"""
+            acked = asyncio.Event()
+            socket_client_mock.send_socket_mode_response = AsyncMock(side_effect=lambda _: acked.set())
+
+            async def process_event(_):
+                await asyncio.wait_for(acked.wait(), timeout=1)
+
+            slack_client.process_event = process_event
+            slack_client._connection_start_time = time.time() - 10
+            slack_client.socket_client = socket_client_mock
+            request = MagicMock()
+            request.envelope_id = "env_123"
+            request.payload = {
+                "event": {"type": "message", "event_ts": str(time.time())},
+                "team_id": "T12345"
+            }
+
+            await slack_client._handle_slack_event(None, request)
+
+            assert acked.is_set()
+
+    class TestDeduplication:
+        """Tests for the deduplication window"""
+
+        def test_remember_event(self, slack_client):
+            """Test that keys are reported as new only once"""
+            assert slack_client.remember_event("Ev1") is True
+            assert slack_client.remember_event("Ev1") is False
+
+        def test_window_is_bounded(self, slack_client):
+            """Test that the oldest keys leave the window"""
+            slack_client.MAX_REMEMBERED_EVENTS = 2
+
+            for key in ("Ev1", "Ev2", "Ev3"):
+                slack_client.remember_event(key)
+
+            assert list(slack_client.seen_events) == ["Ev2", "Ev3"]
+            assert slack_client.remember_event("Ev1") is True
+
+    class TestReconnectBackfill:
+        """Tests for backfilling after reconnects"""
+
+        @pytest.mark.asyncio
+        async def test_first_hello_does_not_backfill(self, slack_client):
+            """Test that the initial connection does not trigger a backfill"""
+            slack_client.backfill_gap = AsyncMock()
+            slack_client.last_event_ts = 1700000000.0001
+
+            await slack_client._handle_socket_message(None, {"type": "hello"}, "")
+
+            assert slack_client._backfill_task is None
+            slack_client.backfill_gap.assert_not_awaited()
+
+        @pytest.mark.asyncio
+        async def test_reconnect_hello_backfills_from_last_event(self, slack_client):
+            """Test that a repeated hello backfills from the last seen event"""
+            slack_client.backfill_gap = AsyncMock()
+            slack_client.last_event_ts = 1700000000.0001
+
+            await slack_client._handle_socket_message(None, {"type": "hello"}, "")
+            await slack_client._handle_socket_message(None, {"type": "hello"}, "")
+            await slack_client._backfill_task
+
+            slack_client.backfill_gap.assert_awaited_once_with("1700000000.000100")
+
+        @pytest.mark.asyncio
+        async def test_reconnect_keeps_connection_start_time(self, slack_client, socket_client_mock):
+            """Test that events redelivered after a reconnect are not dropped as old"""
+            slack_client.socket_client = socket_client_mock
+            slack_client._connection_start_time = 100.0
+
+            with patch("src.adapters.slack_adapter.client.time.time", return_value=200.0):
+                assert await slack_client._setup_connect_task() is True
+
+            assert slack_client._connection_start_time == 100.0
+
@@ -1,7 +1,7 @@
 import pytest
 import asyncio
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.adapters.telegram_adapter.conversation.manager import Manager
 from src.core.cache.message_cache import CachedMessage
@@ -509,3 +509,90 @@ class TestConversationManager:
                 assert "removed_reactions" in delta
                 assert "thumbs_up" in delta["removed_reactions"]  # Count decreased
                 assert "red_heart" in delta["removed_reactions"]  # Completely removed
+
+    class TestEntityCaching:
+        """Tests for caching resolved conversation entities"""
+
+        @pytest.mark.asyncio
+        async def test_cache_entity_from_message(self, manager, mock_telethon_message):
+            """Test caching the InputPeer known from a message"""
+            mock_telethon_message.input_chat = "input_peer"
+
+            await manager.cache_entity(mock_telethon_message)
+
+            assert manager.entity_cache.get("456") == "input_peer"
+
+        @pytest.mark.asyncio
+        async def test_cache_entity_prefers_resolved_entity(self, manager, mock_telethon_message):
+            """Test that a resolved entity replaces the cached InputPeer"""
+            mock_telethon_message.input_chat = "input_peer"
+            await manager.cache_entity(mock_telethon_message)
+
+            await manager.cache_entity(mock_telethon_message, "channel")
+
+            assert manager.entity_cache.get("456") == "channel"
+
+        @pytest.mark.asyncio
+        async def test_cache_entity_without_input_chat(self, manager, mock_telethon_message):
+            """Test that nothing is cached when the message has no InputPeer"""
+            mock_telethon_message.input_chat = None
+
+            await manager.cache_entity(mock_telethon_message)
+
+            assert "456" not in manager.entity_cache
+
+        @pytest.mark.asyncio
+        async def test_invalidate_migrated_entities(self,
+                                                    manager,
+                                                    mock_message_base,
+                                                    mock_peer_id_with_chat_id):
+            """Test forgetting both sides of a group migration"""
+            manager.entity_cache.add("-101112", "old_group")
+            manager.entity_cache.add("-100789", "new_supergroup")
+
+            message = mock_message_base("1", mock_peer_id_with_chat_id, "")
+            message.action = MagicMock(spec=["channel_id"])
+            message.action.channel_id = 789
+
+            await manager.invalidate_migrated_entities(message)
+
+            assert "-101112" not in manager.entity_cache
+            assert "-100789" not in manager.entity_cache
+
+    class TestMessageExists:
+        """Tests for checking whether a message is already cached"""
+
+        @pytest.mark.asyncio
+        async def test_message_exists(self,
+                                      manager,
+                                      mock_telethon_message,
+                                      cached_message_factory,
+                                      standard_conversation_id):
+            """Test finding a cached message"""
+            manager.conversations[standard_conversation_id] = MagicMock()
+
+            with patch.object(
+                manager.cache.message_cache,
+                "get_message_by_id",
+                AsyncMock(return_value=cached_message_factory())
+            ) as get_message_mock:
+                assert await manager.message_exists(mock_telethon_message) is True
+                get_message_mock.assert_awaited_once_with(standard_conversation_id, "123")
+
+        @pytest.mark.asyncio
+        async def test_message_not_cached(self,
+                                          manager,
+                                          mock_telethon_message,
+                                          standard_conversation_id):
+            """Test a message that is not cached"""
+            manager.conversations[standard_conversation_id] = MagicMock()
+
+            with patch.object(
+                manager.cache.message_cache, "get_message_by_id", AsyncMock(return_value=None)
+            ):
+                assert await manager.message_exists(mock_telethon_message) is False
+
+        @pytest.mark.asyncio
+        async def test_message_of_unknown_conversation(self, manager, mock_telethon_message):
+            """Test that messages of unknown conversations are never cached"""
+            assert await manager.message_exists(mock_telethon_message) is False
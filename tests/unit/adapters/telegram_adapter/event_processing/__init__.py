@@ -3,6 +3,7 @@ Unit tests for the adapter event processors and related components.
 
 This package contains unit tests for the core adapter components including:
 - IncomingEventProcessor: For Telegram event processing
+- GapBackfiller: For fetching messages missed during an update gap
 - HistoryFetcher: For fetching history from Telegram
 - OutgoingEventProcessor: For socket.io event processing
 """
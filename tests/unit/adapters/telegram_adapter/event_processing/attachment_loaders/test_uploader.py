@@ -3,9 +3,11 @@ import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 
-import src.core.utils.attachment_loading
 from src.adapters.telegram_adapter.event_processing.attachment_loaders.uploader import Uploader
 from src.core.events.models.outgoing_events import OutgoingAttachmentInfo
+from src.core.utils.attachment_uploading import AttachmentUpload
+
+UPLOADER_MODULE = "src.adapters.telegram_adapter.event_processing.attachment_loaders.uploader"
 
 class TestUploader:
     """Tests for the Uploader class"""
@@ -45,44 +47,51 @@ class TestUploader:
             uploader.client.send_file.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_upload_file(self, uploader, sample_standard_attachment, mock_telegram_message):
+    async def test_upload_file(self, uploader, sample_standard_attachment, mock_telegram_message, tmp_path):
         """Test uploading a standard photo"""
         uploader.client.send_file.return_value = mock_telegram_message
+        uploader.temp_dir = str(tmp_path)
 
-        attachment_dir = "test_attachments/photo/uploaded_media_id"
-        dir_path = "/test/path"
+        metadata = {
+            "attachment_id": "file1_id",
+            "attachment_type": "document",
+            "filename": "file1_id.txt",
+            "size": 12345,
+            "content_type": None,
+            "content": None,
+            "url": None,
+            "created_at": datetime.now(),
+            "processable": True
+        }
+        with patch.object(uploader, "_get_attachment_metadata", return_value=metadata) as mock_metadata:
+            with patch.object(AttachmentUpload, "move_to") as mock_move:
+                with patch(f"{UPLOADER_MODULE}.create_attachment_dir"):
+                    with patch(f"{UPLOADER_MODULE}.save_metadata_file"):
+                        result = await uploader.upload_attachment(
+                            "conversation", sample_standard_attachment
+                        )
 
-        with patch("os.path.exists", side_effect=lambda path: path != dir_path):
-            metadata = {
-                "attachment_id": "file1_id",
-                "attachment_type": "document",
-                "filename": "file1_id.txt",
-                "size": 12345,
-                "content_type": None,
-                "content": None,
-                "url": None,
-                "created_at": datetime.now(),
-                "processable": True
-            }
-            with patch.object(uploader, "_get_attachment_metadata", return_value=metadata) as mock_metadata:
-                with patch("src.core.utils.attachment_loading.create_attachment_dir"):
-                    with patch("src.core.utils.attachment_loading.move_attachment"):
-                        with patch("os.path.join", return_value=attachment_dir):
-                            with patch("os.path.dirname", return_value=dir_path):
-                                with patch("os.listdir", return_value=[]):
-                                    with patch("magic.Magic") as mock_magic:
-                                        mock_magic_instance = mock_magic.return_value
-                                        mock_magic_instance.from_file.return_value = "text/plain"
+                        uploader.client.send_file.assert_awaited_once_with(
+                            entity="conversation",
+                            file=os.path.join(str(tmp_path), "file1.txt"),
+                            reply_to=None
+                        )
+                        mock_metadata.assert_called_once_with(mock_telegram_message)
+                        mock_move.assert_called_once_with(
+                            os.path.join(uploader.download_dir, "document", "file1_id", "file1_id.txt")
+                        )
+                        assert result["attachment_id"] == "file1_id"
+                        assert result["attachment_type"] == "document"
+                        assert result["content_type"] == "text/plain"
+                        assert "message" in result
 
-                                        with patch("src.core.utils.attachment_loading.save_metadata_file"):
-                                            result = await uploader.upload_attachment(
-                                                "conversation", sample_standard_attachment
-                                            )
+    @pytest.mark.asyncio
+    async def test_upload_too_large_file(self, uploader, sample_standard_attachment):
+        """Test that a file exceeding the size limit is not sent"""
+        uploader.max_file_size = 2
 
-                                            mock_metadata.assert_called_once_with(mock_telegram_message)
-                                            assert result["attachment_id"] == "file1_id"
-                                            assert result["attachment_type"] == "document"
-                                            assert "message" in result
+        assert await uploader.upload_attachment("conversation", sample_standard_attachment) == {}
+        uploader.client.send_file.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_upload_error_handling(self, uploader, sample_standard_attachment):
@@ -0,0 +1,92 @@
+import pytest
+
+from telethon import events, types
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.adapters.telegram_adapter.dialog_state import DialogState
+from src.adapters.telegram_adapter.event_processing.gap_backfiller import GapBackfiller
+
+class TestGapBackfiller:
+    """Tests for the GapBackfiller class"""
+
+    @pytest.fixture
+    def telethon_client_mock(self):
+        """Create a mocked Telethon client"""
+        client = MagicMock()
+        client.get_messages = AsyncMock(return_value=[])
+        return client
+
+    @pytest.fixture
+    def dialog_state(self, telegram_config):
+        """Create a dialog state that is not saved"""
+        return DialogState(telegram_config)
+
+    @pytest.fixture
+    def backfiller(self, telegram_config, telethon_client_mock, dialog_state, rate_limiter_mock):
+        """Create a GapBackfiller with mocked dependencies"""
+        with patch(
+            "src.core.rate_limiter.rate_limiter.RateLimiter.get_instance",
+            return_value=rate_limiter_mock
+        ):
+            backfiller = GapBackfiller(telegram_config, telethon_client_mock, dialog_state)
+        backfiller.max_messages = 100
+        return backfiller
+
+    def create_message(self, message_id, channel_id=777):
+        """Create a Telethon message in a channel"""
+        return types.Message(id=message_id, peer_id=types.PeerChannel(channel_id), date=None, message="text")
+
+    @pytest.mark.asyncio
+    async def test_fetch_missed_messages(self, backfiller, dialog_state, telethon_client_mock):
+        """Test fetching only the messages newer than the last seen one without recording them"""
+        input_peer = types.InputPeerChannel(777, 222)
+        dialog_state.update(-100777, 10, input_peer)
+        telethon_client_mock.get_messages.return_value = [
+            types.MessageService(id=11, peer_id=types.PeerChannel(777), date=None, action=None),
+            self.create_message(12)
+        ]
+
+        missed_events = await backfiller.fetch_missed_messages()
+
+        telethon_client_mock.get_messages.assert_awaited_once_with(input_peer, min_id=10, limit=100, reverse=True)
+        assert len(missed_events) == 1
+        assert missed_events[0]["type"] == "new_message"
+        assert isinstance(missed_events[0]["event"], events.NewMessage.Event)
+        assert missed_events[0]["event"].message.id == 12
+        assert missed_events[0]["event"].chat_id == -1000000000777
+        assert dialog_state.get_last_message_id(-100777) == 10
+
+    @pytest.mark.asyncio
+    async def test_fetch_missed_messages_oldest_first(self, backfiller, dialog_state, telethon_client_mock):
+        """Test that a gap larger than the limit is backfilled from its oldest message"""
+        backfiller.max_messages = 2
+        dialog_state.update(-100777, 10)
+        telethon_client_mock.get_messages.side_effect = [
+            [self.create_message(11), self.create_message(12)],
+            [self.create_message(13)]
+        ]
+
+        first_pass = await backfiller.fetch_missed_messages()
+        dialog_state.update(-100777, first_pass[-1]["event"].message.id)
+        second_pass = await backfiller.fetch_missed_messages()
+
+        assert telethon_client_mock.get_messages.await_args_list[0].kwargs == {
+            "min_id": 10, "limit": 2, "reverse": True
+        }
+        assert telethon_client_mock.get_messages.await_args_list[1].kwargs["min_id"] == 12
+        assert [event["event"].message.id for event in first_pass] == [11, 12]
+        assert [event["event"].message.id for event in second_pass] == [13]
+
+    @pytest.mark.asyncio
+    async def test_fetch_missed_messages_error(self, backfiller, dialog_state, telethon_client_mock):
+        """Test that a failing dialog does not stop the others"""
+        dialog_state.update(-100777, 10)
+        dialog_state.update(-100888, 20)
+        telethon_client_mock.get_messages.side_effect = [
+            Exception("Test error"), [self.create_message(21, 888)]
+        ]
+
+        missed_events = await backfiller.fetch_missed_messages()
+
+        assert [event["event"].message.id for event in missed_events] == [21]
+        assert dialog_state.get_last_message_id(-100777) == 10
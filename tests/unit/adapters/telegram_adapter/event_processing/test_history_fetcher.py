@@ -173,6 +173,23 @@ class TestHistoryFetcher:
         assert history[0]["message_id"] == "1001"
         assert history[0]["conversation_id"] == standard_conversation_id
 
+    @pytest.mark.asyncio
+    async def test_fetch_with_message_anchor(self,
+                                             history_fetcher,
+                                             mock_telegram_history,
+                                             mock_formatted_message,
+                                             standard_conversation_id):
+        """Test that a message ID anchor fetches only messages older than it"""
+        fetcher = history_fetcher(standard_conversation_id, anchor="1002")
+        fetcher._make_api_request.return_value = mock_telegram_history.messages
+        fetcher.conversation_manager.add_to_conversation.return_value = {
+            "added_messages": [mock_formatted_message]
+        }
+
+        await fetcher.fetch()
+
+        fetcher._make_api_request.assert_awaited_once_with(fetcher.history_limit, offset_id=1002)
+
     @pytest.mark.asyncio
     async def test_fetch_with_before(self,
                                      history_fetcher,
@@ -24,6 +24,7 @@ class TestIncomingEventProcessor:
         """Create a mocked conversation manager"""
         manager = AsyncMock()
         manager.add_to_conversation = AsyncMock()
+        manager.message_exists = AsyncMock(return_value=False)
         manager.update_conversation = AsyncMock()
         manager.delete_from_conversation = AsyncMock()
         return manager
@@ -165,6 +166,7 @@ class TestIncomingEventProcessor:
                 assert {"event_type": "message_received"} in result
 
                 processor.downloader.download_attachment.assert_called_once_with(message_event_mock.message)
+                processor.conversation_manager.cache_entity.assert_called_once()
                 processor.conversation_manager.add_to_conversation.assert_called_once()
                 processor.incoming_event_builder.conversation_started.assert_called_once_with(delta)
                 processor.incoming_event_builder.history_fetched.assert_called_once_with(delta, history)
@@ -177,6 +179,14 @@ class TestIncomingEventProcessor:
 
             assert await processor._handle_new_message({"event": message_event_mock}) == []
 
+        @pytest.mark.asyncio
+        async def test_handle_new_message_already_cached(self, processor, message_event_mock):
+            """Test that a message recovered after an update gap is not added twice"""
+            processor.conversation_manager.message_exists.return_value = True
+
+            assert await processor._handle_new_message({"event": message_event_mock}) == []
+            processor.conversation_manager.add_to_conversation.assert_not_called()
+
         @pytest.mark.asyncio
         async def test_handle_new_message_exception(self, processor, message_event_mock):
             """Test handling exceptions during new message processing"""
@@ -409,3 +419,24 @@ class TestIncomingEventProcessor:
             processor.incoming_event_builder.pin_status_update.assert_called_once_with(
                 "message_unpinned", {"conversation_id": standard_conversation_id, "message_id": "123"}
             )
+
+    class TestHandleMigration:
+        """Tests for the _handle_migration method"""
+
+        @pytest.mark.asyncio
+        async def test_handle_migration(self, processor):
+            """Test that a migration invalidates the cached entities"""
+            message = MagicMock()
+
+            result = await processor.process_event({"type": "migration", "event": message})
+
+            assert result == []
+            processor.conversation_manager.invalidate_migrated_entities.assert_called_once_with(message)
+
+    class TestConversationKeys:
+        """Tests for sharding events by conversation"""
+
+        def test_conversation_keys(self, processor):
+            """Test the keys of events with and without a known chat"""
+            assert processor.get_conversation_key({"type": "new_message", "event": MagicMock(chat_id=-100)}) == "-100"
+            assert processor.get_conversation_key({"type": "deleted_message", "event": MagicMock(chat_id=None)}) is None
@@ -4,6 +4,7 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from enum import Enum
 from telethon.tl.types import ReactionEmoji
+from src.adapters.telegram_adapter.conversation.entity_cache import EntityCache
 from src.adapters.telegram_adapter.event_processing.outgoing_event_processor import OutgoingEventProcessor
 
 class TestOutgoingEventProcessor:
@@ -30,6 +31,7 @@ class TestOutgoingEventProcessor:
         manager.delete_from_conversation = AsyncMock()
         manager.get_conversation = MagicMock()
         manager.conversations = {}
+        manager.entity_cache = EntityCache()
         return manager
 
     @pytest.fixture
@@ -572,3 +574,74 @@ class TestOutgoingEventProcessor:
                 "data": {}
             })
             assert response["request_completed"] is False
+
+    class TestEntityCache:
+        """Tests for resolving conversation entities"""
+
+        @pytest.fixture
+        def conversation_info(self, conversation_manager_mock):
+            """Setup a conversation info returned by the manager"""
+            conversation_info = MagicMock()
+            conversation_info.platform_conversation_id = "456"
+            conversation_manager_mock.get_conversation.return_value = conversation_info
+            return conversation_info
+
+        @pytest.mark.asyncio
+        async def test_warm_path_skips_resolution(self,
+                                                  processor,
+                                                  telethon_client_mock,
+                                                  conversation_info,
+                                                  standard_conversation_id):
+            """Test that cached entities are used without API calls or rate limiting"""
+            processor.conversation_manager.entity_cache.add("456", "cached_entity")
+
+            response = await processor.process_event({
+                "event_type": "send_typing_indicator",
+                "data": {"conversation_id": standard_conversation_id}
+            })
+
+            assert response["request_completed"] is True
+            telethon_client_mock.get_entity.assert_not_called()
+            assert telethon_client_mock.call_args[0][0].peer == "cached_entity"
+            processor.rate_limiter.limit_request.assert_called_once_with(
+                "send_typing_indicator", standard_conversation_id
+            )
+
+        @pytest.mark.asyncio
+        async def test_resolved_entity_is_cached(self,
+                                                 processor,
+                                                 telethon_client_mock,
+                                                 message_mock,
+                                                 conversation_info,
+                                                 standard_conversation_id):
+            """Test that the entity is resolved once for consecutive actions"""
+            telethon_client_mock.get_entity.return_value = "entity"
+            telethon_client_mock.send_message.return_value = message_mock
+
+            for event_type in ["send_typing_indicator", "send_message"]:
+                response = await processor.process_event({
+                    "event_type": event_type,
+                    "data": {"conversation_id": standard_conversation_id, "text": "Hello"}
+                })
+                assert response["request_completed"] is True
+
+            telethon_client_mock.get_entity.assert_called_once_with(456)
+            assert processor.conversation_manager.entity_cache.get("456") == "entity"
+
+        @pytest.mark.asyncio
+        async def test_failed_action_invalidates_entity(self,
+                                                        processor,
+                                                        telethon_client_mock,
+                                                        conversation_info,
+                                                        standard_conversation_id):
+            """Test that a failed action drops the cached entity"""
+            processor.conversation_manager.entity_cache.add("456", "stale_entity")
+            telethon_client_mock.delete_messages.side_effect = ValueError("Invalid peer")
+
+            response = await processor.process_event({
+                "event_type": "delete_message",
+                "data": {"conversation_id": standard_conversation_id, "message_id": "123"}
+            })
+
+            assert response["request_completed"] is False
+            assert "456" not in processor.conversation_manager.entity_cache
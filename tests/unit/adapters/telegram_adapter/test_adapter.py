@@ -36,7 +36,7 @@ class TestAdapter:
     def outgoing_event_processor_mock(self):
         """Create a mocked OutgoingEventProcessor"""
         processor = AsyncMock()
-        processor.process_event = AsyncMock(return_value=True)
+        processor.process_event = AsyncMock(return_value={"request_completed": True})
         return processor
 
     @pytest.fixture
@@ -116,19 +116,57 @@ class TestAdapter:
                         "disconnect", {"adapter_type": "telegram"}
                     )
 
+        @pytest.mark.asyncio
+        async def test_monitor_connection_after_activity(self, adapter, telethon_client_mock):
+            """Test that recent activity replaces the probe and connect is emitted once"""
+            adapter.running = True
+            adapter.initialized = True
+            adapter.client = telethon_client_mock
+            adapter.record_connection_activity()
+
+            with patch("asyncio.sleep", side_effect=[None, None, asyncio.CancelledError()]):
+                try:
+                    await adapter._monitor_connection()
+                except asyncio.CancelledError:
+                    pass
+
+            telethon_client_mock.client.get_me.assert_not_called()
+            adapter.socketio_server.emit_event.assert_called_once_with(
+                "connect", {"adapter_type": "telegram"}
+            )
+
     class TestEventProcessing:
         """Tests for event processing"""
 
         @pytest.mark.asyncio
         async def test_process_telegram_event(self, adapter, incoming_event_processor_mock):
             """Test processing Telegram events"""
+            adapter.client = MagicMock()
             adapter.incoming_events_processor = incoming_event_processor_mock
             test_event = {"type": "new_message", "event": {"message": "test"}}
 
             await adapter.process_incoming_event(test_event)
 
             incoming_event_processor_mock.process_event.assert_called_once_with(test_event)
-            adapter.socketio_server.emit_event.assert_called_once_with("bot_request", {"test": "event"})
+            adapter.socketio_server.emit_bot_requests.assert_called_once_with([{"test": "event"}])
+
+        @pytest.mark.asyncio
+        async def test_process_new_message_records_it(self,
+                                                      adapter,
+                                                      telethon_client_mock,
+                                                      incoming_event_processor_mock):
+            """Test that a new message is recorded in the dialog state after it is processed"""
+            adapter.client = telethon_client_mock
+            adapter.client.record_message = MagicMock()
+            adapter.incoming_events_processor = incoming_event_processor_mock
+            incoming_event_processor_mock.process_event.side_effect = (
+                lambda event: adapter.client.record_message.assert_not_called() or []
+            )
+            test_event = {"type": "new_message", "event": MagicMock()}
+
+            await adapter.process_incoming_event(test_event)
+
+            adapter.client.record_message.assert_called_once_with(test_event["event"])
 
         @pytest.mark.asyncio
         async def test_process_socket_io_event(self, adapter, outgoing_event_processor_mock):
@@ -142,5 +180,74 @@ class TestAdapter:
             }
             result = await adapter.process_outgoing_event(test_data)
 
-            outgoing_event_processor_mock.process_event.assert_called_once_with(test_data)
-            assert result is True
+            outgoing_event_processor_mock.process_event.assert_called_once_with(test_data, None)
+            assert result == {"request_completed": True}
+
+    class TestGapRecovery:
+        """Tests for recovering the messages missed during an update gap"""
+
+        @pytest.mark.asyncio
+        async def test_backfill_gap(self, adapter, telethon_client_mock, incoming_event_processor_mock):
+            """Test that the missed messages go through the incoming pipeline"""
+            adapter.client = telethon_client_mock
+            adapter.incoming_events_processor = incoming_event_processor_mock
+            missed_events = [{"type": "new_message", "event": "event_1"}]
+
+            with patch(
+                "src.adapters.telegram_adapter.adapter.GapBackfiller.fetch_missed_messages",
+                AsyncMock(return_value=missed_events)
+            ):
+                with patch.object(adapter, "dispatch_incoming_event", AsyncMock()) as dispatch_mock:
+                    await adapter._backfill_gap()
+
+            dispatch_mock.assert_awaited_once_with(missed_events[0])
+            telethon_client_mock.record_message.assert_not_called()
+
+        @pytest.mark.asyncio
+        async def test_backfill_gap_before_setup(self, adapter, telethon_client_mock):
+            """Test that nothing is backfilled before the processors are set up"""
+            adapter.client = telethon_client_mock
+
+            with patch(
+                "src.adapters.telegram_adapter.adapter.GapBackfiller.fetch_missed_messages",
+                AsyncMock()
+            ) as fetch_mock:
+                await adapter._backfill_gap()
+
+            fetch_mock.assert_not_called()
+
+        @pytest.mark.asyncio
+        async def test_reconnect_with_client(self, adapter, telethon_client_mock):
+            """Test that a disconnected client is connected again and backfilled"""
+            adapter.client = telethon_client_mock
+            telethon_client_mock.client.is_connected = MagicMock(return_value=False)
+
+            with patch.object(adapter, "_backfill_gap", AsyncMock()) as backfill_mock:
+                await adapter._reconnect_with_client()
+                await adapter._backfill_task
+
+            telethon_client_mock.client.connect.assert_awaited_once()
+            backfill_mock.assert_awaited_once()
+
+        @pytest.mark.asyncio
+        async def test_backfill_runs_in_background(self, adapter, telethon_client_mock):
+            """Test that the post setup backfill does not block and is cancelled on teardown"""
+            adapter.client = telethon_client_mock
+            backfill_started = asyncio.Event()
+
+            async def slow_backfill():
+                backfill_started.set()
+                await asyncio.sleep(10)
+
+            with patch.object(adapter, "_backfill_gap", side_effect=slow_backfill):
+                await adapter._perform_post_setup_tasks()
+                await backfill_started.wait()
+
+                backfill_task = adapter._backfill_task
+                adapter._start_backfill()
+                assert adapter._backfill_task is backfill_task
+
+                await adapter._teardown_client()
+
+            assert backfill_task.cancelled()
+            telethon_client_mock.disconnect.assert_awaited_once()
@@ -1,7 +1,9 @@
+import os
 import pytest
 import asyncio
 import time
 
+from telethon.sessions import MemorySession, SQLiteSession
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.adapters.telegram_adapter.client import Client
 
@@ -37,6 +39,26 @@ class TestClient:
             assert telethon_client.connected is False
             assert telethon_client.client is None
 
+    class TestSession:
+        """Tests for creating the Telethon session"""
+
+        def test_memory_session_by_default(self, telethon_client):
+            """Test that the session is kept in memory without a session file"""
+            assert isinstance(telethon_client._create_session(), MemorySession)
+
+        def test_file_session(self, telethon_client, tmp_path):
+            """Test creating a file-backed session readable by its owner only"""
+            telethon_client.session_file = str(tmp_path / "sessions" / "telegram")
+
+            session = telethon_client._create_session()
+
+            try:
+                assert isinstance(session, SQLiteSession)
+                assert session.filename == f"{telethon_client.session_file}.session"
+                assert os.stat(session.filename).st_mode & 0o777 == 0o600
+            finally:
+                session.close()
+
     class TestConnection:
         """Tests for connecting to Telegram"""
 
@@ -62,6 +84,24 @@ class TestClient:
                 assert telethon_client.connected is True
                 assert telethon_client.me == me
 
+        @pytest.mark.asyncio
+        @pytest.mark.parametrize("session_file,catch_up", [(None, False), ("sessions/telegram", True)])
+        async def test_connect_catch_up(self,
+                                        telethon_client,
+                                        telegram_client_mock,
+                                        session_file,
+                                        catch_up):
+            """Test that Telethon catches up on missed updates only with a session file"""
+            telethon_client.session_file = session_file
+
+            with patch(
+                "src.adapters.telegram_adapter.client.TelegramClient",
+                return_value=telegram_client_mock
+            ) as telegram_client_class, patch.object(telethon_client, "_create_session"):
+                await telethon_client.connect()
+
+                assert telegram_client_class.call_args.kwargs["catch_up"] is catch_up
+
         @pytest.mark.asyncio
         async def test_connect_with_phone(self, telethon_client, telegram_client_mock):
             """Test connecting with a phone number"""
@@ -125,3 +165,55 @@ class TestClient:
 
             telegram_client_mock.disconnect.assert_called_once()
             assert telethon_client.connected is False
+
+        @pytest.mark.asyncio
+        async def test_disconnect_saves_dialog_state(self, telethon_client, telegram_client_mock):
+            """Test that the last seen messages are saved on disconnect"""
+            telethon_client.client = telegram_client_mock
+            telethon_client.dialog_state.save = AsyncMock()
+
+            await telethon_client.disconnect()
+
+            telethon_client.dialog_state.save.assert_awaited_once()
+
+    class TestRecordMessage:
+        """Tests for recording the last seen message of every dialog"""
+
+        @pytest.fixture
+        def new_message_event_mock(self):
+            """Create a mocked new message event"""
+            event = MagicMock()
+            event.chat_id = -100777
+            event.message.id = 42
+            event.input_chat = None
+            return event
+
+        @pytest.mark.asyncio
+        async def test_record_message(self, telethon_client, new_message_event_mock):
+            """Test that a message updates the dialog state and schedules one save"""
+            telethon_client.dialog_state.save = AsyncMock()
+
+            with patch("asyncio.sleep", AsyncMock()):
+                telethon_client.record_message(new_message_event_mock)
+                save_task = telethon_client._save_dialog_state_task
+
+                new_message_event_mock.message.id = 43
+                telethon_client.record_message(new_message_event_mock)
+
+                assert telethon_client._save_dialog_state_task is save_task
+                await save_task
+
+            assert telethon_client.dialog_state.get_last_message_id(-100777) == 43
+            telethon_client.dialog_state.save.assert_awaited_once()
+            assert telethon_client._save_dialog_state_task is None
+
+        @pytest.mark.asyncio
+        async def test_record_old_message(self, telethon_client, new_message_event_mock):
+            """Test that an older message does not schedule a save"""
+            telethon_client.dialog_state.update(-100777, 50)
+            telethon_client.dialog_state.dirty = False
+
+            telethon_client.record_message(new_message_event_mock)
+
+            assert telethon_client.dialog_state.get_last_message_id(-100777) == 50
+            assert telethon_client._save_dialog_state_task is None
@@ -0,0 +1,125 @@
+import json
+import os
+import pytest
+import stat
+import time
+
+from telethon import types
+from unittest.mock import MagicMock, patch
+
+from src.adapters.telegram_adapter.dialog_state import DialogState
+
+class TestDialogState:
+    """Tests for the DialogState class"""
+
+    @pytest.fixture
+    def state_path(self, tmp_path):
+        """Path of the state file"""
+        return str(tmp_path / "telegram" / "dialog_state.json")
+
+    def create_config(self, state_path, max_dialogs=1000, max_age_days=30):
+        """Create a configuration for the dialog state"""
+        config = MagicMock()
+        config.get_setting = MagicMock(side_effect=lambda section, key, default=None: {
+            ("adapter", "dialog_state_path"): state_path,
+            ("adapter", "dialog_state_max_dialogs"): max_dialogs,
+            ("adapter", "dialog_state_max_age_days"): max_age_days
+        }.get((section, key), default))
+        return config
+
+    @pytest.fixture
+    def dialog_state(self, state_path):
+        """Create a dialog state saved to a temporary file"""
+        return DialogState(self.create_config(state_path))
+
+    def test_update_keeps_last_message_id(self, dialog_state):
+        """Test that only newer messages move the last message ID"""
+        dialog_state.update(-100777, 10)
+        dialog_state.update(-100777, 5)
+
+        assert dialog_state.get_last_message_id(-100777) == 10
+        assert dialog_state.get_last_message_id("-100777") == 10
+        assert dialog_state.get_last_message_id(456) == 0
+
+    @pytest.mark.parametrize("input_peer", [
+        types.InputPeerUser(456, 111),
+        types.InputPeerChat(101112),
+        types.InputPeerChannel(777, 222)
+    ])
+    def test_input_peer(self, dialog_state, input_peer):
+        """Test that the input peer of a dialog is restored"""
+        dialog_state.update("dialog", 1, input_peer)
+
+        assert dialog_state.get_input_peer("dialog") == input_peer
+
+    def test_input_peer_unknown(self, dialog_state):
+        """Test dialogs without a recorded input peer"""
+        dialog_state.update(456, 1, None)
+
+        assert dialog_state.get_input_peer(456) is None
+        assert dialog_state.get_input_peer(789) is None
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self, dialog_state, state_path):
+        """Test that the saved state is loaded by the next run"""
+        dialog_state.update(-100777, 10, types.InputPeerChannel(777, 222))
+        await dialog_state.save()
+
+        assert dialog_state.dirty is False
+
+        loaded_state = DialogState(self.create_config(state_path))
+        await loaded_state.load()
+
+        assert loaded_state.get_last_message_id(-100777) == 10
+        assert loaded_state.get_input_peer(-100777) == types.InputPeerChannel(777, 222)
+
+    @pytest.mark.asyncio
+    async def test_save_snapshots_dialogs(self, dialog_state, state_path):
+        """Test that updates during a save do not change the saved state and the file is private"""
+        dialog_state.update(-100777, 10)
+        write_state = dialog_state._write_state
+
+        def update_while_writing(state):
+            dialog_state.update(-100777, 11, types.InputPeerChannel(777, 222))
+            write_state(state)
+
+        with patch.object(dialog_state, "_write_state", side_effect=update_while_writing):
+            await dialog_state.save()
+
+        with open(state_path, "r", encoding="utf-8") as file:
+            assert json.load(file)["dialogs"]["-100777"]["last_message_id"] == 10
+        assert stat.S_IMODE(os.stat(state_path).st_mode) == 0o600
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        """Test that nothing is saved without a state path"""
+        dialog_state = DialogState(self.create_config(""))
+
+        dialog_state.update(456, 1)
+        await dialog_state.save()
+        await dialog_state.load()
+
+        assert dialog_state.get_last_message_id(456) == 1
+
+    def test_prune_inactive_dialogs(self, state_path):
+        """Test that dialogs without recent messages are forgotten"""
+        dialog_state = DialogState(self.create_config(state_path, max_age_days=1))
+        dialog_state.update(456, 1)
+        dialog_state.update(789, 1)
+        dialog_state.dialogs["456"]["updated_at"] = time.time() - 2 * 24 * 60 * 60
+
+        dialog_state.prune()
+
+        assert list(dialog_state.dialogs) == ["789"]
+
+    def test_prune_keeps_most_recent_dialogs(self, state_path):
+        """Test that only the most recently active dialogs are kept"""
+        dialog_state = DialogState(self.create_config(state_path, max_dialogs=2))
+        for index, dialog_id in enumerate([456, 789, 101112]):
+            dialog_state.update(dialog_id, 1)
+            dialog_state.dialogs[str(dialog_id)]["updated_at"] = 1000 + index
+        dialog_state.max_age_days = 0
+
+        dialog_state.prune()
+
+        assert sorted(dialog_state.dialogs) == ["101112", "789"]
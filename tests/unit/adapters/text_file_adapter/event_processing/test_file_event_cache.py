@@ -103,6 +103,47 @@ class TestFileEventCache:
         assert "backup_info" in event
         assert os.path.exists(event["backup_info"]["backup_file_path"])
 
+    @pytest.mark.asyncio
+    async def test_record_batch_event(self, event_cache, setup_test_files):
+        """Test recording the files modified by a batch"""
+        test_file = setup_test_files["test_file"]
+        new_file = os.path.join(setup_test_files["test_dir"], "new_file.txt")
+
+        await event_cache.record_batch_event([test_file, new_file])
+
+        assert event_cache.event_cache[test_file][0]["action"] == "update"
+        assert os.path.exists(event_cache.event_cache[test_file][0]["backup_info"]["backup_file_path"])
+        assert event_cache.event_cache[new_file][0]["action"] == "delete"
+
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write("Modified by batch.")
+        with open(new_file, "w", encoding="utf-8") as f:
+            f.write("Created by batch.")
+
+        assert await event_cache.undo_recorded_event(test_file) is True
+        assert await event_cache.undo_recorded_event(new_file) is True
+
+        with open(test_file, "r", encoding="utf-8") as f:
+            assert f.read() == "This is a test file content."
+        assert not os.path.exists(new_file)
+
+    @pytest.mark.asyncio
+    async def test_record_batch_event_backup_failure(self, event_cache, setup_test_files):
+        """Test that a failed backup leaves no undo entries of the batch behind"""
+        test_file = setup_test_files["test_file"]
+        move_file = setup_test_files["move_file"]
+        create_backup = event_cache._create_backup
+
+        async def fail_second_backup(file_path):
+            return {} if file_path == move_file else await create_backup(file_path)
+
+        with patch.object(event_cache, "_create_backup", side_effect=fail_second_backup):
+            with pytest.raises(Exception, match="Failed to create backup"):
+                await event_cache.record_batch_event([test_file, move_file])
+
+        assert event_cache.event_cache == {}
+        assert os.listdir(setup_test_files["backup_dir"]) == []
+
     @pytest.mark.asyncio
     async def test_undo_nonexistent_event(self, event_cache, setup_test_files):
         """Test undoing when no events are recorded"""
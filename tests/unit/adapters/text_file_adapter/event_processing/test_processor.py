@@ -53,6 +53,7 @@ class TestProcessor:
         cache.record_update_event = AsyncMock()
         cache.record_delete_event = AsyncMock()
         cache.record_move_event = AsyncMock()
+        cache.record_batch_event = AsyncMock()
         cache.undo_recorded_event = AsyncMock(return_value=True)
         return cache
 
@@ -624,6 +625,143 @@ class TestProcessor:
             result = await processor.process_event({})
             assert result["request_completed"] is False
 
+    class TestBatchOperation:
+        """Tests for the batch operation"""
+
+        @pytest.mark.asyncio
+        async def test_batch_success(self, processor, test_file_paths):
+            """Test successfully executing a batch of operations"""
+            with open(test_file_paths["test_file"], "w") as f:
+                f.write("Original content")
+
+            with patch.object(FileValidator, "validate", return_value=True):
+                result = await processor.process_event({
+                    "event_type": "batch",
+                    "data": {
+                        "operations": [
+                            {
+                                "event_type": "replace",
+                                "data": {
+                                    "path": test_file_paths["test_file"],
+                                    "old_string": "Original",
+                                    "new_string": "Batched"
+                                }
+                            },
+                            {"event_type": "read", "data": {"path": test_file_paths["test_file"]}},
+                            {"event_type": "view", "data": {"path": test_file_paths["test_dir"]}}
+                        ]
+                    }
+                })
+
+            assert result["request_completed"] is True
+            assert [r["event_type"] for r in result["results"]] == ["replace", "read", "view"]
+            assert result["results"][1]["file_content"] == "Batched content"
+            assert "test.txt" in result["results"][2]["files"]
+
+            processor.file_event_cache.record_batch_event.assert_called_once_with(
+                [test_file_paths["test_file"]]
+            )
+            processor.file_event_cache.record_update_event.assert_not_called()
+
+        @pytest.mark.asyncio
+        async def test_batch_records_each_file_once(self, processor, test_file_paths):
+            """Test that a file modified several times is recorded once"""
+            with open(test_file_paths["test_file2"], "w") as f:
+                f.write("Line 1\n")
+
+            result = await processor.process_event({
+                "event_type": "batch",
+                "data": {
+                    "operations": [
+                        {
+                            "event_type": "insert",
+                            "data": {"path": test_file_paths["test_file2"], "line": 1, "content": "Line 2\n"}
+                        },
+                        {
+                            "event_type": "insert",
+                            "data": {"path": test_file_paths["test_file2"], "line": 2, "content": "Line 3\n"}
+                        }
+                    ]
+                }
+            })
+
+            assert result["request_completed"] is True
+            with open(test_file_paths["test_file2"], "r") as f:
+                assert f.read() == "Line 1\nLine 2\nLine 3\n"
+
+            processor.file_event_cache.record_batch_event.assert_called_once_with(
+                [test_file_paths["test_file2"]]
+            )
+
+        @pytest.mark.asyncio
+        async def test_batch_partial_failure(self, processor, test_file_paths):
+            """Test that a non-atomic batch continues after a failed operation"""
+            result = await processor.process_event({
+                "event_type": "batch",
+                "data": {
+                    "operations": [
+                        {"event_type": "delete", "data": {"path": test_file_paths["new_file"] + ".missing"}},
+                        {
+                            "event_type": "update",
+                            "data": {"path": test_file_paths["test_file"], "content": "Still updated"}
+                        }
+                    ]
+                }
+            })
+
+            assert result["request_completed"] is False
+            assert result["results"][0]["request_completed"] is False
+            assert result["results"][1]["request_completed"] is True
+            processor.file_event_cache.undo_recorded_event.assert_not_called()
+
+            with open(test_file_paths["test_file"], "r") as f:
+                assert f.read() == "Still updated"
+
+        @pytest.mark.asyncio
+        async def test_batch_atomic_rollback(self, processor, test_file_paths):
+            """Test that an atomic batch stops and rolls back on failure"""
+            result = await processor.process_event({
+                "event_type": "batch",
+                "data": {
+                    "atomic": True,
+                    "operations": [
+                        {
+                            "event_type": "update",
+                            "data": {"path": test_file_paths["test_file"], "content": "Rolled back"}
+                        },
+                        {"event_type": "delete", "data": {"path": test_file_paths["new_file"] + ".missing"}},
+                        {
+                            "event_type": "update",
+                            "data": {"path": test_file_paths["test_file2"], "content": "Never applied"}
+                        }
+                    ]
+                }
+            })
+
+            assert result["request_completed"] is False
+            assert len(result["results"]) == 2
+            assert "rolled back" in result["error"]
+            assert processor.file_event_cache.undo_recorded_event.call_count == 3
+
+        @pytest.mark.asyncio
+        async def test_batch_unsupported_operation(self, processor, test_file_paths):
+            """Test that a batch with an unsupported operation is rejected before execution"""
+            result = await processor.process_event({
+                "event_type": "batch",
+                "data": {
+                    "operations": [
+                        {
+                            "event_type": "update",
+                            "data": {"path": test_file_paths["test_file"], "content": "Not applied"}
+                        },
+                        {"event_type": "undo", "data": {"path": test_file_paths["test_file"]}}
+                    ]
+                }
+            })
+
+            assert result["request_completed"] is False
+            processor.file_event_cache.record_batch_event.assert_not_called()
+
     class TestUtilityMethods:
         """Tests for utility methods"""
 
@@ -3,6 +3,8 @@ Unit tests for the Zulip adapter components.
 
 This package contains unit tests for the core adapter components including:
 - ZulipAdapter: For Zulip API interaction
+- EventQueueState: For saving the Zulip event queue between runs
+- ApiExecutor: For running Zulip API calls on dedicated threads
 """
 
 __author__ = "Your Name"
@@ -242,6 +242,7 @@ class TestManager:
             """Test updating a message's content"""
             with patch.object(manager.cache.message_cache, "get_message_by_id", return_value=cached_private_message_mock):
                 manager.conversations[standard_private_conversation_id] = conversation_info_mock
+                manager.index.add_message(standard_private_conversation_id, "12346")
 
                 with patch.object(ThreadHandler, "update_thread_info", return_value=(False, None)):
                     delta = await manager.update_conversation({
@@ -269,6 +270,7 @@ class TestManager:
             """Test updating a message's reactions"""
             with patch.object(manager.cache.message_cache, "get_message_by_id", return_value=cached_private_message_mock):
                 manager.conversations[standard_private_conversation_id] = conversation_info_mock
+                manager.index.add_message(standard_private_conversation_id, "12346")
 
                 instance_mock = MagicMock()
                 instance_mock.platform_specific_to_standard.return_value = "thumbs_up"
@@ -310,6 +312,7 @@ class TestManager:
             with patch.object(manager.cache.message_cache, "get_message_by_id", return_value=cached_private_message_mock):
                 with patch.object(manager.cache.message_cache, "delete_message", return_value=True):
                     manager.conversations[standard_private_conversation_id] = conversation_info_mock
+                    manager.index.add_message(standard_private_conversation_id, "12346")
 
                     with patch.object(ThreadHandler, "remove_thread_info", return_value=(False, None)):
                         await manager.delete_from_conversation(
@@ -5,6 +5,7 @@ This package contains unit tests for the core adapter components including:
 - IncomingEventProcessor: For Zulip incoming event processing
 - HistoryFetcher: For fetching Zulip history
 - OutgoingEventProcessor: For Zulip outgoing event processing
+- GapBackfiller: For fetching Zulip messages missed between event queues
 """
 
 __author__ = "Your Name"
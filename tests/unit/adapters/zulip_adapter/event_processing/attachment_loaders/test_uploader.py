@@ -6,6 +6,7 @@ import pytest
 
 from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 from src.adapters.zulip_adapter.event_processing.attachment_loaders.uploader import Uploader
+from src.core.utils.attachment_uploading import AttachmentUpload
 
 class TestUploader:
     """Tests for the Zulip Uploader class"""
@@ -75,49 +76,46 @@ class TestUploader:
         return MockSession()
 
     @pytest.fixture
-    def mock_magic_instance(self):
-        """Create a Downloader with mocked dependencies"""
-        mock_magic = MagicMock()
-        mock_magic.from_file.return_value = "application/pdf"
-        return mock_magic
+    def upload(self, tmp_path):
+        """Create an attachment upload"""
+        upload = AttachmentUpload("dGVzdCBmaWxlIGNvbnRlbnQ=", str(tmp_path / "document.pdf"), 1024)
+        upload.prepare()
+        return upload
 
     @pytest.mark.asyncio
     @pytest.mark.filterwarnings("ignore::RuntimeWarning")
-    async def test_upload_file_success(self, uploader, session_mock, mock_magic_instance):
+    async def test_upload_file_success(self, uploader, session_mock, upload):
         """Test successful file upload"""
-        file_path = "/test/path/document.pdf"
+        form_data = MagicMock()
 
-        with patch("aiohttp.ClientSession", return_value=session_mock):
-            with patch("builtins.open", mock_open(read_data=b"test file content")):
-                with patch("aiohttp.FormData", return_value=MagicMock()):
-                    with patch("aiohttp.BasicAuth", return_value=MagicMock()):
-                        with patch("magic.Magic", return_value=mock_magic_instance):
-                            with patch.object(uploader, "_get_api_key", return_value="test_api_key"):
-                                result = await uploader._upload_file(file_path)
+        with patch.object(uploader.http_session_pool, "get_session", return_value=session_mock):
+            with patch("aiohttp.FormData", return_value=form_data):
+                with patch("aiohttp.BasicAuth", return_value=MagicMock()):
+                    with patch.object(uploader, "_get_api_key", return_value="test_api_key"):
+                        result = await uploader._upload_file(upload)
 
-                                assert "uri" in result
-                                assert "document.pdf" in result["uri"]
+                        _, kwargs = form_data.add_field.call_args
+                        assert kwargs["filename"] == "document.pdf"
+                        assert kwargs["content_type"] == "text/plain"
 
-                                assert session_mock.post_called, "session.post was not called"
-                                assert session_mock.post_args[0].endswith("/api/v1/user_uploads"), \
-                                    f"Unexpected URL: {session_mock.post_args[0]}"
-                                assert "auth" in session_mock.post_kwargs, "auth parameter missing"
-                                assert "data" in session_mock.post_kwargs, "data parameter missing"
+                        assert "uri" in result
+                        assert "document.pdf" in result["uri"]
+
+                        assert session_mock.post_called, "session.post was not called"
+                        assert session_mock.post_args[0].endswith("/api/v1/user_uploads"), \
+                            f"Unexpected URL: {session_mock.post_args[0]}"
+                        assert "auth" in session_mock.post_kwargs, "auth parameter missing"
+                        assert "data" in session_mock.post_kwargs, "data parameter missing"
 
     @pytest.mark.asyncio
     @pytest.mark.filterwarnings("ignore::RuntimeWarning")
-    async def test_upload_file_exception(self, uploader, mock_magic_instance):
+    async def test_upload_file_exception(self, uploader, upload):
         """Test handling exception during upload"""
-        file_path = "/test/path/document.pdf"
-
-        session_mock = AsyncMock()
-        session_mock.__aenter__.return_value = session_mock
+        session_mock = MagicMock()
         session_mock.post.side_effect = Exception("Connection error")
 
-        with patch("aiohttp.ClientSession", return_value=session_mock):
-            with patch("builtins.open", mock_open(read_data=b'test file content')):
-                with patch("magic.Magic", return_value=mock_magic_instance):
-                    with patch.object(logging, "error") as mock_log:
-                        assert await uploader._upload_file(file_path) == {}
-                        assert mock_log.called
-                        assert "Error in manual upload" in mock_log.call_args[0][0]
+        with patch.object(uploader.http_session_pool, "get_session", return_value=session_mock):
+            with patch.object(logging, "error") as mock_log:
+                assert await uploader._upload_file(upload) == {}
+                assert mock_log.called
+                assert "Error in manual upload" in mock_log.call_args[0][0]
@@ -0,0 +1,73 @@
+import json
+import pytest
+
+from unittest.mock import MagicMock, patch
+
+from src.adapters.zulip_adapter.conversation.data_classes import ConversationInfo
+from src.adapters.zulip_adapter.event_processing.gap_backfiller import GapBackfiller
+
+class TestGapBackfiller:
+    """Tests for the GapBackfiller class"""
+
+    @pytest.fixture
+    def client_mock(self):
+        """Create a mocked Zulip client"""
+        client = MagicMock()
+        client.get_messages.return_value = {
+            "result": "success",
+            "messages": [{"id": 12, "content": "second"}, {"id": 11, "content": "first"}]
+        }
+        return client
+
+    @pytest.fixture
+    def conversation_manager_mock(self):
+        """Create a conversation manager with a known stream conversation"""
+        manager = MagicMock()
+        manager.conversations = {
+            "known": ConversationInfo(
+                conversation_id="known",
+                platform_conversation_id="1/news",
+                conversation_type="stream",
+                stream_name="general",
+                stream_topic="news",
+                messages={"9", "10"}
+            ),
+            "empty": ConversationInfo(
+                conversation_id="empty",
+                platform_conversation_id="1/other",
+                conversation_type="stream",
+                stream_name="general",
+                stream_topic="other"
+            )
+        }
+        return manager
+
+    @pytest.fixture
+    def backfiller(self, zulip_config, client_mock, conversation_manager_mock, rate_limiter_mock):
+        """Create a gap backfiller with mocked dependencies"""
+        with patch("src.core.rate_limiter.rate_limiter.RateLimiter.get_instance", return_value=rate_limiter_mock):
+            yield GapBackfiller(zulip_config, client_mock, conversation_manager_mock)
+
+    @pytest.mark.asyncio
+    async def test_fetch_missed_messages(self, backfiller, client_mock):
+        """Test that messages after the newest known one are fetched in order"""
+        messages = await backfiller.fetch_missed_messages()
+
+        assert [message["id"] for message in messages] == [11, 12]
+
+        client_mock.get_messages.assert_called_once()
+        request = client_mock.get_messages.call_args.args[0]
+        assert request["anchor"] == 10
+        assert request["num_before"] == 0
+        assert request["include_anchor"] is False
+        assert json.loads(request["narrow"]) == [
+            {"operator": "stream", "operand": "general"},
+            {"operator": "topic", "operand": "news"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_request(self, backfiller, client_mock):
+        """Test that failed requests do not return messages"""
+        client_mock.get_messages.return_value = {"result": "error"}
+
+        assert await backfiller.fetch_missed_messages() == []
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import json
@@ -178,6 +179,93 @@ class TestIncomingEventProcessor:
             processor.incoming_event_builder.history_fetched.assert_called_once_with(delta, history)
             processor.incoming_event_builder.message_received.assert_called_once_with(message)
 
+        @pytest.mark.asyncio
+        async def test_handle_message_emits_history_later(self,
+                                                         processor,
+                                                         message_event_mock,
+                                                         standard_conversation_id):
+            """Test that the first message is not held back by the history fetch"""
+            message = {"conversation_id": standard_conversation_id, "message_id": "123"}
+            delta = {
+                "fetch_history": True,
+                "conversation_id": standard_conversation_id,
+                "added_messages": [message]
+            }
+            history_released = asyncio.Event()
+
+            async def fetch_history(*args, **kwargs):
+                await history_released.wait()
+                return [{"some": "history"}]
+
+            processor.conversation_manager.add_to_conversation.return_value = delta
+            processor._fetch_history = fetch_history
+            processor.event_emitter = AsyncMock()
+            processor.incoming_event_builder.conversation_started = MagicMock(
+                return_value={"event_type": "conversation_started"}
+            )
+            processor.incoming_event_builder.history_fetched = MagicMock(
+                return_value={"event_type": "history_fetched"}
+            )
+            processor.incoming_event_builder.message_received = MagicMock(
+                return_value={"event_type": "message_received"}
+            )
+
+            result = await processor._handle_message(message_event_mock)
+
+            assert result == [{"event_type": "conversation_started"}, {"event_type": "message_received"}]
+            processor.event_emitter.assert_not_called()
+
+            history_released.set()
+            await asyncio.gather(*processor.emit_tasks)
+
+            processor.event_emitter.assert_awaited_once_with({"event_type": "history_fetched"})
+            processor.incoming_event_builder.history_fetched.assert_called_once_with(
+                delta, [{"some": "history"}]
+            )
+
+        @pytest.mark.asyncio
+        async def test_handle_message_pins_history_to_first_message(self,
+                                                                    processor,
+                                                                    message_event_mock,
+                                                                    standard_conversation_id):
+            """Test that messages arriving before the scheduled fetch are not fetched again"""
+            first_message = {"conversation_id": standard_conversation_id, "message_id": "123"}
+            second_message = {"conversation_id": standard_conversation_id, "message_id": "124"}
+            fetch_kwargs = {}
+            history_released = asyncio.Event()
+
+            async def fetch_history(*args, **kwargs):
+                fetch_kwargs.update(kwargs)
+                await history_released.wait()
+                return [{"some": "history"}]
+
+            processor.conversation_manager.add_to_conversation.side_effect = [
+                {
+                    "fetch_history": True,
+                    "conversation_id": standard_conversation_id,
+                    "added_messages": [first_message]
+                },
+                {"conversation_id": standard_conversation_id, "added_messages": [second_message]}
+            ]
+            processor._fetch_history = fetch_history
+            processor.event_emitter = AsyncMock()
+            processor.incoming_event_builder.message_received = MagicMock(
+                side_effect=lambda message: {
+                    "event_type": "message_received", "data": message
+                }
+            )
+
+            await processor._handle_message(message_event_mock)
+            result = await processor._handle_message(message_event_mock)
+
+            assert result == [{"event_type": "message_received", "data": second_message}]
+
+            history_released.set()
+            await asyncio.gather(*processor.emit_tasks)
+
+            assert fetch_kwargs["anchor"] == "123"
+            assert fetch_kwargs["message_to_exclude"] == first_message
+
         @pytest.mark.asyncio
         async def test_handle_message_no_delta(self, processor, message_event_mock):
             """Test handling a message with no conversation delta"""
@@ -429,3 +517,31 @@ class TestIncomingEventProcessor:
             processor.conversation_manager.update_conversation.side_effect = Exception("Test error")
 
             assert await processor._handle_reaction(reaction_event_mock) == []
+
+    class TestConversationKeys:
+        """Tests for sharding events by conversation"""
+
+        def test_message_keys(self, processor):
+            """Test the keys of stream and private messages"""
+            assert processor.get_conversation_key({
+                "type": "message",
+                "message": {"id": 1, "type": "stream", "stream_id": 5, "subject": "news"}
+            }) == "5/news"
+            assert processor.get_conversation_key({
+                "type": "message",
+                "message": {"id": 2, "type": "private", "display_recipient": [{"id": 9}, {"id": 3}]}
+            }) == "3_9"
+
+        def test_events_referring_to_messages(self, processor):
+            """Test that reactions and edits follow the conversation of their message"""
+            processor.get_conversation_key({
+                "type": "message",
+                "message": {"id": 1, "type": "stream", "stream_id": 5, "subject": "news"}
+            })
+
+            assert processor.get_conversation_key({"type": "reaction", "message_id": 1}) == "5/news"
+            assert processor.get_conversation_key({"type": "update_message", "message_ids": [1]}) == "5/news"
+            assert processor.get_conversation_key({
+                "type": "delete_message", "message_id": 7, "stream_id": 5, "topic": "other"
+            }) == "5/other"
+            assert processor.get_conversation_key({"type": "reaction", "message_id": 7}) is None
@@ -1,3 +1,4 @@
+import base64
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -530,6 +531,101 @@ class TestOutgoingEventProcessor:
             result = await processor.process_event(event_data)
             assert result["request_completed"] is False
 
+    class TestValidateEvent:
+        """Tests for validating events before they are queued"""
+
+        def test_validate_event(self, processor, standard_private_conversation_id):
+            """Test validating a valid event"""
+            event = processor.validate_event({
+                "event_type": "send_message",
+                "data": {
+                    "conversation_id": standard_private_conversation_id,
+                    "text": "Hello",
+                    "attachments": [{"file_name": "test.txt", "content": "dGVzdA=="}]
+                }
+            })
+
+            assert event.data.conversation_id == standard_private_conversation_id
+            assert event.data.mentions == []
+
+        def test_validate_event_missing_fields(self, processor):
+            """Test rejecting an event with missing fields"""
+            with pytest.raises(ValueError):
+                processor.validate_event({"event_type": "send_message", "data": {"text": "Hello"}})
+
+        def test_validate_event_too_large_attachment(self, processor, standard_private_conversation_id):
+            """Test rejecting an attachment by the size of its content"""
+            with pytest.raises(ValueError, match="exceeds size limit"):
+                processor.validate_event({
+                    "event_type": "send_message",
+                    "data": {
+                        "conversation_id": standard_private_conversation_id,
+                        "text": "Hello",
+                        "attachments": [{"file_name": "test.bin", "content": "A" * (12 * 1024 * 1024)}]
+                    }
+                })
+
+        @pytest.mark.parametrize("file_name,content", [
+            ("image.png", base64.b64encode(b"\x89PNG\r\n\x1a\n" + b"\x00" * 64).decode()),
+            ("notes.txt", base64.b64encode(b"plain text").decode()),
+            ("empty.png", "")
+        ])
+        def test_validate_event_attachment_type(self,
+                                                processor,
+                                                standard_private_conversation_id,
+                                                file_name,
+                                                content):
+            """Test accepting attachments whose content matches their extension"""
+            event = processor.validate_event({
+                "event_type": "send_message",
+                "data": {
+                    "conversation_id": standard_private_conversation_id,
+                    "text": "Hello",
+                    "attachments": [{"file_name": file_name, "content": content}]
+                }
+            })
+
+            assert event.data.attachments[0].file_name == file_name
+
+        @pytest.mark.parametrize("file_name,content,error", [
+            ("image.png", base64.b64encode(b"just some plain text").decode(), "does not contain image"),
+            ("notes.txt", "!!!! not base64", "not valid base64")
+        ])
+        def test_validate_event_invalid_attachment_type(self,
+                                                        processor,
+                                                        standard_private_conversation_id,
+                                                        file_name,
+                                                        content,
+                                                        error):
+            """Test rejecting attachments with invalid or mismatching content"""
+            with pytest.raises(ValueError, match=error):
+                processor.validate_event({
+                    "event_type": "send_message",
+                    "data": {
+                        "conversation_id": standard_private_conversation_id,
+                        "text": "Hello",
+                        "attachments": [{"file_name": file_name, "content": content}]
+                    }
+                })
+
+        @pytest.mark.asyncio
+        async def test_process_validated_event(self, processor, standard_private_conversation_id):
+            """Test that a validated event is processed without being built again"""
+            data = {
+                "event_type": "send_typing_indicator",
+                "data": {"conversation_id": standard_private_conversation_id}
+            }
+            outgoing_event = processor.validate_event(data)
+
+            with patch.object(processor.outgoing_event_builder, "build") as build_mock, \
+                 patch.object(processor, "_handle_send_typing_indicator_event",
+                              AsyncMock(return_value={"request_completed": True})) as handler_mock:
+                result = await processor.process_event(data, outgoing_event)
+
+            assert result["request_completed"] is True
+            build_mock.assert_not_called()
+            handler_mock.assert_awaited_once_with(outgoing_event.data)
+
     class TestHelperMethods:
         """Tests for helper methods"""
 
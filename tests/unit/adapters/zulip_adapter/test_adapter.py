@@ -27,6 +27,7 @@ class TestAdapter:
             "full_name": "Test Bot",
             "email": "test@example.com"
         })
+        client.api_executor.run = AsyncMock(side_effect=lambda func, *args: func(*args))
         client.running = True
         return client
 
@@ -104,6 +105,17 @@ class TestAdapter:
                     "disconnect", {"adapter_type": adapter.adapter_type}
                 )
 
+        @pytest.mark.asyncio
+        async def test_connection_event(self, adapter):
+            """Test reporting the current connection state"""
+            assert adapter.get_connection_event() is None
+
+            await adapter._set_connection_state(True)
+            assert adapter.get_connection_event() == ("connect", {"adapter_type": adapter.adapter_type})
+
+            await adapter._set_connection_state(False)
+            assert adapter.get_connection_event() == ("disconnect", {"adapter_type": adapter.adapter_type})
+
     class TestEventProcessing:
         """Tests for event processing"""
 
@@ -125,7 +137,7 @@ class TestAdapter:
             await adapter.process_incoming_event(test_event)
 
             adapter.incoming_events_processor.process_event.assert_called_once_with(test_event)
-            adapter.socketio_server.emit_event.assert_called_once_with("bot_request", {"test": "event"})
+            adapter.socketio_server.emit_bot_requests.assert_called_once_with([{"test": "event"}])
 
         @pytest.mark.asyncio
         async def test_process_socket_io_event(self, adapter, events_processor_mock):
@@ -136,7 +148,7 @@ class TestAdapter:
 
             response = await adapter.process_outgoing_event(test_data)
             assert response["request_completed"] is True
-            adapter.outgoing_events_processor.process_event.assert_called_once_with(test_data)
+            adapter.outgoing_events_processor.process_event.assert_called_once_with(test_data, None)
 
         @pytest.mark.asyncio
         async def test_process_socket_io_event_not_connected(self, adapter):
@@ -145,3 +157,29 @@ class TestAdapter:
 
             response = await adapter.process_outgoing_event({"event_type": "send_message", "data": {"test": "socket_data"}})
             assert response["request_completed"] is False
+
+    class TestStop:
+        """Tests for stopping the adapter"""
+
+        @pytest.mark.asyncio
+        async def test_stop_drains_events_before_saving_queue(self, adapter, zulip_client_mock):
+            """Test that received events are processed before the queue position is saved"""
+            calls = []
+            adapter.running = True
+            adapter.client = zulip_client_mock
+            zulip_client_mock.stop_polling = AsyncMock(side_effect=lambda: calls.append("stop_polling"))
+            zulip_client_mock.disconnect = AsyncMock(side_effect=lambda: calls.append("disconnect"))
+            zulip_client_mock.api_executor.shutdown = MagicMock()
+
+            async def process_event(event):
+                await asyncio.sleep(0.01)
+                calls.append(event["id"])
+                return []
+
+            adapter.incoming_events_processor = MagicMock()
+            adapter.incoming_events_processor.process_event = AsyncMock(side_effect=process_event)
+
+            await adapter.dispatch_incoming_event({"id": 1, "type": "message", "message": {}})
+            await adapter.stop()
+
+            assert calls == ["stop_polling", 1, "disconnect"]
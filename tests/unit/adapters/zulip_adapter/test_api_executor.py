@@ -0,0 +1,112 @@
+import asyncio
+import pytest
+import threading
+
+from unittest.mock import MagicMock
+
+from src.adapters.zulip_adapter.api_executor import ApiExecutor
+
+class TestApiExecutor:
+    """Tests for the ApiExecutor class"""
+
+    @pytest.fixture
+    def api_executor(self, zulip_config):
+        """Create an API executor with a single worker"""
+        zulip_config.adapter["max_api_workers"] = 1
+        executor = ApiExecutor(zulip_config)
+        yield executor
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run(self, api_executor):
+        """Test that calls run on the API threads"""
+        thread_name = await api_executor.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("zulip-api")
+        assert await api_executor.run(max, 1, 2) == 2
+
+    @pytest.mark.asyncio
+    async def test_long_poll_does_not_block_calls(self, api_executor):
+        """Test that API calls run while the long poll is waiting"""
+        release_poll = threading.Event()
+        poll = asyncio.create_task(api_executor.run_long_poll(release_poll.wait, 5))
+        await asyncio.sleep(0.01)
+
+        assert api_executor.get_stats()["long_poll_active"] is True
+        assert await asyncio.wait_for(api_executor.run(lambda: "sent"), timeout=1) == "sent"
+
+        release_poll.set()
+        assert await poll is True
+        assert api_executor.get_stats()["long_poll_active"] is False
+
+    @pytest.mark.asyncio
+    async def test_queue_depth(self, api_executor):
+        """Test that calls waiting for a thread are reported"""
+        release = threading.Event()
+        calls = [asyncio.create_task(api_executor.run(release.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        stats = api_executor.get_stats()
+        assert stats["workers"] == 1
+        assert stats["active_calls"] == 1
+        assert stats["queued_calls"] == 2
+
+        release.set()
+        await asyncio.gather(*calls)
+
+        stats = api_executor.get_stats()
+        assert stats["active_calls"] == 0
+        assert stats["queued_calls"] == 0
+        assert stats["max_queued_calls"] >= 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_calls_are_not_counted(self, api_executor):
+        """Test that calls cancelled while waiting for a thread leave the queue count"""
+        release = threading.Event()
+        running_call = asyncio.create_task(api_executor.run(release.wait, 5))
+        waiting_call = asyncio.create_task(api_executor.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+
+        waiting_call.cancel()
+        await asyncio.sleep(0.01)
+
+        assert api_executor.get_stats()["queued_calls"] == 0
+
+        release.set()
+        await running_call
+        assert api_executor.get_stats()["active_calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_queued_calls(self, api_executor):
+        """Test that calls dropped by the shutdown leave the queue count"""
+        release = threading.Event()
+        calls = [asyncio.create_task(api_executor.run(release.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        api_executor.shutdown()
+        release.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert results[0] is True
+        assert all(isinstance(result, asyncio.CancelledError) for result in results[1:])
+        assert api_executor.get_stats()["queued_calls"] == 0
+
+    def test_configure_client(self, api_executor):
+        """Test that the long poll gets its own session and API calls a sized pool"""
+        client = MagicMock()
+
+        long_poll_client = api_executor.configure_client(client)
+
+        client.ensure_session.assert_called_once()
+        mounted_adapter = client.session.mount.call_args.args[1]
+        assert mounted_adapter._pool_maxsize == 1
+        assert long_poll_client is not client
+        assert long_poll_client.session is None
+
+    def test_shutdown_drops_instance(self, zulip_config):
+        """Test that a new instance is created after shutdown"""
+        executor = ApiExecutor.get_instance(zulip_config)
+
+        executor.shutdown()
+
+        assert ApiExecutor.get_instance(zulip_config) is not executor
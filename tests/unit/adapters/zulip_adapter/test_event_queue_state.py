@@ -0,0 +1,51 @@
+import pytest
+
+from unittest.mock import MagicMock
+
+from src.adapters.zulip_adapter.event_queue_state import EventQueueState
+
+class TestEventQueueState:
+    """Tests for the EventQueueState class"""
+
+    @pytest.fixture
+    def state_path(self, tmp_path):
+        """Path of the state file"""
+        return str(tmp_path / "zulip" / "event_queue.json")
+
+    @pytest.fixture
+    def queue_state(self, state_path):
+        """Create an event queue state saved to a temporary file"""
+        config = MagicMock()
+        config.get_setting.return_value = state_path
+        return EventQueueState(config)
+
+    @pytest.mark.asyncio
+    async def test_load_without_saved_state(self, queue_state):
+        """Test loading before anything was saved"""
+        assert await queue_state.load() is None
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self, queue_state):
+        """Test that a saved queue is loaded by the next run"""
+        await queue_state.save("queue_1", 42)
+
+        assert await queue_state.load() == {"queue_id": "queue_1", "last_event_id": 42}
+
+    @pytest.mark.asyncio
+    async def test_clear(self, queue_state, state_path):
+        """Test that a cleared queue is not loaded"""
+        await queue_state.save("queue_1", 42)
+        await queue_state.clear()
+
+        assert await queue_state.load() is None
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        """Test that nothing is saved without a state path"""
+        config = MagicMock()
+        config.get_setting.return_value = ""
+        queue_state = EventQueueState(config)
+
+        await queue_state.save("queue_1", 42)
+
+        assert await queue_state.load() is None
@@ -115,3 +115,100 @@ class TestZulipClient:
                 assert zulip_client.running is False
                 assert zulip_client.queue_id is None
                 assert zulip_client.last_event_id is None
+
+    class TestPolling:
+        """Tests for the event polling loop"""
+
+        @pytest.fixture
+        def poll_once(self, zulip_client, zulip_mock):
+            """Make the polling loop stop after the first response"""
+            def _poll_once(response):
+                def get_events(**kwargs):
+                    zulip_client.running = False
+                    return response
+
+                zulip_mock.get_events.side_effect = get_events
+                zulip_client.running = True
+            return _poll_once
+
+        @pytest.mark.asyncio
+        async def test_polling_records_activity(self, zulip_client, poll_once):
+            """Test that successful polling responses are recorded as connection activity"""
+            poll_once({
+                "result": "success",
+                "events": [{"id": 12346, "type": "message", "content": "test message"}]
+            })
+            zulip_client.record_activity = MagicMock()
+
+            await zulip_client._polling_loop()
+
+            zulip_client.record_activity.assert_called_once()
+            zulip_client.process_event.assert_called_once()
+            assert zulip_client.last_event_id == 12346
+
+        @pytest.mark.asyncio
+        async def test_expired_queue_is_replaced(self, zulip_client, zulip_mock):
+            """Test that an expired queue is registered again and the gap is backfilled"""
+            zulip_client.queue_id = "expired_queue"
+            zulip_client.running = True
+            zulip_client.queue_state = AsyncMock()
+
+            async def stop_polling():
+                zulip_client.running = False
+
+            zulip_client.backfill_gap = AsyncMock(side_effect=stop_polling)
+            zulip_mock.get_events.return_value = {
+                "result": "error", "code": "BAD_EVENT_QUEUE_ID", "msg": "Bad event queue id"
+            }
+
+            await zulip_client._polling_loop()
+
+            zulip_mock.register.assert_called_once()
+            zulip_client.backfill_gap.assert_called_once()
+            zulip_client.queue_state.clear.assert_called_once()
+            zulip_client.queue_state.save.assert_called_once_with("test_queue_id", 12345)
+            assert zulip_client.queue_id == "test_queue_id"
+
+        @pytest.mark.asyncio
+        async def test_errors_are_retried_with_backoff(self, zulip_client, zulip_mock):
+            """Test that failed polls are retried with exponential backoff"""
+            zulip_client.running = True
+            zulip_mock.get_events.return_value = {"result": "error", "msg": "Server error"}
+            delays = []
+
+            async def mock_sleep(delay):
+                delays.append(delay)
+                if len(delays) == 3:
+                    zulip_client.running = False
+
+            with patch("asyncio.sleep", side_effect=mock_sleep):
+                await zulip_client._polling_loop()
+
+            assert delays == [1, 2, 4]
+
+    class TestResume:
+        """Tests for resuming the event queue of a previous run"""
+
+        @pytest.mark.asyncio
+        async def test_connect_resumes_saved_queue(self, zulip_client, zulip_mock):
+            """Test that a saved queue is resumed instead of registering a new one"""
+            zulip_client.queue_state = AsyncMock()
+            zulip_client.queue_state.load.return_value = {"queue_id": "saved_queue", "last_event_id": 7}
+
+            await zulip_client.connect()
+
+            zulip_mock.register.assert_not_called()
+            assert zulip_client.queue_id == "saved_queue"
+            assert zulip_client.last_event_id == 7
+            assert zulip_client.running is True
+
+        @pytest.mark.asyncio
+        async def test_disconnect_saves_queue(self, zulip_client):
+            """Test that the queue is saved on disconnect"""
+            zulip_client.queue_state = AsyncMock()
+            zulip_client.queue_id = "queue"
+            zulip_client.last_event_id = 9
+
+            await zulip_client.disconnect()
+
+            zulip_client.queue_state.save.assert_called_once_with("queue", 9)
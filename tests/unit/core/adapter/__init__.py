@@ -0,0 +1,9 @@
+"""
+Unit tests for the core adapter components.
+
+This package contains unit tests for the core adapter components including:
+- ConnectionHealth: For tracking the liveness of platform connections
+"""
+
+__author__ = "Your Name"
+__version__ = "0.1.0"
@@ -0,0 +1,30 @@
+import math
+
+from unittest.mock import patch
+
+from src.core.adapter.connection_health import ConnectionHealth
+
+class TestConnectionHealth:
+    """Tests for the ConnectionHealth class"""
+
+    def test_idle_without_activity(self):
+        """Test that a connection without activity is idle forever"""
+        assert ConnectionHealth().idle_for() == math.inf
+
+    def test_idle_after_activity(self):
+        """Test the time since the last activity"""
+        health = ConnectionHealth()
+
+        with patch("time.monotonic", return_value=100.0):
+            health.record_activity()
+        with patch("time.monotonic", return_value=130.0):
+            assert health.idle_for() == 30.0
+
+    def test_state_changes(self):
+        """Test that only changes of the connection state are reported"""
+        health = ConnectionHealth()
+
+        assert health.set_connected(True) is True
+        assert health.set_connected(True) is False
+        assert health.set_connected(False) is True
+        assert health.set_connected(False) is False
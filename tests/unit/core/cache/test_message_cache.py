@@ -178,3 +178,34 @@ class TestMessageCache:
             # Verify the newest messages are kept (lowest indices in our sample data)
             assert "msg_0" in message_cache.messages["conv_1"]
             assert "msg_conv2_0" in message_cache.messages["conv_2"]
+
+        @pytest.mark.asyncio
+        async def test_eviction_listeners_notified(self, message_cache, sample_messages_info):
+            """Test that eviction listeners receive the evicted messages"""
+            evicted = []
+            message_cache.add_eviction_listener(evicted.append)
+            message_cache.max_messages_per_conversation = 5
+
+            for msg in sample_messages_info:
+                if msg["conversation_id"] == "conv_1":
+                    await message_cache.add_message(msg)
+
+            await message_cache._enforce_conversation_limit("conv_1")
+
+            assert sorted(msg.message_id for msg in evicted) == [f"msg_{i}" for i in range(5, 10)]
+
+        @pytest.mark.asyncio
+        async def test_eviction_listener_errors_are_contained(self, message_cache, sample_messages_info):
+            """Test that a failing listener does not stop cache maintenance"""
+            evicted = []
+            message_cache.add_eviction_listener(MagicMock(side_effect=Exception("Test error")))
+            message_cache.add_eviction_listener(evicted.append)
+            message_cache.max_total_messages = 7
+
+            for msg in sample_messages_info:
+                await message_cache.add_message(msg)
+
+            await message_cache._enforce_total_limit()
+
+            assert sum(len(msgs) for msgs in message_cache.messages.values()) == 7
+            assert len(evicted) == 8
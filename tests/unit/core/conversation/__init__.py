@@ -3,6 +3,7 @@ Unit tests for the conversation components.
 
 This package contains unit tests for the core conversation components including:
 - BaseReactionHandler: For retrieving reactions from platform data
+- ConversationIndex: For reverse lookups over conversations
 """
 
 __author__ = "Your Name"
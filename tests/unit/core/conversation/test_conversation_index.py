@@ -0,0 +1,70 @@
+import pytest
+
+from src.core.conversation.base_data_classes import BaseConversationInfo
+from src.core.conversation.conversation_index import ConversationIndex
+
+class TestConversationIndex:
+    """Tests for ConversationIndex"""
+
+    @pytest.fixture
+    def index(self):
+        """Create an empty conversation index"""
+        return ConversationIndex()
+
+    def test_add_conversation(self, index):
+        """Test indexing a conversation by platform and server IDs"""
+        index.add_conversation(
+            BaseConversationInfo(
+                conversation_id="conv_1",
+                platform_conversation_id="123",
+                conversation_type="channel",
+                server_id="456"
+            )
+        )
+
+        assert index.get_platform_conversations("123") == {"conv_1"}
+        assert index.get_server_conversations(456) == {"conv_1"}
+        assert index.get_server_conversations("789") == set()
+
+    def test_add_conversation_without_server(self, index):
+        """Test that conversations without a server are not indexed by server"""
+        index.add_conversation(
+            BaseConversationInfo(
+                conversation_id="conv_1",
+                platform_conversation_id="123",
+                conversation_type="private"
+            )
+        )
+
+        assert index.server_conversations == {}
+        assert index.get_platform_conversations("123") == {"conv_1"}
+
+    def test_add_and_remove_message(self, index):
+        """Test indexing a message and its attachments"""
+        index.add_message("conv_1", "msg_1", ["att_1"])
+        index.add_message("conv_2", "msg_1")
+        index.add_message("conv_1", "msg_2", ["att_1"])
+
+        assert index.get_message_conversations("msg_1") == {"conv_1", "conv_2"}
+        assert index.count_attachment_references("conv_1", "att_1") == 2
+        assert index.count_attachment_references("conv_2", "att_1") == 0
+
+        index.remove_message("conv_1", "msg_1", ["att_1"])
+
+        assert index.get_message_conversations("msg_1") == {"conv_2"}
+        assert index.count_attachment_references("conv_1", "att_1") == 1
+
+    def test_remove_drops_empty_entries(self, index):
+        """Test that entries without references are removed"""
+        index.add_message("conv_1", "msg_1", ["att_1"])
+        index.remove_message("conv_1", "msg_1", ["att_1"])
+
+        assert index.message_conversations == {}
+        assert index.attachment_messages == {}
+
+    def test_remove_unknown_message(self, index):
+        """Test that removing an unknown message is a no-op"""
+        index.remove_message("conv_1", "msg_1", ["att_1"])
+        index.remove_attachment_reference("conv_1", "att_1", "msg_1")
+
+        assert index.get_message_conversations("msg_1") == set()
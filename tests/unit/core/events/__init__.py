@@ -5,6 +5,8 @@ This package contains unit tests for the events components including:
 - IncomingEventBuilder: For building incoming events
 - OutgoingEventBuilder: For building outgoing events
 - RequestEventBuilder: For building request events
+- HistoryFetchScheduler: For scheduling history fetches
+- IncomingEventDispatcher: For processing incoming events by conversation
 """
 
 __author__ = "Your Name"
@@ -0,0 +1,98 @@
+import asyncio
+import pytest
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.core.events.history_fetcher.history_fetch_scheduler import HistoryFetchScheduler
+
+class TestHistoryFetchScheduler:
+    """Tests for HistoryFetchScheduler"""
+
+    @pytest.fixture
+    def scheduler(self):
+        """Create a scheduler running one fetch at a time"""
+        config = MagicMock()
+        config.get_setting.side_effect = lambda section, key, default=None: (
+            1 if key == "max_concurrent_history_fetches" else default
+        )
+        return HistoryFetchScheduler(config)
+
+    def blocking_fetch(self, started, released, history):
+        """Create a fetch that records its start and waits to be released"""
+        async def _fetch():
+            started.append(history)
+            await released.wait()
+            return history
+        return _fetch
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self, scheduler):
+        """Test that fetches of the same window share one request"""
+        fetch = AsyncMock(return_value=["history"])
+
+        first = scheduler.schedule("conv_1", ("newest", None, None, None), fetch)
+        second = scheduler.schedule("conv_1", ("newest", None, None, None), fetch)
+
+        assert first is second
+        assert await first == ["history"]
+        fetch.assert_awaited_once()
+        assert scheduler.futures == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_budget_and_activity_order(self, scheduler):
+        """Test that queued fetches start in order of conversation activity"""
+        started = []
+        released = asyncio.Event()
+
+        futures = [
+            scheduler.schedule(
+                conversation_id, "newest", self.blocking_fetch(started, released, conversation_id)
+            )
+            for conversation_id in ("conv_1", "conv_2", "conv_3")
+        ]
+        scheduler.touch("conv_2")
+        await asyncio.sleep(0)
+
+        assert started == ["conv_1"]
+        assert len(scheduler.tasks) == 1
+
+        released.set()
+        assert await asyncio.gather(*futures) == ["conv_1", "conv_2", "conv_3"]
+        assert started == ["conv_1", "conv_2", "conv_3"]
+        assert scheduler.activity == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_now_skips_queue(self, scheduler):
+        """Test that requested fetches do not wait for the queued ones"""
+        started = []
+        released = asyncio.Event()
+
+        scheduler.schedule("conv_1", "newest", self.blocking_fetch(started, released, "conv_1"))
+        scheduler.schedule("conv_2", "newest", self.blocking_fetch(started, released, "conv_2"))
+
+        assert await scheduler.fetch_now("conv_3", (None, 1, 2, 3), AsyncMock(return_value=["now"])) == ["now"]
+        assert "conv_2" not in started
+
+        released.set()
+        await asyncio.gather(*scheduler.futures.values())
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_resolves_empty(self, scheduler):
+        """Test that a failing fetch resolves with an empty history"""
+        future = scheduler.schedule("conv_1", "newest", AsyncMock(side_effect=Exception("Test error")))
+
+        assert await future == []
+
+    @pytest.mark.asyncio
+    async def test_close(self, scheduler):
+        """Test that closing cancels queued and running fetches"""
+        released = asyncio.Event()
+        futures = [
+            scheduler.schedule(conversation_id, "newest", self.blocking_fetch([], released, conversation_id))
+            for conversation_id in ("conv_1", "conv_2")
+        ]
+
+        scheduler.close()
+
+        assert all(future.cancelled() for future in futures)
+        assert scheduler.queued == {}
@@ -342,3 +342,42 @@ class TestIncomingEventBuilder:
         assert attachment["processable"] == minimal_attachment["processable"]
         assert attachment["url"] is None
         assert attachment["content"] is None
+
+    @pytest.fixture
+    def validating_event_builder(self):
+        """Fixture for creating a test event builder that validates messages."""
+        return IncomingEventBuilder(
+            adapter_type="test_adapter",
+            adapter_name="test_instance",
+            adapter_id="test_id",
+            validate_messages=True
+        )
+
+    def test_message_received_matches_validated_event(self,
+                                                      event_builder,
+                                                      validating_event_builder,
+                                                      sample_message_delta):
+        """Test that trusted messages are serialized the same way as validated ones."""
+        sample_message_delta["attachments"][0]["attachment_type"] = "document"
+        del sample_message_delta["sender"]["display_name"]
+
+        assert event_builder.message_received(sample_message_delta) == \
+            validating_event_builder.message_received(sample_message_delta)
+
+    def test_history_fetched_matches_validated_event(self,
+                                                     event_builder,
+                                                     validating_event_builder,
+                                                     sample_history):
+        """Test that trusted history is serialized the same way as validated history."""
+        delta = {"conversation_id": "conv_456"}
+
+        assert event_builder.history_fetched(delta, sample_history) == \
+            validating_event_builder.history_fetched(delta, sample_history)
+
+    def test_validated_message_invalid_data(self, validating_event_builder, sample_message_delta):
+        """Test that enabled validation rejects invalid messages."""
+        sample_message_delta["timestamp"] = "not a timestamp"
+
+        with pytest.raises(ValueError):
+            validating_event_builder.message_received(sample_message_delta)
+
@@ -0,0 +1,174 @@
+import asyncio
+import pytest
+
+from unittest.mock import MagicMock
+
+from src.core.events.processors.incoming_event_dispatcher import IncomingEventDispatcher
+
+class TestIncomingEventDispatcher:
+    """Tests for IncomingEventDispatcher"""
+
+    @pytest.fixture
+    def processed(self):
+        """Events in the order their processing started"""
+        return []
+
+    @pytest.fixture
+    def released(self):
+        """Event that lets blocked events finish"""
+        return asyncio.Event()
+
+    @pytest.fixture
+    def create_dispatcher(self, processed, released):
+        """Create a dispatcher whose events of conversation "slow" block until released"""
+        def _create(max_concurrent_events=8, max_queued_events=1000):
+            config = MagicMock()
+            config.get_setting.side_effect = lambda section, key, default=None: {
+                "max_concurrent_incoming_events": max_concurrent_events,
+                "max_queued_incoming_events": max_queued_events
+            }.get(key, default)
+
+            async def process_event(event):
+                processed.append(event["id"])
+                if event["conversation"] == "slow":
+                    await released.wait()
+
+            return IncomingEventDispatcher(config, process_event, lambda event: event["conversation"])
+        return _create
+
+    @pytest.mark.asyncio
+    async def test_conversations_do_not_block_each_other(self, create_dispatcher, processed, released):
+        """Test that a slow conversation does not delay other conversations"""
+        dispatcher = create_dispatcher()
+
+        await dispatcher.dispatch({"id": 1, "conversation": "slow"})
+        await dispatcher.dispatch({"id": 2, "conversation": "slow"})
+        await dispatcher.dispatch({"id": 3, "conversation": "fast"})
+        await asyncio.sleep(0)
+
+        assert processed == [1, 3]
+
+        released.set()
+        await dispatcher.join()
+
+        assert processed == [1, 3, 2]
+        assert dispatcher.shards == {}
+        assert dispatcher.workers == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, create_dispatcher, processed, released):
+        """Test that at most max_concurrent_incoming_events events are processed at once"""
+        dispatcher = create_dispatcher(max_concurrent_events=1)
+
+        await dispatcher.dispatch({"id": 1, "conversation": "slow"})
+        await dispatcher.dispatch({"id": 2, "conversation": "fast"})
+        await asyncio.sleep(0)
+
+        assert processed == [1]
+
+        released.set()
+        await dispatcher.join()
+
+        assert processed == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_waits_while_queue_is_full(self, create_dispatcher, released):
+        """Test that dispatching blocks until there is space in the queue"""
+        dispatcher = create_dispatcher(max_queued_events=1)
+
+        await dispatcher.dispatch({"id": 1, "conversation": "slow"})
+        blocked_dispatch = asyncio.create_task(dispatcher.dispatch({"id": 2, "conversation": "fast"}))
+        await asyncio.sleep(0)
+
+        assert not blocked_dispatch.done()
+
+        released.set()
+        await blocked_dispatch
+        await dispatcher.join()
+
+        assert dispatcher.queued_events == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_do_not_stop_the_shard(self, processed):
+        """Test that an event failing to process does not block its conversation"""
+        async def process_event(event):
+            processed.append(event)
+            if event == 1:
+                raise ValueError("Test error")
+
+        config = MagicMock()
+        config.get_setting.side_effect = lambda section, key, default=None: default
+        dispatcher = IncomingEventDispatcher(config, process_event, lambda event: "conversation")
+
+        await dispatcher.dispatch(1)
+        await dispatcher.dispatch(2)
+        await dispatcher.join()
+
+        assert processed == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_stats(self, create_dispatcher, released):
+        """Test the latency and lag statistics"""
+        dispatcher = create_dispatcher()
+
+        await dispatcher.dispatch({"id": 1, "conversation": "slow"})
+        await dispatcher.dispatch({"id": 2, "conversation": "slow"})
+        await asyncio.sleep(0)
+
+        stats = dispatcher.get_stats()
+        assert stats["queued_events"] == 2
+        assert stats["active_shards"] == 1
+        assert stats["dispatched_events"] == 1
+        assert stats["shards"]["slow"]["queued_events"] == 1
+        assert stats["shards"]["slow"]["lag"] >= 0
+
+        released.set()
+        await dispatcher.join()
+
+        stats = dispatcher.get_stats()
+        assert stats["dispatched_events"] == 2
+        assert stats["shards"] == {}
+        assert stats["max_latency"] >= stats["average_latency"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_close(self, create_dispatcher):
+        """Test that closing cancels the queued events"""
+        dispatcher = create_dispatcher()
+
+        await dispatcher.dispatch({"id": 1, "conversation": "slow"})
+        await dispatcher.close()
+
+        assert dispatcher.queued_events == 0
+        assert dispatcher.workers == {}
+
+    @pytest.mark.asyncio
+    async def test_close_releases_blocked_dispatch(self, create_dispatcher, processed):
+        """Test that closing releases a dispatch waiting on a full queue and drops later events"""
+        dispatcher = create_dispatcher(max_queued_events=1)
+
+        await dispatcher.dispatch({"id": 1, "conversation": "slow"})
+        blocked_dispatch = asyncio.create_task(dispatcher.dispatch({"id": 2, "conversation": "fast"}))
+        await asyncio.sleep(0)
+
+        await dispatcher.close()
+        await asyncio.wait_for(blocked_dispatch, timeout=1)
+        await dispatcher.dispatch({"id": 3, "conversation": "fast"})
+
+        assert processed == [1]
+        assert dispatcher.queued_events == 0
+        assert dispatcher.shards == {}
+
+    @pytest.mark.asyncio
+    async def test_join_timeout(self, create_dispatcher, processed, released):
+        """Test that a timed out join reports the events still queued and does not cancel them"""
+        dispatcher = create_dispatcher()
+
+        await dispatcher.dispatch({"id": 1, "conversation": "slow"})
+        await dispatcher.dispatch({"id": 2, "conversation": "slow"})
+
+        assert await dispatcher.join(timeout=0.01) is False
+        assert dispatcher.queued_events == 2
+
+        released.set()
+        assert await dispatcher.join(timeout=1) is True
+        assert processed == [1, 2]
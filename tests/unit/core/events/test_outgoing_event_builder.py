@@ -349,3 +349,20 @@ class TestOutgoingEventBuilder:
         assert event_dict["event_type"] == "send_message"
         assert "data" in event_dict
         assert event_dict["data"]["conversation_id"] == sample_send_message_data["data"]["conversation_id"]
+
+    def test_build_send_message_without_mentions(self, event_builder, sample_send_message_data):
+        """Test that missing mentions default to an empty list."""
+        del sample_send_message_data["data"]["mentions"]
+
+        event = event_builder.build(sample_send_message_data)
+
+        assert event.data.mentions == []
+        assert "mentions" not in sample_send_message_data["data"]
+
+    def test_attachment_content_is_not_copied(self, event_builder, sample_send_message_data):
+        """Test that attachment content is validated without being copied."""
+        content = sample_send_message_data["data"]["attachments"][0]["content"]
+
+        event = event_builder.build(sample_send_message_data)
+
+        assert event.data.attachments[0].content is content
@@ -4,6 +4,7 @@ from datetime import datetime
 from src.core.events.models.incoming_events import IncomingAttachmentInfo, SenderInfo
 from src.core.events.models.request_events import (
     RequestEvent,
+    BatchResultData,
     FetchedAttachmentData,
     SentMessageData,
     ReadFileData,
@@ -134,6 +135,21 @@ class TestRequestEventBuilder:
         assert len(event.data.directories) == 0
         assert len(event.data.files) == 0
 
+    def test_build_batch_result_data(self, request_event_builder):
+        """Test building an event with BatchResultData."""
+        results = [
+            {"event_type": "update", "request_completed": True},
+            {"event_type": "read", "request_completed": False, "error": "Error reading file"}
+        ]
+
+        event = request_event_builder.build(
+            "req_789", "internal_req_789", {"results": results, "error": "Batch operations failed: [1]"}
+        )
+
+        assert isinstance(event.data, BatchResultData)
+        assert event.data.results == results
+        assert event.data.error == "Batch operations failed: [1]"
+
     def test_build_with_empty_data(self, request_event_builder):
         """Test building an event with empty data."""
         internal_request_id = "internal_req_empty"
@@ -0,0 +1,10 @@
+"""
+Unit tests for the Socket.IO components.
+
+This package contains unit tests for the core Socket.IO components including:
+- SocketIOServer: For emitting events to and queuing requests from LLM clients
+- RequestQueue: For ordering queued requests by priority class
+"""
+
+__author__ = "Your Name"
+__version__ = "0.1.0"
@@ -0,0 +1,166 @@
+import asyncio
+import pytest
+import time
+
+from src.core.socket_io.request_queue import RequestPriority, RequestQueue
+from src.core.socket_io.server import SocketIOQueuedEvent
+
+class TestRequestQueue:
+    """Tests for the RequestQueue class"""
+
+    @pytest.fixture
+    def request_queue(self):
+        """Create an empty request queue"""
+        return RequestQueue()
+
+    def create_event(self, request_id, priority, waited=0.0, sid="sid", size=0, conversation_key=None):
+        """Create a queued event"""
+        return SocketIOQueuedEvent(
+            {"event_type": "test"},
+            sid,
+            time.time() - waited,
+            request_id,
+            priority=priority,
+            size=size,
+            conversation_key=conversation_key
+        )
+
+    @pytest.mark.parametrize("priority,event_type,expected", [
+        (None, "send_typing_indicator", RequestPriority.INTERACTIVE),
+        (None, "fetch_history", RequestPriority.BULK),
+        (None, "send_message", RequestPriority.NORMAL),
+        (None, None, RequestPriority.NORMAL),
+        ("bulk", "send_typing_indicator", RequestPriority.BULK)
+    ])
+    def test_resolve_priority(self, priority, event_type, expected):
+        """Test resolving the priority class of a request"""
+        assert RequestQueue.resolve_priority(priority, event_type) == expected
+
+    def test_resolve_unknown_priority(self):
+        """Test that unknown priorities are rejected"""
+        with pytest.raises(ValueError):
+            RequestQueue.resolve_priority("urgent", "send_message")
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self, request_queue):
+        """Test that requests are taken by priority class, then by arrival"""
+        request_queue.put_nowait(self.create_event("bulk", RequestPriority.BULK))
+        request_queue.put_nowait(self.create_event("normal_1", RequestPriority.NORMAL))
+        request_queue.put_nowait(self.create_event("interactive", RequestPriority.INTERACTIVE))
+        request_queue.put_nowait(self.create_event("normal_2", RequestPriority.NORMAL))
+
+        assert request_queue.qsize() == 4
+        assert [request_queue.get_nowait().request_id for _ in range(3)] == [
+            "interactive", "normal_1", "normal_2"
+        ]
+        assert (await request_queue.get()).request_id == "bulk"
+        assert request_queue.empty()
+
+    def test_conversation_order(self, request_queue):
+        """Test that requests of one conversation keep their order across priority classes"""
+        request_queue.put_nowait(self.create_event("a_bulk", RequestPriority.BULK, conversation_key="a"))
+        request_queue.put_nowait(self.create_event("b_normal", RequestPriority.NORMAL, conversation_key="b"))
+        request_queue.put_nowait(self.create_event("a_normal", RequestPriority.NORMAL, conversation_key="a"))
+        request_queue.put_nowait(self.create_event("b_interactive", RequestPriority.INTERACTIVE, conversation_key="b"))
+        request_queue.put_nowait(self.create_event("c_bulk", RequestPriority.BULK, conversation_key="c"))
+
+        assert [request_queue.get_nowait().request_id for _ in range(5)] == [
+            "b_normal", "b_interactive", "a_bulk", "a_normal", "c_bulk"
+        ]
+        assert request_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_request(self, request_queue):
+        """Test that get waits until a request is queued"""
+        getter = asyncio.create_task(request_queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        request_queue.put_nowait(self.create_event("first", RequestPriority.NORMAL))
+
+        assert (await asyncio.wait_for(getter, timeout=1)).request_id == "first"
+        with pytest.raises(asyncio.QueueEmpty):
+            request_queue.get_nowait()
+
+    def test_stats(self, request_queue):
+        """Test the statistics of the priority classes"""
+        request_queue.put_nowait(self.create_event("first", RequestPriority.NORMAL, waited=2.0))
+        request_queue.put_nowait(self.create_event("second", RequestPriority.NORMAL, waited=1.0))
+        request_queue.put_nowait(self.create_event("third", RequestPriority.BULK))
+
+        request_queue.record_expired(request_queue.get_nowait())
+        request_queue.get_nowait()
+
+        stats = request_queue.get_stats()
+
+        assert stats["normal"]["depth"] == 0
+        assert stats["normal"]["dequeued"] == 2
+        assert stats["normal"]["expired"] == 1
+        assert 1.0 <= stats["normal"]["average_wait"] < 2.0
+        assert 2.0 <= stats["normal"]["max_wait"] < 3.0
+        assert stats["bulk"]["depth"] == 1
+        assert stats["interactive"] == {
+            "depth": 0, "dequeued": 0, "expired": 0, "average_wait": 0.0, "max_wait": 0.0
+        }
+
+    @pytest.mark.parametrize("limits,sid,size,expected", [
+        ({}, "sid", 10**9, None),
+        ({"max_requests": 2}, "other", 0, "queue holds the maximum of 2 requests"),
+        ({"max_bytes": 150}, "other", 51, "queue holds the maximum of 150 payload bytes"),
+        ({"max_bytes": 150}, "other", 50, None),
+        ({"max_requests_per_client": 2}, "sid", 0, "client has the maximum of 2 queued requests"),
+        ({"max_requests_per_client": 2}, "other", 0, None),
+        ({"max_bytes_per_client": 100}, "sid", 1, "client has the maximum of 100 queued payload bytes")
+    ])
+    def test_check_capacity(self, limits, sid, size, expected):
+        """Test that requests exceeding the limits are refused"""
+        request_queue = RequestQueue(**limits)
+        request_queue.put_nowait(self.create_event("first", RequestPriority.NORMAL, size=60))
+        request_queue.put_nowait(self.create_event("second", RequestPriority.NORMAL, size=40))
+
+        assert request_queue.check_capacity(sid, size) == expected
+
+    def test_usage(self, request_queue):
+        """Test that the usage is released when requests leave the queue"""
+        request_queue.put_nowait(self.create_event("first", RequestPriority.NORMAL, sid="a", size=60))
+        request_queue.put_nowait(self.create_event("second", RequestPriority.NORMAL, sid="b", size=40))
+
+        assert request_queue.get_usage() == {
+            "requests": 2,
+            "bytes": 100,
+            "clients": {"a": {"requests": 1, "bytes": 60}, "b": {"requests": 1, "bytes": 40}}
+        }
+
+        request_queue.get_nowait()
+
+        assert request_queue.get_usage() == {
+            "requests": 1, "bytes": 40, "clients": {"b": {"requests": 1, "bytes": 40}}
+        }
+
+    def test_release_cancelled_request(self):
+        """Test that a cancelled request stops counting towards the limits while still queued"""
+        request_queue = RequestQueue(max_requests=1)
+        event = self.create_event("first", RequestPriority.NORMAL, size=60)
+        request_queue.put_nowait(event)
+
+        assert request_queue.check_capacity("sid", 0) is not None
+
+        request_queue.release(event)
+        request_queue.release(event)
+
+        assert request_queue.check_capacity("sid", 0) is None
+        assert request_queue.get_usage() == {"requests": 0, "bytes": 0, "clients": {}}
+
+        assert request_queue.get_nowait() is event
+        assert request_queue.get_usage() == {"requests": 0, "bytes": 0, "clients": {}}
+
+    def test_release_expired_requests(self):
+        """Test that queued requests past their deadline do not throttle new ones"""
+        request_queue = RequestQueue(max_requests_per_client=1)
+        event = self.create_event("first", RequestPriority.NORMAL)
+        event.deadline = time.time() - 1
+        request_queue.put_nowait(event)
+
+        assert request_queue.check_capacity("sid", 0) is None
+        assert request_queue.get_usage() == {"requests": 0, "bytes": 0, "clients": {}}
+        assert request_queue.qsize() == 1
@@ -0,0 +1,326 @@
+import asyncio
+import json
+import pytest
+import time
+
+from unittest.mock import AsyncMock, MagicMock, call
+
+from src.core.socket_io.request_queue import RequestPriority
+from src.core.socket_io.server import OrjsonPacketEncoder, SocketIOServer
+
+class TestSocketIOServer:
+    """Tests for the SocketIOServer class"""
+
+    @pytest.fixture
+    def config_mock(self):
+        """Create a config with a short batch interval"""
+        config = MagicMock()
+        config.get_setting.side_effect = lambda section, key, default=None: {
+            "adapter": {"adapter_type": "test"},
+            "socketio": {
+                "bot_request_batch_interval_ms": 10,
+                "max_bot_request_batch_size": 3
+            }
+        }.get(section, {}).get(key, default)
+        return config
+
+    @pytest.fixture
+    def server(self, config_mock):
+        """Create a server with a mocked Socket.IO server"""
+        server = SocketIOServer(config_mock)
+        server.sio = MagicMock()
+        server.sio.emit = AsyncMock()
+        server.sio.enter_room = AsyncMock()
+        return server
+
+    class TestBotRequests:
+        """Tests for the bot request emission"""
+
+        @pytest.mark.asyncio
+        async def test_events_are_batched(self, server):
+            """Test that events emitted back to back are sent in one batch"""
+            await server.emit_bot_requests([{"id": 1}])
+            await server.emit_bot_requests([{"id": 2}])
+
+            server.sio.emit.assert_not_called()
+
+            await server.bot_request_flush_task
+
+            assert server.sio.emit.call_args_list == [
+                call("bot_requests", [{"id": 1}, {"id": 2}], room=server.BATCHED_CLIENTS_ROOM),
+                call("bot_request", {"id": 1}, room=server.SINGLE_EVENT_CLIENTS_ROOM),
+                call("bot_request", {"id": 2}, room=server.SINGLE_EVENT_CLIENTS_ROOM)
+            ]
+            assert server.bot_request_buffer == []
+
+        @pytest.mark.asyncio
+        async def test_full_batch_is_sent_immediately(self, server):
+            """Test that reaching the batch size sends the batch without waiting"""
+            await server.emit_bot_requests([{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}])
+
+            assert server.sio.emit.call_args_list[0] == call(
+                "bot_requests", [{"id": 1}, {"id": 2}, {"id": 3}], room=server.BATCHED_CLIENTS_ROOM
+            )
+            assert server.sio.emit.call_args_list[4] == call(
+                "bot_requests", [{"id": 4}], room=server.BATCHED_CLIENTS_ROOM
+            )
+
+        @pytest.mark.asyncio
+        async def test_other_events_keep_order(self, server):
+            """Test that buffered events are sent before a status event"""
+            await server.emit_bot_requests([{"id": 1}])
+            await server.emit_event("request_success", {"request_id": "R1"})
+
+            assert server.sio.emit.call_args_list == [
+                call("bot_requests", [{"id": 1}], room=server.BATCHED_CLIENTS_ROOM),
+                call("bot_request", {"id": 1}, room=server.SINGLE_EVENT_CLIENTS_ROOM),
+                call("request_success", {"request_id": "R1"})
+            ]
+
+        @pytest.mark.asyncio
+        async def test_stop_cancels_pending_flush(self, server):
+            """Test that stopping sends the buffered events once and cancels the scheduled flush"""
+            await server.emit_bot_requests([{"id": 1}])
+            flush_task = server.bot_request_flush_task
+
+            await server.stop()
+
+            assert flush_task.cancelled()
+            assert server.bot_request_flush_task is None
+            assert server.sio.emit.call_args_list == [
+                call("bot_requests", [{"id": 1}], room=server.BATCHED_CLIENTS_ROOM),
+                call("bot_request", {"id": 1}, room=server.SINGLE_EVENT_CLIENTS_ROOM)
+            ]
+
+        @pytest.mark.asyncio
+        async def test_emit_empty_list(self, server):
+            """Test that nothing is sent for an empty list of events"""
+            await server.emit_bot_requests([])
+
+            assert server.bot_request_flush_task is None
+            server.sio.emit.assert_not_called()
+
+        @pytest.mark.parametrize("auth,room", [
+            ({"capabilities": ["bot_requests"]}, SocketIOServer.BATCHED_CLIENTS_ROOM),
+            ({"capabilities": []}, SocketIOServer.SINGLE_EVENT_CLIENTS_ROOM),
+            (None, SocketIOServer.SINGLE_EVENT_CLIENTS_ROOM)
+        ])
+        def test_bot_request_room(self, server, auth, room):
+            """Test choosing the room from the advertised capabilities"""
+            assert server._get_bot_request_room(auth) == room
+
+    class TestConnectClient:
+        """Tests for registering connected clients"""
+
+        @pytest.mark.asyncio
+        async def test_connection_state_is_sent(self, server):
+            """Test that a new client is told the current adapter connection state"""
+            server.adapter = MagicMock()
+            server.adapter.get_connection_event.return_value = ("connect", {"adapter_type": "zulip"})
+
+            await server._connect_client("sid", None)
+
+            assert "sid" in server.connected_clients
+            server.sio.emit.assert_called_once_with("connect", {"adapter_type": "zulip"}, to="sid")
+
+        @pytest.mark.asyncio
+        async def test_unknown_connection_state_is_not_sent(self, server):
+            """Test that nothing is sent before the adapter connection state is known"""
+            server.adapter = MagicMock()
+            server.adapter.get_connection_event.return_value = None
+
+            await server._connect_client("sid", None)
+
+            assert "sid" in server.connected_clients
+            server.sio.emit.assert_not_called()
+
+    class TestQueueEvent:
+        """Tests for queuing requests"""
+
+        @pytest.mark.asyncio
+        async def test_valid_request_is_queued(self, server):
+            """Test that a valid request is queued and acknowledged"""
+            server.adapter = MagicMock()
+            server.adapter.validate_outgoing_event.return_value = "validated request"
+
+            await server._queue_event("sid", {"event_type": "send_message", "request_id": "R1"})
+
+            assert "R1" in server.request_map
+            assert server.event_queue.qsize() == 1
+            assert server.request_map["R1"].outgoing_event == "validated request"
+            assert server.sio.emit.call_args.args[0] == "request_queued"
+
+        @pytest.mark.asyncio
+        async def test_invalid_request_is_rejected(self, server):
+            """Test that an invalid request fails without being queued"""
+            server.adapter = MagicMock()
+            server.adapter.validate_outgoing_event.side_effect = ValueError("Invalid request: missing text")
+
+            await server._queue_event("sid", {"event_type": "send_message", "request_id": "R1"})
+
+            assert server.request_map == {}
+            assert server.event_queue.empty()
+            server.sio.emit.assert_called_once()
+            assert server.sio.emit.call_args.args[0] == "request_failed"
+            assert server.sio.emit.call_args.args[1]["data"]["error"] == "Invalid request: missing text"
+
+        @pytest.mark.asyncio
+        async def test_request_rejected_while_stopping(self, server):
+            """Test that requests fail while the server is stopping"""
+            server.is_stopping = True
+
+            await server._queue_event(
+                "sid", {"event_type": "delete_message", "request_id": "R1", "data": {"message_id": "M1"}}
+            )
+
+            assert server.event_queue.empty()
+            assert server.sio.emit.call_args.args[1]["data"] == {
+                "error": server.ADAPTER_STOPPED_ERROR, "affected_message_id": "M1"
+            }
+
+        @pytest.mark.asyncio
+        async def test_envelope_priority_and_deadline(self, server):
+            """Test reading the priority and deadline from the request envelope"""
+            await server._queue_event("sid", {
+                "event_type": "send_message",
+                "request_id": "R1",
+                "priority": "interactive",
+                "deadline": 1234567890
+            })
+
+            event = server.request_map["R1"]
+            assert event.priority == RequestPriority.INTERACTIVE
+            assert event.deadline == 1234567890.0
+            assert "priority" not in event.data and "deadline" not in event.data
+
+        @pytest.mark.asyncio
+        @pytest.mark.parametrize("envelope", [{"priority": "urgent"}, {"deadline": "soon"}])
+        async def test_invalid_envelope_is_rejected(self, server, envelope):
+            """Test that requests with an invalid envelope are not queued"""
+            await server._queue_event("sid", {"event_type": "send_message", "request_id": "R1", **envelope})
+
+            assert server.event_queue.empty()
+            assert server.sio.emit.call_args.args[0] == "request_failed"
+
+        @pytest.mark.asyncio
+        async def test_request_over_quota_is_throttled(self, server):
+            """Test that a client over its quota is told to back off"""
+            server.event_queue.max_requests_per_client = 1
+
+            await server._queue_event("sid", {"event_type": "send_message", "request_id": "R1"})
+            await server._queue_event("sid", {"event_type": "send_message", "request_id": "R2"})
+
+            assert list(server.request_map) == ["R1"]
+            assert server.event_queue.qsize() == 1
+
+            throttled = [c for c in server.sio.emit.call_args_list if c.args[0] == "request_throttled"]
+            assert len(throttled) == 1
+            assert throttled[0].args[1]["request_id"] == "R2"
+            assert throttled[0].args[1]["queue_usage"] == {"requests": 1, "bytes": len("send_message") + len("R1")}
+            assert throttled[0].kwargs == {"to": "sid"}
+
+            assert server.sio.emit.call_args.args[0] == "request_failed"
+            assert server.sio.emit.call_args.args[1]["data"]["error"].startswith(server.THROTTLED_ERROR)
+
+        @pytest.mark.asyncio
+        async def test_cancelled_request_frees_quota(self, server):
+            """Test that a request cancelled while queued no longer counts towards the quota"""
+            server.event_queue.max_requests_per_client = 1
+
+            await server._queue_event("sid", {"event_type": "send_message", "request_id": "R1"})
+            await server._cancel_request("sid", {"request_id": "R1"})
+            await server._queue_event("sid", {"event_type": "send_message", "request_id": "R2"})
+
+            assert list(server.request_map) == ["R2"]
+            assert server.event_queue.get_usage()["clients"]["sid"]["requests"] == 1
+
+        @pytest.mark.asyncio
+        async def test_payload_size_is_accounted(self, server):
+            """Test that queued payloads are accounted in the queue statistics"""
+            await server._queue_event("sid", {
+                "event_type": "send_message",
+                "request_id": "R1",
+                "data": {"conversation_id": "C1", "attachments": [{"file_name": "a", "content": "x" * 100}]}
+            })
+
+            assert server.get_queue_stats()["usage"]["bytes"] == len("send_message") + len("R1") + len("C1") + 1 + 100
+
+    class TestProcessEvent:
+        """Tests for processing queued requests"""
+
+        @pytest.fixture
+        def adapter_mock(self, server):
+            """Set a mocked adapter that completes every request"""
+            server.adapter = MagicMock()
+            server.adapter.validate_outgoing_event.return_value = None
+            server.adapter.process_outgoing_event = AsyncMock(return_value={"request_completed": True})
+            return server.adapter
+
+        def test_queue_stats_include_incoming_events(self, server, adapter_mock):
+            """Test that the incoming event statistics of the adapter are reported"""
+            adapter_mock.get_incoming_event_stats.return_value = {"queued_events": 2}
+
+            assert server.get_queue_stats()["incoming"] == {"queued_events": 2}
+
+        def test_queue_stats_include_platform_stats(self, server, adapter_mock):
+            """Test that platform statistics are reported only when the adapter has some"""
+            adapter_mock.get_platform_stats.return_value = {}
+            assert "platform" not in server.get_queue_stats()
+
+            adapter_mock.get_platform_stats.return_value = {"api_executor": {"queued_calls": 3}}
+            assert server.get_queue_stats()["platform"] == {"api_executor": {"queued_calls": 3}}
+
+        @pytest.mark.asyncio
+        async def test_interactive_requests_first(self, server, adapter_mock):
+            """Test that interactive requests are processed before earlier bulk ones"""
+            await server._queue_event("sid", {"event_type": "fetch_history", "request_id": "R1"})
+            await server._queue_event("sid", {"event_type": "send_typing_indicator", "request_id": "R2"})
+
+            await server._process_single_event()
+
+            adapter_mock.process_outgoing_event.assert_called_once_with({
+                "event_type": "send_typing_indicator", "request_id": "R2"
+            }, None)
+
+        @pytest.mark.asyncio
+        async def test_validated_request_is_reused(self, server, adapter_mock):
+            """Test that the request model built during validation is passed to the adapter"""
+            adapter_mock.validate_outgoing_event.return_value = "validated request"
+
+            await server._queue_event("sid", {"event_type": "send_message", "request_id": "R1"})
+            await server._process_single_event()
+
+            adapter_mock.process_outgoing_event.assert_called_once_with(
+                {"event_type": "send_message", "request_id": "R1"}, "validated request"
+            )
+
+        @pytest.mark.asyncio
+        async def test_expired_request_is_dropped(self, server, adapter_mock):
+            """Test that a request past its deadline fails without being processed"""
+            await server._queue_event("sid", {
+                "event_type": "send_typing_indicator",
+                "request_id": "R1",
+                "deadline": time.time() - 1
+            })
+
+            await server._process_single_event()
+
+            adapter_mock.process_outgoing_event.assert_not_called()
+            assert server.request_map == {}
+            assert server.sio.emit.call_args.args[0] == "request_failed"
+            assert server.sio.emit.call_args.args[1]["data"]["error"] == server.DEADLINE_EXCEEDED_ERROR
+            assert server.get_queue_stats()["interactive"]["expired"] == 1
+
+    class TestPacketEncoding:
+        """Tests for the packet encoding"""
+
+        def test_orjson_packet_encoder(self):
+            """Test that orjson encodes packets the way the json module does"""
+            pytest.importorskip("orjson")
+            data = {"event_type": "message_received", "data": {1: "one", "text": "Hello"}}
+
+            encoded = OrjsonPacketEncoder.dumps(data, separators=(",", ":"))
+
+            assert isinstance(encoded, str)
+            assert OrjsonPacketEncoder.loads(encoded) == json.loads(json.dumps(data))
+
@@ -2,7 +2,9 @@
 Test suite for core util classes and functions.
 
 - tests/test_attachment_loading.py: shared attachment loading functions
+- tests/test_attachment_uploading.py: chunked base64 decoding of attachment uploads
 - tests/test_config.py: configuration handling tests
+- tests/test_http_session_pool.py: shared HTTP session and download limits
 """
 
 __author__ = "Your Name"
@@ -0,0 +1,128 @@
+import base64
+import os
+import pytest
+import threading
+
+from src.core.utils.attachment_uploading import AttachmentUpload
+
+class TestAttachmentUpload:
+    """Tests for AttachmentUpload"""
+
+    @pytest.fixture
+    def content(self):
+        """Binary content spanning several chunks"""
+        return bytes(range(256)) * 100 + b"tail"
+
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        """Path to write the decoded content to"""
+        return str(tmp_path / "upload.bin")
+
+    def test_persist(self, content, file_path):
+        """Test decoding the content into a file chunk by chunk"""
+        upload = AttachmentUpload(
+            base64.b64encode(content).decode("utf-8"), file_path, len(content), chunk_size=1000
+        )
+
+        assert upload.persist() == file_path
+        with open(file_path, "rb") as f:
+            assert f.read() == content
+        assert upload.size == len(content)
+
+    def test_persist_ignores_line_breaks(self, content, file_path):
+        """Test that line breaks in the content do not break chunk alignment"""
+        upload = AttachmentUpload(
+            base64.encodebytes(content).decode("utf-8"), file_path, len(content), chunk_size=999
+        )
+
+        upload.persist()
+        with open(file_path, "rb") as f:
+            assert f.read() == content
+
+    def test_sniff_content_type_from_first_chunk(self, file_path):
+        """Test sniffing the MIME type before the content is written"""
+        upload = AttachmentUpload(
+            base64.b64encode(b"plain text content\n").decode("utf-8"), file_path, 1024
+        )
+
+        upload.prepare()
+        assert upload.content_type == "text/plain"
+        assert not os.path.exists(file_path)
+
+    def test_persist_too_large(self, content, file_path):
+        """Test that decoding stops once the size limit is exceeded"""
+        upload = AttachmentUpload(
+            base64.b64encode(content).decode("utf-8"), file_path, 2000, chunk_size=1000
+        )
+
+        with pytest.raises(ValueError, match="exceeds size limit"):
+            upload.persist()
+        assert upload.size <= 3000
+        assert not os.path.exists(file_path)
+
+    def test_persist_invalid_content(self, file_path):
+        """Test handling content that is not valid base64"""
+        upload = AttachmentUpload("dGVzdA=", file_path, 1024)
+
+        with pytest.raises(ValueError, match="Failed to decode base64 content"):
+            upload.persist()
+
+    @pytest.mark.asyncio
+    async def test_stream(self, content, file_path):
+        """Test streaming chunks while persisting them in the same pass"""
+        upload = AttachmentUpload(
+            base64.b64encode(content).decode("utf-8"), file_path, len(content), chunk_size=1000
+        )
+
+        chunks = [chunk async for chunk in upload.stream()]
+
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert b"".join(chunks) == content
+        with open(file_path, "rb") as f:
+            assert f.read() == content
+
+    @pytest.mark.asyncio
+    async def test_stream_decodes_off_the_event_loop(self, content, file_path):
+        """Test that chunks are decoded outside of the event loop thread"""
+        upload = AttachmentUpload(
+            base64.b64encode(content).decode("utf-8"), file_path, len(content), chunk_size=1000
+        )
+        decode = upload._decode
+        decoding_threads = set()
+
+        def record_thread(encoded):
+            decoding_threads.add(threading.get_ident())
+            return decode(encoded)
+
+        upload._decode = record_thread
+        upload_thread = threading.get_ident()
+
+        async for _ in upload.stream():
+            pass
+
+        assert decoding_threads
+        assert upload_thread not in decoding_threads
+
+    @pytest.mark.asyncio
+    async def test_stream_too_large(self, content, file_path):
+        """Test that a streamed upload exceeding the size limit is removed"""
+        upload = AttachmentUpload(
+            base64.b64encode(content).decode("utf-8"), file_path, 2000, chunk_size=1000
+        )
+
+        with pytest.raises(ValueError, match="exceeds size limit"):
+            async for _ in upload.stream():
+                pass
+        assert not os.path.exists(file_path)
+
+    def test_move_to(self, file_path, tmp_path):
+        """Test moving the written file into the attachment store"""
+        upload = AttachmentUpload(base64.b64encode(b"test").decode("utf-8"), file_path, 1024)
+        upload.persist()
+
+        dest_path = str(tmp_path / "store.bin")
+        upload.move_to(dest_path)
+
+        assert upload.file_path == dest_path
+        assert os.path.exists(dest_path)
+        assert not os.path.exists(file_path)
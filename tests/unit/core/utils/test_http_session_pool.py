@@ -0,0 +1,135 @@
+import asyncio
+import pytest
+
+from aiohttp import web
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+from src.core.utils.http_session_pool import HttpSessionPool
+
+class TestHttpSessionPool:
+    """Tests for HttpSessionPool"""
+
+    @pytest.fixture
+    def http_session_pool(self):
+        """Create an HttpSessionPool with small limits"""
+        config = MagicMock()
+        config.get_setting = MagicMock(side_effect=lambda section, key, default=None: {
+            ("attachments", "max_concurrent_downloads"): 3,
+            ("attachments", "max_downloads_per_host"): 2,
+            ("adapter", "http_connection_limit"): 5,
+            ("adapter", "http_keepalive_timeout"): 30,
+            ("adapter", "http_dns_cache_ttl"): 120,
+            ("adapter", "http_connect_timeout"): 2,
+            ("adapter", "http_read_timeout"): 0.2
+        }.get((section, key), default))
+        return HttpSessionPool(config)
+
+    @asynccontextmanager
+    async def _run_server(self):
+        """Run a local HTTP server that records the client port of every request"""
+        client_ports = []
+
+        async def handle_file(request):
+            client_ports.append(request.transport.get_extra_info("peername")[1])
+            return web.Response(body=b"file content")
+
+        async def handle_slow(request):
+            await asyncio.sleep(1)
+            return web.Response(body=b"too late")
+
+        app = web.Application()
+        app.router.add_get("/file", handle_file)
+        app.router.add_get("/slow", handle_slow)
+
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+
+        port = runner.addresses[0][1]
+        yield f"http://127.0.0.1:{port}", client_ports
+
+        await runner.cleanup()
+
+    async def _track_download(self, http_session_pool, url, active, peaks):
+        """Hold a download slot for a while and record concurrency"""
+        async with http_session_pool.limit(url):
+            active.append(url)
+            peaks.append((len(active), sum(1 for item in active if item == url)))
+            await asyncio.sleep(0.01)
+            active.remove(url)
+
+    @pytest.mark.asyncio
+    async def test_global_and_per_host_limits(self, http_session_pool):
+        """Test that downloads respect the global and per-host limits"""
+        active = []
+        peaks = []
+        urls = ["https://a.example.com/file"] * 4 + ["https://b.example.com/file"] * 4
+
+        await asyncio.gather(*[
+            self._track_download(http_session_pool, url, active, peaks) for url in urls
+        ])
+
+        assert max(total for total, _ in peaks) == 3
+        assert max(per_host for _, per_host in peaks) == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_session(self, http_session_pool):
+        """Test that the session is shared until the pool is closed"""
+        session = http_session_pool.get_session()
+        assert http_session_pool.get_session() is session
+
+        await http_session_pool.close()
+        assert session.closed
+        assert http_session_pool.session is None
+
+    @pytest.mark.asyncio
+    async def test_session_settings(self, http_session_pool):
+        """Test that the connector and timeouts follow the configuration"""
+        session = http_session_pool.get_session()
+
+        try:
+            assert session.connector.limit_per_host == 5
+            assert session.connector.use_dns_cache is True
+            assert session.connector._keepalive_timeout == 30
+            assert session.timeout.connect == 2
+            assert session.timeout.sock_read == 0.2
+        finally:
+            await http_session_pool.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_reuse(self, http_session_pool):
+        """Test that consecutive transfers to a host reuse one keep-alive connection"""
+        async with self._run_server() as (base_url, client_ports):
+            try:
+                for _ in range(5):
+                    async with http_session_pool.limit(f"{base_url}/file"):
+                        async with http_session_pool.get_session().get(f"{base_url}/file") as response:
+                            assert await response.read() == b"file content"
+            finally:
+                await http_session_pool.close()
+
+        assert len(client_ports) == 5
+        assert len(set(client_ports)) == 1
+
+    @pytest.mark.asyncio
+    async def test_read_timeout(self, http_session_pool):
+        """Test that a stalled transfer fails after the read timeout"""
+        async with self._run_server() as (base_url, _):
+            try:
+                with pytest.raises(asyncio.TimeoutError):
+                    async with http_session_pool.get_session().get(f"{base_url}/slow") as response:
+                        await response.read()
+            finally:
+                await http_session_pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_drops_instance(self, http_session_pool):
+        """Test that closing the pool closes the session and drops the singleton"""
+        HttpSessionPool._instance = http_session_pool
+        session = http_session_pool.get_session()
+
+        await http_session_pool.close()
+
+        assert session.closed
+        assert HttpSessionPool._instance is None